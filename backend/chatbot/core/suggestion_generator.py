@@ -15,6 +15,7 @@ import os
 from collections import Counter, defaultdict
 
 from dotenv import load_dotenv
+from modules.core.services.async_runtime import run_sync
 
 load_dotenv()
 
@@ -268,15 +269,9 @@ class SuggestionGenerator:
 
             if openai_service:
                 try:
-                    # 새로운 이벤트 루프 생성하여 사용
-                    import asyncio
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        response = loop.run_until_complete(openai_service.generate_json_response(prompt))
-                        result_text = response.strip() if response else ""
-                    finally:
-                        loop.close()
+                    # 요청마다 새 루프를 만들지 않고 백그라운드 루프에서 실행
+                    response = run_sync(openai_service.generate_json_response(prompt))
+                    result_text = response.strip() if response else ""
                 except Exception as e:
                     print(f"AI 호출 중 오류: {e}")
                     result_text = ""
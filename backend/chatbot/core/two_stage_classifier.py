@@ -4,6 +4,7 @@
 2차: 의미 기반 재판단 (정확함, 비용 높음)
 """
 
+import asyncio
 import json
 import re
 from typing import Any, Dict, Optional, Tuple
@@ -12,9 +13,14 @@ try:
     from openai_service import OpenAIService
 except ImportError:
     OpenAIService = None
+try:
+    from modules.ai.services.intent_classifier import classify_locally
+except ImportError:
+    classify_locally = None
 import os
 
 from dotenv import load_dotenv
+from modules.core.services.async_runtime import run_sync
 
 from .suggestion_generator import suggestion_generator
 
@@ -77,6 +83,10 @@ class TwoStageClassifier:
         }
 
     def classify_text(self, text: str) -> Dict[str, Any]:
+        """2단계 분류 시스템 (동기 래퍼, 백그라운드 루프에서 실행)"""
+        return run_sync(self.classify_text_async(text))
+
+    async def classify_text_async(self, text: str) -> Dict[str, Any]:
         """2단계 분류 시스템"""
         print(f"\n🔍 [2단계 분류 시작] 텍스트: {text[:100]}...")
 
@@ -84,10 +94,24 @@ class TwoStageClassifier:
         first_stage_result = self._first_stage_scoring(text)
         print(f"🔍 [1차] 점수: {first_stage_result['score']}, 판정: {first_stage_result['decision']}")
 
+        # 로컬 분류기가 채용공고가 아님을 확신하면 2차 LLM 재분석 생략
+        local_prediction = None
+        if first_stage_result['decision'] != 'recruitment' and classify_locally:
+            local_prediction = classify_locally('recruitment_text', text)
+
+        if local_prediction is not None and local_prediction.label == 'general':
+            print(f"🔍 [로컬] 일반 텍스트로 판정 (신뢰도 {local_prediction.confidence:.2f}) → 2차 분석 생략")
+            final_result = {
+                'is_recruitment': False,
+                'confidence': local_prediction.confidence,
+                'fields': {},
+                'stage': 'first_stage+local',
+                'first_stage_score': first_stage_result['score']
+            }
         # 2차: 의미 기반 재판단 (1차가 채용으로 확정되지 않은 모든 경우)
-        if first_stage_result['decision'] != 'recruitment':
+        elif first_stage_result['decision'] != 'recruitment':
             print(f"🔍 [2차] 1차 판정이 '{first_stage_result['decision']}' → 의미 기반 재분석 수행")
-            second_stage_result = self._second_stage_semantic_analysis(text)
+            second_stage_result = await self._second_stage_semantic_analysis_async(text)
 
             final_result = {
                 'is_recruitment': second_stage_result.get('is_recruitment', False),
@@ -108,7 +132,7 @@ class TwoStageClassifier:
             # 채용으로 확정되었으나 필드가 비어있으면 2차 의미 기반으로 보강
             if not final_result['fields']:
                 print("🔍 [후보강] 채용공고로 확정되었으나 필드가 비어있음 → 2차 의미 기반 보강 실행")
-                second_stage = self._second_stage_semantic_analysis(text)
+                second_stage = await self._second_stage_semantic_analysis_async(text)
                 if second_stage.get('is_recruitment', False) and second_stage.get('fields'):
                     final_result['fields'] = second_stage['fields']
                     final_result['confidence'] = max(final_result['confidence'], second_stage.get('confidence', 0.5))
@@ -224,6 +248,10 @@ class TwoStageClassifier:
         return fields
 
     def _second_stage_semantic_analysis(self, text: str) -> Dict[str, Any]:
+        """2차 의미 기반 재분석 (동기 래퍼, 백그라운드 루프에서 실행)"""
+        return run_sync(self._second_stage_semantic_analysis_async(text))
+
+    async def _second_stage_semantic_analysis_async(self, text: str) -> Dict[str, Any]:
         """2차 의미 기반 재분석 + 추천문구 생성"""
         try:
             prompt = f"""
@@ -256,15 +284,8 @@ class TwoStageClassifier:
 
             if openai_service:
                 try:
-                    # 새로운 이벤트 루프 생성하여 사용
-                    import asyncio
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        response = loop.run_until_complete(openai_service.generate_json_response(prompt))
-                        result_text = response.strip() if response else ""
-                    finally:
-                        loop.close()
+                    response = await openai_service.generate_json_response(prompt)
+                    result_text = response.strip() if response else ""
                 except Exception as e:
                     print(f"AI 호출 중 오류: {e}")
                     result_text = ""
@@ -284,7 +305,10 @@ class TwoStageClassifier:
                     suggestions = {}
                     if result.get('isRecruitment', False) and fields:
                         print(f"🔍 [2차] 추천문구 생성 시작")
-                        suggestions = suggestion_generator.generate_field_suggestions(fields, text)
+                        # 동기 생성기는 루프 밖 스레드에서 실행
+                        suggestions = await asyncio.to_thread(
+                            suggestion_generator.generate_field_suggestions, fields, text
+                        )
                         print(f"🔍 [2차] 추천문구 생성 완료: {len(suggestions)}개 필드")
 
                     return {
@@ -6,6 +6,7 @@ import math
 import os
 import pickle
 import re
+import time
 from collections import Counter
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
@@ -13,6 +14,7 @@ from typing import Any, Dict, List, Optional, Tuple
 import httpx
 from dotenv import load_dotenv
 from fastapi import APIRouter, HTTPException
+from modules.token_monitor import llm_instrumentation
 from pydantic import BaseModel
 from pymongo import MongoClient
 
@@ -3492,6 +3494,7 @@ async def generate_unified_summary(username: str, repo_name: Optional[str] = Non
     }
 
     async with httpx.AsyncClient(timeout=httpx.Timeout(120.0)) as client:  # GPT-4o는 더 긴 응답 시간 필요
+        call_started = time.perf_counter()
         response = await client.post(endpoint, json=payload, headers={
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {api_key}'
@@ -3499,10 +3502,18 @@ async def generate_unified_summary(username: str, repo_name: Optional[str] = Non
         response.raise_for_status()
         data = response.json()
 
-        # 토큰 사용량 추적 제거됨
-
         response_text = data.get('choices', [{}])[0].get('message', {}).get('content', '').strip()
 
+        # 토큰 사용량 기록 (httpx 직접 호출이라 응답 usage 로 직접 기록)
+        llm_instrumentation.record(
+            f"{__name__}.generate_unified_summary",
+            model,
+            usage=data.get('usage'),
+            messages=payload["messages"],
+            output_text=response_text,
+            latency_ms=(time.perf_counter() - call_started) * 1000
+        )
+
         try:
             # GPT-4o의 response_format: json_object를 사용하므로 직접 파싱 가능
             result = json.loads(response_text.strip())
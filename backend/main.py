@@ -1,13 +1,19 @@
+import asyncio
 import codecs
 import csv
 import locale
 import logging
 import os
 import sys
+import threading
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+# 모듈 로드 시간 측정 시작 (시작 시간 예산 확인용)
+_module_load_started = time.perf_counter()
+
 import uvicorn
 
 # .env 파일 로드 (가장 먼저 실행)
@@ -16,74 +22,38 @@ import uvicorn
 # except Exception:
 #     pass  # .env 파일이 없어도 무시
 from bson import ObjectId
-from chatbot.routers.chatbot_router import router as chatbot_router
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
-
-# chatbot 라우터 추가
-try:
-    from github import router as github_router
-except ImportError:
-    github_router = None
-from modules.token_monitor import auto_monitor
+from modules.token_monitor import (AdmissionRejected, LLMRouteMiddleware,
+                                   auto_monitor)
 from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel
-from routers.applicants import get_mongo_service, get_similarity_service
-from routers.applicants import router as applicants_router
-from routers.dynamic_messages import router as dynamic_messages_router
-from routers.integrated_ocr import router as integrated_ocr_router
-from routers.job_posting import router as job_posting_router
-
-# from routers.pdf_ocr import router as pdf_ocr_router
-from routers.pick_chatbot import router as pick_chatbot_router
-from routers.pick_chatbot_direct_registration import (
-    router as pick_chatbot_direct_router,
-)
-from routers.sample_data import router as sample_data_router
-from routers.token_monitor import router as token_monitor_router
-from routers.upload import router as upload_router
-
-# 회사 인재상 라우터 추가
-try:
-    from routers.company_culture import router as company_culture_router
-except ImportError:
-    company_culture_router = None
-
-# 모듈화된 라우터 추가
-try:
-    from modules.resume.router import router as resume_router
-except ImportError:
-    resume_router = None
-
-try:
-    from modules.cover_letter.router import router as cover_letter_router
-except ImportError:
-    cover_letter_router = None
-
-try:
-    from modules.portfolio.router import router as portfolio_router
-except ImportError:
-    portfolio_router = None
-
-try:
-    from modules.hybrid.router import router as hybrid_router
-except ImportError:
-    hybrid_router = None
-
-# AI 유사도 분석 모듈화된 라우터 추가
-try:
-    from modules.api.routers.similarity_router import router as similarity_router
-except ImportError:
-    similarity_router = None
-
 
+from modules.core.services.async_runtime import (install_slow_callback_monitor,
+                                                 shutdown_async_runtime)
+from modules.core.services.background_preloader import (background_preloader,
+                                                        register_preload_task)
+from modules.core.services.cohort_similarity_index import (
+    SIMILARITY_FIELDS, CohortSimilarityIndex, cohort_query,
+    schedule_cohort_backfill)
 from modules.core.services.embedding_service import EmbeddingService
-from modules.core.services.mongo_service import MongoService
-from modules.core.services.similarity_service import SimilarityService
-from modules.core.services.vector_service import VectorService
+from modules.core.services.lazy_routers import (LazyRouterMiddleware,
+                                                LazyRouterRegistry, RouterSpec)
+from modules.core.services.model_warmup import \
+    get_readiness as get_model_readiness
+from modules.core.services.model_warmup import start_model_warmup
+from modules.core.services.mongo_service import (MongoService,
+                                                 get_shared_mongo_service)
+from modules.core.services.near_duplicate_index import \
+    schedule_near_duplicate_backfill
+from modules.core.services.structured_logging import (configure_logging,
+                                                      get_correlation_id,
+                                                      reset_correlation_id,
+                                                      set_correlation_id,
+                                                      shutdown_logging)
 
 # Python 환경 인코딩 설정
 # 시스템 기본 인코딩을 UTF-8로 설정
@@ -98,19 +68,58 @@ if sys.platform.startswith('win'):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    # 디버그 모드에서 이벤트 루프를 막는 호출 감지 (스택 기록)
+    install_slow_callback_monitor()
+
     await init_services()
 
+    # LangGraph 워크플로우 컴파일 + 의존성 워밍업 (워커당 1회, 첫 요청 지연 제거)
+    async def warm_up_langgraph():
+        from modules.ai.services.langgraph_agent_system import langgraph_workflow_registry
+        langgraph_workflow_registry.set_database(db)
+        app.state.langgraph_warmup = await langgraph_workflow_registry.warm_up()
+        return app.state.langgraph_warmup
+
+    # 모델/워크플로우 로딩 예약 (설정에 따라 백그라운드/시작 단계/요청 시, /health 에 상태 보고)
+    register_preload_task("langgraph_workflows", 9, warm_up_langgraph, always_preload=True)
+    # 유사도 서비스(langchain/pinecone/elasticsearch/Kiwi)는 포트가 열린 뒤 백그라운드에서 생성
+    register_preload_task("similarity_service", 8, get_app_similarity_service, always_preload=True)
+    await start_model_warmup()
+
     # 자동 토큰 모니터링 시작
     if os.getenv("TOKEN_AUTO_MONITOR", "true").lower() == "true":
         auto_monitor.start_monitoring()
         print("🔍 자동 토큰 모니터링 활성화")
 
+    # 지원자 통계 문서 주기적 재계산 (증분 갱신 보정)
+    stats_reconcile_task = asyncio.create_task(
+        get_shared_mongo_service().run_applicant_stats_reconciler(
+            int(os.getenv("APPLICANT_STATS_RECONCILE_INTERVAL", "600"))
+        )
+    )
+
+    # 자소서 표절 후보 인덱스 백필 (완성 표시가 없거나 서명 버전이 바뀐 경우만 재구성)
+    near_duplicate_backfill_task = schedule_near_duplicate_backfill(db)
+    # 지원자 코호트 유사도 인덱스 백필 (다른 경로로 추가되어 인덱스에 없는 지원자만 임베딩)
+    cohort_backfill_task = schedule_cohort_backfill(db, embedding_service) if embedding_service else None
+
+    # 지연 등록된 라우터를 포트가 열린 뒤 백그라운드에서 import
+    router_warmup_task = asyncio.create_task(router_registry.warm_up())
+
     yield
 
     # Shutdown
+    router_warmup_task.cancel()
+    near_duplicate_backfill_task.cancel()
+    if cohort_backfill_task is not None:
+        cohort_backfill_task.cancel()
+    stats_reconcile_task.cancel()
     if auto_monitor.is_running:
         auto_monitor.stop_monitoring()
         print("⏹️ 자동 토큰 모니터링 중지")
+    await background_preloader.stop()
+    shutdown_async_runtime()
+    shutdown_logging()
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -130,6 +139,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 상관관계 ID (X-Request-ID 헤더가 있으면 그대로 사용)
+@app.middleware("http")
+async def add_correlation_id(request, call_next):
+    token = set_correlation_id(request.headers.get("x-request-id"))
+    try:
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = get_correlation_id()
+        return response
+    finally:
+        reset_correlation_id(token)
+
 # 한글 인코딩을 위한 미들웨어
 @app.middleware("http")
 async def add_charset_header(request, call_next):
@@ -147,62 +167,58 @@ async def add_charset_header(request, call_next):
 
     return response
 
-# 라우터 등록
-if github_router:
-    app.include_router(github_router, prefix="/api", tags=["github"])
-app.include_router(upload_router, tags=["upload"])
-app.include_router(pick_chatbot_router, prefix="/api/pick-chatbot", tags=["pick-chatbot"])
-app.include_router(pick_chatbot_direct_router, tags=["pick-chatbot-direct"])
-app.include_router(dynamic_messages_router, tags=["dynamic-messages"])
-app.include_router(integrated_ocr_router, prefix="/api/integrated-ocr", tags=["integrated-ocr"])
-# app.include_router(pdf_ocr_router, prefix="/api/pdf-ocr", tags=["pdf_ocr"])
-app.include_router(job_posting_router, tags=["job-postings"])
-app.include_router(applicants_router, tags=["applicants"])
-app.include_router(sample_data_router, prefix="/api/sample", tags=["sample-data"])
-app.include_router(chatbot_router, prefix="/chatbot", tags=["chatbot"])
-app.include_router(token_monitor_router, tags=["token-monitor"])
-
-# 회사 인재상 라우터 등록
-if company_culture_router:
-    app.include_router(company_culture_router, tags=["company-culture"])
-
-# 모듈화된 라우터 등록
-if resume_router:
-    app.include_router(resume_router, prefix="/api/resume", tags=["resume"])
-
-if cover_letter_router:
-    app.include_router(cover_letter_router, tags=["cover-letter"])
-
-if portfolio_router:
-    app.include_router(portfolio_router, prefix="/api/portfolio", tags=["portfolio"])
-
-if hybrid_router:
-    app.include_router(hybrid_router, prefix="/api/hybrid", tags=["hybrid"])
-
-# AI 유사도 분석 모듈화된 라우터 등록
-if similarity_router:
-    app.include_router(similarity_router, tags=["similarity"])
-
-# 채용공고 에이전트 라우터 등록
-try:
-    from routers.job_posting_agent import router as job_posting_agent_router
-    app.include_router(job_posting_agent_router, tags=["job-posting-agent"])
-except ImportError:
-    pass
-
-# 리액트 에이전트 라우터 등록
-try:
-    from routers.react_agent_router import router as react_agent_router
-    app.include_router(react_agent_router, prefix="/api", tags=["react-agent"])
-except ImportError:
-    pass
-
-# 향상된 ReAct 에이전트 라우터 등록
-try:
-    from routers.react_agent_enhanced import router as react_agent_enhanced_router
-    app.include_router(react_agent_enhanced_router, prefix="/api", tags=["react-agent-v2"])
-except ImportError:
-    pass
+# 라우터 등록 (LAZY_ROUTERS=true 면 eager 가 아닌 라우터는 첫 요청/워밍업 시 import)
+router_registry = LazyRouterRegistry(app)
+app.add_middleware(LazyRouterMiddleware, registry=router_registry)
+
+# LLM 호출 기록에 요청 라우트 경로를 남기기 위한 컨텍스트
+app.add_middleware(LLMRouteMiddleware)
+
+ROUTER_SPECS = [
+    RouterSpec("github", ("/api/github",), {"prefix": "/api", "tags": ["github"]}),
+    # 루트 경로(/health 등)를 main.py 경로보다 먼저 매칭해야 하므로 즉시 등록
+    RouterSpec("routers.upload", ("/file", "/summarize", "/health"), {"tags": ["upload"]},
+               optional=False, eager=True),
+    RouterSpec("routers.pick_chatbot", ("/api/pick-chatbot",),
+               {"prefix": "/api/pick-chatbot", "tags": ["pick-chatbot"]}, optional=False),
+    RouterSpec("routers.pick_chatbot_direct_registration", ("/pick-chatbot",),
+               {"tags": ["pick-chatbot-direct"]}, optional=False),
+    RouterSpec("routers.dynamic_messages", ("/api/dynamic-messages",),
+               {"tags": ["dynamic-messages"]}, optional=False),
+    RouterSpec("routers.integrated_ocr", ("/api/integrated-ocr",),
+               {"prefix": "/api/integrated-ocr", "tags": ["integrated-ocr"]}, optional=False),
+    # RouterSpec("routers.pdf_ocr", ("/api/pdf-ocr",), {"prefix": "/api/pdf-ocr", "tags": ["pdf_ocr"]}),
+    RouterSpec("routers.job_posting", ("/api/job-postings",), {"tags": ["job-postings"]}, optional=False),
+    # main.py 의 /api/applicants/{applicant_id}/cover-letter 보다 먼저 매칭
+    RouterSpec("routers.applicants", ("/api/applicants",), {"tags": ["applicants"]},
+               optional=False, eager=True),
+    RouterSpec("routers.sample_data", ("/api/sample",),
+               {"prefix": "/api/sample", "tags": ["sample-data"]}, optional=False),
+    RouterSpec("chatbot.routers.chatbot_router", ("/chatbot/chatbot",),
+               {"prefix": "/chatbot", "tags": ["chatbot"]}, optional=False),
+    RouterSpec("routers.token_monitor", ("/api/token-monitor",), {"tags": ["token-monitor"]}, optional=False),
+    # 회사 인재상 라우터
+    RouterSpec("routers.company_culture", ("/api/company-culture",), {"tags": ["company-culture"]}),
+    # 모듈화된 라우터 (include prefix 와 APIRouter prefix 가 함께 붙음)
+    RouterSpec("modules.resume.router", ("/api/resume/api/resumes",),
+               {"prefix": "/api/resume", "tags": ["resume"]}),
+    RouterSpec("modules.cover_letter.router", ("/api/cover-letters",), {"tags": ["cover-letter"]}),
+    RouterSpec("modules.portfolio.router", ("/api/portfolio/api/portfolios",),
+               {"prefix": "/api/portfolio", "tags": ["portfolio"]}),
+    RouterSpec("modules.hybrid.router", ("/api/hybrid/api/hybrid",),
+               {"prefix": "/api/hybrid", "tags": ["hybrid"]}),
+    # AI 유사도 분석 모듈화된 라우터
+    RouterSpec("modules.api.routers.similarity_router", ("/similarity",), {"tags": ["similarity"]}),
+    # 채용공고 에이전트 / 리액트 에이전트 라우터
+    RouterSpec("routers.job_posting_agent", ("/api/job-posting-agent",), {"tags": ["job-posting-agent"]}),
+    RouterSpec("routers.react_agent_router", ("/api/react-agent",),
+               {"prefix": "/api", "tags": ["react-agent"]}),
+    RouterSpec("routers.react_agent_enhanced", ("/api/react-agent-v2",),
+               {"prefix": "/api", "tags": ["react-agent-v2"]}),
+]
+
+for router_spec in ROUTER_SPECS:
+    router_registry.register(router_spec)
 
 # 채용공고 에이전트 초기화
 try:
@@ -251,8 +267,6 @@ PINECONE_INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "resume-vectors")
 
 # 통합 최적화 서비스 초기화 (비동기로 처리)
 try:
-    import asyncio
-
     from modules.core.services.optimization_service import initialize_optimization
 
     # 환경별 최적화 설정
@@ -286,20 +300,39 @@ try:
 except Exception:
     embedding_service = None
 
-# VectorService 선택적 초기화
-try:
-    vector_service = VectorService(
-        api_key=PINECONE_API_KEY or "dummy-key",
-        index_name=PINECONE_INDEX_NAME
-    )
-except Exception:
-    vector_service = None
+# VectorService/SimilarityService 는 langchain·pinecone·elasticsearch·Kiwi 를 import 하므로
+# 포트가 열리기 전에 만들지 않고 첫 사용 시 생성 (LAZY_ROUTERS 와 같은 이유)
+_similarity_service = None
+_similarity_service_initialized = False
+_similarity_service_lock = threading.Lock()
+
+
+def get_app_similarity_service():
+    """앱 공용 SimilarityService (첫 호출 시 생성, 초기화 실패 시 None)"""
+    global _similarity_service, _similarity_service_initialized
+    if _similarity_service_initialized:
+        return _similarity_service
+    with _similarity_service_lock:
+        if _similarity_service_initialized:
+            return _similarity_service
+        from modules.core.services.similarity_service import SimilarityService
+        from modules.core.services.vector_service import VectorService
+
+        # VectorService 선택적 초기화 (실패하면 None 으로 SimilarityService 생성)
+        try:
+            vector_service = VectorService(
+                api_key=PINECONE_API_KEY or "dummy-key",
+                index_name=PINECONE_INDEX_NAME
+            )
+        except Exception:
+            vector_service = None
 
-# SimilarityService 초기화 (vector_service가 None일 수 있음)
-try:
-    similarity_service = SimilarityService(embedding_service, vector_service)
-except Exception:
-    similarity_service = None
+        try:
+            _similarity_service = SimilarityService(embedding_service, vector_service)
+        except Exception:
+            _similarity_service = None
+        _similarity_service_initialized = True
+    return _similarity_service
 
 # Pydantic 모델들
 class User(BaseModel):
@@ -484,9 +517,22 @@ def load_applicants_from_csv() -> List[Dict[str, Any]]:
 async def root():
     return {"message": "AI 채용 관리 시스템 API가 실행 중입니다."}
 
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy", "message": "서버가 정상적으로 작동 중입니다."}
+# /health 는 먼저 등록된 routers.upload 가 응답 (readiness 포함)
+@app.get("/health/ready")
+async def readiness_check():
+    # 로드밸런서/오케스트레이터용: 백그라운드 로딩이 끝나기 전에는 503
+    readiness = get_model_readiness()
+    return JSONResponse(status_code=200 if readiness["ready"] else 503, content=readiness)
+
+@app.get("/api/system/startup")
+async def get_startup_report():
+    """모듈 로드 시간과 라우터별 import 시간/지연 로드 상태"""
+    return {
+        "module_load_seconds": MODULE_LOAD_SECONDS,
+        "import_budget_seconds": IMPORT_TIME_BUDGET_SECONDS,
+        "routers": router_registry.summary(),
+        "router_imports": router_registry.report()
+    }
 
 # 사용자 관련 API
 @app.get("/api/users", response_model=List[User])
@@ -1482,18 +1528,22 @@ async def search_resumes_multi_hybrid(data: Dict[str, Any]):
         query = data.get("query", "")
         search_type = data.get("type", "resume")
         limit = data.get("limit", 10)
+        offset = data.get("offset", 0)
+        sort_by = data.get("sort_by", "final_score")
 
-        print(f"[API] 다중 하이브리드 검색 요청 - 쿼리: '{query}', 제한: {limit}")
+        print(f"[API] 다중 하이브리드 검색 요청 - 쿼리: '{query}', 제한: {limit}, 오프셋: {offset}")
 
         if not query or not query.strip():
             raise HTTPException(status_code=400, detail="검색어를 입력해주세요.")
 
         # SimilarityService의 다중 하이브리드 검색 실행
-        result = await similarity_service.search_resumes_multi_hybrid(
+        result = await get_app_similarity_service().search_resumes_multi_hybrid(
             query=query,
             collection=db.applicants,
             search_type=search_type,
-            limit=limit
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by
         )
 
         if not result["success"]:
@@ -1507,6 +1557,8 @@ async def search_resumes_multi_hybrid(data: Dict[str, Any]):
 
     except HTTPException:
         raise
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         print(f"[API] 다중 하이브리드 검색 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"다중 하이브리드 검색 실패: {str(e)}")
@@ -1525,7 +1577,7 @@ async def search_resumes_keyword(data: Dict[str, Any]):
             raise HTTPException(status_code=400, detail="검색어를 입력해주세요.")
 
         # KeywordSearchService를 통한 BM25 검색
-        result = await similarity_service.keyword_search_service.search_by_keywords(
+        result = await get_app_similarity_service().keyword_search_service.search_by_keywords(
             query=query,
             collection=db.applicants,
             limit=limit
@@ -1560,7 +1612,7 @@ async def rebuild_keyword_index():
         print(f"[API] 키워드 인덱스 재구축 요청")
 
         # KeywordSearchService를 통한 인덱스 재구축
-        result = await similarity_service.keyword_search_service.build_index(db.applicants)
+        result = await get_app_similarity_service().keyword_search_service.build_index(db.applicants)
 
         if not result["success"]:
             raise HTTPException(status_code=500, detail=result.get("message", "인덱스 재구축에 실패했습니다."))
@@ -1584,7 +1636,7 @@ async def rebuild_keyword_index():
 async def get_keyword_search_stats():
     """키워드 검색 인덱스 통계 조회"""
     try:
-        stats = await similarity_service.keyword_search_service.get_index_stats()
+        stats = await get_app_similarity_service().keyword_search_service.get_index_stats()
 
         return {
             "success": True,
@@ -1596,180 +1648,95 @@ async def get_keyword_search_stats():
         raise HTTPException(status_code=500, detail=f"키워드 검색 통계 조회 실패: {str(e)}")
 
 # 이력서 유사도 체크 API
+def get_cohort_similarity_index() -> CohortSimilarityIndex:
+    return CohortSimilarityIndex(db, embedding_service)
+
+
+async def _analyze_similar_resume(similar_resume: Dict[str, Any], overall_similarity: float):
+    """유사 이력서 1건에 대한 LLM 분석"""
+    try:
+        return await get_app_similarity_service().llm_service.analyze_plagiarism_suspicion(
+            similarity_score=overall_similarity,
+            similar_documents=[{
+                "similarity_score": overall_similarity,
+                "name": similar_resume.get("name", "Unknown"),
+                "basic_info_names": similar_resume.get("name", "Unknown")
+            }],
+            document_type="resume"
+        )
+    except Exception as llm_error:
+        print(f"[API] LLM 분석 중 오류: {llm_error}")
+        return {
+            "success": False,
+            "error": str(llm_error),
+            "analysis": "LLM 분석에 실패했습니다."
+        }
+
+
 @app.post("/api/resume/similarity-check/{resume_id}")
 async def check_resume_similarity(resume_id: str):
-    """특정 이력서의 유사도 체크 (다른 모든 이력서와 비교)"""
+    """특정 이력서의 유사도 체크 (같은 채용공고 지원자와 비교, 코호트 유사도 인덱스 조회)"""
     try:
         print(f"[INFO] 유사도 체크 요청 - resume_id: {resume_id}")
 
-        # SimilarityService를 통한 청킹 기반 유사도 분석
-        result = await similarity_service.find_similar_documents_by_chunks(resume_id, db.applicants, "resume", 50)
-
-        # 현재 이력서 정보 조회
         current_resume = await db.applicants.find_one({"_id": ObjectId(resume_id)})
-        print(f"[INFO] 데이터베이스 조회 결과: {current_resume is not None}")
-
-        # 청킹 기반 API 응답 형식에 맞게 변환
-        similarity_results = []
-        for similar in result["data"]["similar_resumes"]:
-            # 청킹 상세 정보에서 필드별 유사도 추출
-            chunk_details = similar.get("chunk_details", {})
-            field_similarities = {
-                "growthBackground": 0.0,
-                "motivation": 0.0,
-                "careerHistory": 0.0
-            }
-
-            # 청크 매칭에서 필드별 최고 점수 추출
-            for chunk_key, chunk_info in chunk_details.items():
-                if "growth_background" in chunk_key:
-                    field_similarities["growthBackground"] = max(field_similarities["growthBackground"], chunk_info["score"])
-                elif "motivation" in chunk_key:
-                    field_similarities["motivation"] = max(field_similarities["motivation"], chunk_info["score"])
-                elif "career_history" in chunk_key:
-                    field_similarities["careerHistory"] = max(field_similarities["careerHistory"], chunk_info["score"])
-
-            similarity_result = {
-                "resume_id": str(similar["resume"]["_id"]),
-                "applicant_name": similar["resume"].get("name", "알 수 없음"),
-                "position": similar["resume"].get("position", ""),
-                "department": similar["resume"].get("department", ""),
-                "overall_similarity": round(similar["similarity_score"], 4),
-                "field_similarities": {
-                    "growthBackground": round(field_similarities["growthBackground"], 4),
-                    "motivation": round(field_similarities["motivation"], 4),
-                    "careerHistory": round(field_similarities["careerHistory"], 4)
-                },
-                "chunk_matches": similar.get("chunk_matches", 0),
-                "chunk_details": chunk_details,
-                "is_high_similarity": similar["similarity_score"] > 0.7,
-                "is_moderate_similarity": 0.4 <= similar["similarity_score"] <= 0.7,
-                "is_low_similarity": similar["similarity_score"] < 0.4,
-                "llm_analysis": similar.get("llm_analysis")
-            }
-            similarity_results.append(similarity_result)
-
-        # 다른 모든 이력서 조회 (현재 이력서 제외)
-        other_resumes = await db.applicants.find({"_id": {"$ne": ObjectId(resume_id)}}).to_list(1000)
+        if not current_resume:
+            raise HTTPException(status_code=404, detail="지원자를 찾을 수 없습니다")
 
-        # 현재 이력서의 비교 텍스트 (유사도 계산 필드)
-        current_fields = {
-            "growthBackground": current_resume.get("growthBackground", ""),
-            "motivation": current_resume.get("motivation", ""),
-            "careerHistory": current_resume.get("careerHistory", "")
+        # 인덱스에 없거나 내용이 바뀐 경우에만 임베딩 계산 후 이웃 목록 조회
+        cohort_index = get_cohort_similarity_index()
+        cohort_result = await cohort_index.find_similar(current_resume)
+        neighbors = cohort_result["neighbors"]
+
+        # 비교 대상 수는 실제 코호트 지원자 수, 인덱스가 덜 채워졌으면 백그라운드 백필 예약
+        cohort_size = await db.applicants.count_documents(cohort_query(current_resume))
+        if embedding_service and await cohort_index.indexed_count(cohort_result["cohort"]) < cohort_size:
+            schedule_cohort_backfill(db, embedding_service, current_resume.get("job_posting_id") or None)
+
+        neighbor_ids = [ObjectId(neighbor["applicant_id"]) for neighbor in neighbors]
+        similar_resumes = {
+            str(resume["_id"]): resume
+            async for resume in db.applicants.find(
+                {"_id": {"$in": neighbor_ids}},
+                {"name": 1, "position": 1, "department": 1}
+            )
         }
+        # 삭제된 지원자는 제외
+        neighbors = [neighbor for neighbor in neighbors if neighbor["applicant_id"] in similar_resumes]
 
-        # 전체 텍스트 조합
-        current_text = " ".join([text for text in current_fields.values() if text])
+        # 이웃은 모두 최소 유사도(0.3) 이상이므로 LLM 분석을 동시에 실행
+        llm_analyses = await asyncio.gather(*[
+            _analyze_similar_resume(similar_resumes[neighbor["applicant_id"]], neighbor["score"])
+            for neighbor in neighbors
+        ])
 
         similarity_results = []
-
-        for other_resume in other_resumes:
-            other_id = str(other_resume["_id"])
-
-            # 다른 이력서의 비교 텍스트
-            other_fields = {
-                "growthBackground": other_resume.get("growthBackground", ""),
-                "motivation": other_resume.get("motivation", ""),
-                "careerHistory": other_resume.get("careerHistory", "")
-            }
-            other_text = " ".join([text for text in other_fields.values() if text])
-
-            # 실제 유사도 계산 사용
-            try:
-                print(f"💫 이력서 간 유사도 계산 시작: {resume_id} vs {other_id}")
-
-                # SimilarityService의 텍스트 유사도 계산 메서드 직접 호출
-                text_similarity = similarity_service._calculate_text_similarity(current_resume, other_resume)
-                overall_similarity = text_similarity if text_similarity is not None else 0.0
-
-                print(f"📊 텍스트 유사도 결과: {overall_similarity:.3f}")
-
-                # 필드별 유사도 계산
-                field_similarities = {}
-                for field_name in current_fields.keys():
-                    if current_fields[field_name] and other_fields[field_name]:
-                        # 필드별 개별 텍스트 유사도 계산
-                        field_sim = similarity_service._calculate_text_similarity(
-                            {field_name: current_fields[field_name]},
-                            {field_name: other_fields[field_name]}
-                        )
-                        field_similarities[field_name] = field_sim if field_sim is not None else 0.0
-                        print(f"📋 {field_name} 유사도: {field_similarities[field_name]:.3f}")
-                    else:
-                        field_similarities[field_name] = 0.0
-
-            except Exception as e:
-                print(f"[ERROR] 유사도 계산 중 오류 발생: {e}")
-                import traceback
-                traceback.print_exc()
-
-                # 오류 시 기본값 사용
-                import random
-                overall_similarity = random.uniform(0.1, 0.9)
-                field_similarities = {}
-                for field_name in current_fields.keys():
-                    if current_fields[field_name] and other_fields[field_name]:
-                        field_similarities[field_name] = random.uniform(0.0, 1.0)
-                    else:
-                        field_similarities[field_name] = 0.0
-
-            # LLM 분석 추가 (유사도가 일정 수준 이상일 때만)
-            llm_analysis = None
-
-            if overall_similarity >= 0.3:  # 30% 이상 유사할 때만 LLM 분석
-                try:
-                    print(f"[API] LLM 분석 시작 - 유사도: {overall_similarity:.3f}")
-                    llm_analysis = await similarity_service.llm_service.analyze_plagiarism_suspicion(
-                        similarity_score=overall_similarity,
-                        similar_documents=[{
-                            "similarity_score": overall_similarity,
-                            "name": other_resume.get("name", "Unknown"),
-                            "basic_info_names": other_resume.get("name", "Unknown")
-                        }],
-                        document_type="resume"
-                    )
-                    print(f"[API] LLM 분석 완료")
-                except Exception as llm_error:
-                    print(f"[API] LLM 분석 중 오류: {llm_error}")
-                    llm_analysis = {
-                        "success": False,
-                        "error": str(llm_error),
-                        "analysis": "LLM 분석에 실패했습니다."
-                    }
-
-            similarity_result = {
-                "resume_id": other_id,
-                "applicant_name": other_resume.get("name", "알 수 없음"),
-                "position": other_resume.get("position", ""),
-                "department": other_resume.get("department", ""),
-                "overall_similarity": round(overall_similarity, 4),
+        for neighbor, llm_analysis in zip(neighbors, llm_analyses):
+            similar_resume = similar_resumes[neighbor["applicant_id"]]
+            overall_similarity = neighbor["score"]
+            similarity_results.append({
+                "resume_id": neighbor["applicant_id"],
+                "applicant_name": similar_resume.get("name", "알 수 없음"),
+                "position": similar_resume.get("position", ""),
+                "department": similar_resume.get("department", ""),
+                "overall_similarity": overall_similarity,
                 "field_similarities": {
-                    "growthBackground": round(field_similarities["growthBackground"], 4),
-                    "motivation": round(field_similarities["motivation"], 4),
-                    "careerHistory": round(field_similarities["careerHistory"], 4)
+                    field: neighbor["fields"].get(field, 0.0) for field in SIMILARITY_FIELDS
                 },
                 "is_high_similarity": overall_similarity > 0.7,
                 "is_moderate_similarity": 0.4 <= overall_similarity <= 0.7,
                 "is_low_similarity": overall_similarity < 0.4,
                 "llm_analysis": llm_analysis
-            }
-
-            similarity_results.append(similarity_result)
-
-        # 유사도 높은 순으로 정렬
-        similarity_results.sort(key=lambda x: x["overall_similarity"], reverse=True)
+            })
 
         # 전체 표절 의심도 분석 추가
         plagiarism_analysis = None
-        high_similarity_results = [r for r in similarity_results if r["overall_similarity"] >= 0.3]
-
-        if high_similarity_results:
+        if similarity_results:
             try:
                 print(f"[API] 표절 의심도 분석 시작")
-                plagiarism_analysis = await similarity_service.llm_service.analyze_plagiarism_suspicion(
+                plagiarism_analysis = await get_app_similarity_service().llm_service.analyze_plagiarism_suspicion(
                     original_resume=current_resume,
-                    similar_resumes=high_similarity_results
+                    similar_resumes=similarity_results
                 )
                 print(f"[API] 표절 의심도 분석 완료")
             except Exception as plag_error:
@@ -1783,10 +1750,11 @@ async def check_resume_similarity(resume_id: str):
                     "analysis": "표절 의심도 분석에 실패했습니다."
                 }
 
-        # 통계 정보
+        # 통계 정보 (비교 대상은 코호트 전체, 최소 유사도 미만은 낮은 유사도로 집계)
+        total_compared = max(cohort_size - 1, len(similarity_results))
         high_similarity_count = len([r for r in similarity_results if r["is_high_similarity"]])
         moderate_similarity_count = len([r for r in similarity_results if r["is_moderate_similarity"]])
-        low_similarity_count = len([r for r in similarity_results if r["is_low_similarity"]])
+        low_similarity_count = total_compared - high_similarity_count - moderate_similarity_count
 
         return {
             "current_resume": {
@@ -1797,7 +1765,7 @@ async def check_resume_similarity(resume_id: str):
             },
             "similarity_results": similarity_results,
             "statistics": {
-                "total_compared": len(similarity_results),
+                "total_compared": total_compared,
                 "high_similarity_count": high_similarity_count,
                 "moderate_similarity_count": moderate_similarity_count,
                 "low_similarity_count": low_similarity_count,
@@ -1808,14 +1776,28 @@ async def check_resume_similarity(resume_id: str):
             "analysis_timestamp": datetime.now().isoformat()
         }
 
+    except HTTPException:
+        raise
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"유사도 체크 실패: {str(e)}")
 
+
+@app.post("/api/resume/similarity-index/rebuild")
+async def rebuild_resume_similarity_index(job_posting_id: Optional[str] = None):
+    """코호트 유사도 인덱스 재구축 (내용이 바뀐 지원자만 다시 임베딩)"""
+    try:
+        indexed = await get_cohort_similarity_index().rebuild(db.applicants, job_posting_id)
+        return {"success": True, "indexed": indexed}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"유사도 인덱스 재구축 실패: {str(e)}")
+
 # 커버레터 유사도 체크 엔드포인트
 @app.post("/api/coverletter/similarity-check/{applicant_id}")
 async def check_coverletter_similarity(
     applicant_id: str,
-    mongo_service: MongoService = Depends(get_mongo_service)
+    mongo_service: MongoService = Depends(get_shared_mongo_service)
 ):
     """자기소개서 표절체크 (호환성을 위한 별명 엔드포인트)"""
     try:
@@ -1884,7 +1866,7 @@ async def check_coverletter_similarity(
             print(f"[INFO] 자소서 필드들: {list(cover_letter.keys())}")
 
             # 4. 유사도 서비스 초기화
-            similarity_service = get_similarity_service()
+            similarity_service = get_app_similarity_service()
 
             # 5. 자소서 표절체크 수행 (청킹 기반 유사도 검색 사용)
             # 자소서 데이터를 직접 전달하여 청킹 처리
@@ -1897,6 +1879,8 @@ async def check_coverletter_similarity(
 
         except HTTPException:
             raise
+        except AdmissionRejected as e:
+            raise HTTPException(status_code=429, detail=str(e))
         except Exception as e:
             print(f"[ERROR] 자소서 조회 실패: {str(e)}")
             raise HTTPException(status_code=500, detail="자소서 조회 중 오류가 발생했습니다")
@@ -2397,19 +2381,20 @@ async def send_bulk_mail(request: Request):
         print(f"대량 메일 발송 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"대량 메일 발송 중 오류가 발생했습니다: {str(e)}")
 
-# 로깅 설정 (버퍼 분리 문제 해결)
-logging.basicConfig(
-    level=logging.WARNING,
-    format='%(levelname)s:%(name)s:%(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('server.log', encoding='utf-8', mode='a')
-    ]
+# 로깅 설정: 큐 기반 비동기 핸들러 + JSON 레코드 (LOG_PRETTY=true 면 콘솔용 포맷)
+configure_logging(
+    extra_handlers=[logging.FileHandler('server.log', encoding='utf-8', mode='a')]
 )
 
-# 로깅 핸들러 설정
-for handler in logging.root.handlers:
-    handler.setFormatter(logging.Formatter('%(levelname)s:%(name)s:%(message)s'))
+# 시작 시간 예산 확인 (상세 모듈별 비용은 scripts/import_time_report.py)
+IMPORT_TIME_BUDGET_SECONDS = float(os.getenv("IMPORT_TIME_BUDGET_SECONDS", "5.0"))
+MODULE_LOAD_SECONDS = round(time.perf_counter() - _module_load_started, 3)
+if MODULE_LOAD_SECONDS > IMPORT_TIME_BUDGET_SECONDS:
+    logging.getLogger(__name__).warning(
+        "main 모듈 로드 %.2fs 가 예산 %.2fs 초과 (라우터 import %.2fs, 지연 등록: %s)",
+        MODULE_LOAD_SECONDS, IMPORT_TIME_BUDGET_SECONDS,
+        router_registry.summary()["import_seconds"], router_registry.lazy
+    )
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
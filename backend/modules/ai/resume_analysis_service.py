@@ -15,9 +15,11 @@ from models.resume_analysis import (
     ResumeAnalysisRequest,
     ResumeAnalysisResponse,
 )
-from modules.ai.huggingface_analyzer import HuggingFaceResumeAnalyzer
 from modules.ai.resume_analyzer import OpenAIResumeAnalyzer
 from modules.config.settings import get_settings
+from modules.core.services.model_warmup import (HUGGINGFACE_ANALYZER,
+                                                ensure_model, get_loaded_model)
+from modules.token_monitor import PRIORITY_BATCH, llm_call_context
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 
@@ -50,25 +52,14 @@ class ResumeAnalysisService:
             print(f"❌ OpenAI 분석기 초기화 실패: {str(e)}")
             self.analyzers["openai"] = None
 
-        # HuggingFace 분석기 초기화 (하이브리드 로딩)
-        if self.lazy_loading:
-            self.analyzers["huggingface"] = None
-            print("✅ HuggingFace 분석기 지연 로딩 설정 완료")
-        else:
-            try:
-                self.analyzers["huggingface"] = HuggingFaceResumeAnalyzer()
-                print("✅ HuggingFace 분석기 초기화 완료")
-            except Exception as e:
-                print(f"❌ HuggingFace 분석기 초기화 실패: {str(e)}")
-                self.analyzers["huggingface"] = None
+        # HuggingFace 분석기는 프로세스 공용 인스턴스 (모델 워밍업 오케스트레이터가 로딩)
+        self.analyzers["huggingface"] = get_loaded_model(HUGGINGFACE_ANALYZER)
 
-    def _get_huggingface_analyzer(self):
-        """HuggingFace 분석기 지연 로딩"""
+    async def _get_huggingface_analyzer(self):
+        """HuggingFace 분석기 (로딩 중이면 진행 중인 로딩을 기다림)"""
         if self.analyzers["huggingface"] is None:
             try:
-                print("📥 HuggingFace 분석기 로딩 중...")
-                self.analyzers["huggingface"] = HuggingFaceResumeAnalyzer()
-                print("✅ HuggingFace 분석기 로딩 완료")
+                self.analyzers["huggingface"] = await ensure_model(HUGGINGFACE_ANALYZER)
             except Exception as e:
                 print(f"❌ HuggingFace 분석기 로딩 실패: {str(e)}")
                 return None
@@ -102,7 +93,7 @@ class ResumeAnalysisService:
                     )
 
             # 분석기 선택
-            analyzer = self._select_analyzer(request.analysis_type)
+            analyzer = await self._select_analyzer(request.analysis_type)
             if not analyzer:
                 return ResumeAnalysisResponse(
                     success=False,
@@ -172,7 +163,7 @@ class ResumeAnalysisService:
                 )
 
             # 분석기 선택
-            analyzer = self._select_analyzer(request.analysis_type)
+            analyzer = await self._select_analyzer(request.analysis_type)
             if not analyzer:
                 return ResumeAnalysisResponse(
                     success=False,
@@ -180,8 +171,9 @@ class ResumeAnalysisService:
                     data=None
                 )
 
-            # 일괄 분석 실행
-            analysis_results = await analyzer.batch_analyze(applicants)
+            # 일괄 분석 실행 (대화 요청에 분당 한도를 양보하는 일괄 작업 우선순위)
+            with llm_call_context(priority=PRIORITY_BATCH):
+                analysis_results = await analyzer.batch_analyze(applicants)
 
             # 성공한 분석 결과만 저장
             saved_results = []
@@ -313,11 +305,11 @@ class ResumeAnalysisService:
             print(f"❌ 분석 결과 조회 실패: {str(e)}")
             return None
 
-    def _select_analyzer(self, analysis_type: str):
+    async def _select_analyzer(self, analysis_type: str):
         """분석기 선택"""
         if analysis_type == "openai" and self.analyzers.get("openai"):
             return self.analyzers["openai"]
-        elif analysis_type == "huggingface" and self.analyzers.get("huggingface"):
+        elif analysis_type == "huggingface" and await self._get_huggingface_analyzer():
             return self.analyzers["huggingface"]
         else:
             # 기본값으로 OpenAI 사용
@@ -12,6 +12,7 @@ from langchain.output_parsers import PydanticOutputParser
 from langchain.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from models.resume_analysis import ResumeAnalysisResult
+from modules.token_monitor import llm_instrumentation
 from openai import OpenAI
 
 
@@ -162,8 +163,17 @@ JSON 형태로 다음 구조를 따라주세요:
                 resume_content=resume_content
             )
 
-            # OpenAI API 호출
+            # OpenAI API 호출 (LangChain 경유라 토큰 사용량은 직접 기록)
+            call_started = time.perf_counter()
             response = await self.model.ainvoke(prompt)
+            llm_instrumentation.record(
+                f"{__name__}.analyze_resume",
+                self.model.model_name,
+                usage=(response.response_metadata or {}).get("token_usage"),
+                prompt=prompt,
+                output_text=response.content,
+                latency_ms=(time.perf_counter() - call_started) * 1000
+            )
 
             # 응답 파싱
             analysis_result = self._parse_response(response.content)
@@ -0,0 +1,366 @@
+"""
+로컬 의도 분류기
+
+라벨링된 예시 파일(modules/ai/data/intent_examples.jsonl)로 작업(task)별 모델을 학습합니다.
+모델은 문자 n-gram TF-IDF 특징과 다항 로지스틱 회귀로 구성되고, 수 초 안에 학습됩니다.
+교차 검증 예측으로 온도(temperature)를 맞춰 신뢰도를 보정하고,
+모델은 JSON 으로 저장해 워커당 한 번만 로드합니다.
+
+호출부는 classify_locally() 로 신뢰도가 임계값 이상인 결과만 받고,
+그 외에는 기존 LLM 분류로 넘어갑니다.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+EXAMPLES_PATH = Path(os.getenv("INTENT_EXAMPLES_PATH", str(DATA_DIR / "intent_examples.jsonl")))
+MODEL_DIR = Path(os.getenv("INTENT_MODEL_DIR", str(DATA_DIR / "intent_models")))
+
+# 이 값 이상의 보정 신뢰도일 때만 로컬 결과 사용 (미만이면 LLM 폴백)
+DEFAULT_CONFIDENCE_THRESHOLD = float(os.getenv("LOCAL_INTENT_CONFIDENCE_THRESHOLD", "0.8"))
+
+# 호출부에서 사용하는 작업 (워밍업 시 미리 로드)
+LOCAL_INTENT_TASKS = ("job_posting_intent", "tool_usage", "recruitment_text")
+
+MODEL_FORMAT_VERSION = 1
+NGRAM_RANGE = (1, 3)
+MAX_FEATURES = 20000
+EPOCHS = 25
+LEARNING_RATE = 0.5
+L2_PENALTY = 1e-4
+CALIBRATION_FOLDS = 3
+TEMPERATURE_GRID = [round(0.05 * 1.2 ** step, 4) for step in range(30)]
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    return WHITESPACE_PATTERN.sub(" ", text.lower()).strip()
+
+
+def char_ngrams(text: str, ngram_range: Tuple[int, int] = NGRAM_RANGE) -> Counter:
+    """공백 경계를 포함한 문자 n-gram 빈도"""
+    padded = f" {normalize_text(text)} "
+    grams: Counter = Counter()
+    for n in range(ngram_range[0], ngram_range[1] + 1):
+        for start in range(len(padded) - n + 1):
+            gram = padded[start:start + n]
+            if gram != " " * n:
+                grams[gram] += 1
+    return grams
+
+
+def _softmax(logits: Sequence[float], temperature: float = 1.0) -> List[float]:
+    scaled = [logit / temperature for logit in logits]
+    peak = max(scaled)
+    exps = [math.exp(value - peak) for value in scaled]
+    total = sum(exps)
+    return [value / total for value in exps]
+
+
+@dataclass
+class IntentPrediction:
+    """로컬 분류 결과"""
+    label: str
+    confidence: float
+    probabilities: Dict[str, float] = field(default_factory=dict)
+    latency_ms: float = 0.0
+
+    def is_confident(self, threshold: float = DEFAULT_CONFIDENCE_THRESHOLD) -> bool:
+        return self.confidence >= threshold
+
+
+class LocalIntentClassifier:
+    """문자 n-gram TF-IDF + 다항 로지스틱 회귀 분류기 (외부 의존성 없음)"""
+
+    def __init__(self, task: str):
+        self.task = task
+        self.labels: List[str] = []
+        # n-gram -> [idf, 클래스별 가중치...]
+        self.features: Dict[str, List[float]] = {}
+        self.bias: List[float] = []
+        self.temperature = 1.0
+        self.examples_hash = ""
+        self.metrics: Dict[str, float] = {}
+        self._idf: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------
+    # 특징 추출
+    # ------------------------------------------------------------------
+
+    def _vectorize(self, text: str, idf: Dict[str, float]) -> Dict[str, float]:
+        """서브리니어 TF x IDF, L2 정규화 (학습 어휘에 없는 n-gram 은 무시)"""
+        vector = {gram: (1.0 + math.log(count)) * idf[gram]
+                  for gram, count in char_ngrams(text).items() if gram in idf}
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        if norm == 0:
+            return {}
+        return {gram: value / norm for gram, value in vector.items()}
+
+    @staticmethod
+    def _fit_idf(texts: Sequence[str]) -> Dict[str, float]:
+        document_frequency: Counter = Counter()
+        for text in texts:
+            document_frequency.update(char_ngrams(text).keys())
+        vocabulary = [gram for gram, _ in document_frequency.most_common(MAX_FEATURES)]
+        total = len(texts)
+        return {gram: math.log((1 + total) / (1 + document_frequency[gram])) + 1.0 for gram in vocabulary}
+
+    # ------------------------------------------------------------------
+    # 학습
+    # ------------------------------------------------------------------
+
+    def _train(self, texts: Sequence[str], labels: Sequence[str], seed: int = 13
+               ) -> Tuple[Dict[str, float], Dict[str, List[float]], List[float]]:
+        """SGD 로 다항 로지스틱 회귀 학습. (idf, 가중치, 편향) 반환"""
+        idf = self._fit_idf(texts)
+        label_index = {label: index for index, label in enumerate(self.labels)}
+        samples = [(self._vectorize(text, idf), label_index[label]) for text, label in zip(texts, labels)]
+        class_count = len(self.labels)
+
+        weights: Dict[str, List[float]] = defaultdict(lambda: [0.0] * class_count)
+        bias = [0.0] * class_count
+        rng = random.Random(seed)
+        order = list(range(len(samples)))
+
+        for epoch in range(EPOCHS):
+            rng.shuffle(order)
+            rate = LEARNING_RATE / (1.0 + epoch * 0.2)
+            for position in order:
+                vector, target = samples[position]
+                logits = list(bias)
+                for gram, value in vector.items():
+                    row = weights[gram]
+                    for index in range(class_count):
+                        logits[index] += row[index] * value
+                probabilities = _softmax(logits)
+                gradients = [probability - (1.0 if index == target else 0.0)
+                             for index, probability in enumerate(probabilities)]
+                for index in range(class_count):
+                    bias[index] -= rate * gradients[index]
+                for gram, value in vector.items():
+                    row = weights[gram]
+                    for index in range(class_count):
+                        row[index] -= rate * (gradients[index] * value + L2_PENALTY * row[index])
+
+        return idf, dict(weights), bias
+
+    def _logits(self, text: str) -> List[float]:
+        return self._logits_with(text, self._idf, self.features, self.bias, offset=1)
+
+    def _logits_with(self, text: str, idf: Dict[str, float], weights: Dict[str, List[float]],
+                     bias: List[float], offset: int = 0) -> List[float]:
+        logits = list(bias)
+        for gram, value in self._vectorize(text, idf).items():
+            row = weights.get(gram)
+            if row is None:
+                continue
+            for index in range(len(logits)):
+                logits[index] += row[index + offset] * value
+        return logits
+
+    def _calibrate(self, texts: Sequence[str], labels: Sequence[str]) -> Dict[str, float]:
+        """층화 K-fold 의 예측 logit 으로 NLL 이 최소인 온도 선택, 교차 검증 지표 반환"""
+        folds: List[List[int]] = [[] for _ in range(CALIBRATION_FOLDS)]
+        by_label: Dict[str, List[int]] = defaultdict(list)
+        for index, label in enumerate(labels):
+            by_label[label].append(index)
+        for indices in by_label.values():
+            for position, index in enumerate(indices):
+                folds[position % CALIBRATION_FOLDS].append(index)
+
+        label_index = {label: index for index, label in enumerate(self.labels)}
+        held_out: List[Tuple[List[float], int]] = []
+        for fold in folds:
+            if not fold:
+                continue
+            excluded = set(fold)
+            train_texts = [text for index, text in enumerate(texts) if index not in excluded]
+            train_labels = [label for index, label in enumerate(labels) if index not in excluded]
+            idf, weights, bias = self._train(train_texts, train_labels)
+            for index in fold:
+                held_out.append((self._logits_with(texts[index], idf, weights, bias), label_index[labels[index]]))
+
+        def negative_log_likelihood(temperature: float) -> float:
+            return -sum(math.log(max(_softmax(logits, temperature)[target], 1e-12))
+                        for logits, target in held_out) / len(held_out)
+
+        self.temperature = min(TEMPERATURE_GRID, key=negative_log_likelihood)
+        correct = sum(1 for logits, target in held_out if max(range(len(logits)), key=logits.__getitem__) == target)
+        return {
+            "cv_accuracy": round(correct / len(held_out), 4),
+            "cv_nll": round(negative_log_likelihood(self.temperature), 4),
+            "temperature": self.temperature,
+        }
+
+    def fit(self, texts: Sequence[str], labels: Sequence[str], examples_hash: str = "") -> "LocalIntentClassifier":
+        started = time.perf_counter()
+        self.labels = sorted(set(labels))
+        if len(self.labels) < 2:
+            raise ValueError(f"{self.task}: 라벨이 2개 이상 필요합니다")
+
+        self.metrics = self._calibrate(texts, labels) if len(texts) >= CALIBRATION_FOLDS * len(self.labels) else {}
+        idf, weights, bias = self._train(texts, labels)
+        self.features = {gram: [idf[gram]] + weights.get(gram, [0.0] * len(self.labels)) for gram in idf}
+        self._idf = idf
+        self.bias = bias
+        self.examples_hash = examples_hash
+        self.metrics.update({
+            "examples": len(texts),
+            "features": len(self.features),
+            "train_seconds": round(time.perf_counter() - started, 3),
+        })
+        return self
+
+    # ------------------------------------------------------------------
+    # 예측
+    # ------------------------------------------------------------------
+
+    def predict(self, text: str) -> IntentPrediction:
+        started = time.perf_counter()
+        probabilities = _softmax(self._logits(text), self.temperature)
+        best = max(range(len(probabilities)), key=probabilities.__getitem__)
+        return IntentPrediction(
+            label=self.labels[best],
+            confidence=probabilities[best],
+            probabilities=dict(zip(self.labels, probabilities)),
+            latency_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict:
+        return {
+            "version": MODEL_FORMAT_VERSION,
+            "task": self.task,
+            "labels": self.labels,
+            "features": {gram: [round(value, 6) for value in entry] for gram, entry in self.features.items()},
+            "bias": self.bias,
+            "temperature": self.temperature,
+            "examples_hash": self.examples_hash,
+            "metrics": self.metrics,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict) -> "LocalIntentClassifier":
+        if payload.get("version") != MODEL_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 모델 버전: {payload.get('version')}")
+        classifier = cls(payload["task"])
+        classifier.labels = payload["labels"]
+        classifier.features = payload["features"]
+        classifier._idf = {gram: entry[0] for gram, entry in classifier.features.items()}
+        classifier.bias = payload["bias"]
+        classifier.temperature = payload["temperature"]
+        classifier.examples_hash = payload.get("examples_hash", "")
+        classifier.metrics = payload.get("metrics", {})
+        return classifier
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(self.to_dict(), ensure_ascii=False), encoding="utf-8")
+        temporary.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "LocalIntentClassifier":
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def load_examples(path: Path = EXAMPLES_PATH) -> Dict[str, List[Tuple[str, str]]]:
+    """예시 파일을 작업별 (텍스트, 라벨) 목록으로 로드"""
+    examples: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            record = json.loads(line)
+            examples[record["task"]].append((record["text"], record["label"]))
+    return dict(examples)
+
+
+def examples_fingerprint(examples: Iterable[Tuple[str, str]]) -> str:
+    payload = json.dumps(sorted(examples), ensure_ascii=False)
+    return hashlib.sha1(f"{MODEL_FORMAT_VERSION}:{payload}".encode("utf-8")).hexdigest()[:16]
+
+
+def train_classifier(task: str, examples: Sequence[Tuple[str, str]]) -> LocalIntentClassifier:
+    texts = [text for text, _ in examples]
+    labels = [label for _, label in examples]
+    return LocalIntentClassifier(task).fit(texts, labels, examples_hash=examples_fingerprint(examples))
+
+
+_classifiers: Dict[str, Optional[LocalIntentClassifier]] = {}
+_classifiers_lock = threading.Lock()
+
+
+def get_local_intent_classifier(task: str) -> Optional[LocalIntentClassifier]:
+    """작업별 분류기 (워커당 1회 로드, 예시 파일이 바뀌었으면 재학습 후 저장)
+
+    예시가 없거나 로드/학습에 실패하면 None (호출부는 LLM 분류 사용)
+    """
+    if task in _classifiers:
+        return _classifiers[task]
+
+    with _classifiers_lock:
+        if task in _classifiers:
+            return _classifiers[task]
+
+        classifier = None
+        try:
+            examples = load_examples().get(task)
+            if not examples:
+                logger.warning("로컬 의도 분류 예시 없음: %s", task)
+            else:
+                fingerprint = examples_fingerprint(examples)
+                model_path = MODEL_DIR / f"{task}.json"
+                if model_path.exists():
+                    try:
+                        cached = LocalIntentClassifier.load(model_path)
+                        if cached.examples_hash == fingerprint:
+                            classifier = cached
+                    except (ValueError, KeyError, json.JSONDecodeError) as e:
+                        logger.warning("로컬 의도 분류 모델 로드 실패, 재학습: %s (%s)", task, e)
+
+                if classifier is None:
+                    classifier = train_classifier(task, examples)
+                    try:
+                        classifier.save(model_path)
+                    except OSError as e:
+                        logger.warning("로컬 의도 분류 모델 저장 실패: %s (%s)", task, e)
+                    logger.info("로컬 의도 분류 모델 학습: %s %s", task, classifier.metrics)
+        except Exception as e:
+            logger.warning("로컬 의도 분류기 준비 실패: %s (%s)", task, e)
+            classifier = None
+
+        _classifiers[task] = classifier
+        return classifier
+
+
+def classify_locally(task: str, text: str,
+                     threshold: float = DEFAULT_CONFIDENCE_THRESHOLD) -> Optional[IntentPrediction]:
+    """보정 신뢰도가 임계값 이상이면 로컬 결과, 아니면 None (LLM 폴백 신호)"""
+    classifier = get_local_intent_classifier(task)
+    if classifier is None or not text or not text.strip():
+        return None
+
+    prediction = classifier.predict(text)
+    logger.debug("로컬 의도 분류 %s: %s (%.3f, %.2fms)",
+                 task, prediction.label, prediction.confidence, prediction.latency_ms)
+    return prediction if prediction.is_confident(threshold) else None
@@ -0,0 +1,480 @@
+"""
+LangGraph 에이전트 의도 라우팅 엔진
+
+모든 키워드 사전을 하나의 Aho-Corasick 오토마톤으로, 문장 구조 패턴은 정규식으로
+임포트 시점에 한 번만 컴파일합니다. 입력을 한 번 훑으면 모든 사전의 일치 위치가 나오고,
+혼합 의도 분리/판단은 그 위치 정보만으로 수행합니다.
+"""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# ---------------------------------------------------------------------------
+# 키워드 사전
+# ---------------------------------------------------------------------------
+
+# 혼합 의도 연결어 (목록 순서 = 같은 위치에서의 우선순위)
+MIXED_CONNECTORS = [
+    # 기본 연결어
+    "하고", "그리고", "다음", "후에", "이후", "다음에",
+    "그 다음", "그다음", "그리고 나서", "그러고 나서",
+
+    # 동작 연결어
+    "해주고", "알려주고", "설명하고", "분석하고", "보여주고",
+    "확인하고", "검토하고", "평가하고", "조회하고", "찾아주고",
+
+    # 시간 연결어
+    "한 후", "한 다음", "하면서", "하고나서", "이후에",
+    "다음으로", "그러고나서", "그런다음", "그리고나서",
+
+    # 목적 연결어
+    "위한", "관련", "필요한", "대한", "따른",
+    "기반", "바탕", "근거", "참고"
+]
+
+# 문장 분리용 정보/액션 키워드 (목록 순서대로 분리 지점 탐색)
+SPLIT_INFO_KEYWORDS = ["알려줘", "설명", "분석", "확인", "검토", "평가", "조회", "찾아"]
+SPLIT_ACTION_KEYWORDS = ["페이지", "화면", "창", "이동", "열어", "보여", "들어가"]
+
+# 혼합 의도 판단용 키워드
+MIXED_INFO_KEYWORDS = [
+    # 기본 질문
+    "알려줘", "설명", "분석", "확인", "검토", "평가", "조회", "찾아",
+    "어떻게", "왜", "뭐", "무엇", "어디", "언제", "누구", "방법",
+
+    # 정보 요청
+    "정보", "내용", "결과", "피드백", "데이터", "상태", "현황",
+    "기준", "과정", "사례", "팁", "예시", "방식", "절차", "순서",
+
+    # 분석 요청
+    "분석", "평가", "검토", "확인", "조회", "찾기", "비교", "측정",
+    "진단", "점검", "파악", "이해", "판단", "검사", "테스트",
+
+    # 학습/교육
+    "배우", "가르쳐", "교육", "학습", "공부", "연습", "훈련", "준비",
+    "연구", "조사", "탐구", "실습", "경험", "노하우", "스킬",
+
+    # 추가 정보 요청
+    "의미", "개념", "정의", "특징", "장단점", "차이", "비교", "관계",
+    "원리", "원칙", "규칙", "기법", "전략", "방안", "해결", "해결책",
+    "대안", "대책", "요령", "요약", "정리", "설계", "구조", "구성",
+    "흐름", "프로세스", "시스템", "메커니즘", "아키텍처", "패턴"
+]
+
+MIXED_ACTION_KEYWORDS = [
+    # 기본 액션
+    "페이지", "화면", "창", "이동", "열어", "보여", "들어가", "접속",
+    "확인", "돌아가", "닫아", "새로고침", "클릭", "선택", "입력",
+
+    # UI 조작
+    "저장", "삭제", "수정", "변경", "추가", "제거", "업데이트",
+    "등록", "취소", "확인", "적용", "실행", "처리", "완료",
+
+    # 네비게이션
+    "이전", "다음", "처음", "마지막", "위", "아래", "좌", "우",
+    "앞", "뒤", "메인", "홈", "대시보드", "목록", "상세",
+
+    # 특수 액션
+    "새로고침", "리로드", "초기화", "리셋", "되돌리기", "복원",
+    "확대", "축소", "정렬", "필터", "검색", "출력", "다운로드",
+
+    # 추가 UI 액션
+    "보기", "뷰", "탭", "메뉴", "버튼", "링크", "폼", "입력창",
+    "체크박스", "라디오", "드롭다운", "리스트", "테이블", "그리드",
+    "차트", "그래프", "다이어그램", "이미지", "아이콘", "로고"
+]
+
+# 혼합 의도 세부 판단용 보조 키워드
+EXPLAIN_HINTS = ["방법", "과정", "절차", "기준", "예시"]
+PAGE_WORDS = ["페이지", "화면", "창"]
+PAGE_VIEW_WORDS = ["페이지", "화면", "창", "보기", "뷰"]
+CHECK_WORDS = ["확인", "검토", "분석"]
+SEQUENCE_WORDS = ["먼저", "우선", "처음"]
+DATA_WORDS = ["정보", "내용", "결과", "데이터"]
+
+# intent_detection_node 빠른 분류 키워드
+QUICK_INFO_KEYWORDS = ["알려줘", "설명", "어떻게", "왜", "뭐", "무엇", "어디", "언제", "누구", "방법",
+                       "어떤", "어느", "가르쳐", "궁금", "분석"]
+QUICK_ACTION_KEYWORDS = ["열어줘", "이동", "보여줘", "클릭", "선택", "입력", "변경", "저장", "삭제", "추가",
+                         "페이지", "화면", "들어가"]
+
+# get_intent_keywords 키워드
+INTENT_INFO_KEYWORDS = [
+    "알려줘", "설명", "어떻게", "왜", "뭐", "무엇", "어디", "언제", "누구", "방법",
+    "어떤", "어느", "가르쳐", "궁금", "분석", "평가", "확인", "찾아", "검색"
+]
+INTENT_ACTION_KEYWORDS = [
+    "열어줘", "이동", "보여줘", "클릭", "선택", "입력", "변경", "저장", "삭제", "추가",
+    "페이지", "화면", "창", "들어가", "접속", "확인", "돌아가", "닫아", "새로고침"
+]
+
+# 이전 액션/주제가 있을 때 이어지는 입력 판단 키워드
+FOLLOWUP_ACTION_KEYWORDS = [
+    # 기본 액션
+    "다시", "취소", "확인", "저장", "삭제", "수정", "이전", "다음",
+
+    # UI 조작
+    "실행", "적용", "처리", "완료", "중단", "재시작", "새로고침",
+
+    # 네비게이션
+    "뒤로", "앞으로", "처음으로", "마지막으로", "위로", "아래로",
+
+    # 특수 액션
+    "되돌리기", "복원", "초기화", "리셋", "업데이트", "동기화",
+
+    # 추가 액션
+    "선택", "입력", "클릭", "체크", "해제", "닫기", "열기",
+    "추가", "제거", "변경", "이동", "보기", "숨기기", "표시"
+]
+CONTEXT_ACTION_KEYWORDS = ["다시", "취소", "확인", "저장", "삭제", "수정", "이전", "다음"]
+CONTEXT_TOPIC_KEYWORDS = ["그거", "이거", "저거", "그것", "이것", "저것", "그", "이", "저"]
+TOPIC_KEYWORDS = [
+    # 지시대명사
+    "그거", "이거", "저거", "그것", "이것", "저것", "그", "이", "저",
+
+    # 연결어
+    "그래서", "그러면", "그렇다면", "그럼", "그리고", "그런데",
+    "그러니까", "그래도", "그러다가", "그러고", "그리하여",
+
+    # 지시부사
+    "거기", "여기", "저기", "그곳", "이곳", "저곳",
+    "그쪽", "이쪽", "저쪽", "그리", "이리", "저리",
+
+    # 시간 관련
+    "그때", "이때", "저때", "그동안", "이제", "아까",
+    "방금", "조금전", "이전", "다음", "이후", "그후"
+]
+
+LEXICONS: Dict[str, List[str]] = {
+    "connector": MIXED_CONNECTORS,
+    "split_info": SPLIT_INFO_KEYWORDS,
+    "split_action": SPLIT_ACTION_KEYWORDS,
+    "mixed_info": MIXED_INFO_KEYWORDS,
+    "mixed_action": MIXED_ACTION_KEYWORDS,
+    "explain_hint": EXPLAIN_HINTS,
+    "page": PAGE_WORDS,
+    "page_view": PAGE_VIEW_WORDS,
+    "check": CHECK_WORDS,
+    "sequence": SEQUENCE_WORDS,
+    "data": DATA_WORDS,
+    "quick_info": QUICK_INFO_KEYWORDS,
+    "quick_action": QUICK_ACTION_KEYWORDS,
+    "intent_info": INTENT_INFO_KEYWORDS,
+    "intent_action": INTENT_ACTION_KEYWORDS,
+    "followup_action": FOLLOWUP_ACTION_KEYWORDS,
+    "context_action": CONTEXT_ACTION_KEYWORDS,
+    "context_topic": CONTEXT_TOPIC_KEYWORDS,
+    "topic": TOPIC_KEYWORDS,
+}
+
+# 단순 응답 사전 (get_response_type)
+SIMPLE_RESPONSES = {
+    # 긍정
+    "네": "confirm", "응": "confirm", "어": "confirm", "그래": "confirm",
+    "ㅇㅇ": "confirm", "좋아": "confirm", "알겠어": "confirm", "괜찮아": "confirm",
+    "yes": "confirm", "ok": "confirm", "y": "confirm", "ㅇ": "confirm",
+
+    # 부정
+    "아니": "deny", "ㄴㄴ": "deny", "싫어": "deny", "no": "deny", "n": "deny",
+    "ㄴ": "deny", "아뇨": "deny", "아니오": "deny",
+
+    # 모름/불확실
+    "모르겠어": "unknown", "글쎄": "unknown", "잘모르겠어": "unknown",
+    "maybe": "unknown", "아마도": "unknown", "글쎄요": "unknown"
+}
+
+EMOTION_RESPONSES = {
+    # 긍정적
+    "ㅋㅋ": "laugh", "ㅎㅎ": "laugh", "^^": "happy", "😊": "happy",
+    "ㅋ": "laugh", "ㅎ": "laugh", "😄": "laugh", "😆": "laugh",
+    "ㅋㅋㅋ": "laugh", "ㅎㅎㅎ": "laugh", "ㅋㅋㅋㅋ": "laugh", "ㅎㅎㅎㅎ": "laugh",
+
+    # 부정적
+    "ㅠㅠ": "sad", "ㅜㅜ": "sad", "ㅡㅡ": "annoyed", "😢": "sad",
+    "ㅠ": "sad", "ㅜ": "sad", "😭": "sad", "😤": "annoyed",
+    "ㅠㅠㅠ": "sad", "ㅜㅜㅜ": "sad", "ㅠㅠㅠㅠ": "sad", "ㅜㅜㅜㅜ": "sad",
+
+    # 놀람/혼란
+    "헐": "surprise", "와": "surprise", "오": "surprise", "아": "surprise",
+    "엥": "confusion", "헉": "surprise", "😮": "surprise", "😲": "surprise",
+    "헐~": "surprise", "와~": "surprise", "오~": "surprise", "아~": "surprise"
+}
+
+CONFIRMATION_RESPONSES = {
+    # 긍정
+    "좋습니다": "confirm", "알겠습니다": "confirm", "그렇습니다": "confirm",
+    "맞습니다": "confirm", "동의합니다": "confirm", "네맞아요": "confirm",
+    "좋아요": "confirm", "알겠어요": "confirm", "그래요": "confirm",
+
+    # 부정
+    "싫습니다": "deny", "아닙니다": "deny", "그렇지않습니다": "deny",
+    "아니요": "deny", "반대합니다": "deny", "아니에요": "deny",
+    "싫어요": "deny", "아니예요": "deny", "그렇지않아요": "deny",
+
+    # 모름/불확실
+    "모르겠습니다": "unknown", "잘모르겠습니다": "unknown",
+    "글쎄요": "unknown", "애매합니다": "unknown",
+    "모르겠어요": "unknown", "잘모르겠어요": "unknown"
+}
+
+# ---------------------------------------------------------------------------
+# 정규식 (임포트 시 1회 컴파일)
+# ---------------------------------------------------------------------------
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+PUNCTUATION_RUN_PATTERN = re.compile(r'[,.!?]+')
+DIRECTION_PARTICLE_PATTERN = re.compile(r'(으로|로)\s+(이동|가|보여)')
+OBJECT_PARTICLE_PATTERN = re.compile(r'(을|를)\s+(보여|열어)')
+PART_SEPARATOR_PATTERN = re.compile(r'[.,]')
+
+JAMO_ONLY_PATTERN = re.compile(r'^[ㄱ-ㅎㅏ-ㅣ]+$')
+PUNCTUATION_ONLY_PATTERN = re.compile(r'^[!?.]+$')
+EMOTICON_ONLY_PATTERN = re.compile(r'^[ㅋㅎㅠㅜ]+$')
+DIGITS_ONLY_PATTERN = re.compile(r'^\d+$')
+SPECIAL_ONLY_PATTERN = re.compile(r'^[!@#$%^&*()_+=\-\[\]{}|\\:;"\'<>,.?/~`]+$')
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+SALARY_PATTERN = re.compile(r'(\d+)만원')
+
+# 문장 구조 기반 분리 패턴 - 모두 페이지/화면/창 을 포함하므로 해당 단어가 없으면 건너뜀
+STRUCTURE_PATTERNS = [re.compile(pattern) for pattern in [
+    # 기본 구조
+    r"(.+?)(?:하고|해주고|알려주고|설명하고|분석하고)\s+(.+?)(?:페이지|화면|창)(?:\s+(?:보여|열어|이동|들어가))?",
+    r"(.+?)(?:방법|기준|과정|사례|팁|예시|정보|결과|피드백).*?(?:알려|설명|분석|보여).*?(?:페이지|화면|창)",
+    r"(.+?)(?:준비|최적화|스케줄링|관리).*?방법.*?(?:페이지|화면|창)",
+    r"(.+?)(?:위한|관련|필요한)\s+(.+?)(?:페이지|화면|창)",
+
+    # 확장 구조
+    r"(.+?)(?:확인|검토|평가|조회|찾기).*?(?:하고|후).*?(?:페이지|화면|창)",
+    r"(.+?)(?:정보|데이터|내용|상태).*?(?:보고|확인).*?(?:페이지|화면|창)",
+    r"(.+?)(?:작성|입력|수정|삭제).*?(?:방법|기준).*?(?:페이지|화면|창)",
+    r"(.+?)(?:처리|진행|관리|설정).*?(?:절차|순서).*?(?:페이지|화면|창)",
+
+    # 역순 구조
+    r"(?:페이지|화면|창).*?(?:보여|열어|이동).*?(?:다음|후).*?(.+?)(?:알려|설명|분석)",
+    r"(?:페이지|화면|창).*?(?:확인|검토).*?(?:하면서|하고).*?(.+?)(?:진행|처리)",
+
+    # 복합 구조
+    r"(.+?)(?:방법|기준|과정).*?(?:알려|설명).*?(?:다음|후).*?(?:페이지|화면|창)",
+    r"(.+?)(?:정보|내용).*?(?:확인|검토).*?(?:위해|필요).*?(?:페이지|화면|창)"
+]]
+
+Span = Tuple[int, int]
+
+
+class KeywordAutomaton:
+    """여러 키워드 사전을 한 번에 찾는 Aho-Corasick 오토마톤
+
+    scan() 은 입력을 한 번만 훑으며 모든 사전의 (시작, 끝, 사전 내 순번) 일치를 돌려줍니다.
+    """
+
+    def __init__(self, lexicons: Dict[str, Iterable[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, int, int]]] = [[]]
+
+        for category, keywords in lexicons.items():
+            for keyword_index, keyword in enumerate(keywords):
+                state = 0
+                for char in keyword:
+                    if char not in self._goto[state]:
+                        self._goto.append({})
+                        self._fail.append(0)
+                        self._output.append([])
+                        self._goto[state][char] = len(self._goto) - 1
+                    state = self._goto[state][char]
+                self._output[state].append((category, keyword_index, len(keyword)))
+
+        # BFS 로 실패 링크 연결 및 출력 병합
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def scan(self, text: str) -> "KeywordMatches":
+        matches: Dict[str, List[Tuple[int, int, int]]] = {}
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for category, keyword_index, length in self._output[state]:
+                matches.setdefault(category, []).append((position + 1 - length, position + 1, keyword_index))
+        for category_matches in matches.values():
+            category_matches.sort()
+        return KeywordMatches(text, matches)
+
+
+class KeywordMatches:
+    """scan 결과: 사전별 일치 위치 조회"""
+
+    def __init__(self, text: str, matches: Dict[str, List[Tuple[int, int, int]]]):
+        self.text = text
+        self.matches = matches
+
+    def has(self, category: str, span: Optional[Span] = None) -> bool:
+        """사전의 키워드가 (span 구간 안에) 하나라도 있는지"""
+        if span is None:
+            return bool(self.matches.get(category))
+        start, end = span
+        return any(start <= match_start and match_end <= end
+                   for match_start, match_end, _ in self.matches.get(category, ()))
+
+    def first_occurrences(self, category: str) -> Dict[int, Span]:
+        """사전 순번별 첫 번째 일치 위치"""
+        first: Dict[int, Span] = {}
+        for match_start, match_end, keyword_index in self.matches.get(category, ()):
+            first.setdefault(keyword_index, (match_start, match_end))
+        return first
+
+    def at(self, category: str, position: int) -> List[Tuple[int, int]]:
+        """position 에서 시작하는 일치 (사전 순번, 끝 위치) - 순번 오름차순"""
+        return sorted((keyword_index, match_end)
+                      for match_start, match_end, keyword_index in self.matches.get(category, ())
+                      if match_start == position)
+
+
+INTENT_AUTOMATON = KeywordAutomaton(LEXICONS)
+
+
+def normalize_text(text: str) -> str:
+    """텍스트 정규화"""
+    # 1. 공백 정규화
+    text = WHITESPACE_PATTERN.sub(' ', text.strip())
+
+    # 2. 문장 부호 정규화
+    text = PUNCTUATION_RUN_PATTERN.sub('.', text)
+
+    # 3. 조사 정규화
+    text = DIRECTION_PARTICLE_PATTERN.sub(r'\2', text)
+    text = OBJECT_PARTICLE_PATTERN.sub(r'\2', text)
+
+    return text
+
+
+def split_mixed_spans(text: str, features: KeywordMatches) -> Tuple[Span, Span]:
+    """혼합 의도 문장 분리 - 두 부분의 (시작, 끝) 구간 반환 (두 번째가 없으면 빈 구간)
+
+    text 는 normalize_text 를 거친(줄바꿈 없는) 문자열이어야 합니다.
+    """
+    length = len(text)
+
+    # 1. 연결어 기반 분리 (기존 정규식 "(.+?)(연결어|...)\s+(.+)" 와 같은 결과)
+    #    가장 앞선 위치(1 이상)에서, 같은 위치면 목록 순서가 앞선 연결어부터
+    #    뒤에 공백과 내용이 이어지는 경우만 인정
+    connector_starts = sorted({match_start for match_start, _, _ in features.matches.get("connector", ())
+                               if match_start >= 1})
+    for position in connector_starts:
+        for _, connector_end in features.at("connector", position):
+            rest = connector_end
+            while rest < length and text[rest].isspace():
+                rest += 1
+            whitespace = rest - connector_end
+            if whitespace >= 1 and rest < length:
+                return (0, position), (rest, length)
+            if whitespace >= 2:
+                return (0, position), (rest - 1, length)
+
+    # 2. 문장 구조 기반 분리 (모든 패턴이 페이지/화면/창 을 요구)
+    if features.has("page"):
+        for pattern in STRUCTURE_PATTERNS:
+            if match := pattern.search(text):
+                first_span = match.span(1)
+                second_span = match.span(2) if pattern.groups >= 2 else (match.end(1), length)
+                if text[first_span[0]:first_span[1]].strip() and text[second_span[0]:second_span[1]].strip():
+                    return first_span, second_span
+
+    # 3. 문장 부호 기반 분리
+    separators = [match.start() for match in PART_SEPARATOR_PATTERN.finditer(text)]
+    if separators:
+        second_end = separators[1] if len(separators) >= 2 else length
+        return (0, separators[0]), (separators[0] + 1, second_end)
+
+    # 4. 키워드 기반 분리
+    # 정보 요청이 먼저 나오는 경우
+    info_first = features.first_occurrences("split_info")
+    for keyword_index in range(len(SPLIT_INFO_KEYWORDS)):
+        if keyword_index in info_first:
+            info_end = info_first[keyword_index][1]
+            if features.has("split_action", (info_end, length)):
+                return (0, info_end), (info_end, length)
+
+    # UI 액션이 먼저 나오는 경우
+    action_first = features.first_occurrences("split_action")
+    for keyword_index in range(len(SPLIT_ACTION_KEYWORDS)):
+        if keyword_index in action_first:
+            action_start = action_first[keyword_index][0]
+            if features.has("split_info", (0, action_start)):
+                return (0, action_start), (action_start, length)
+
+    return (0, length), (length, length)
+
+
+def detect_mixed_from_features(text: str, features: KeywordMatches) -> Tuple[bool, List[str], List[str], float]:
+    """정규화된 텍스트와 그 scan 결과로 혼합 의도 판단"""
+    first_span, second_span = split_mixed_spans(text, features)
+    first_part = text[first_span[0]:first_span[1]].strip()
+    second_part = text[second_span[0]:second_span[1]].strip()
+    parts = [first_part, second_part]
+
+    def has(category: str, span: Span) -> bool:
+        return features.has(category, span)
+
+    first_info = has("mixed_info", first_span)
+    first_action = has("mixed_action", first_span)
+    second_info = has("mixed_info", second_span)
+    second_action = has("mixed_action", second_span)
+
+    if first_info and second_action:
+        # 정보 요청 → UI 액션 패턴 (설명 후 관련 페이지로 이동)
+        if has("explain_hint", first_span) and has("page", second_span):
+            return True, ["info_request", "ui_action"], parts, 0.95
+        return True, ["info_request", "ui_action"], parts, 0.9
+    elif first_action and second_info:
+        # UI 액션 → 정보 요청 패턴 (특정 페이지에서 정보를 확인)
+        if has("page", first_span) and has("check", second_span):
+            return True, ["ui_action", "info_request"], parts, 0.95
+        return True, ["ui_action", "info_request"], parts, 0.9
+    elif first_info and second_info:
+        # 정보 요청 → 정보 요청 패턴
+        if has("page_view", second_span):
+            return True, ["info_request", "ui_action"], parts, 0.85
+        if has("sequence", first_span):
+            return True, ["info_request", "info_request"], parts, 0.9
+        return True, ["info_request", "info_request"], parts, 0.8
+    elif first_action and second_action:
+        # UI 액션 → UI 액션 패턴
+        if has("data", first_span):
+            return True, ["info_request", "ui_action"], parts, 0.85
+        if has("sequence", first_span):
+            return True, ["ui_action", "ui_action"], parts, 0.9
+        return True, ["ui_action", "ui_action"], parts, 0.8
+
+    return False, [], [], 0.0
+
+
+class IntentFeatures:
+    """한 메시지의 라우팅 특징 (원문/정규화 텍스트 각각 1회 scan, 같으면 재사용)"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.matches = INTENT_AUTOMATON.scan(text)
+        self.normalized = normalize_text(text)
+        self.normalized_matches = (self.matches if self.normalized == text
+                                   else INTENT_AUTOMATON.scan(self.normalized))
+        self._mixed: Optional[Tuple[bool, List[str], List[str], float]] = None
+
+    @property
+    def mixed(self) -> Tuple[bool, List[str], List[str], float]:
+        if self._mixed is None:
+            self._mixed = detect_mixed_from_features(self.normalized, self.normalized_matches)
+        return self._mixed
+
+    def has(self, category: str) -> bool:
+        return self.matches.has(category)
@@ -15,7 +15,10 @@ except ImportError as e:
     LANGCHAIN_AVAILABLE = False
     print(f"LangChain 라이브러리가 설치되지 않았습니다: {e}")
 
+from bson import ObjectId
 from elasticsearch import Elasticsearch
+from modules.config.settings import get_settings
+from modules.core.services.search_fusion import ScoreFusion
 from pinecone import Pinecone
 
 
@@ -78,6 +81,8 @@ class LangChainHybridService:
 
             # 하이브리드 검색은 수동으로 구현 (기존 구조 호환성 유지)
             self.hybrid_retriever = None  # 수동 하이브리드 검색 사용
+            self.ensemble_weights = {"vector": 0.5, "keyword": 0.5}
+            self.score_fusion = ScoreFusion(get_settings().search_fusion_method, self.ensemble_weights)
 
             print(f"[LangChainHybridService] LangChain 컴포넌트 초기화 완료")
 
@@ -111,57 +116,16 @@ class LangChainHybridService:
             print(f"[LangChainHybridService] 벡터 쿼리: {vector_query[:100]}...")
             print(f"[LangChainHybridService] 키워드 쿼리 길이: {len(keyword_query)}")
 
-            # 1. 벡터 검색 수행 (지원자 정보 기반)
-            print(f"[LangChainHybridService] 벡터 검색 수행...")
-            print(f"[LangChainHybridService] 벡터 필터: {self.vector_retriever.search_kwargs}")
-
-            # 필터 없이 전체 검색도 테스트
-            try:
-                test_retriever = self.vector_store.as_retriever(search_kwargs={"k": 5})
-                test_docs = await asyncio.to_thread(test_retriever.invoke, vector_query)
-                print(f"[LangChainHybridService] 필터 없는 전체 검색 결과: {len(test_docs)}개")
-            except Exception as e:
-                print(f"[LangChainHybridService] 테스트 검색 실패: {e}")
-
-            vector_docs = await asyncio.to_thread(
-                self.vector_retriever.invoke,
-                vector_query
+            # 1. 벡터 검색(지원자 정보) + 키워드 검색(이력서 텍스트) 동시 수행
+            print(f"[LangChainHybridService] 벡터/키워드 검색 동시 수행 (벡터 필터: {self.vector_retriever.search_kwargs})")
+            vector_scored, keyword_docs = await self._retrieve_hybrid(
+                vector_query, keyword_query, resumes_collection
             )
-            print(f"[LangChainHybridService] 벡터 검색 결과: {len(vector_docs)}개")
-
-            # 2. 키워드 검색 수행 (이력서 컬렉션 사용)
-            keyword_docs = []
-            if keyword_query:
-                print(f"[LangChainHybridService] 키워드 검색 수행 (이력서 텍스트 대상)...")
-                keyword_result = await self.keyword_search_service.search_by_keywords(
-                    query=keyword_query,
-                    collection=resumes_collection,
-                    limit=10
-                )
-                keyword_docs = self._convert_keyword_results_to_docs(keyword_result)
-                print(f"[LangChainHybridService] 키워드 검색 결과: {len(keyword_docs)}개")
-
-            # 3. 수동 하이브리드 검색 (벡터 + 키워드 결합)
-            print(f"[LangChainHybridService] 수동 하이브리드 검색 수행...")
-            hybrid_docs = vector_docs + keyword_docs  # 단순 결합
-            # 중복 제거
-            seen_ids = set()
-            unique_hybrid_docs = []
-            for doc in hybrid_docs:
-                doc_id = None
-                if hasattr(doc, 'metadata') and doc.metadata:
-                    doc_id = doc.metadata.get('resume_id') or doc.metadata.get('document_id')
-                if doc_id and doc_id not in seen_ids:
-                    seen_ids.add(doc_id)
-                    unique_hybrid_docs.append(doc)
-            hybrid_docs = unique_hybrid_docs
-
-            print(f"[LangChainHybridService] 하이브리드 검색 결과: {len(hybrid_docs)}개")
-
-            # 4. 결과를 지원자 정보로 변환
+            print(f"[LangChainHybridService] 벡터 검색 결과: {len(vector_scored)}개, 키워드 검색 결과: {len(keyword_docs)}개")
+
+            # 2. 순위 융합 후 결과를 지원자 정보로 변환
             return await self._convert_docs_to_applicants(
-                hybrid_docs, vector_docs, keyword_docs,
-                applicants_collection, target_applicant, limit
+                vector_scored, keyword_docs, applicants_collection, target_applicant, limit
             )
 
         except Exception as e:
@@ -172,152 +136,129 @@ class LangChainHybridService:
                 "message": "LangChain 하이브리드 검색 중 오류가 발생했습니다."
             }
 
+    async def _retrieve_hybrid(self, vector_query: str, keyword_query: str, keyword_collection,
+                               keyword_limit: int = 10):
+        """벡터/키워드 검색을 동시에 수행합니다. 벡터 결과는 (Document, 유사도) 목록"""
+        async def vector_search():
+            return await asyncio.to_thread(
+                self.vector_store.similarity_search_with_score,
+                vector_query,
+                **self.vector_retriever.search_kwargs
+            )
+
+        async def keyword_search():
+            if not keyword_query:
+                return []
+            keyword_result = await self.keyword_search_service.search_by_keywords(
+                query=keyword_query,
+                collection=keyword_collection,
+                limit=keyword_limit,
+                hydrate=False  # 융합 후 상위 후보만 한 번에 조회
+            )
+            return self._convert_keyword_results_to_docs(keyword_result)
+
+        return await asyncio.gather(vector_search(), keyword_search())
+
+    def _fuse_docs(self, vector_scored: List, keyword_docs: List[Document], key_of) -> List[Dict[str, Any]]:
+        """Document 들을 key_of(doc) 기준으로 ScoreFusion 융합"""
+        return self.score_fusion.fuse({
+            "vector": [(key_of(doc), score) for doc, score in vector_scored],
+            "keyword": [(key_of(doc), doc.metadata.get("bm25_score", 0)) for doc in keyword_docs]
+        })
+
+    @staticmethod
+    def _serialize_document(document: Dict[str, Any]) -> Dict[str, Any]:
+        """ObjectId / datetime 필드를 문자열로 변환"""
+        for key, value in list(document.items()):
+            if hasattr(value, 'isoformat'):
+                document[key] = value.isoformat()
+            elif isinstance(value, ObjectId):
+                document[key] = str(value)
+        return document
+
     async def _convert_docs_to_applicants(self,
-                                        hybrid_docs: List[Document],
-                                        vector_docs: List[Document],
+                                        vector_scored: List,
                                         keyword_docs: List[Document],
                                         applicants_collection,
                                         target_applicant: Dict[str, Any],
                                         limit: int) -> Dict[str, Any]:
         """
-        LangChain Document 객체들을 지원자 정보로 변환
+        벡터/키워드 결과를 융합하고 지원자 정보를 한 번의 조회로 가져옵니다.
+
+        지원자 벡터(chunk_type=applicant)는 document_id 가 지원자 ID이고,
+        이력서/키워드 결과는 resume_id 로 지원자를 찾아 융합 전에 같은 지원자 ID 로 맞춥니다.
         """
         try:
-            # 문서에서 resume_id 추출하여 지원자 매핑
-            applicant_scores = {}
-            target_resume_id = target_applicant.get('resume_id')
-
-            # 하이브리드 결과 처리
-            for i, doc in enumerate(hybrid_docs):
-                try:
-                    # Document의 메타데이터에서 식별자 추출 및 지원자 찾기
-                    applicant = None
-                    resume_id = None
-
-                    if hasattr(doc, 'metadata') and doc.metadata:
-                        chunk_type = doc.metadata.get('chunk_type')
-
-                        if chunk_type == 'applicant':
-                            # 지원자 벡터의 경우: document_id가 applicant_id임
-                            applicant_id = doc.metadata.get('document_id')
-                            if applicant_id and applicant_id != str(target_applicant.get('_id')):
-                                from bson import ObjectId
-                                applicant = await applicants_collection.find_one({"_id": ObjectId(applicant_id)})
-                        else:
-                            # 이력서/키워드 검색 결과의 경우: resume_id 기준
-                            resume_id = doc.metadata.get('resume_id') or doc.metadata.get('document_id')
-                            if resume_id and resume_id != target_resume_id:
-                                applicant = await applicants_collection.find_one({"resume_id": resume_id})
-                    
-                    if applicant:
-                        applicant_id = str(applicant["_id"])
-
-                        # 하이브리드 점수 계산 (순위 기반)
-                        hybrid_score = max(0, (len(hybrid_docs) - i) / len(hybrid_docs))
-
-                        # 벡터/키워드 개별 점수 계산
-                        vector_score = 0
-                        keyword_score = 0
-
-                        # 벡터 결과에서 점수 찾기 (지원자 벡터 고려)
-                        for v_i, v_doc in enumerate(vector_docs):
-                            v_applicant_id = None
-                            v_resume_id = None
-
-                            if hasattr(v_doc, 'metadata') and v_doc.metadata:
-                                v_chunk_type = v_doc.metadata.get('chunk_type')
-                                if v_chunk_type == 'applicant':
-                                    v_applicant_id = v_doc.metadata.get('document_id')
-                                else:
-                                    v_resume_id = v_doc.metadata.get('resume_id') or v_doc.metadata.get('document_id')
-
-                            # 현재 지원자와 매칭되는지 확인
-                            is_match = False
-                            if chunk_type == 'applicant' and v_applicant_id == applicant_id:
-                                is_match = True
-                            elif chunk_type != 'applicant' and v_resume_id == resume_id:
-                                is_match = True
-
-                            if is_match:
-                                vector_score = max(0, (len(vector_docs) - v_i) / len(vector_docs))
-                                break
-
-                        # 키워드 결과에서 점수 찾기 (BM25 점수 기반)
-                        for k_i, k_doc in enumerate(keyword_docs):
-                            k_resume_id = None
-                            if hasattr(k_doc, 'metadata') and k_doc.metadata:
-                                k_resume_id = k_doc.metadata.get('resume_id') or k_doc.metadata.get('document_id')
-                            if k_resume_id == resume_id:
-                                # BM25 점수를 0-1 범위로 정규화
-                                bm25_score = k_doc.metadata.get('bm25_score', 0)
-                                keyword_score = min(1.0, max(0.0, bm25_score / 50.0))  # 50으로 나누어 정규화 (더 관대하게)
-                                break
-
-                        if applicant_id not in applicant_scores or hybrid_score > applicant_scores[applicant_id]['final_score']:
-                            applicant_scores[applicant_id] = {
-                                'final_score': hybrid_score,
-                                'vector_score': vector_score,
-                                'keyword_score': keyword_score,
-                                'applicant': applicant,
-                                'search_methods': []
-                            }
-
-                            # 검색 방법 추가 - 하이브리드 검색에서는 기본적으로 둘 다 사용
-                            search_methods = []
-                            if len(vector_docs) > 0:  # 벡터 검색이 실행되었다면
-                                search_methods.append('vector')
-                            if len(keyword_docs) > 0:  # 키워드 검색이 실행되었다면
-                                search_methods.append('keyword')
-                            
-                            applicant_scores[applicant_id]['search_methods'] = search_methods
-
-                except Exception as e:
-                    continue
-
-            # 결과 정렬 및 포맷팅
+            # 이력서 ID → 지원자 ID 매핑 (벡터/키워드 결과가 같은 지원자로 융합되도록)
+            resume_ids = {
+                (doc.metadata or {}).get('resume_id') or (doc.metadata or {}).get('document_id')
+                for doc in [doc for doc, _ in vector_scored] + list(keyword_docs)
+                if (doc.metadata or {}).get('chunk_type') != 'applicant'
+            }
+            resume_ids.discard(None)
+            applicant_id_by_resume = {}
+            if resume_ids:
+                owners = await applicants_collection.find(
+                    {"resume_id": {"$in": list(resume_ids)}}, {"_id": 1, "resume_id": 1}
+                ).to_list(len(resume_ids))
+                applicant_id_by_resume = {str(owner["resume_id"]): str(owner["_id"]) for owner in owners}
+
+            def key_of(doc) -> Optional[str]:
+                metadata = doc.metadata or {}
+                if metadata.get('chunk_type') == 'applicant':
+                    return str(metadata['document_id']) if metadata.get('document_id') else None
+                resume_id = metadata.get('resume_id') or metadata.get('document_id')
+                return applicant_id_by_resume.get(str(resume_id)) if resume_id else None
+
+            fused = self._fuse_docs(vector_scored, keyword_docs, key_of)
+
+            # 융합된 후보 전체를 한 번의 쿼리로 조회
+            applicant_ids = [ObjectId(entry["id"]) for entry in fused if ObjectId.is_valid(entry["id"])]
+            applicants = await applicants_collection.find(
+                {"_id": {"$in": applicant_ids}}
+            ).to_list(len(applicant_ids))
+            applicants_by_key = {str(applicant["_id"]): applicant for applicant in applicants}
+
+            # 기준 지원자 제외, 같은 지원자는 최고 순위만 유지
+            excluded_ids = {str(target_applicant.get('_id'))}
             results = []
-            for applicant_id, score_data in applicant_scores.items():
-                applicant = score_data['applicant']
-
-                # ID와 datetime 필드 처리
-                applicant["_id"] = str(applicant["_id"])
-
-                # 모든 datetime 필드를 문자열로 변환
-                for key, value in list(applicant.items()):
-                    if hasattr(value, 'isoformat'):
-                        applicant[key] = value.isoformat()
-                    elif key == "_id":
-                        applicant[key] = str(value)
+            for entry in fused:
+                applicant = applicants_by_key.get(entry["id"])
+                if not applicant or str(applicant["_id"]) in excluded_ids:
+                    continue
+                excluded_ids.add(str(applicant["_id"]))
 
+                applicant = self._serialize_document(applicant)
                 # 이름 필드 확보
                 if not applicant.get('name'):
                     applicant['name'] = '이름미상'
 
                 results.append({
-                    "final_score": score_data['final_score'],
-                    "vector_score": score_data['vector_score'],
-                    "keyword_score": score_data['keyword_score'],
+                    "final_score": entry["final_score"],
+                    "vector_score": entry["raw_scores"].get("vector", 0.0),
+                    "keyword_score": entry["raw_scores"].get("keyword", 0.0),
+                    "vector_fused_score": entry["scores"].get("vector", 0.0),
+                    "keyword_fused_score": entry["scores"].get("keyword", 0.0),
                     "applicant": applicant,
-                    "search_methods": score_data['search_methods']
+                    "search_methods": list(entry["scores"].keys())
                 })
+                if len(results) >= limit:
+                    break
 
-            # 최종 점수 기준으로 정렬
-            results.sort(key=lambda x: x["final_score"], reverse=True)
-            final_results = results[:limit]
-
-            print(f"[LangChainHybridService] 최종 결과: {len(final_results)}개 지원자")
+            print(f"[LangChainHybridService] 최종 결과: {len(results)}개 지원자 (융합: {self.score_fusion.method})")
 
             return {
                 "success": True,
                 "message": "LangChain 하이브리드 검색 완료",
                 "data": {
                     "search_method": "langchain_hybrid",
-                    "ensemble_weights": {"vector": 0.5, "keyword": 0.5},
-                    "results": final_results,
-                    "total": len(final_results),
-                    "vector_count": len(vector_docs),
+                    "ensemble_weights": self.ensemble_weights,
+                    "fusion_method": self.score_fusion.method,
+                    "results": results,
+                    "total": len(results),
+                    "vector_count": len(vector_scored),
                     "keyword_count": len(keyword_docs),
-                    "hybrid_count": len(hybrid_docs),
+                    "hybrid_count": len(fused),
                     "target_applicant": {
                         "name": target_applicant.get('name', 'N/A'),
                         "position": target_applicant.get('position', 'N/A'),
@@ -488,47 +429,12 @@ class LangChainHybridService:
             print(f"[LangChainHybridService] === 이력서 하이브리드 검색 시작 ===")
             print(f"[LangChainHybridService] 검색 쿼리: {query}")
 
-            # 1. 벡터 검색 수행
-            print(f"[LangChainHybridService] 벡터 검색 수행...")
-            vector_docs = await asyncio.to_thread(
-                self.vector_retriever.invoke,
-                query
-            )
-            print(f"[LangChainHybridService] 벡터 검색 결과: {len(vector_docs)}개")
+            # 1. 벡터 검색 + 키워드 검색 동시 수행
+            vector_scored, keyword_docs = await self._retrieve_hybrid(query, query, collection)
+            print(f"[LangChainHybridService] 벡터: {len(vector_scored)}개, 키워드: {len(keyword_docs)}개")
 
-            # 2. 키워드 검색 수행 (기존 서비스 사용)
-            print(f"[LangChainHybridService] 키워드 검색 수행...")
-            keyword_result = await self.keyword_search_service.search_by_keywords(
-                query=query,
-                collection=collection,
-                limit=10
-            )
-            keyword_docs = self._convert_keyword_results_to_docs(keyword_result)
-            print(f"[LangChainHybridService] 키워드 검색 결과: {len(keyword_docs)}개")
-
-            # 3. 수동 하이브리드 검색 (벡터 + 키워드 결합)
-            print(f"[LangChainHybridService] 수동 하이브리드 검색 수행...")
-            hybrid_docs = vector_docs + keyword_docs  # 단순 결합
-            # 중복 제거
-            seen_ids = set()
-            unique_hybrid_docs = []
-            for doc in hybrid_docs:
-                doc_id = None
-                if hasattr(doc, 'metadata') and doc.metadata:
-                    doc_id = doc.metadata.get('resume_id') or doc.metadata.get('document_id')
-                if doc_id and doc_id not in seen_ids:
-                    seen_ids.add(doc_id)
-                    unique_hybrid_docs.append(doc)
-            hybrid_docs = unique_hybrid_docs
-
-            print(f"[LangChainHybridService] 하이브리드 검색 결과: {len(hybrid_docs)}개")
-            print(f"[LangChainHybridService] 벡터: {len(vector_docs)}개, 키워드: {len(keyword_docs)}개")
-
-            # 4. 결과를 이력서 정보로 변환
-            return await self._convert_docs_to_resumes(
-                hybrid_docs, vector_docs, keyword_docs,
-                collection, limit
-            )
+            # 2. 순위 융합 후 결과를 이력서 정보로 변환
+            return await self._convert_docs_to_resumes(vector_scored, keyword_docs, collection, limit)
 
         except Exception as e:
             print(f"[LangChainHybridService] 이력서 하이브리드 검색 실패: {str(e)}")
@@ -539,112 +445,47 @@ class LangChainHybridService:
             }
 
     async def _convert_docs_to_resumes(self,
-                                     hybrid_docs: List[Document],
-                                     vector_docs: List[Document],
+                                     vector_scored: List,
                                      keyword_docs: List[Document],
                                      collection,
                                      limit: int) -> Dict[str, Any]:
         """
-        LangChain Document 객체들을 이력서 정보로 변환
+        벡터/키워드 결과를 융합하고 상위 이력서만 한 번의 조회로 가져옵니다.
         """
         try:
             print(f"[LangChainHybridService] === 문서를 이력서 정보로 변환 시작 ===")
 
-            # 문서에서 resume_id 추출하여 이력서 매핑
-            resume_scores = {}
-
-            # 하이브리드 결과 처리
-            for i, doc in enumerate(hybrid_docs):
-                try:
-                    # Document의 메타데이터에서 resume_id 추출
-                    resume_id = None
-                    if hasattr(doc, 'metadata') and doc.metadata:
-                        resume_id = doc.metadata.get('resume_id') or doc.metadata.get('document_id')
-
-                    if resume_id:
-                        # 하이브리드 점수 계산 (순위 기반)
-                        hybrid_score = max(0, (len(hybrid_docs) - i) / len(hybrid_docs))
-
-                        # 벡터/키워드 개별 점수 계산
-                        vector_score = 0
-                        keyword_score = 0
-
-                        # 벡터 결과에서 점수 찾기
-                        for v_i, v_doc in enumerate(vector_docs):
-                            v_resume_id = None
-                            if hasattr(v_doc, 'metadata') and v_doc.metadata:
-                                v_resume_id = v_doc.metadata.get('resume_id') or v_doc.metadata.get('document_id')
-                            if v_resume_id == resume_id:
-                                vector_score = max(0, (len(vector_docs) - v_i) / len(vector_docs))
-                                break
-
-                        # 키워드 결과에서 점수 찾기
-                        for k_i, k_doc in enumerate(keyword_docs):
-                            k_resume_id = None
-                            if hasattr(k_doc, 'metadata') and k_doc.metadata:
-                                k_resume_id = k_doc.metadata.get('resume_id') or k_doc.metadata.get('document_id')
-                            if k_resume_id == resume_id:
-                                keyword_score = max(0, (len(keyword_docs) - k_i) / len(keyword_docs))
-                                break
-
-                        if resume_id not in resume_scores or hybrid_score > resume_scores[resume_id]['final_score']:
-                            resume_scores[resume_id] = {
-                                'final_score': hybrid_score,
-                                'vector_score': vector_score,
-                                'keyword_score': keyword_score,
-                                'search_methods': []
-                            }
+            fused = self._fuse_docs(
+                vector_scored, keyword_docs,
+                lambda doc: (doc.metadata or {}).get('resume_id') or (doc.metadata or {}).get('document_id')
+            )[:limit]
 
-                            # 검색 방법 추가
-                            if vector_score > 0:
-                                resume_scores[resume_id]['search_methods'].append('vector')
-                            if keyword_score > 0:
-                                resume_scores[resume_id]['search_methods'].append('keyword')
+            # MongoDB에서 이력서 상세 정보 조회
+            resume_ids_obj = [ObjectId(entry["id"]) for entry in fused if ObjectId.is_valid(entry["id"])]
+            resumes = await collection.find({"_id": {"$in": resume_ids_obj}}).to_list(len(resume_ids_obj))
+            resumes_by_id = {str(resume["_id"]): resume for resume in resumes}
 
-                except Exception as e:
-                    print(f"[LangChainHybridService] 문서 {i} 처리 중 오류: {e}")
+            results = []
+            for entry in fused:
+                resume = resumes_by_id.get(entry["id"])
+                if not resume:
                     continue
 
-            # MongoDB에서 이력서 상세 정보 조회
-            from bson import ObjectId
-            resume_ids_obj = [ObjectId(rid) for rid in resume_scores.keys()]
-            resumes = await collection.find({"_id": {"$in": resume_ids_obj}}).to_list(1000)
+                resume = self._serialize_document(resume)
+                resume.setdefault("resume_id", resume["_id"])
 
-            # 결과 정렬 및 포맷팅
-            results = []
-            for resume in resumes:
-                resume_id = str(resume["_id"])
-                score_data = resume_scores.get(resume_id)
-
-                if score_data:
-                    # ID와 datetime 필드 처리
-                    resume["_id"] = str(resume["_id"])
-                    if "resume_id" in resume:
-                        resume["resume_id"] = str(resume["resume_id"])
-                    else:
-                        resume["resume_id"] = str(resume["_id"])
-
-                    # 모든 datetime 필드를 문자열로 변환
-                    for key, value in list(resume.items()):
-                        if hasattr(value, 'isoformat'):
-                            resume[key] = value.isoformat()
-                        elif key == "_id":
-                            resume[key] = str(value)
-
-                    results.append({
-                        "final_score": score_data['final_score'],
-                        "vector_score": score_data['vector_score'],
-                        "keyword_score": score_data['keyword_score'],
-                        "resume": resume,
-                        "search_methods": score_data['search_methods']
-                    })
-
-            # 최종 점수 기준으로 정렬
-            results.sort(key=lambda x: x["final_score"], reverse=True)
-            final_results = results[:limit]
-
-            print(f"[LangChainHybridService] 최종 결과: {len(final_results)}개 이력서")
-            for i, result in enumerate(final_results[:3]):
+                results.append({
+                    "final_score": entry["final_score"],
+                    "vector_score": entry["raw_scores"].get("vector", 0.0),
+                    "keyword_score": entry["raw_scores"].get("keyword", 0.0),
+                    "vector_fused_score": entry["scores"].get("vector", 0.0),
+                    "keyword_fused_score": entry["scores"].get("keyword", 0.0),
+                    "resume": resume,
+                    "search_methods": list(entry["scores"].keys())
+                })
+
+            print(f"[LangChainHybridService] 최종 결과: {len(results)}개 이력서")
+            for i, result in enumerate(results[:3]):
                 resume_name = result['resume'].get('name', '이름미상')
                 resume_position = result['resume'].get('position', 'N/A')
                 print(f"[LangChainHybridService] #{i+1}: {resume_name} ({resume_position}) "
@@ -656,12 +497,13 @@ class LangChainHybridService:
                 "message": "LangChain 하이브리드 이력서 검색 완료",
                 "data": {
                     "search_method": "langchain_hybrid_resume",
-                    "ensemble_weights": {"vector": 0.5, "keyword": 0.5},
-                    "results": final_results,
-                    "total": len(final_results),
-                    "vector_count": len(vector_docs),
+                    "ensemble_weights": self.ensemble_weights,
+                    "fusion_method": self.score_fusion.method,
+                    "results": results,
+                    "total": len(results),
+                    "vector_count": len(vector_scored),
                     "keyword_count": len(keyword_docs),
-                    "hybrid_count": len(hybrid_docs)
+                    "hybrid_count": len(fused)
                 }
             }
 
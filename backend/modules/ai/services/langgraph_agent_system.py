@@ -7,7 +7,8 @@ import asyncio
 import json
 import math
 import os
-import re
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Annotated, Any, Dict, List, Optional, TypedDict
@@ -16,6 +17,14 @@ from dotenv import load_dotenv
 from modules.core.services.openai_service import OpenAIService
 
 from .dynamic_message_generator import DynamicMessageGenerator
+from .intent_classifier import LOCAL_INTENT_TASKS, get_local_intent_classifier
+from .intent_router import (CONFIRMATION_RESPONSES, DIGITS_ONLY_PATTERN,
+                            EMOTICON_ONLY_PATTERN, EMOTION_RESPONSES,
+                            INTENT_AUTOMATON, JAMO_ONLY_PATTERN,
+                            NON_WORD_PATTERN, PUNCTUATION_ONLY_PATTERN,
+                            SALARY_PATTERN, SIMPLE_RESPONSES, SPECIAL_ONLY_PATTERN,
+                            IntentFeatures, detect_mixed_from_features,
+                            normalize_text, split_mixed_spans)
 
 # LangGraph 관련 import
 try:
@@ -64,244 +73,27 @@ class AgentState(TypedDict):
     metadata: Dict[str, Any]
 
 # 노드 함수들
-def normalize_text(text: str) -> str:
-    """텍스트 정규화"""
-    # 1. 공백 정규화
-    text = re.sub(r'\s+', ' ', text.strip())
-
-    # 2. 문장 부호 정규화
-    text = re.sub(r'[,.!?]+', '.', text)
-
-    # 3. 조사 정규화
-    text = re.sub(r'(으로|로)\s+(이동|가|보여)', r'\2', text)
-    text = re.sub(r'(을|를)\s+(보여|열어)', r'\2', text)
-
-    return text
-
 def split_mixed_intent(text: str) -> tuple[str, str]:
     """혼합 의도 문장 분리"""
-    # 1. 연결어 기반 분리
-    connectors = [
-        # 기본 연결어
-        "하고", "그리고", "다음", "후에", "이후", "다음에",
-        "그 다음", "그다음", "그리고 나서", "그러고 나서",
-
-        # 동작 연결어
-        "해주고", "알려주고", "설명하고", "분석하고", "보여주고",
-        "확인하고", "검토하고", "평가하고", "조회하고", "찾아주고",
-
-        # 시간 연결어
-        "한 후", "한 다음", "하면서", "하고나서", "이후에",
-        "다음으로", "그러고나서", "그런다음", "그리고나서",
-
-        # 목적 연결어
-        "위한", "관련", "필요한", "대한", "따른",
-        "기반", "바탕", "근거", "참고"
-    ]
-
-    # 1.1 정규식 패턴 생성
-    connector_pattern = "|".join(map(re.escape, connectors))
-    pattern = f"(.+?)({connector_pattern})\\s+(.+)"
-
-    if match := re.search(pattern, text):
-        first_part = match.group(1).strip()
-        second_part = match.group(3).strip()
-        return first_part, second_part
-
-    # 2. 문장 구조 기반 분리
-    structure_patterns = [
-        # 기본 구조
-        r"(.+?)(?:하고|해주고|알려주고|설명하고|분석하고)\s+(.+?)(?:페이지|화면|창)(?:\s+(?:보여|열어|이동|들어가))?",
-        r"(.+?)(?:방법|기준|과정|사례|팁|예시|정보|결과|피드백).*?(?:알려|설명|분석|보여).*?(?:페이지|화면|창)",
-        r"(.+?)(?:준비|최적화|스케줄링|관리).*?방법.*?(?:페이지|화면|창)",
-        r"(.+?)(?:위한|관련|필요한)\s+(.+?)(?:페이지|화면|창)",
-
-        # 확장 구조
-        r"(.+?)(?:확인|검토|평가|조회|찾기).*?(?:하고|후).*?(?:페이지|화면|창)",
-        r"(.+?)(?:정보|데이터|내용|상태).*?(?:보고|확인).*?(?:페이지|화면|창)",
-        r"(.+?)(?:작성|입력|수정|삭제).*?(?:방법|기준).*?(?:페이지|화면|창)",
-        r"(.+?)(?:처리|진행|관리|설정).*?(?:절차|순서).*?(?:페이지|화면|창)",
-
-        # 역순 구조
-        r"(?:페이지|화면|창).*?(?:보여|열어|이동).*?(?:다음|후).*?(.+?)(?:알려|설명|분석)",
-        r"(?:페이지|화면|창).*?(?:확인|검토).*?(?:하면서|하고).*?(.+?)(?:진행|처리)",
-
-        # 복합 구조
-        r"(.+?)(?:방법|기준|과정).*?(?:알려|설명).*?(?:다음|후).*?(?:페이지|화면|창)",
-        r"(.+?)(?:정보|내용).*?(?:확인|검토).*?(?:위해|필요).*?(?:페이지|화면|창)"
-    ]
-
-    for pattern in structure_patterns:
-        if match := re.search(pattern, text):
-            first_part = match.group(1).strip() if len(match.groups()) >= 1 else ""
-            second_part = match.group(2).strip() if len(match.groups()) >= 2 else text[match.end(1):].strip()
-            if first_part and second_part:
-                return first_part, second_part
-
-    # 3. 문장 부호 기반 분리
-    if "." in text or "," in text:
-        parts = re.split(r'[.,]', text)
-        if len(parts) >= 2:
-            return parts[0].strip(), parts[1].strip()
-
-    # 4. 키워드 기반 분리
-    info_keywords = ["알려줘", "설명", "분석", "확인", "검토", "평가", "조회", "찾아"]
-    action_keywords = ["페이지", "화면", "창", "이동", "열어", "보여", "들어가"]
-
-    # 정보 요청이 먼저 나오는 경우
-    for info_kw in info_keywords:
-        if info_kw in text:
-            parts = text.split(info_kw, 1)
-            if len(parts) == 2:
-                first_part = (parts[0] + info_kw).strip()
-                second_part = parts[1].strip()
-                if any(kw in second_part for kw in action_keywords):
-                    return first_part, second_part
-
-    # UI 액션이 먼저 나오는 경우
-    for action_kw in action_keywords:
-        if action_kw in text:
-            parts = text.split(action_kw, 1)
-            if len(parts) == 2:
-                first_part = parts[0].strip()
-                second_part = (action_kw + parts[1]).strip()
-                if any(kw in first_part for kw in info_keywords):
-                    return first_part, second_part
-
-    return text, ""
+    first_span, second_span = split_mixed_spans(text, INTENT_AUTOMATON.scan(text))
+    if first_span == (0, len(text)):
+        return text, ""
+    return text[first_span[0]:first_span[1]].strip(), text[second_span[0]:second_span[1]].strip()
 
 def detect_mixed_intent(text: str) -> tuple[bool, list[str], list[str], float]:
     """혼합 의도 감지 함수"""
-    # 텍스트 정규화
+    # 텍스트 정규화 후 키워드 오토마톤 1회 탐색으로 분리/판단
     text = normalize_text(text)
-
-    # 1. 문장 분리
-    first_part, second_part = split_mixed_intent(text)
-
-    # 2. 의도 키워드 체크
-    info_keywords = [
-        # 기본 질문
-        "알려줘", "설명", "분석", "확인", "검토", "평가", "조회", "찾아",
-        "어떻게", "왜", "뭐", "무엇", "어디", "언제", "누구", "방법",
-
-        # 정보 요청
-        "정보", "내용", "결과", "피드백", "데이터", "상태", "현황",
-        "기준", "과정", "사례", "팁", "예시", "방식", "절차", "순서",
-
-        # 분석 요청
-        "분석", "평가", "검토", "확인", "조회", "찾기", "비교", "측정",
-        "진단", "점검", "파악", "이해", "판단", "검사", "테스트",
-
-        # 학습/교육
-        "배우", "가르쳐", "교육", "학습", "공부", "연습", "훈련", "준비",
-        "연구", "조사", "탐구", "실습", "경험", "노하우", "스킬",
-
-        # 추가 정보 요청
-        "의미", "개념", "정의", "특징", "장단점", "차이", "비교", "관계",
-        "원리", "원칙", "규칙", "기법", "전략", "방안", "해결", "해결책",
-        "대안", "대책", "요령", "요약", "정리", "설계", "구조", "구성",
-        "흐름", "프로세스", "시스템", "메커니즘", "아키텍처", "패턴"
-    ]
-
-    action_keywords = [
-        # 기본 액션
-        "페이지", "화면", "창", "이동", "열어", "보여", "들어가", "접속",
-        "확인", "돌아가", "닫아", "새로고침", "클릭", "선택", "입력",
-
-        # UI 조작
-        "저장", "삭제", "수정", "변경", "추가", "제거", "업데이트",
-        "등록", "취소", "확인", "적용", "실행", "처리", "완료",
-
-        # 네비게이션
-        "이전", "다음", "처음", "마지막", "위", "아래", "좌", "우",
-        "앞", "뒤", "메인", "홈", "대시보드", "목록", "상세",
-
-        # 특수 액션
-        "새로고침", "리로드", "초기화", "리셋", "되돌리기", "복원",
-        "확대", "축소", "정렬", "필터", "검색", "출력", "다운로드",
-
-        # 추가 UI 액션
-        "보기", "뷰", "탭", "메뉴", "버튼", "링크", "폼", "입력창",
-        "체크박스", "라디오", "드롭다운", "리스트", "테이블", "그리드",
-        "차트", "그래프", "다이어그램", "이미지", "아이콘", "로고"
-    ]
-
-    # 3. 각 부분의 의도 분석
-    first_info = any(kw in first_part for kw in info_keywords)
-    first_action = any(kw in first_part for kw in action_keywords)
-    second_info = any(kw in second_part for kw in info_keywords)
-    second_action = any(kw in second_part for kw in action_keywords)
-
-    # 4. 혼합 의도 판단
-    if first_info and second_action:
-        # 정보 요청 → UI 액션 패턴
-        if any(kw in first_part for kw in ["방법", "과정", "절차", "기준", "예시"]):
-            # 설명 후 관련 페이지로 이동하는 패턴
-            if any(kw in second_part for kw in ["페이지", "화면", "창"]):
-                return True, ["info_request", "ui_action"], [first_part, second_part], 0.95
-        return True, ["info_request", "ui_action"], [first_part, second_part], 0.9
-    elif first_action and second_info:
-        # UI 액션 → 정보 요청 패턴
-        if any(kw in first_part for kw in ["페이지", "화면", "창"]):
-            # 특정 페이지에서 정보를 확인하는 패턴
-            if any(kw in second_part for kw in ["확인", "검토", "분석"]):
-                return True, ["ui_action", "info_request"], [first_part, second_part], 0.95
-        return True, ["ui_action", "info_request"], [first_part, second_part], 0.9
-    elif first_info and second_info:
-        # 정보 요청 → 정보 요청 패턴
-        if any(kw in second_part for kw in ["페이지", "화면", "창", "보기", "뷰"]):
-            # 두 번째 부분이 UI 관련 정보를 요청하는 패턴
-            return True, ["info_request", "ui_action"], [first_part, second_part], 0.85
-        # 연속된 정보 요청 패턴
-        if any(kw in first_part for kw in ["먼저", "우선", "처음"]):
-            return True, ["info_request", "info_request"], [first_part, second_part], 0.9
-        return True, ["info_request", "info_request"], [first_part, second_part], 0.8
-    elif first_action and second_action:
-        # UI 액션 → UI 액션 패턴
-        if any(kw in first_part for kw in ["정보", "내용", "결과", "데이터"]):
-            # 첫 번째 부분이 정보 관련 UI를 요청하는 패턴
-            return True, ["info_request", "ui_action"], [first_part, second_part], 0.85
-        # 연속된 UI 액션 패턴
-        if any(kw in first_part for kw in ["먼저", "우선", "처음"]):
-            return True, ["ui_action", "ui_action"], [first_part, second_part], 0.9
-        return True, ["ui_action", "ui_action"], [first_part, second_part], 0.8
-
-    # 5. 연결 패턴 감지
-    connection_patterns = [
-        # 기본 패턴
-        r"(.+?)하고\s+(.+?)해줘",
-        r"(.+?)알려주고\s+(.+?)로\s+이동",
-        r"(.+?)설명하고\s+(.+?)보여줘",
-        r"(.+?)분석해주고\s+(.+?)페이지",
-        r"(.+?)하고\s+(.+?)페이지",
-        r"(.+?)해주고\s+(.+?)화면",
-
-        # 추가 패턴
-        r"(.+?)알려주고\s+(.+?)보여줘",
-        r"(.+?)설명해주고\s+(.+?)이동",
-        r"(.+?)방법\s+알려주고\s+(.+?)페이지",
-        r"(.+?)기준\s+설명하고\s+(.+?)화면",
-        r"(.+?)정보\s+알려주고\s+(.+?)페이지",
-        r"(.+?)분석하고\s+(.+?)보여줘",
-        r"(.+?)결과\s+설명하고\s+(.+?)페이지",
-        r"(.+?)피드백\s+해주고\s+(.+?)이동",
-        r"(.+?)과정\s+설명하고\s+(.+?)보여줘",
-        r"(.+?)사례\s+알려주고\s+(.+?)페이지",
-        r"(.+?)방법\s+설명하고\s+(.+?)열어줘",
-        r"(.+?)기준\s+알려주고\s+(.+?)이동",
-        r"(.+?)팁\s+알려주고\s+(.+?)페이지"
-    ]
-
-    # 기본 반환값
-    return False, [], [], 0.0
+    return detect_mixed_from_features(text, INTENT_AUTOMATON.scan(text))
 
 async def intent_detection_node(state: AgentState) -> AgentState:
     """의도 분류 노드"""
     try:
         user_input = state["user_input"].lower()
+        features = IntentFeatures(user_input)
 
         # 1. 혼합 의도 감지
-        is_mixed, sub_intents, parts, confidence = detect_mixed_intent(user_input)
+        is_mixed, sub_intents, parts, confidence = features.mixed
         if is_mixed:
             state["intent"] = "mixed"
             state["sub_intents"] = sub_intents
@@ -309,19 +101,19 @@ async def intent_detection_node(state: AgentState) -> AgentState:
             state["confidence"] = confidence
             return state
 
-        # 2. 키워드 기반 빠른 분류
-        info_keywords = ["알려줘", "설명", "어떻게", "왜", "뭐", "무엇", "어디", "언제", "누구", "방법", "어떤", "어느", "가르쳐", "궁금", "분석"]
-        action_keywords = ["열어줘", "이동", "보여줘", "클릭", "선택", "입력", "변경", "저장", "삭제", "추가", "페이지", "화면", "들어가"]
+        # 2. 키워드 기반 빠른 분류 (혼합 의도 감지와 같은 탐색 결과 사용)
+        has_info = features.has("quick_info")
+        has_action = features.has("quick_action")
 
         # 명확한 키워드 매칭
-        if any(keyword in user_input for keyword in info_keywords):
-            if not any(keyword in user_input for keyword in action_keywords):
+        if has_info:
+            if not has_action:
                 state["intent"] = "info_request"
                 state["confidence"] = 0.9
                 return state
 
-        if any(keyword in user_input for keyword in action_keywords):
-            if not any(keyword in user_input for keyword in info_keywords):
+        if has_action:
+            if not has_info:
                 state["intent"] = "ui_action"
                 state["confidence"] = 0.9
                 return state
@@ -575,7 +367,7 @@ def calculator_node(state: AgentState) -> AgentState:
         # 수식 계산
         if "연봉" in user_input and "월급" in user_input:
             # 연봉에서 월급 계산
-            salary_match = re.search(r'(\d+)만원', user_input)
+            salary_match = SALARY_PATTERN.search(user_input)
             if salary_match:
                 annual_salary = int(salary_match.group(1))
                 monthly_salary = annual_salary // 12
@@ -897,7 +689,7 @@ def analyze_intent_parts(text: str, context: dict = None) -> tuple[str, str, flo
         return "ui_action", text, confidence
     elif response_type == "mixed":
         # 혼합 의도 감지
-        is_mixed, intents, parts = detect_mixed_intent(text)
+        is_mixed, intents, parts, _ = detect_mixed_intent(text)
         if is_mixed:
             # 각 부분의 의도 분석
             first_type, first_conf = get_response_type(parts[0], context)
@@ -928,15 +720,14 @@ def analyze_intent_parts(text: str, context: dict = None) -> tuple[str, str, flo
                 # 이전 의도가 있는 경우
                 if last_intent in ["info_request", "ui_action"]:
                     # 이전 액션이 있고 현재 입력이 관련 키워드를 포함하는 경우
+                    features = INTENT_AUTOMATON.scan(text)
                     if last_action:
-                        action_keywords = ["다시", "취소", "확인", "저장", "삭제", "수정", "이전", "다음"]
-                        if any(kw in text for kw in action_keywords):
+                        if features.has("context_action"):
                             return "ui_action", text, 0.8
 
                     # 이전 주제가 있고 현재 입력이 관련 키워드를 포함하는 경우
                     if last_topic:
-                        topic_keywords = ["그거", "이거", "저거", "그것", "이것", "저것", "그", "이", "저"]
-                        if any(kw in text for kw in topic_keywords):
+                        if features.has("context_topic"):
                             return last_intent, text, 0.7  # 이전 의도 유지
 
         # 기본적으로 혼합 의도로 처리
@@ -1121,77 +912,11 @@ def get_conversation_context(state: AgentState) -> dict:
 
 def get_intent_keywords(text: str) -> tuple[bool, bool]:
     """의도 관련 키워드 체크"""
-    # 1. 정보 요청 키워드
-    info_keywords = [
-        "알려줘", "설명", "어떻게", "왜", "뭐", "무엇", "어디", "언제", "누구", "방법",
-        "어떤", "어느", "가르쳐", "궁금", "분석", "평가", "확인", "찾아", "검색"
-    ]
-
-    # 2. UI 액션 키워드
-    action_keywords = [
-        "열어줘", "이동", "보여줘", "클릭", "선택", "입력", "변경", "저장", "삭제", "추가",
-        "페이지", "화면", "창", "들어가", "접속", "확인", "돌아가", "닫아", "새로고침"
-    ]
-
-    has_info = any(keyword in text for keyword in info_keywords)
-    has_action = any(keyword in text for keyword in action_keywords)
-
-    return has_info, has_action
+    features = INTENT_AUTOMATON.scan(text)
+    return features.has("intent_info"), features.has("intent_action")
 
 def get_response_type(text: str, context: dict = None) -> tuple[str, float]:
     """응답 유형 판단"""
-    # 1. 기본 응답
-    simple_responses = {
-        # 긍정
-        "네": "confirm", "응": "confirm", "어": "confirm", "그래": "confirm",
-        "ㅇㅇ": "confirm", "좋아": "confirm", "알겠어": "confirm", "괜찮아": "confirm",
-        "yes": "confirm", "ok": "confirm", "y": "confirm", "ㅇ": "confirm",
-
-        # 부정
-        "아니": "deny", "ㄴㄴ": "deny", "싫어": "deny", "no": "deny", "n": "deny",
-        "ㄴ": "deny", "아뇨": "deny", "아니오": "deny",
-
-        # 모름/불확실
-        "모르겠어": "unknown", "글쎄": "unknown", "잘모르겠어": "unknown",
-        "maybe": "unknown", "아마도": "unknown", "글쎄요": "unknown"
-    }
-
-    # 2. 감정 표현
-    emotion_responses = {
-        # 긍정적
-        "ㅋㅋ": "laugh", "ㅎㅎ": "laugh", "^^": "happy", "😊": "happy",
-        "ㅋ": "laugh", "ㅎ": "laugh", "😄": "laugh", "😆": "laugh",
-        "ㅋㅋㅋ": "laugh", "ㅎㅎㅎ": "laugh", "ㅋㅋㅋㅋ": "laugh", "ㅎㅎㅎㅎ": "laugh",
-
-        # 부정적
-        "ㅠㅠ": "sad", "ㅜㅜ": "sad", "ㅡㅡ": "annoyed", "😢": "sad",
-        "ㅠ": "sad", "ㅜ": "sad", "😭": "sad", "😤": "annoyed",
-        "ㅠㅠㅠ": "sad", "ㅜㅜㅜ": "sad", "ㅠㅠㅠㅠ": "sad", "ㅜㅜㅜㅜ": "sad",
-
-        # 놀람/혼란
-        "헐": "surprise", "와": "surprise", "오": "surprise", "아": "surprise",
-        "엥": "confusion", "헉": "surprise", "😮": "surprise", "😲": "surprise",
-        "헐~": "surprise", "와~": "surprise", "오~": "surprise", "아~": "surprise"
-    }
-
-    # 3. 단순 긍정/부정
-    confirmation_responses = {
-        # 긍정
-        "좋습니다": "confirm", "알겠습니다": "confirm", "그렇습니다": "confirm",
-        "맞습니다": "confirm", "동의합니다": "confirm", "네맞아요": "confirm",
-        "좋아요": "confirm", "알겠어요": "confirm", "그래요": "confirm",
-
-        # 부정
-        "싫습니다": "deny", "아닙니다": "deny", "그렇지않습니다": "deny",
-        "아니요": "deny", "반대합니다": "deny", "아니에요": "deny",
-        "싫어요": "deny", "아니예요": "deny", "그렇지않아요": "deny",
-
-        # 모름/불확실
-        "모르겠습니다": "unknown", "잘모르겠습니다": "unknown",
-        "글쎄요": "unknown", "애매합니다": "unknown",
-        "모르겠어요": "unknown", "잘모르겠어요": "unknown"
-    }
-
     text = text.strip().lower()
 
     # 1. 빈 입력 체크
@@ -1201,7 +926,7 @@ def get_response_type(text: str, context: dict = None) -> tuple[str, float]:
         return "empty", 1.0
 
     # 2. 정규식 패턴
-    if re.match(r'^[ㄱ-ㅎㅏ-ㅣ]+$', text):  # 자음/모음만
+    if JAMO_ONLY_PATTERN.match(text):  # 자음/모음만
         if context and context.get("last_intent"):
             # 자음/모음이 긍정/부정을 나타내는 경우
             if text in ["ㅇ", "ㄴ"]:
@@ -1213,7 +938,7 @@ def get_response_type(text: str, context: dict = None) -> tuple[str, float]:
             return context["last_intent"], 0.6  # 이전 의도 유지 (매우 낮은 신뢰도)
         return "incomplete", 1.0
 
-    if re.match(r'^[!?.]+$', text):  # 문장부호만
+    if PUNCTUATION_ONLY_PATTERN.match(text):  # 문장부호만
         if "?" in text:  # 물음표는 정보 요청일 가능성이 높음
             if context and context.get("last_intent") == "info_request":
                 return "info_request", 0.8  # 이전 정보 요청 의도 유지
@@ -1224,7 +949,7 @@ def get_response_type(text: str, context: dict = None) -> tuple[str, float]:
             return "ui_action", 0.7
         return "punctuation", 1.0
 
-    if re.match(r'^[ㅋㅎㅠㅜ]+$', text):  # 이모티콘
+    if EMOTICON_ONLY_PATTERN.match(text):  # 이모티콘
         if context and context.get("last_intent"):
             # 이모티콘이 긍정/부정을 나타내는 경우
             if text.startswith("ㅋ") or text.startswith("ㅎ"):
@@ -1240,7 +965,7 @@ def get_response_type(text: str, context: dict = None) -> tuple[str, float]:
             return context["last_intent"], 0.7  # 이전 의도 유지 (낮은 신뢰도)
         return "emotion", 1.0
 
-    if re.match(r'^\d+$', text):  # 숫자만
+    if DIGITS_ONLY_PATTERN.match(text):  # 숫자만
         if context:
             if context.get("last_intent") == "calc":
                 return "calc", 0.9  # 계산 의도 유지 (높은 신뢰도)
@@ -1252,7 +977,7 @@ def get_response_type(text: str, context: dict = None) -> tuple[str, float]:
                 return context["last_intent"], 0.7  # 이전 의도 유지 (낮은 신뢰도)
         return "number", 1.0
 
-    if re.match(r'^[!@#$%^&*()_+=\-\[\]{}|\\:;"\'<>,.?/~`]+$', text):  # 특수문자만
+    if SPECIAL_ONLY_PATTERN.match(text):  # 특수문자만
         if context and context.get("last_intent"):
             # 특수문자가 긍정/부정을 나타내는 경우
             if text in ["!", "?", ".."]:
@@ -1263,13 +988,14 @@ def get_response_type(text: str, context: dict = None) -> tuple[str, float]:
             return context["last_intent"], 0.6  # 이전 의도 유지 (매우 낮은 신뢰도)
         return "special", 1.0
 
-    # 3. 혼합 의도 체크
-    is_mixed, intents, parts, confidence = detect_mixed_intent(text)
+    # 3. 혼합 의도 체크 (원문/정규화 텍스트를 각각 한 번만 탐색해 이후 키워드 체크에 재사용)
+    features = IntentFeatures(text)
+    is_mixed, intents, parts, confidence = features.mixed
     if is_mixed:
         return "mixed", confidence
 
     # 4. 의도 키워드 체크
-    has_info, has_action = get_intent_keywords(text)
+    has_info, has_action = features.has("intent_info"), features.has("intent_action")
     if has_info and has_action:
         return "mixed", 0.8
     elif has_info:
@@ -1278,8 +1004,8 @@ def get_response_type(text: str, context: dict = None) -> tuple[str, float]:
         return "ui_action", 0.9
 
     # 5. 단순 응답 체크
-    if text in simple_responses:
-        response_type = simple_responses[text]
+    if text in SIMPLE_RESPONSES:
+        response_type = SIMPLE_RESPONSES[text]
         # 이전 의도가 있는 경우
         if context and context.get("last_intent"):
             last_intent = context["last_intent"]
@@ -1291,8 +1017,8 @@ def get_response_type(text: str, context: dict = None) -> tuple[str, float]:
                 return last_intent, 0.7  # 이전 의도 유지 (낮은 신뢰도)
         return response_type, 1.0
 
-    if text in emotion_responses:
-        response_type = emotion_responses[text]
+    if text in EMOTION_RESPONSES:
+        response_type = EMOTION_RESPONSES[text]
         # 이전 의도가 있는 경우
         if context and context.get("last_intent"):
             last_intent = context["last_intent"]
@@ -1304,8 +1030,8 @@ def get_response_type(text: str, context: dict = None) -> tuple[str, float]:
                 return last_intent, 0.6  # 이전 의도 유지 (매우 낮은 신뢰도)
         return response_type, 1.0
 
-    if text in confirmation_responses:
-        response_type = confirmation_responses[text]
+    if text in CONFIRMATION_RESPONSES:
+        response_type = CONFIRMATION_RESPONSES[text]
         # 이전 의도가 있는 경우
         if context and context.get("last_intent"):
             last_intent = context["last_intent"]
@@ -1339,45 +1065,12 @@ def get_response_type(text: str, context: dict = None) -> tuple[str, float]:
 
         # 이전 액션이 있고 현재 입력이 관련 키워드를 포함하는 경우
         if last_action:
-            action_keywords = [
-                # 기본 액션
-                "다시", "취소", "확인", "저장", "삭제", "수정", "이전", "다음",
-
-                # UI 조작
-                "실행", "적용", "처리", "완료", "중단", "재시작", "새로고침",
-
-                # 네비게이션
-                "뒤로", "앞으로", "처음으로", "마지막으로", "위로", "아래로",
-
-                # 특수 액션
-                "되돌리기", "복원", "초기화", "리셋", "업데이트", "동기화",
-
-                # 추가 액션
-                "선택", "입력", "클릭", "체크", "해제", "닫기", "열기",
-                "추가", "제거", "변경", "이동", "보기", "숨기기", "표시"
-            ]
-            if any(kw in text for kw in action_keywords):
+            if features.has("followup_action"):
                 return "ui_action", 0.8
 
         # 이전 주제가 있고 현재 입력이 관련 키워드를 포함하는 경우
         if last_topic:
-            topic_keywords = [
-                # 지시대명사
-                "그거", "이거", "저거", "그것", "이것", "저것", "그", "이", "저",
-
-                # 연결어
-                "그래서", "그러면", "그렇다면", "그럼", "그리고", "그런데",
-                "그러니까", "그래도", "그러다가", "그러고", "그리하여",
-
-                # 지시부사
-                "거기", "여기", "저기", "그곳", "이곳", "저곳",
-                "그쪽", "이쪽", "저쪽", "그리", "이리", "저리",
-
-                # 시간 관련
-                "그때", "이때", "저때", "그동안", "이제", "아까",
-                "방금", "조금전", "이전", "다음", "이후", "그후"
-            ]
-            if any(kw in text for kw in topic_keywords):
+            if features.has("topic"):
                 if last_confidence >= 0.8:
                     return last_intent, 0.7  # 이전 의도 유지 (낮은 신뢰도)
                 return last_intent, 0.6  # 이전 의도 유지 (매우 낮은 신뢰도)
@@ -1424,7 +1117,7 @@ def is_valid_input(text: str) -> bool:
         return False
 
     # 2. 특수문자/이모지만 있는 경우 체크
-    text_clean = re.sub(r'[^\w\s]', '', text)
+    text_clean = NON_WORD_PATTERN.sub('', text)
     if not text_clean:
         return False
 
@@ -1562,31 +1255,137 @@ def create_langgraph_workflow():
     return workflow.compile()
 
 
+class LangGraphWorkflowRegistry:
+    """워커(프로세스)당 하나씩 두는 LangGraph 워크플로우 레지스트리
+
+    그래프는 이름별로 한 번만 컴파일하고, LLM 클라이언트/Mongo 핸들 같은 의존성은
+    warm_up() 에서 미리 준비합니다. 요청마다 생성되는 것은 new_state() 의 가벼운 상태 dict 뿐입니다.
+    """
+
+    def __init__(self):
+        self._builders = {"agent": create_langgraph_workflow}
+        self._workflows: Dict[str, Any] = {}
+        self._compile_lock = threading.Lock()
+        self._db = None
+        self.timings: Dict[str, float] = {}
+        self.warmed_up = False
+
+    def register(self, name: str, builder) -> None:
+        """워크플로우 빌더 등록 (컴파일은 처음 요청될 때 1회)"""
+        self._builders[name] = builder
+
+    def get_workflow(self, name: str = "agent"):
+        """컴파일된 워크플로우 반환 (없으면 컴파일 후 캐시)"""
+        workflow = self._workflows.get(name)
+        if workflow is not None:
+            return workflow
+
+        with self._compile_lock:
+            if name not in self._workflows:
+                started = time.perf_counter()
+                self._workflows[name] = self._builders[name]()
+                self.timings[f"compile_{name}_ms"] = round((time.perf_counter() - started) * 1000, 2)
+                print(f"[LangGraph] 워크플로우 컴파일 완료: {name} ({self.timings[f'compile_{name}_ms']}ms)")
+        return self._workflows[name]
+
+    def set_database(self, db) -> None:
+        """앱이 이미 연 Mongo 데이터베이스 핸들 주입 (별도 클라이언트/커넥션 풀을 만들지 않음)"""
+        self._db = db
+
+    def get_database(self):
+        """워커 공용 Mongo 데이터베이스 핸들 (주입되지 않았으면 공용 MongoService 사용)"""
+        if self._db is None:
+            from modules.core.services.mongo_service import get_shared_mongo_service
+            self._db = get_shared_mongo_service().db
+        return self._db
+
+    @property
+    def llm_service(self):
+        return llm_service
+
+    async def warm_up(self) -> Dict[str, Any]:
+        """모든 워크플로우 컴파일 + 의존성 준비 후 단계별 소요 시간 보고"""
+        if LANGGRAPH_AVAILABLE:
+            for name in self._builders:
+                self.get_workflow(name)
+
+        started = time.perf_counter()
+        llm_mode = llm_service.warm_up() if llm_service else None
+        self.timings["warm_llm_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+        started = time.perf_counter()
+        try:
+            await self.get_database().command("ping")
+            mongo_ready = True
+        except Exception as e:
+            print(f"[LangGraph] Mongo 워밍업 실패: {e}")
+            mongo_ready = False
+        self.timings["warm_mongo_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+        # 의도 라우팅 오토마톤/정규식 첫 실행
+        started = time.perf_counter()
+        get_response_type("채용 공고 작성 방법 알려주고 채용 페이지로 이동해줘")
+        self.timings["warm_intent_router_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+        # 로컬 의도 분류 모델 로드 (저장본이 없거나 예시가 바뀌었으면 학습)
+        started = time.perf_counter()
+        await asyncio.to_thread(lambda: [get_local_intent_classifier(task) for task in LOCAL_INTENT_TASKS])
+        self.timings["warm_intent_classifier_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+        self.warmed_up = True
+        report = {
+            "workflows": list(self._workflows),
+            "llm": llm_mode,
+            "mongo_ready": mongo_ready,
+            "timings": dict(self.timings)
+        }
+        print(f"[LangGraph] 워밍업 완료: {report}")
+        return report
+
+    @staticmethod
+    def new_state(user_input: str, conversation_history: List[Dict[str, str]] = None) -> AgentState:
+        """요청별 초기 상태"""
+        return AgentState(
+            user_input=user_input,
+            conversation_history=conversation_history or [],
+            intent="",
+            tool_result="",
+            final_response="",
+            error="",
+            current_node="",
+            next_node="",
+            metadata={}
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workflows": list(self._workflows),
+            "warmed_up": self.warmed_up,
+            "timings": dict(self.timings)
+        }
+
+
+# 워커 공용 레지스트리
+langgraph_workflow_registry = LangGraphWorkflowRegistry()
+
+
 class LangGraphAgentSystem:
     """LangGraph 기반 Agent 시스템"""
 
-    def __init__(self):
+    def __init__(self, registry: LangGraphWorkflowRegistry = None):
         if not LANGGRAPH_AVAILABLE:
             raise ImportError("LangGraph 라이브러리가 설치되지 않았습니다.")
 
-        self.workflow = create_langgraph_workflow()
+        # 컴파일된 그래프는 레지스트리에서 공유 (인스턴스마다 다시 컴파일하지 않음)
+        self.registry = registry or langgraph_workflow_registry
+        self.workflow = self.registry.get_workflow("agent")
         print("✅ LangGraph Agent 시스템 초기화 완료")
 
     async def process_request(self, user_input: str, conversation_history: List[Dict[str, str]] = None) -> Dict[str, Any]:
         """사용자 요청을 처리하고 결과를 반환합니다."""
         try:
             # 초기 상태 설정
-            initial_state = AgentState(
-                user_input=user_input,
-                conversation_history=conversation_history or [],
-                intent="",
-                tool_result="",
-                final_response="",
-                error="",
-                current_node="",
-                next_node="",
-                metadata={}
-            )
+            initial_state = self.registry.new_state(user_input, conversation_history)
 
             # 워크플로우 실행
             result = await self.workflow.ainvoke(initial_state)
@@ -1631,9 +1430,11 @@ class LangGraphAgentSystem:
 langgraph_agent_system = None
 
 def initialize_langgraph_system():
-    """LangGraph 시스템 초기화"""
+    """LangGraph 시스템 초기화 (이미 초기화되어 있으면 재사용)"""
     global langgraph_agent_system
     try:
+        if langgraph_agent_system is not None:
+            return True
         if LANGGRAPH_AVAILABLE:
             langgraph_agent_system = LangGraphAgentSystem()
             print("✅ LangGraph Agent 시스템 초기화 성공")
@@ -1645,5 +1446,10 @@ def initialize_langgraph_system():
         print(f"❌ LangGraph 시스템 초기화 실패: {e}")
         return False
 
+def get_langgraph_agent_system() -> Optional[LangGraphAgentSystem]:
+    """워커 공용 LangGraph Agent 시스템 (초기화 실패 시 None)"""
+    initialize_langgraph_system()
+    return langgraph_agent_system
+
 # 시스템 초기화
 initialize_langgraph_system()
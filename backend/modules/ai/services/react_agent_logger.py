@@ -6,12 +6,15 @@ ReAct 에이전트 진행상황 시각화 로거
 import asyncio
 import json
 import logging
+import os
 import time
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from modules.core.services.structured_logging import configure_logging, log_event
+
 logger = logging.getLogger(__name__)
 
 class LogLevel(Enum):
@@ -33,36 +36,36 @@ class LogEntry:
     details: Dict[str, Any] = None
     duration: float = 0.0
 
+# LogLevel → 표준 logging 레벨
+_LOGGING_LEVELS = {
+    "INFO": logging.INFO,
+    "SUCCESS": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "DEBUG": logging.DEBUG
+}
+
 class ReActAgentLogger:
-    """ReAct 에이전트 진행상황 로거"""
+    """ReAct 에이전트 진행상황 로거
 
-    def __init__(self, task_id: str = None):
+    각 엔트리는 구조화 필드(task_id, step, phase, duration, details)를 가진 로그 레코드로
+    큐 기반 핸들러에 넘깁니다. 이모지/색상 콘솔 출력은 pretty=True (또는 LOG_PRETTY=true) 일 때만 합니다.
+    """
+
+    def __init__(self, task_id: str = None, pretty: Optional[bool] = None):
         self.task_id = task_id or f"task_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.logs: List[LogEntry] = []
         self.current_step = 0
         self.start_time = time.time()
         self.phase_start_time = time.time()
+        self.pretty = pretty if pretty is not None else os.getenv("LOG_PRETTY", "false").lower() == "true"
 
         # 로그 포맷터 설정
         self.setup_logger()
 
     def setup_logger(self):
-        """로거 설정"""
-        # 기존 핸들러 제거
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-
-        # 포맷터 설정
-        formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)s | %(message)s',
-            datefmt='%H:%M:%S'
-        )
-
-        # 콘솔 핸들러
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-        logger.setLevel(logging.INFO)
+        """로거 설정 - 루트 로거의 비동기 큐 핸들러 사용 (이미 설정되어 있으면 그대로)"""
+        configure_logging()
 
     def log(self, level: LogLevel, phase: str, message: str, details: Dict[str, Any] = None):
         """로그 추가"""
@@ -81,14 +84,24 @@ class ReActAgentLogger:
 
         self.logs.append(entry)
 
-        # 콘솔에 출력
-        self._print_log_entry(entry)
+        if self.pretty:
+            self._print_log_entry(entry)
+        else:
+            # 레벨이 꺼져 있으면 필드 구성/직렬화 비용 없음
+            log_event(logger, _LOGGING_LEVELS.get(entry.level, logging.INFO), entry.message, fields={
+                "task_id": self.task_id,
+                "agent_level": entry.level,
+                "step": entry.step,
+                "phase": entry.phase,
+                "duration": round(entry.duration, 4),
+                "details": entry.details
+            })
 
         # 다음 단계를 위한 시간 초기화
         self.phase_start_time = current_time
 
     def _print_log_entry(self, entry: LogEntry):
-        """로그 엔트리를 콘솔에 출력"""
+        """로그 엔트리를 콘솔에 출력 (pretty 모드 전용)"""
         # 단계별 색상 및 아이콘
         phase_icons = {
             "reasoning": "🧠",
@@ -212,13 +225,14 @@ class VisualReActAgent:
     async def process_task_with_visual_logging(self, user_goal: str, initial_context: Dict[str, Any] = None) -> Dict[str, Any]:
         """시각적 로깅과 함께 작업 처리"""
 
-        # 시작 메시지
-        print("🚀" + "="*80)
-        print(f"🤖 ReAct 에이전트 작업 시작")
-        print(f"📋 목표: {user_goal}")
-        print(f"⏰ 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*82)
-        print()
+        # 시작 메시지 (pretty 모드 전용)
+        if self.logger.pretty:
+            print("🚀" + "="*80)
+            print(f"🤖 ReAct 에이전트 작업 시작")
+            print(f"📋 목표: {user_goal}")
+            print(f"⏰ 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            print("="*82)
+            print()
 
         self.logger.log(LogLevel.INFO, "reasoning", f"작업 시작: {user_goal}", {
             "goal": user_goal,
@@ -517,6 +531,9 @@ class VisualReActAgent:
     def _print_summary(self):
         """요약 정보 출력"""
         summary = self.logger.get_summary()
+        if not self.logger.pretty:
+            log_event(logger, logging.INFO, "작업 요약", fields={"summary": summary})
+            return
 
         print("📊" + "="*80)
         print("📈 작업 요약")
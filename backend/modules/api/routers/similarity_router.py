@@ -17,6 +17,7 @@ from ...core.services.keyword_search_service import KeywordSearchService
 from ...core.services.llm_service import LLMService
 from ...core.services.similarity_service import SimilarityService
 from ...core.services.vector_service import VectorService
+from ...token_monitor import AdmissionRejected
 
 router = APIRouter(prefix="/similarity", tags=["similarity"])
 
@@ -103,6 +104,8 @@ async def check_plagiarism(
             analyzed_at=datetime.fromisoformat(plagiarism_analysis["analyzed_at"])
         )
 
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"표절 검사 중 오류가 발생했습니다: {str(e)}")
 
@@ -189,6 +192,8 @@ async def search_similar_documents(
             execution_time=execution_time
         )
 
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"검색 중 오류가 발생했습니다: {str(e)}")
 
@@ -273,6 +278,8 @@ async def batch_similarity_check(
                     "above_threshold": any(doc.get("similarity_score", 0) >= similarity_threshold for doc in result.get("similar_documents", []))
                 })
 
+            except AdmissionRejected:
+                raise
             except Exception as e:
                 results.append({
                     "document_id": doc_id,
@@ -292,6 +299,8 @@ async def batch_similarity_check(
             "processed_at": datetime.now().isoformat()
         }
 
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"배치 검사 중 오류가 발생했습니다: {str(e)}")
 
@@ -57,6 +57,7 @@ class Settings(BaseSettings):
     # 검색 가중치 설정
     vector_search_weight: float = float(os.getenv("VECTOR_SEARCH_WEIGHT", "0.5"))
     keyword_search_weight: float = float(os.getenv("KEYWORD_SEARCH_WEIGHT", "0.5"))
+    search_fusion_method: str = os.getenv("SEARCH_FUSION_METHOD", "rrf")  # rrf / minmax / zscore
 
     # 필드별 유사도 임계값
     field_thresholds: dict = {
@@ -74,6 +75,8 @@ class Settings(BaseSettings):
     max_concurrent_requests: int = int(os.getenv("MAX_CONCURRENT_REQUESTS", "10"))
     request_timeout: int = int(os.getenv("REQUEST_TIMEOUT", "30"))
     cache_ttl: int = int(os.getenv("CACHE_TTL", "3600"))  # 1시간
+    embedding_batch_size: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "100"))  # 임베딩 API 1회 입력 수
+    embedding_requests_per_minute: int = int(os.getenv("EMBEDDING_REQUESTS_PER_MINUTE", "500"))
 
     # 하이브리드 로딩 설정
     fast_startup: bool = os.getenv("FAST_STARTUP", "false").lower() == "true"
@@ -0,0 +1,180 @@
+"""
+비동기 실행 계층
+
+- BackgroundEventLoop: 전용 스레드에서 도는 이벤트 루프 1개. 동기 코드가 코루틴 결과를 받아야 할 때
+  요청마다 새 루프를 만들지 않고 이 루프에 제출합니다 (run_sync).
+- SlowCallbackMonitor: 디버그 모드에서 메인 루프가 임계값 이상 막히면 막힌 지점의 스택을 기록합니다.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Awaitable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SLOW_CALLBACK_THRESHOLD = float(os.getenv("ASYNCIO_SLOW_CALLBACK_SECONDS", "0.1"))
+
+
+class BackgroundEventLoop:
+    """동기 래퍼용 전용 이벤트 루프 스레드 (프로세스당 1개, 첫 사용 시 시작)"""
+
+    def __init__(self, name: str = "background-event-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    ready = threading.Event()
+
+                    def run():
+                        asyncio.set_event_loop(loop)
+                        loop.call_soon(ready.set)
+                        loop.run_forever()
+
+                    self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+                    self._thread.start()
+                    ready.wait()
+                    self._loop = loop
+        return self._loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """코루틴을 전용 루프에서 실행하고 결과를 기다림"""
+        if self.in_loop_thread():
+            raise RuntimeError("백그라운드 루프 스레드 안에서는 run_sync 대신 await 를 사용하세요")
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # 동작은 하지만 호출한 루프가 결과를 기다리는 동안 멈춤 → async 변형을 써야 하는 호출부
+            logger.warning("실행 중인 이벤트 루프에서 동기 래퍼 호출: %s",
+                           getattr(coro, "__qualname__", coro), stack_info=True)
+        return self.submit(coro).result(timeout)
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._loop is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+
+background_loop = BackgroundEventLoop()
+
+
+def run_sync(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """동기 코드에서 코루틴 실행 (새 이벤트 루프를 만들지 않음)"""
+    return background_loop.run(coro, timeout)
+
+
+class SlowCallbackMonitor:
+    """이벤트 루프 블로킹 감지기
+
+    asyncio 디버그 모드의 slow_callback_duration 경고에 더해, 감시 스레드가 루프의 하트비트가
+    임계값 이상 늦어지면 그 순간 루프 스레드의 스택을 잡아 기록합니다.
+    (디버그 모드 경고는 끝난 뒤에 핸들만 알려주므로 막힌 코드 위치는 이 스택으로 확인)
+    """
+
+    def __init__(self, threshold: float = SLOW_CALLBACK_THRESHOLD, max_reports: int = 50):
+        self.threshold = threshold
+        self.reports: Deque[Dict[str, Any]] = deque(maxlen=max_reports)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = time.monotonic()
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._watchdog is not None and self._watchdog.is_alive()
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """실행 중인 루프에서 호출 (lifespan 시작 시)"""
+        if self.running:
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self._loop.set_debug(True)
+        self._loop.slow_callback_duration = self.threshold
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._heartbeat_task = self._loop.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="slow-callback-monitor", daemon=True)
+        self._watchdog.start()
+        logger.info("이벤트 루프 블로킹 감지 시작 (임계값 %.3fs)", self.threshold)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        interval = self.threshold / 2
+        while not self._stopped.is_set():
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(interval)
+
+    def _watch(self) -> None:
+        interval = self.threshold / 2
+        reported_beat = None
+        while not self._stopped.wait(interval):
+            beat = self._last_beat
+            # 하트비트 주기(interval)를 뺀 만큼이 실제 블로킹 시간
+            blocked = time.monotonic() - beat - interval
+            if blocked < self.threshold or beat == reported_beat:
+                continue
+            reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+            report = {"blocked_seconds": round(blocked, 3), "detected_at": time.time(), "stack": stack}
+            self.reports.append(report)
+            logger.warning("이벤트 루프 블로킹 %.3fs 감지\n%s", blocked, stack)
+
+    def get_reports(self) -> List[Dict[str, Any]]:
+        return list(self.reports)
+
+
+slow_callback_monitor = SlowCallbackMonitor()
+
+
+def install_slow_callback_monitor(enabled: Optional[bool] = None) -> bool:
+    """디버그 모드(DEBUG 또는 ASYNCIO_DEBUG=true)일 때만 현재 루프에 블로킹 감지기 설치"""
+    if enabled is None:
+        enabled = (os.getenv("ASYNCIO_DEBUG", "false").lower() == "true"
+                   or os.getenv("DEBUG", "false").lower() == "true")
+    if enabled:
+        slow_callback_monitor.start()
+    return enabled
+
+
+def shutdown_async_runtime() -> None:
+    slow_callback_monitor.stop()
+    background_loop.stop()
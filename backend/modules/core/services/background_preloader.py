@@ -4,6 +4,7 @@
 - 사용 패턴 분석 기반 모델 프리로딩
 - 서버 시작 후 백그라운드에서 모델 로딩
 - 사용량 기반 우선순위 관리
+- 요청이 로딩 중인 모델을 필요로 하면 같은 Future 를 기다림 (중복 로딩 방지)
 """
 
 import asyncio
@@ -29,6 +30,10 @@ class PreloadTask:
     usage_count: int = 0
     is_loaded: bool = False
     load_start_time: Optional[datetime] = None
+    always_preload: bool = False  # 모델 사전 로딩이 꺼져 있어도 백그라운드에서 로딩
+    result: Any = None
+    error: Optional[str] = None
+    future: Optional[asyncio.Future] = None
 
 class BackgroundPreloader:
     """백그라운드 프리로더"""
@@ -40,6 +45,10 @@ class BackgroundPreloader:
         self.usage_patterns = defaultdict(lambda: deque(maxlen=100))
         self.is_running = False
         self._preload_task = None
+        # False 면 always_preload 작업만 백그라운드 로딩, 나머지는 요청 시 로딩
+        self.preload_enabled = True
+        # 새 작업 등록/설정 변경 시 대기 중인 루프를 깨움
+        self._wake: Optional[asyncio.Event] = None
 
         # 통계
         self.total_preloads = 0
@@ -48,10 +57,18 @@ class BackgroundPreloader:
         self.cache_hits = 0
 
     def register_task(self, task: PreloadTask):
-        """프리로드 작업 등록"""
+        """프리로드 작업 등록 (같은 이름이 이미 있으면 기존 로딩 상태 유지)"""
+        if task.name in self.tasks:
+            return
         self.tasks[task.name] = task
+        self.wake()
         logger.info(f"프리로드 작업 등록: {task.name} (우선순위: {task.priority})")
 
+    def wake(self):
+        """프리로딩 루프가 다음 작업을 바로 확인하도록 깨움"""
+        if self._wake is not None:
+            self._wake.set()
+
     def record_usage(self, task_name: str):
         """사용 기록"""
         if task_name in self.tasks:
@@ -83,8 +100,12 @@ class BackgroundPreloader:
 
     def _get_next_tasks(self) -> List[PreloadTask]:
         """다음 로딩할 작업들 선택"""
-        # 아직 로딩되지 않은 작업들
-        unloaded_tasks = [task for task in self.tasks.values() if not task.is_loaded]
+        # 아직 로딩되지 않은 작업들 (실패한 작업은 요청 시에만 재시도)
+        unloaded_tasks = [
+            task for task in self.tasks.values()
+            if not task.is_loaded and task.error is None and task.name not in self.loading_tasks
+            and (self.preload_enabled or task.always_preload)
+        ]
 
         # 의존성 확인
         available_tasks = []
@@ -104,64 +125,123 @@ class BackgroundPreloader:
         return available_tasks[:self.max_concurrent_loads]
 
     async def _load_task(self, task: PreloadTask):
-        """개별 작업 로딩"""
+        """개별 작업 로딩 (결과는 task.result 와 공유 Future 로 전달)"""
+        future = task.future
         try:
             logger.info(f"프리로딩 시작: {task.name}")
             task.load_start_time = datetime.now()
+            task.error = None
 
             # 비동기 함수인지 확인
             if asyncio.iscoroutinefunction(task.load_function):
-                await task.load_function()
+                result = await task.load_function()
             else:
-                # 동기 함수를 비동기로 실행
-                await asyncio.get_event_loop().run_in_executor(None, task.load_function)
+                # 동기 로딩(모델 가중치 등)은 스레드에서 실행해 이벤트 루프를 막지 않음
+                result = await asyncio.to_thread(task.load_function)
 
+            task.result = result
             task.is_loaded = True
             self.successful_preloads += 1
             self.total_preloads += 1
+            if not future.done():
+                future.set_result(result)
 
             load_time = (datetime.now() - task.load_start_time).total_seconds()
+            task.estimated_load_time = load_time
             logger.info(f"프리로딩 완료: {task.name} ({load_time:.2f}초)")
 
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
         except Exception as e:
             self.failed_preloads += 1
             self.total_preloads += 1
+            task.error = str(e)
             logger.error(f"프리로딩 실패: {task.name} - {e}")
+            if not future.done():
+                future.set_exception(e)
+                # 기다리는 요청이 없어도 경고가 남지 않도록 예외 조회 처리
+                future.exception()
         finally:
-            if task.name in self.loading_tasks:
+            if self.loading_tasks.get(task.name) is asyncio.current_task():
                 del self.loading_tasks[task.name]
 
+    def _start_load(self, task: PreloadTask) -> asyncio.Future:
+        """작업 로딩 시작 (이미 로딩 중이면 진행 중인 Future 반환)"""
+        loading = self.loading_tasks.get(task.name)
+        if loading is not None and not loading.done() and task.future is not None:
+            return task.future
+        task.future = asyncio.get_running_loop().create_future()
+        self.loading_tasks[task.name] = asyncio.create_task(self._load_task(task))
+        return task.future
+
+    async def ensure_loaded(self, task_name: str) -> Any:
+        """작업 결과 반환 - 로딩 전이면 지금 로딩, 로딩 중이면 같은 Future 를 기다림
+
+        Raises:
+            KeyError: 등록되지 않은 작업
+            Exception: 로딩 실패 시 로딩 함수의 예외
+        """
+        task = self.tasks[task_name]
+        self.record_usage(task_name)
+        if task.is_loaded:
+            return task.result
+        # 대기 중인 요청이 취소돼도 공유 로딩은 계속
+        return await asyncio.shield(self._start_load(task))
+
+    def get_loaded(self, task_name: str) -> Any:
+        """로딩이 끝난 작업 결과 (없거나 로딩 전이면 None)"""
+        task = self.tasks.get(task_name)
+        return task.result if task is not None and task.is_loaded else None
+
+    async def wait_until_loaded(self, timeout: Optional[float] = None):
+        """백그라운드 대상 작업이 모두 끝날 때까지 대기 (사전 로딩을 시작 단계에서 끝낼 때)"""
+        async def _wait():
+            while self._get_next_tasks() or self.loading_tasks:
+                pending = [task for task in self.loading_tasks.values() if not task.done()]
+                if pending:
+                    await asyncio.wait(pending)
+                else:
+                    await asyncio.sleep(0.1)
+        await asyncio.wait_for(_wait(), timeout)
+
     async def _preload_loop(self):
-        """프리로딩 루프"""
+        """프리로딩 루프 - 의존성/우선순위 순으로 로딩하고, 하나가 끝나면 바로 다음 작업 시작"""
         logger.info("백그라운드 프리로더 시작")
 
         while self.is_running:
             try:
                 # 현재 로딩 중인 작업 수 확인
-                current_loads = len(self.loading_tasks)
-
-                if current_loads < self.max_concurrent_loads:
-                    # 다음 작업들 가져오기
-                    next_tasks = self._get_next_tasks()
-
-                    for task in next_tasks:
+                if len(self.loading_tasks) < self.max_concurrent_loads:
+                    for task in self._get_next_tasks():
                         if len(self.loading_tasks) >= self.max_concurrent_loads:
                             break
-
-                        # 로딩 작업 시작
-                        load_task = asyncio.create_task(self._load_task(task))
-                        self.loading_tasks[task.name] = load_task
-
-                # 10초 대기
-                await asyncio.sleep(10)
-
+                        self._start_load(task)
+
+                pending = [task for task in self.loading_tasks.values() if not task.done()]
+                if pending:
+                    await asyncio.wait(pending, timeout=10, return_when=asyncio.FIRST_COMPLETED)
+                else:
+                    # 로딩할 작업이 없으면 새 등록/설정 변경을 기다리며 대기
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout=10)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wake.clear()
+
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"프리로딩 루프 오류: {e}")
                 await asyncio.sleep(30)  # 오류 시 더 긴 대기
 
     async def start(self):
-        """프리로더 시작"""
-        if not self.is_running:
+        """프리로더 시작 (다른 이벤트 루프에서 끝난 이전 루프 태스크가 있으면 새로 시작)"""
+        if self.is_running and self._preload_task is not None and not self._preload_task.done():
+            self.wake()
+        else:
+            self.loading_tasks = {name: task for name, task in self.loading_tasks.items() if not task.done()}
+            self._wake = asyncio.Event()
             self.is_running = True
             self._preload_task = asyncio.create_task(self._preload_loop())
             logger.info("백그라운드 프리로더 시작됨")
@@ -202,6 +282,22 @@ class BackgroundPreloader:
             "is_running": self.is_running
         }
 
+    def get_readiness(self) -> Dict[str, str]:
+        """작업별 준비 상태: ready / loading / pending / failed / on_demand"""
+        readiness = {}
+        for name, task in self.tasks.items():
+            if task.is_loaded:
+                readiness[name] = "ready"
+            elif name in self.loading_tasks:
+                readiness[name] = "loading"
+            elif task.error is not None:
+                readiness[name] = "failed"
+            elif self.preload_enabled or task.always_preload:
+                readiness[name] = "pending"
+            else:
+                readiness[name] = "on_demand"
+        return readiness
+
     def get_task_status(self) -> Dict[str, Dict[str, Any]]:
         """작업별 상태 반환"""
         status = {}
@@ -212,7 +308,8 @@ class BackgroundPreloader:
                 "priority": task.priority,
                 "usage_count": task.usage_count,
                 "last_used": task.last_used.isoformat() if task.last_used else None,
-                "estimated_load_time": task.estimated_load_time
+                "estimated_load_time": task.estimated_load_time,
+                "error": task.error
             }
         return status
 
@@ -221,14 +318,16 @@ background_preloader = BackgroundPreloader()
 
 # 편의 함수들
 def register_preload_task(name: str, priority: int, load_function: Callable,
-                         dependencies: List[str] = None, estimated_load_time: float = 0.0):
+                         dependencies: List[str] = None, estimated_load_time: float = 0.0,
+                         always_preload: bool = False):
     """프리로드 작업 등록 편의 함수"""
     task = PreloadTask(
         name=name,
         priority=priority,
         load_function=load_function,
         dependencies=dependencies or [],
-        estimated_load_time=estimated_load_time
+        estimated_load_time=estimated_load_time,
+        always_preload=always_preload
     )
     background_preloader.register_task(task)
 
@@ -1,6 +1,24 @@
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import hashlib
 import re
 
+# 청크 경계 후보 (우선순위 순): 문단 > 글머리표 항목 > 문장 끝 > 줄바꿈 > 공백
+_BOUNDARY_PATTERNS = [
+    re.compile(r'\n[ \t]*\n\s*'),
+    re.compile(r'\n(?=[ \t]*(?:[-•●▪▫*·]|\d+[.)])\s)'),
+    re.compile(r'(?:[.!?。…]|(?:다|요|죠|니다|습니다)(?=\s*\n))["\'”’)\]]*\s+'),
+    re.compile(r'\n\s*'),
+    re.compile(r'\s+'),
+]
+# 오버랩 시작 위치를 단어 경계에 맞추기 위한 패턴
+_WORD_START = re.compile(r'(?<=\s)\S')
+# 스트리밍 입력에서 페이지 사이에 넣는 구분자 (문단 경계로 취급)
+_PAGE_SEPARATOR = "\n\n"
+# 이력서 청킹에 쓰는 지원자 필드
+RESUME_SOURCE_FIELDS = (
+    "name", "position", "department", "experience", "skills", "growthBackground", "motivation", "careerHistory"
+)
+
 class ChunkingService:
     def __init__(self):
         """청킹 서비스 초기화"""
@@ -24,13 +42,15 @@ class ChunkingService:
         }
         print("청킹 서비스 초기화 완료")
     
-    def chunk_document(self, document: Dict[str, Any], document_type: str = None) -> List[Dict[str, Any]]:
+    def chunk_document(self, document: Dict[str, Any], document_type: str = None,
+                       text_source: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
         """
         문서를 청킹 단위로 분할합니다. (resumes, cover_letters, portfolios 모두 지원)
         
         Args:
             document (Dict[str, Any]): 문서 데이터
             document_type (str): 문서 타입 ("resume", "cover_letter", "portfolio")
+            text_source (Optional[Iterable[str]]): 페이지별 텍스트 스트림 (지정 시 extracted_text 대신 사용)
             
         Returns:
             List[Dict[str, Any]]: 청크 리스트
@@ -72,7 +92,7 @@ class ChunkingService:
             print(f"[ChunkingService] ❌ 키워드 청크 생성 실패")
         
         # 3. 전체 텍스트 청크
-        text_chunks = self._create_extracted_text_chunks(document, document_id, base_metadata)
+        text_chunks = self._create_extracted_text_chunks(document, document_id, base_metadata, text_source)
         chunks.extend(text_chunks)
         print(f"[ChunkingService] 텍스트 청크 생성: {len(text_chunks)}개")
         
@@ -103,6 +123,8 @@ class ChunkingService:
         for chunk in chunks:
             if id_field not in chunk:
                 chunk[id_field] = document_id
+            # 증분 재임베딩을 위한 청크 내용 해시
+            chunk["content_hash"] = self.compute_chunk_hash(chunk)
         
         print(f"[ChunkingService] 총 {len(chunks)}개 청크 생성 완료 ({id_field} 필드 추가)")
         for i, chunk in enumerate(chunks):
@@ -145,18 +167,70 @@ class ChunkingService:
         
         return chunks
     
-    def chunk_portfolio(self, portfolio: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def chunk_portfolio(self, portfolio: Dict[str, Any], text_source: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
         """
         포트폴리오 청킹 (편의 메서드)
         
         Args:
             portfolio (Dict[str, Any]): 포트폴리오 데이터
+            text_source (Optional[Iterable[str]]): 페이지별 텍스트 스트림 (대용량 포트폴리오용)
             
         Returns:
             List[Dict[str, Any]]: 청크 리스트
         """
-        return self.chunk_document(portfolio, "portfolio")
+        return self.chunk_document(portfolio, "portfolio", text_source)
     
+    @staticmethod
+    def compute_chunk_hash(chunk: Dict[str, Any]) -> str:
+        """청크 타입과 텍스트로 내용 해시 생성 (임베딩 입력이 바뀌었는지 판단하는 기준)"""
+        content = f"{chunk.get('chunk_type', '')}\x1f{chunk.get('text', '')}"
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def build_resume_source(resume_id: str, applicant: Dict[str, Any], resume_text: str,
+                            overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """지원자 정보와 이력서 본문으로 이력서 청킹 입력 구성 (overrides 에 값이 있으면 우선 사용)"""
+        overrides = overrides or {}
+        source = {"_id": str(resume_id), "resume_text": resume_text}
+        for field in RESUME_SOURCE_FIELDS:
+            source[field] = overrides.get(field, "") or applicant.get(field, "")
+        return source
+
+    def diff_chunks(self, previous_chunks: List[Dict[str, Any]], current_chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        이전 청크와 새 청크를 chunk_id 기준으로 비교합니다.
+
+        Args:
+            previous_chunks (List[Dict[str, Any]]): 저장되어 있던 청크 리스트
+            current_chunks (List[Dict[str, Any]]): 새로 생성한 청크 리스트
+
+        Returns:
+            Dict[str, Any]: added / changed / unchanged 청크 리스트와 removed 청크 ID 리스트
+        """
+        previous_hashes = {
+            chunk["chunk_id"]: chunk.get("content_hash") or self.compute_chunk_hash(chunk)
+            for chunk in previous_chunks or []
+            if chunk.get("chunk_id")
+        }
+
+        diff = {"added": [], "changed": [], "unchanged": [], "removed": []}
+        current_ids = set()
+        for chunk in current_chunks:
+            chunk_id = chunk["chunk_id"]
+            current_ids.add(chunk_id)
+            content_hash = chunk.setdefault("content_hash", self.compute_chunk_hash(chunk))
+            if chunk_id not in previous_hashes:
+                diff["added"].append(chunk)
+            elif previous_hashes[chunk_id] != content_hash:
+                diff["changed"].append(chunk)
+            else:
+                diff["unchanged"].append(chunk)
+
+        diff["removed"] = [chunk_id for chunk_id in previous_hashes if chunk_id not in current_ids]
+        print(f"[ChunkingService] 청크 비교: 추가 {len(diff['added'])}, 변경 {len(diff['changed'])}, "
+              f"유지 {len(diff['unchanged'])}, 삭제 {len(diff['removed'])}")
+        return diff
+
     def _create_base_metadata(self, document: Dict[str, Any], doc_type: str) -> Dict[str, Any]:
         """문서의 기본 메타데이터 생성"""
         return {
@@ -433,44 +507,55 @@ class ChunkingService:
             }
         return None
     
-    def _create_extracted_text_chunks(self, document: Dict[str, Any], document_id: str, base_metadata: Dict[str, Any] = None) -> List[Dict[str, Any]]:
-        """추출된 텍스트를 청크로 분할 - extracted_text 또는 resume_text 필드 사용"""
-        chunks = []
-        
-        # extracted_text가 없거나 짧으면 resume_text를 사용
-        extracted_text = document.get("extracted_text", "").strip()
-        if not extracted_text or len(extracted_text) < 50:
-            extracted_text = document.get("resume_text", "").strip()
-            print(f"[ChunkingService] extracted_text 부족, resume_text 사용: {len(extracted_text)} 문자")
-        
-        if extracted_text:
-            # 문서 타입별 청킹 설정 적용
-            doc_type = base_metadata.get("document_type", "resume") if base_metadata else "resume"
-            config = self.chunk_configs.get(doc_type, self.chunk_configs["resume"])
-            chunk_size = config["chunk_size"]
-            overlap = config["overlap"]
-            
-            for i in range(0, len(extracted_text), chunk_size - overlap):
-                chunk_text = extracted_text[i:i + chunk_size]
-                if chunk_text.strip():
-                    metadata = {
-                        "section": "extracted_text",
-                        "chunk_index": i // (chunk_size - overlap) + 1,
-                        "original_field": "extracted_text",
-                        "start_position": i,
-                        "end_position": min(i + chunk_size, len(extracted_text)),
-                        **(base_metadata or {})
-                    }
-                    chunks.append({
-                        "document_id": document_id,
-                        "resume_id": document_id,  # VectorService에서 필요한 필드
-                        "chunk_id": f"{document_id}_text_{i // (chunk_size - overlap) + 1}",
-                        "chunk_type": "extracted_text",
-                        "text": chunk_text.strip(),
-                        "metadata": metadata
-                    })
-        
-        return chunks
+    def _create_extracted_text_chunks(self, document: Dict[str, Any], document_id: str, base_metadata: Dict[str, Any] = None,
+                                      text_source: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """추출된 텍스트를 청크로 분할 - text_source(페이지 스트림) 또는 extracted_text/resume_text 필드 사용"""
+        # 문서 타입별 청킹 설정 적용
+        doc_type = base_metadata.get("document_type", "resume") if base_metadata else "resume"
+        config = self.chunk_configs.get(doc_type, self.chunk_configs["resume"])
+        chunk_size = config["chunk_size"]
+        overlap = config["overlap"]
+        
+        if text_source is not None:
+            spans = self.iter_stream_chunk_spans(text_source, chunk_size, overlap)
+        else:
+            # extracted_text가 없거나 짧으면 resume_text를 사용
+            extracted_text = document.get("extracted_text", "").strip()
+            if not extracted_text or len(extracted_text) < 50:
+                extracted_text = document.get("resume_text", "").strip()
+                print(f"[ChunkingService] extracted_text 부족, resume_text 사용: {len(extracted_text)} 문자")
+            spans = (
+                (start, end, extracted_text[start:end])
+                for start, end in self.iter_chunk_spans(extracted_text, chunk_size, overlap)
+            )
+        
+        return list(self._build_text_chunks(spans, document_id, base_metadata))
+    
+    def _build_text_chunks(self, spans: Iterable[Tuple[int, int, str]], document_id: str,
+                           base_metadata: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """(start, end, text) 범위에서 extracted_text 청크를 하나씩 생성"""
+        chunk_index = 0
+        for start, end, chunk_text in spans:
+            chunk_text = chunk_text.strip()
+            if not chunk_text:
+                continue
+            chunk_index += 1
+            metadata = {
+                "section": "extracted_text",
+                "chunk_index": chunk_index,
+                "original_field": "extracted_text",
+                "start_position": start,
+                "end_position": end,
+                **(base_metadata or {})
+            }
+            yield {
+                "document_id": document_id,
+                "resume_id": document_id,  # VectorService에서 필요한 필드
+                "chunk_id": f"{document_id}_text_{chunk_index}",
+                "chunk_type": "extracted_text",
+                "text": chunk_text,
+                "metadata": metadata
+            }
     
     def _create_basic_info_chunk(self, document: Dict[str, Any], document_id: str, base_metadata: Dict[str, Any] = None) -> Dict[str, Any]:
         """기본 정보 청크 생성 - basic_info 필드의 배열/문자열 모두 처리"""
@@ -608,14 +693,104 @@ class ChunkingService:
         return chunks
     
     def _split_text_into_chunks(self, text: str, chunk_size: int = 1000, overlap: int = 100) -> List[str]:
-        """긴 텍스트를 오버랩을 두고 청크로 분할"""
+        """긴 텍스트를 오버랩을 두고 문장/문단 경계에 맞춰 청크로 분할"""
         if not text or len(text) <= chunk_size:
             return [text] if text.strip() else []
         
         chunks = []
-        for i in range(0, len(text), chunk_size - overlap):
-            chunk = text[i:i + chunk_size]
-            if chunk.strip():
-                chunks.append(chunk.strip())
+        for start, end in self.iter_chunk_spans(text, chunk_size, overlap):
+            chunk = text[start:end].strip()
+            if chunk:
+                chunks.append(chunk)
         
-        return chunks
\ No newline at end of file
+        return chunks
+    
+    def iter_chunk_spans(self, text: str, chunk_size: int = 1000, overlap: int = 100) -> Iterator[Tuple[int, int]]:
+        """
+        텍스트를 복사하지 않고 (start, end) 오프셋으로 청크 범위를 생성합니다.
+        
+        Args:
+            text (str): 원본 텍스트
+            chunk_size (int): 최대 청크 길이
+            overlap (int): 이전 청크와 겹치는 최대 길이
+            
+        Yields:
+            Tuple[int, int]: 원본 텍스트 기준 청크 시작/끝 오프셋
+        """
+        yield from self._iter_spans(text, 0, chunk_size, overlap, final=True)
+    
+    def iter_stream_chunk_spans(self, pages: Iterable[str], chunk_size: int = 1000,
+                                overlap: int = 100) -> Iterator[Tuple[int, int, str]]:
+        """
+        페이지 단위 텍스트 스트림을 청크로 분할합니다. (대용량 포트폴리오용)
+        
+        전체 텍스트를 만들지 않고 현재 페이지와 직전 청크의 꼬리만 버퍼에 유지하므로
+        메모리 사용량이 문서 길이와 무관하게 (페이지 크기 + chunk_size) 수준으로 유지됩니다.
+        
+        Args:
+            pages (Iterable[str]): 페이지별 텍스트 (제너레이터 가능)
+            chunk_size (int): 최대 청크 길이
+            overlap (int): 이전 청크와 겹치는 최대 길이
+            
+        Yields:
+            Tuple[int, int, str]: 페이지를 이어 붙인 전체 텍스트 기준 시작/끝 오프셋과 청크 텍스트
+        """
+        buffer = ""
+        buffer_offset = 0
+        for page_text in pages:
+            if not page_text:
+                continue
+            buffer = f"{buffer}{_PAGE_SEPARATOR}{page_text}" if buffer else page_text
+            
+            # 버퍼에 chunk_size 를 넘는 분량이 쌓인 동안만 청크 확정 (나머지는 다음 페이지와 이어서 분할)
+            spans = self._iter_spans(buffer, 0, chunk_size, overlap, final=False)
+            next_start = 0
+            while True:
+                try:
+                    start, end = next(spans)
+                except StopIteration as stop:
+                    next_start = stop.value
+                    break
+                yield buffer_offset + start, buffer_offset + end, buffer[start:end]
+            
+            # 소비한 앞부분을 버퍼에서 제거
+            buffer = buffer[next_start:]
+            buffer_offset += next_start
+        
+        for start, end in self._iter_spans(buffer, 0, chunk_size, overlap, final=True):
+            yield buffer_offset + start, buffer_offset + end, buffer[start:end]
+    
+    def _iter_spans(self, text: str, start: int, chunk_size: int, overlap: int, final: bool):
+        """청크 범위 생성기 본체. final=False 이면 남은 길이가 chunk_size 이하일 때 멈추고 다음 시작 위치를 반환"""
+        length = len(text)
+        overlap = max(0, min(overlap, chunk_size // 2))
+        while start < length:
+            if length - start <= chunk_size:
+                if not final:
+                    return start
+                yield start, length
+                return
+            
+            end = self._find_boundary(text, start, start + chunk_size)
+            yield start, end
+            
+            # 오버랩 구간의 시작을 단어 경계에 맞추고, 항상 앞으로 진행하도록 보장
+            next_start = end - overlap
+            if overlap:
+                word = _WORD_START.search(text, next_start, end)
+                if word:
+                    next_start = word.start()
+            start = max(next_start, start + 1)
+        return start
+    
+    def _find_boundary(self, text: str, start: int, limit: int) -> int:
+        """[start, limit] 구간에서 가장 우선순위가 높은 마지막 경계 위치를 찾습니다."""
+        # 청크가 너무 작아지지 않도록 절반 이후의 경계만 사용
+        search_from = start + (limit - start) // 2
+        for pattern in _BOUNDARY_PATTERNS:
+            last_end = None
+            for match in pattern.finditer(text, search_from, limit):
+                last_end = match.end()
+            if last_end is not None and last_end > start:
+                return last_end
+        return limit
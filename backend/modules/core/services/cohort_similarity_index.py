@@ -0,0 +1,435 @@
+import asyncio
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from bson import Binary, ObjectId
+from modules.token_monitor import PRIORITY_BATCH, llm_call_context
+from pymongo import UpdateMany, UpdateOne
+
+# 지원자 간 유사도 비교 필드 (이력서 유사도 체크 API 와 동일)
+SIMILARITY_FIELDS = ("growthBackground", "motivation", "careerHistory")
+
+# 지원자별로 저장하는 이웃 수와 최소 유사도 (이 값 미만은 이웃 목록에 넣지 않음)
+NEIGHBOR_TOP_K = 50
+NEIGHBOR_MIN_SCORE = 0.3
+
+# 채용공고가 없는 지원자들의 코호트
+UNASSIGNED_COHORT = "unassigned"
+
+# 이 필드가 바뀐 지원자만 다시 인덱싱 (상태 변경 등은 건너뜀)
+COHORT_INDEX_FIELDS = frozenset(("job_posting_id",) + SIMILARITY_FIELDS)
+
+
+def cohort_key(applicant: Dict[str, Any]) -> str:
+    """지원자가 속한 코호트 (채용공고 ID)"""
+    job_posting_id = applicant.get("job_posting_id")
+    return str(job_posting_id) if job_posting_id else UNASSIGNED_COHORT
+
+
+def cohort_query(applicant: Dict[str, Any]) -> Dict[str, Any]:
+    """지원자와 같은 코호트의 지원자 조회 조건"""
+    job_posting_id = applicant.get("job_posting_id")
+    if not job_posting_id:
+        return {"job_posting_id": {"$in": [None, ""]}}
+    return {"job_posting_id": job_posting_id}
+
+
+def applicant_field_texts(applicant: Dict[str, Any]) -> Dict[str, str]:
+    """비교 필드 중 내용이 있는 것만"""
+    texts = {}
+    for field in SIMILARITY_FIELDS:
+        value = applicant.get(field)
+        if isinstance(value, str) and value.strip():
+            texts[field] = value.strip()
+    return texts
+
+
+def field_texts_fingerprint(texts: Dict[str, str]) -> str:
+    return hashlib.sha1(json.dumps(texts, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class CohortMatrix:
+    """한 코호트의 필드별 L2 정규화 float32 임베딩 행렬 (워커 메모리)
+
+    행은 지원자 순서대로 쌓이고, 필드가 비었거나 제거된 지원자는 present 마스크로 제외합니다.
+    용량을 두 배씩 늘려 추가 시 전체 복사를 피합니다.
+    """
+
+    def __init__(self):
+        self.ids: List[Optional[str]] = []
+        self.positions: Dict[str, int] = {}
+        self.dimension: Optional[int] = None
+        self.matrices: Dict[str, np.ndarray] = {}
+        self.present: Dict[str, np.ndarray] = {}
+        self.synced_at: Optional[datetime] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    @property
+    def member_count(self) -> int:
+        return len(self.positions)
+
+    def _grow(self, dimension: int) -> None:
+        capacity = max(16, 2 * self.size)
+        for field in SIMILARITY_FIELDS:
+            matrix = np.zeros((capacity, dimension), dtype=np.float32)
+            present = np.zeros(capacity, dtype=bool)
+            if field in self.matrices:
+                matrix[:self.size] = self.matrices[field][:self.size]
+                present[:self.size] = self.present[field][:self.size]
+            self.matrices[field] = matrix
+            self.present[field] = present
+
+    def upsert(self, applicant_id: str, vectors: Dict[str, np.ndarray]) -> None:
+        """지원자 행 추가/교체 (vectors 가 비어 있으면 모든 필드에서 제외)"""
+        if self.dimension is None and vectors:
+            self.dimension = len(next(iter(vectors.values())))
+
+        position = self.positions.get(applicant_id)
+        if position is None:
+            if not vectors:
+                return
+            if not self.matrices or self.size >= len(self.present[SIMILARITY_FIELDS[0]]):
+                self._grow(self.dimension)
+            position = self.size
+            self.ids.append(applicant_id)
+            self.positions[applicant_id] = position
+
+        for field in SIMILARITY_FIELDS:
+            vector = vectors.get(field)
+            if vector is not None and len(vector) == self.dimension:
+                self.matrices[field][position] = vector
+                self.present[field][position] = True
+            else:
+                self.present[field][position] = False
+
+        if not vectors:
+            del self.positions[applicant_id]
+            self.ids[position] = None
+
+    def scores(self, vectors: Dict[str, np.ndarray], exclude: Optional[str] = None
+               ) -> Tuple[np.ndarray, np.ndarray, Dict[str, Tuple[np.ndarray, np.ndarray]]]:
+        """필드마다 행렬-벡터 곱 1회로 코호트 전체와의 코사인 유사도 계산
+
+        Returns:
+            (전체 유사도, 전체 유효 마스크, {필드: (유사도, 유효 마스크)})
+            전체 유사도는 두 지원자 모두 내용이 있는 필드의 평균
+        """
+        size = self.size
+        total = np.zeros(size, dtype=np.float32)
+        count = np.zeros(size, dtype=np.int32)
+        per_field: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        if size == 0:
+            return total, count > 0, per_field
+
+        excluded = self.positions.get(exclude) if exclude else None
+        for field, vector in vectors.items():
+            if len(vector) != self.dimension:
+                continue
+            mask = self.present[field][:size].copy()
+            if excluded is not None:
+                mask[excluded] = False
+            field_scores = np.where(mask, self.matrices[field][:size] @ vector, 0.0).astype(np.float32)
+            per_field[field] = (field_scores, mask)
+            total += field_scores
+            count += mask
+
+        overall = np.divide(total, count, out=np.zeros(size, dtype=np.float32), where=count > 0)
+        return overall, count > 0, per_field
+
+
+class CohortSimilarityIndex:
+    """채용공고(코호트)별 지원자 유사도 인덱스
+
+    applicant_field_embeddings 에 지원자별 필드 임베딩(float32 바이너리)을 저장하고, 워커 메모리에
+    코호트별 행렬을 유지합니다. 지원자가 인덱싱되면 행렬-벡터 곱으로 코호트 전체와 비교해
+    applicant_similarity_neighbors 에 상위 이웃을 저장하고, 상대 지원자들의 이웃 목록도
+    $push/$sort/$slice 로 갱신합니다. 유사도 조회는 이웃 문서 1건 조회로 끝납니다.
+    """
+
+    embeddings_collection_name = "applicant_field_embeddings"
+    neighbors_collection_name = "applicant_similarity_neighbors"
+    _indexes_ensured = False
+    _cohorts: Dict[str, CohortMatrix] = {}
+    _cohort_locks: Dict[str, asyncio.Lock] = {}
+
+    def __init__(self, db, embedding_service, top_k: int = NEIGHBOR_TOP_K,
+                 min_score: float = NEIGHBOR_MIN_SCORE):
+        self.db = db
+        self.embeddings = db[self.embeddings_collection_name]
+        self.neighbors = db[self.neighbors_collection_name]
+        self.embedding_service = embedding_service
+        self.top_k = top_k
+        self.min_score = min_score
+
+    async def ensure_indexes(self) -> None:
+        """코호트 증분 동기화/이웃 정리용 인덱스 생성 (프로세스당 1회)"""
+        if CohortSimilarityIndex._indexes_ensured:
+            return
+        await self.embeddings.create_index([("cohort", 1), ("updated_at", 1)], name="cohort_1_updated_at_1")
+        await self.neighbors.create_index("cohort", name="cohort_1")
+        CohortSimilarityIndex._indexes_ensured = True
+
+    def _lock(self, cohort: str) -> asyncio.Lock:
+        lock = CohortSimilarityIndex._cohort_locks.get(cohort)
+        if lock is None:
+            lock = CohortSimilarityIndex._cohort_locks[cohort] = asyncio.Lock()
+        return lock
+
+    @staticmethod
+    def _decode_vectors(stored: Optional[Dict[str, bytes]]) -> Dict[str, np.ndarray]:
+        return {field: np.frombuffer(data, dtype=np.float32)
+                for field, data in (stored or {}).items() if field in SIMILARITY_FIELDS}
+
+    async def _load_cohort(self, cohort: str) -> CohortMatrix:
+        """코호트 행렬 (처음엔 전체 로드, 이후엔 다른 워커가 갱신한 행만 반영)"""
+        matrix = CohortSimilarityIndex._cohorts.get(cohort)
+        query: Dict[str, Any] = {"cohort": cohort}
+        if matrix is None:
+            matrix = CohortMatrix()
+        elif matrix.synced_at is not None:
+            query["updated_at"] = {"$gt": matrix.synced_at}
+
+        async for entry in self.embeddings.find(query, {"vectors": 1, "updated_at": 1}):
+            matrix.upsert(str(entry["_id"]), self._decode_vectors(entry.get("vectors")))
+            if matrix.synced_at is None or entry["updated_at"] > matrix.synced_at:
+                matrix.synced_at = entry["updated_at"]
+
+        CohortSimilarityIndex._cohorts[cohort] = matrix
+        return matrix
+
+    async def _embed_fields(self, texts: Dict[str, str]) -> Dict[str, np.ndarray]:
+        """필드 텍스트를 배치 1회로 임베딩하고 L2 정규화"""
+        if not texts:
+            return {}
+        fields = list(texts)
+        embeddings = await self.embedding_service.create_embeddings([texts[field] for field in fields])
+        vectors = {}
+        for field, embedding in zip(fields, embeddings):
+            if not embedding:
+                continue
+            vector = np.asarray(embedding, dtype=np.float32)
+            norm = float(np.linalg.norm(vector))
+            if norm > 0:
+                vectors[field] = vector / norm
+        return vectors
+
+    async def index_applicant(self, applicant: Dict[str, Any]) -> bool:
+        """지원자 행을 계산/저장하고 이웃 목록을 갱신합니다. 내용이 그대로면 False"""
+        await self.ensure_indexes()
+        applicant_id = str(applicant["_id"])
+        cohort = cohort_key(applicant)
+        texts = applicant_field_texts(applicant)
+        fingerprint = field_texts_fingerprint(texts)
+
+        # 내용이 그대로면 임베딩 없이 종료 (빠른 경로, 최종 판단은 잠금 안에서)
+        existing = await self.embeddings.find_one({"_id": applicant_id}, {"fingerprint": 1, "cohort": 1})
+        if existing and existing.get("fingerprint") == fingerprint and existing.get("cohort") == cohort:
+            return False
+
+        vectors = await self._embed_fields(texts)
+
+        async with self._lock(cohort):
+            # 임베딩하는 동안 다른 작업이 같은 지원자를 먼저 색인했을 수 있으므로 잠금 안에서 다시 확인
+            current = await self.embeddings.find_one({"_id": applicant_id}, {"fingerprint": 1, "cohort": 1})
+            if current and current.get("fingerprint") == fingerprint and current.get("cohort") == cohort:
+                return False
+            if current and current.get("cohort") != cohort:
+                await self.remove_applicant(applicant_id)
+
+            matrix = await self._load_cohort(cohort)
+            overall, overall_mask, per_field = matrix.scores(vectors, exclude=applicant_id)
+            matrix.upsert(applicant_id, vectors)
+
+            await self.embeddings.update_one(
+                {"_id": applicant_id},
+                {"$set": {
+                    "cohort": cohort,
+                    "fingerprint": fingerprint,
+                    "vectors": {field: Binary(vector.tobytes()) for field, vector in vectors.items()},
+                    "dimension": matrix.dimension,
+                    "updated_at": datetime.now()
+                }},
+                upsert=True
+            )
+            await self._store_neighbors(applicant_id, cohort, matrix, overall, overall_mask, per_field)
+        return True
+
+    def _top_neighbors(self, matrix: CohortMatrix, scores: np.ndarray, mask: np.ndarray,
+                       per_field: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> List[Dict[str, Any]]:
+        candidates = np.flatnonzero(mask & (scores >= self.min_score))
+        if candidates.size > self.top_k:
+            candidates = candidates[np.argpartition(-scores[candidates], self.top_k - 1)[:self.top_k]]
+        ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [self._neighbor_entry(matrix.ids[position], position, scores, per_field) for position in ordered]
+
+    @staticmethod
+    def _neighbor_entry(applicant_id: str, position: int, scores: np.ndarray,
+                        per_field: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> Dict[str, Any]:
+        return {
+            "applicant_id": applicant_id,
+            "score": round(float(scores[position]), 4),
+            "fields": {field: round(float(field_scores[position]), 4)
+                       for field, (field_scores, field_mask) in per_field.items() if field_mask[position]}
+        }
+
+    async def _store_neighbors(self, applicant_id: str, cohort: str, matrix: CohortMatrix,
+                               overall: np.ndarray, overall_mask: np.ndarray,
+                               per_field: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> None:
+        """본인 이웃 목록 저장 + 유사도가 기준 이상인 상대들의 목록에 본인 추가 (코사인은 대칭)
+
+        다른 워커가 같은 지원자를 동시에 색인해도 중복 항목이 쌓이지 않도록 항상 기존 항목을 먼저 제거합니다.
+        """
+        now = datetime.now()
+        await self.neighbors.replace_one(
+            {"_id": applicant_id},
+            {
+                "cohort": cohort,
+                "neighbors": self._top_neighbors(matrix, overall, overall_mask, per_field),
+                "updated_at": now
+            },
+            upsert=True
+        )
+
+        operations = [UpdateMany({"cohort": cohort}, {"$pull": {"neighbors": {"applicant_id": applicant_id}}})]
+        for position in np.flatnonzero(overall_mask & (overall >= self.min_score)):
+            operations.append(UpdateOne(
+                {"_id": matrix.ids[position]},
+                {
+                    "$push": {"neighbors": {
+                        "$each": [self._neighbor_entry(applicant_id, position, overall, per_field)],
+                        "$sort": {"score": -1},
+                        "$slice": self.top_k
+                    }},
+                    "$set": {"updated_at": now}
+                }
+            ))
+        await self.neighbors.bulk_write(operations, ordered=True)
+
+    async def remove_applicant(self, applicant_id: str) -> None:
+        """지원자를 코호트에서 제외 (다른 워커도 증분 동기화로 반영하도록 빈 행으로 표시)"""
+        applicant_id = str(applicant_id)
+        entry = await self.embeddings.find_one_and_update(
+            {"_id": applicant_id},
+            {"$set": {"vectors": {}, "fingerprint": None, "updated_at": datetime.now()}},
+            projection={"cohort": 1}
+        )
+        if entry is None:
+            return
+        cohort = entry.get("cohort")
+        matrix = CohortSimilarityIndex._cohorts.get(cohort)
+        if matrix is not None:
+            matrix.upsert(applicant_id, {})
+        await self.neighbors.delete_one({"_id": applicant_id})
+        await self.neighbors.update_many({"cohort": cohort}, {"$pull": {"neighbors": {"applicant_id": applicant_id}}})
+
+    async def clear(self) -> None:
+        """인덱스 전체 삭제 (지원자 컬렉션 초기화 시, 다른 워커 메모리는 이웃 조회 시 삭제된 지원자로 걸러짐)"""
+        await self.embeddings.delete_many({})
+        await self.neighbors.delete_many({})
+        CohortSimilarityIndex._cohorts.clear()
+
+    async def indexed_count(self, cohort: str) -> int:
+        """코호트에 인덱싱된(제거되지 않은) 지원자 수"""
+        return await self.embeddings.count_documents({"cohort": cohort, "fingerprint": {"$ne": None}})
+
+    async def find_similar(self, applicant: Dict[str, Any], limit: int = NEIGHBOR_TOP_K) -> Dict[str, Any]:
+        """지원자의 유사 지원자 (필요 시 인덱싱 후 이웃 문서 조회)
+
+        Returns:
+            {"cohort", "cohort_size", "neighbors": [{"applicant_id", "score", "fields"}]}
+        """
+        await self.index_applicant(applicant)
+        cohort = cohort_key(applicant)
+        entry = await self.neighbors.find_one({"_id": str(applicant["_id"])}, {"neighbors": 1})
+        matrix = CohortSimilarityIndex._cohorts.get(cohort)
+        return {
+            "cohort": cohort,
+            "cohort_size": matrix.member_count if matrix is not None else 0,
+            "neighbors": (entry or {}).get("neighbors", [])[:limit]
+        }
+
+    async def rebuild(self, applicants_collection, job_posting_id: Optional[str] = None,
+                      batch_size: int = 200) -> int:
+        """지원자 컬렉션으로 인덱스를 채웁니다. (최초 구축/다른 경로로 추가된 지원자 반영)"""
+        await self.ensure_indexes()
+        query: Dict[str, Any] = {}
+        if job_posting_id:
+            query["job_posting_id"] = job_posting_id
+        projection = {"job_posting_id": 1, **{field: 1 for field in SIMILARITY_FIELDS}}
+
+        indexed = 0
+        with llm_call_context(priority=PRIORITY_BATCH):
+            async for applicant in applicants_collection.find(query, projection).batch_size(batch_size):
+                if await self.index_applicant(applicant):
+                    indexed += 1
+        print(f"[CohortSimilarityIndex] 지원자 유사도 인덱스 갱신 완료: {indexed}건")
+        return indexed
+
+
+_sync_tasks: Set[asyncio.Task] = set()
+_backfill_tasks: Dict[Optional[str], asyncio.Task] = {}
+
+
+def _keep_task(task: asyncio.Task) -> asyncio.Task:
+    _sync_tasks.add(task)
+    task.add_done_callback(_sync_tasks.discard)
+    return task
+
+
+def schedule_cohort_sync(db, applicant_ids: Iterable[Any], removed: bool = False) -> Optional[asyncio.Task]:
+    """지원자 쓰기 이후 코호트 인덱스 갱신을 백그라운드로 예약 (임베딩 호출이 쓰기 응답을 막지 않도록)
+
+    removed=True 이면 삭제된 지원자를 코호트에서 제외합니다.
+    """
+    applicant_ids = [str(applicant_id) for applicant_id in applicant_ids if applicant_id]
+    if not applicant_ids:
+        return None
+    return _keep_task(asyncio.create_task(_sync_applicants(db, applicant_ids, removed)))
+
+
+async def _sync_applicants(db, applicant_ids: List[str], removed: bool) -> None:
+    from modules.core.services.embedding_service import EmbeddingService
+
+    index = CohortSimilarityIndex(db, EmbeddingService())
+    projection = {"job_posting_id": 1, **{field: 1 for field in SIMILARITY_FIELDS}}
+    with llm_call_context(priority=PRIORITY_BATCH):
+        for applicant_id in applicant_ids:
+            try:
+                applicant = None
+                if not removed:
+                    query_id = ObjectId(applicant_id) if ObjectId.is_valid(applicant_id) else applicant_id
+                    applicant = await db.applicants.find_one({"_id": query_id}, projection)
+                if applicant is None:
+                    await index.remove_applicant(applicant_id)
+                else:
+                    await index.index_applicant(applicant)
+            except Exception as e:
+                print(f"[CohortSimilarityIndex] 지원자 인덱스 갱신 실패 ({applicant_id}): {e}")
+
+
+def schedule_cohort_backfill(db, embedding_service, job_posting_id: Optional[str] = None) -> asyncio.Task:
+    """인덱스에 없는 지원자 백필을 백그라운드로 예약 (같은 범위가 진행 중이면 그 태스크 반환)
+
+    job_posting_id 가 없으면 전체 지원자 대상 (시작 시 백필)
+    """
+    task = _backfill_tasks.get(job_posting_id)
+    if task is None or task.done():
+        task = _backfill_tasks[job_posting_id] = asyncio.create_task(
+            _run_backfill(db, embedding_service, job_posting_id)
+        )
+    return task
+
+
+async def _run_backfill(db, embedding_service, job_posting_id: Optional[str]) -> None:
+    try:
+        await CohortSimilarityIndex(db, embedding_service).rebuild(db.applicants, job_posting_id)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"[CohortSimilarityIndex] 지원자 유사도 인덱스 백필 실패: {e}")
@@ -0,0 +1,282 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from modules.core.services.cohort_similarity_index import schedule_cohort_sync
+from modules.core.services.mongo_service import MongoService
+from modules.core.services.near_duplicate_index import CoverLetterNearDuplicateIndex
+
+# 문서 타입별 컬렉션 / 지원자 연결 필드
+DOCUMENT_COLLECTIONS = {
+    "resume": "resumes",
+    "cover_letter": "cover_letters",
+    "portfolio": "portfolios",
+}
+DOCUMENT_LINK_FIELDS = {
+    "resume": "resume_id",
+    "cover_letter": "cover_letter_id",
+    "portfolio": "portfolio_id",
+}
+
+
+class DocumentUnitOfWork:
+    """지원자 + 문서(이력서/자기소개서/포트폴리오) 저장을 묶어 처리하는 Unit of Work
+
+    - 지원자는 이메일 기준 upsert 1회로 생성/조회, 기술 스택 병합, 문서 ID 연결을 함께 처리
+    - 문서는 청크를 포함해 insert 1회로 저장
+    - use_transaction=True 이면 위 쓰기를 하나의 다중 문서 트랜잭션으로 묶음 (레플리카셋 필요)
+
+    사용 예::
+
+        async with DocumentUnitOfWork(mongo_service) as uow:
+            document_id = uow.new_document_id()
+            applicant = await uow.upsert_applicant(applicant_data, "resume", document_id, skills=skills)
+            document = await uow.insert_document("resume", document_id, resume_data, chunks)
+    """
+
+    def __init__(self, mongo_service: MongoService, use_transaction: bool = False):
+        self.mongo_service = mongo_service
+        self.db = mongo_service.db
+        self.use_transaction = use_transaction
+        self.session = None
+        self._pending_stats_deltas: List[Dict[str, int]] = []
+        self._pending_cohort_ids: List[str] = []
+
+    async def __aenter__(self) -> "DocumentUnitOfWork":
+        if self.use_transaction:
+            self.session = await self.mongo_service.client.start_session()
+            self.session.start_transaction()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if self.session is not None:
+                if exc_type is None:
+                    await self.session.commit_transaction()
+                else:
+                    await self.session.abort_transaction()
+        finally:
+            if self.session is not None:
+                await self.session.end_session()
+                self.session = None
+
+        # 통계 문서와 코호트 유사도 인덱스는 커밋이 확정된 뒤에만 반영
+        if exc_type is None:
+            for stats_delta in self._pending_stats_deltas:
+                await self.mongo_service._apply_applicant_stats_delta(stats_delta)
+            schedule_cohort_sync(self.db, dict.fromkeys(self._pending_cohort_ids))
+        self._pending_stats_deltas.clear()
+        self._pending_cohort_ids.clear()
+
+    @staticmethod
+    def new_document_id() -> ObjectId:
+        """청킹 전에 문서 ID를 미리 할당 (청크 ID와 지원자 연결 필드에 사용)"""
+        return ObjectId()
+
+    @staticmethod
+    def _to_dict(data: Any) -> Dict[str, Any]:
+        """Pydantic 모델을 dict로 변환"""
+        if hasattr(data, 'dict'):
+            return data.dict()
+        return dict(data)
+
+    @staticmethod
+    def _now() -> datetime:
+        """MongoDB 저장 정밀도(밀리초)에 맞춘 현재 시각"""
+        now = datetime.now()
+        return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+    @staticmethod
+    def _merged_skills_expression(skills: List[str]) -> Dict[str, Any]:
+        """기존 skills(문자열/배열)와 새 기술 스택을 합쳐 ', ' 로 연결하는 집계 표현식"""
+        existing = {
+            "$cond": [
+                {"$isArray": "$skills"},
+                "$skills",
+                {"$map": {
+                    "input": {"$split": [{"$ifNull": ["$skills", ""]}, ","]},
+                    "as": "skill",
+                    "in": {"$trim": {"input": "$$skill"}}
+                }}
+            ]
+        }
+        merged = {"$filter": {
+            "input": {"$setUnion": [existing, {"$literal": skills}]},
+            "as": "skill",
+            "cond": {"$ne": ["$$skill", ""]}
+        }}
+        return {"$reduce": {
+            "input": merged,
+            "initialValue": "",
+            "in": {"$cond": [
+                {"$eq": ["$$value", ""]},
+                "$$this",
+                {"$concat": ["$$value", ", ", "$$this"]}
+            ]}
+        }}
+
+    def _applicant_upsert(self, applicant_dict: Dict[str, Any], now: datetime,
+                          document_type: Optional[str] = None, document_id: Optional[ObjectId] = None,
+                          skills: Optional[List[str]] = None, merge_skills: bool = True):
+        """지원자 upsert 필터와 파이프라인 업데이트 생성"""
+        email = applicant_dict.get("email")
+        query = {"email": email} if email else {"_id": ObjectId()}
+
+        # 기존 지원자의 값은 유지하고 비어 있는 필드만 새 값으로 채움 (None 값은 쓰지 않음)
+        defaults = {
+            key: {"$ifNull": [f"${key}", {"$literal": value}]}
+            for key, value in applicant_dict.items()
+            if key not in ("_id", "id", "created_at", "updated_at") and value is not None
+        }
+        defaults["created_at"] = {"$ifNull": ["$created_at", {"$literal": now}]}
+
+        updates = {"updated_at": {"$literal": now}}
+        if document_type and document_id is not None:
+            updates[DOCUMENT_LINK_FIELDS[document_type]] = {"$literal": str(document_id)}
+        if skills:
+            if merge_skills:
+                updates["skills"] = self._merged_skills_expression(skills)
+            else:
+                updates["skills"] = {"$literal": ", ".join(skills)}
+
+        return query, [{"$set": defaults}, {"$set": updates}]
+
+    @staticmethod
+    def _format_applicant(applicant: Dict[str, Any]) -> Dict[str, Any]:
+        applicant["id"] = str(applicant["_id"])
+        del applicant["_id"]
+        return applicant
+
+    async def upsert_applicant(self, applicant_data: Any, document_type: Optional[str] = None,
+                               document_id: Optional[ObjectId] = None, skills: Optional[List[str]] = None,
+                               merge_skills: bool = True) -> Dict[str, Any]:
+        """지원자 생성/조회 + 기술 스택 갱신 + 문서 ID 연결을 upsert 1회로 처리
+
+        Returns:
+            create_or_get_applicant 와 같은 형태의 {"id", "is_new", "applicant"}
+        """
+        now = self._now()
+        query, pipeline = self._applicant_upsert(
+            self._to_dict(applicant_data), now, document_type, document_id, skills, merge_skills
+        )
+        result = await self.db.applicants.update_one(query, pipeline, upsert=True, session=self.session)
+        is_new = result.upserted_id is not None
+        applicant = await self.db.applicants.find_one(
+            {"_id": result.upserted_id} if is_new else query, session=self.session
+        )
+        if is_new:
+            self._pending_stats_deltas.append(self.mongo_service._applicant_stats_inc(applicant, 1))
+
+        applicant = self._format_applicant(applicant)
+        self._pending_cohort_ids.append(applicant["id"])
+        return {"id": applicant["id"], "is_new": is_new, "applicant": applicant}
+
+    async def insert_document(self, document_type: str, document_id: ObjectId, document_data: Any,
+                              chunks: Optional[List[Dict[str, Any]]] = None, replace: bool = False) -> Dict[str, Any]:
+        """문서를 청크와 함께 insert 1회로 저장
+
+        replace=True 이면 같은 ID 의 기존 문서를 교체 (재업로드 시 청크 ID 유지)
+        """
+        document = self._to_dict(document_data)
+        document["_id"] = document_id
+        document["created_at"] = datetime.now()
+        if chunks:
+            document["chunks"] = chunks
+            document["chunks_updated_at"] = document["created_at"]
+
+        collection = self.db[DOCUMENT_COLLECTIONS[document_type]]
+        if replace:
+            await collection.replace_one({"_id": document_id}, document, upsert=True, session=self.session)
+        else:
+            await collection.insert_one(document, session=self.session)
+        if document_type == "cover_letter":
+            await CoverLetterNearDuplicateIndex(self.db).index_cover_letter(document, session=self.session)
+        document["id"] = str(document_id)
+        return document
+
+    async def bulk_ingest(self, records: List[Dict[str, Any]],
+                          chunker: Optional[Callable[[str, Dict[str, Any]], List[Dict[str, Any]]]] = None
+                          ) -> List[Dict[str, Any]]:
+        """여러 지원자와 문서를 한 번에 저장 (캠퍼스 리크루팅 일괄 등록용)
+
+        지원자는 bulk_write 1회, 조회 1회, 문서는 컬렉션별 insert_many 1회로 처리합니다.
+
+        Args:
+            records: {"applicant": 지원자 데이터, "document_type": 문서 타입(선택),
+                      "document": 문서 데이터(선택), "skills": 기술 스택 리스트(선택)} 목록
+            chunker: (document_type, document) -> chunks. 지정 시 문서 저장 전에 청크 생성
+
+        Returns:
+            records 순서대로 {"applicant_id", "is_new", "document_id"} 목록
+        """
+        if not records:
+            return []
+
+        now = self._now()
+        operations = []
+        prepared = []
+        for record in records:
+            applicant_dict = self._to_dict(record["applicant"])
+            document_type = record.get("document_type") if record.get("document") is not None else None
+            document_id = self.new_document_id() if document_type else None
+            query, pipeline = self._applicant_upsert(
+                applicant_dict, now, document_type, document_id, record.get("skills"),
+                record.get("merge_skills", True)
+            )
+            operations.append(UpdateOne(query, pipeline, upsert=True))
+            prepared.append((query, document_type, document_id, record.get("document")))
+
+        result = await self.db.applicants.bulk_write(operations, ordered=True, session=self.session)
+        upserted_indexes = set(result.upserted_ids.keys())
+
+        # 신규/기존 지원자 ID를 한 번의 조회로 확인
+        emails = [query["email"] for query, _, _, _ in prepared if "email" in query]
+        ids = [query["_id"] for query, _, _, _ in prepared if "_id" in query]
+        applicants_by_key = {}
+        async for applicant in self.db.applicants.find(
+            {"$or": [{"email": {"$in": emails}}, {"_id": {"$in": ids}}]},
+            {"email": 1, "status": 1, "position": 1, "created_at": 1},
+            session=self.session
+        ):
+            applicants_by_key[applicant["_id"]] = applicant
+            if applicant.get("email"):
+                applicants_by_key[applicant["email"]] = applicant
+
+        documents_by_collection: Dict[str, List[Dict[str, Any]]] = {}
+        results = []
+        for index, (query, document_type, document_id, document_data) in enumerate(prepared):
+            applicant = applicants_by_key[query.get("email", query.get("_id"))]
+            applicant_id = str(applicant["_id"])
+            self._pending_cohort_ids.append(applicant_id)
+            if index in upserted_indexes:
+                self._pending_stats_deltas.append(self.mongo_service._applicant_stats_inc(applicant, 1))
+
+            if document_type:
+                document = self._to_dict(document_data)
+                document["_id"] = document_id
+                document["applicant_id"] = applicant_id
+                document["created_at"] = datetime.now()
+                if chunker:
+                    chunks = chunker(document_type, document)
+                    if chunks:
+                        document["chunks"] = chunks
+                        document["chunks_updated_at"] = document["created_at"]
+                documents_by_collection.setdefault(DOCUMENT_COLLECTIONS[document_type], []).append(document)
+
+            results.append({
+                "applicant_id": applicant_id,
+                "is_new": index in upserted_indexes,
+                "document_id": str(document_id) if document_id is not None else None
+            })
+
+        for collection, documents in documents_by_collection.items():
+            await self.db[collection].insert_many(documents, ordered=False, session=self.session)
+
+        if documents_by_collection.get("cover_letters"):
+            near_duplicate_index = CoverLetterNearDuplicateIndex(self.db)
+            for document in documents_by_collection["cover_letters"]:
+                await near_duplicate_index.index_cover_letter(document, session=self.session)
+
+        return results
@@ -1,11 +1,39 @@
+import asyncio
+import logging
 import os
+import threading
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
 import openai
 from modules.config.settings import get_settings
-from sentence_transformers import SentenceTransformer
+from modules.token_monitor import (AdmissionRejected, admission_controller,
+                                   estimate_tokens, llm_instrumentation)
+
+logger = logging.getLogger(__name__)
+
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+FALLBACK_MODEL_NAME = 'paraphrase-multilingual-MiniLM-L12-v2'
+# 프리로딩 작업 이름 (modules.core.services.model_warmup 에서 등록)
+FALLBACK_MODEL_TASK = "embedding_fallback_model"
+
+_fallback_model = None
+_fallback_model_lock = threading.Lock()
+
+
+def load_fallback_model():
+    """프로세스 공용 백업 SentenceTransformer 모델 (처음 호출 시 1회 로딩, 스레드 안전)"""
+    global _fallback_model
+    if _fallback_model is None:
+        with _fallback_model_lock:
+            if _fallback_model is None:
+                logger.debug("[EmbeddingService] 백업 모델 로딩 중...")
+                # torch 를 끌어오므로 백업 모델이 실제로 필요할 때 import
+                from sentence_transformers import SentenceTransformer
+                _fallback_model = SentenceTransformer(FALLBACK_MODEL_NAME)
+                logger.debug("[EmbeddingService] 백업 모델 로딩 완료")
+    return _fallback_model
 
 
 class EmbeddingType(Enum):
@@ -30,28 +58,32 @@ class EmbeddingService:
             raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다.")
 
         # OpenAI 클라이언트 초기화
-        self.client = openai.OpenAI(api_key=self.openai_api_key)
+        self.client = llm_instrumentation.instrument(openai.OpenAI(api_key=self.openai_api_key), __name__)
 
-        # 백업용 SentenceTransformer 모델 초기화
-        if self.lazy_loading:
-            self.fallback_model = None
-            print("OpenAI text-embedding-3-small 모델 초기화 완료 (지연 로딩 모드)")
-        else:
-            self._load_fallback_model()
-            print("OpenAI text-embedding-3-small 모델 초기화 완료 (사전 로딩 모드)")
+        # 백업용 SentenceTransformer 모델은 프로세스 공용 인스턴스를 사용
+        # (사전 로딩 여부는 model_warmup 오케스트레이터가 설정값에 따라 결정)
+        logger.debug("OpenAI text-embedding-3-small 모델 초기화 완료 (지연 로딩: %s)", self.lazy_loading)
+
+    @property
+    def fallback_model(self):
+        return _fallback_model
 
     def _load_fallback_model(self):
         """백업용 SentenceTransformer 모델 로딩"""
-        if not hasattr(self, 'fallback_model') or self.fallback_model is None:
-            print("[EmbeddingService] 백업 모델 로딩 중...")
-            self.fallback_model = SentenceTransformer('paraphrase-multilingual-MiniLM-L12-v2')
-            print("[EmbeddingService] 백업 모델 로딩 완료")
+        load_fallback_model()
 
     def get_fallback_model(self):
-        """백업 모델을 안전하게 가져오기"""
-        if not hasattr(self, 'fallback_model') or self.fallback_model is None:
-            self._load_fallback_model()
-        return self.fallback_model
+        """백업 모델을 안전하게 가져오기 (동기 호출부용, 필요하면 현재 스레드에서 로딩)"""
+        return load_fallback_model()
+
+    async def aget_fallback_model(self):
+        """백업 모델 (로딩 중이면 진행 중인 프리로딩을 기다리고, 아니면 스레드에서 로딩)"""
+        if _fallback_model is not None:
+            return _fallback_model
+        from modules.core.services.background_preloader import background_preloader
+        if FALLBACK_MODEL_TASK in background_preloader.tasks:
+            return await background_preloader.ensure_loaded(FALLBACK_MODEL_TASK)
+        return await asyncio.to_thread(load_fallback_model)
 
     async def create_embedding(self, text: str, embedding_type: EmbeddingType = EmbeddingType.DOCUMENT) -> Optional[List[float]]:
         """
@@ -63,53 +95,113 @@ class EmbeddingService:
 
         Returns:
             Optional[List[float]]: 임베딩 벡터 (실패 시 None)
+
+        Raises:
+            AdmissionRejected: 분당 한도/월 예산으로 보류된 경우 (백업 모델로 대체하지 않음)
         """
         try:
-            print(f"[EmbeddingService] === 임베딩 생성 시작 ===")
-            print(f"[EmbeddingService] 임베딩 타입: {embedding_type.value}")
-            print(f"[EmbeddingService] 입력 텍스트 길이: {len(text)} 문자")
-            print(f"[EmbeddingService] 입력 텍스트 미리보기: {text[:100]}...")
+            logger.debug("[EmbeddingService] === 임베딩 생성 시작 ===")
+            logger.debug("[EmbeddingService] 임베딩 타입: %s", embedding_type.value)
+            logger.debug("[EmbeddingService] 입력 텍스트 길이: %s 문자", len(text))
+            logger.debug("[EmbeddingService] 입력 텍스트 미리보기: %s...", text[:100])
 
             # 임베딩 타입에 따른 전처리
             processed_text = self._preprocess_text(text, embedding_type)
 
-            # OpenAI API를 사용한 임베딩 생성
+            # OpenAI API를 사용한 임베딩 생성 (API 오류면 백업 모델 사용, 한도 보류는 호출자에게 전달)
             try:
+                admission = await admission_controller.admit(
+                    OPENAI_EMBEDDING_MODEL, estimate_tokens(processed_text, OPENAI_EMBEDDING_MODEL)
+                )
                 response = self.client.embeddings.create(
-                    model="text-embedding-3-small",
+                    model=OPENAI_EMBEDDING_MODEL,
                     input=processed_text
                 )
+                admission_controller.settle(admission, response.usage.total_tokens)
                 embedding = response.data[0].embedding
 
-                print(f"[EmbeddingService] OpenAI 임베딩 생성 성공!")
-                print(f"[EmbeddingService] 임베딩 차원: {len(embedding)}")
-                print(f"[EmbeddingService] 임베딩 값 미리보기: {embedding[:5]}...")
-                print(f"[EmbeddingService] === 임베딩 생성 완료 ===")
+                logger.debug("[EmbeddingService] OpenAI 임베딩 생성 성공!")
+                logger.debug("[EmbeddingService] 임베딩 차원: %s", len(embedding))
+                logger.debug("[EmbeddingService] 임베딩 값 미리보기: %s...", embedding[:5])
+                logger.debug("[EmbeddingService] === 임베딩 생성 완료 ===")
 
                 return embedding
 
+            except AdmissionRejected:
+                # 한도 보류는 호출자가 429/재시도로 처리 (백업 모델은 차원이 달라 같은 인덱스에 섞을 수 없음)
+                raise
             except Exception as openai_error:
-                print(f"[EmbeddingService] OpenAI 임베딩 실패, 백업 모델 사용: {openai_error}")
+                logger.warning("[EmbeddingService] OpenAI 임베딩 실패, 백업 모델 사용: %s", openai_error)
 
                 # 백업 모델 지연 로딩 (필요할 때만 로딩)
-                fallback_model = self.get_fallback_model()
+                fallback_model = await self.aget_fallback_model()
 
                 # 백업 모델 사용 (SentenceTransformer)
-                embedding = fallback_model.encode(processed_text)
+                embedding = await asyncio.to_thread(fallback_model.encode, processed_text)
 
-                print(f"[EmbeddingService] 백업 임베딩 생성 성공!")
-                print(f"[EmbeddingService] 임베딩 차원: {len(embedding)}")
-                print(f"[EmbeddingService] 임베딩 값 미리보기: {embedding[:5].tolist()}...")
-                print(f"[EmbeddingService] === 백업 임베딩 생성 완료 ===")
+                logger.debug("[EmbeddingService] 백업 임베딩 생성 성공!")
+                logger.debug("[EmbeddingService] 임베딩 차원: %s", len(embedding))
+                logger.debug("[EmbeddingService] 임베딩 값 미리보기: %s...", embedding[:5].tolist())
+                logger.debug("[EmbeddingService] === 백업 임베딩 생성 완료 ===")
 
                 return embedding.tolist()  # numpy array를 list로 변환
+        except AdmissionRejected:
+            raise
         except Exception as e:
-            print(f"[EmbeddingService] === 임베딩 생성 실패 ====")
-            print(f"[EmbeddingService] 오류 메시지: {e}")
-            print(f"[EmbeddingService] 입력 텍스트: {text[:200]}...")
-            print(f"[EmbeddingService] === 임베딩 생성 실패 완료 ===")
+            logger.warning("[EmbeddingService] === 임베딩 생성 실패 ====")
+            logger.warning("[EmbeddingService] 오류 메시지: %s", e)
+            logger.debug("[EmbeddingService] 입력 텍스트: %s...", text[:200])
+            logger.warning("[EmbeddingService] === 임베딩 생성 실패 완료 ===")
             return None
 
+    async def create_embeddings(self, texts: List[str],
+                                embedding_type: EmbeddingType = EmbeddingType.DOCUMENT) -> List[Optional[List[float]]]:
+        """
+        여러 텍스트의 임베딩을 API 1회 호출로 생성합니다. (일괄 백필용)
+
+        Args:
+            texts (List[str]): 임베딩을 생성할 텍스트 목록 (settings.embedding_batch_size 이하 권장)
+            embedding_type (EmbeddingType): 임베딩 타입 (쿼리 또는 문서)
+
+        Returns:
+            List[Optional[List[float]]]: 입력 순서대로의 임베딩 (실패 시 None)
+
+        Raises:
+            AdmissionRejected: 분당 한도/월 예산으로 보류된 경우 (백업 모델로 대체하지 않음)
+        """
+        if not texts:
+            return []
+
+        processed_texts = [self._preprocess_text(text, embedding_type) for text in texts]
+        try:
+            admission = await admission_controller.admit(
+                OPENAI_EMBEDDING_MODEL,
+                sum(estimate_tokens(text, OPENAI_EMBEDDING_MODEL) for text in processed_texts)
+            )
+            # 동기 클라이언트 호출은 스레드에서 실행해 다른 배치와 겹쳐 처리
+            response = await asyncio.to_thread(
+                self.client.embeddings.create,
+                model=OPENAI_EMBEDDING_MODEL,
+                input=processed_texts
+            )
+            admission_controller.settle(admission, response.usage.total_tokens)
+            embeddings = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+            logger.debug("[EmbeddingService] OpenAI 배치 임베딩 생성 성공: %s개", len(embeddings))
+            return embeddings
+        except AdmissionRejected:
+            # 한도 보류는 호출자가 재시도하도록 전달 (백업 모델은 차원이 달라 같은 인덱스에 섞을 수 없음)
+            raise
+        except Exception as openai_error:
+            logger.warning("[EmbeddingService] OpenAI 배치 임베딩 실패, 백업 모델 사용: %s", openai_error)
+
+        try:
+            fallback_model = await self.aget_fallback_model()
+            embeddings = await asyncio.to_thread(fallback_model.encode, processed_texts)
+            return [embedding.tolist() for embedding in embeddings]
+        except Exception as e:
+            logger.warning("[EmbeddingService] 배치 임베딩 생성 실패: %s", e)
+            return [None] * len(texts)
+
     def _preprocess_text(self, text: str, embedding_type: EmbeddingType) -> str:
         """
         임베딩 타입에 따른 텍스트 전처리를 수행합니다.
@@ -131,7 +223,7 @@ class EmbeddingService:
             # 문서용 전처리: 문서 내용임을 명시
             processed_text = f"문서: {text.strip()}"
 
-        print(f"[EmbeddingService] 전처리 결과: {processed_text[:100]}...")
+        logger.debug("[EmbeddingService] 전처리 결과: %s...", processed_text[:100])
         return processed_text
 
     async def create_query_embedding(self, text: str) -> Optional[List[float]]:
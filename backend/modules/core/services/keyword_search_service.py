@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import re
@@ -8,6 +9,8 @@ from bson import ObjectId
 from dotenv import load_dotenv
 from pymongo.collection import Collection
 
+from .search_result_cache import search_result_cache
+
 load_dotenv()
 try:
     from kiwipiepy import Kiwi
@@ -467,6 +470,7 @@ class KeywordSearchService:
             )
 
             self.logger.info(f"문서 인덱싱 완료: {resume.get('name', 'Unknown')} ({len(tokens)} 토큰)")
+            search_result_cache.bump_generation(f"resume indexed {resume_id}")
 
             return {
                 "success": True,
@@ -534,6 +538,7 @@ class KeywordSearchService:
 
             # 인덱스 새로고침
             self.es_client.indices.refresh(index=self.es_index)
+            search_result_cache.bump_generation("keyword index rebuilt")
 
             self.logger.info(f"Elasticsearch 인덱스 구축 완료: {indexed_count}개 성공, {failed_count}개 실패")
 
@@ -554,7 +559,7 @@ class KeywordSearchService:
             }
 
     async def search_by_keywords(self, query: str, collection: Collection,
-                               limit: int = 10) -> Dict[str, Any]:
+                               limit: int = 10, hydrate: bool = True) -> Dict[str, Any]:
         """
         Elasticsearch를 사용한 키워드 기반 이력서 검색
 
@@ -562,6 +567,12 @@ class KeywordSearchService:
             query (str): 검색 쿼리
             collection (Collection): MongoDB 이력서 컬렉션 (호환성)
             limit (int): 반환할 최대 결과 수
+            hydrate (bool): False 이면 MongoDB 조회 없이 색인 필드(_source)만으로 결과 구성
+                            (하이브리드 검색에서 융합 후 한 번만 조회할 때 사용)
+
+        같은 (검색어, 개수) 의 Elasticsearch 결과 중 순위(resume_id/점수/하이라이트)만
+        search_result_cache 에 저장되어 색인이 바뀌기 전까지 재사용되고, 문서 본문은 매번
+        MongoDB(hydrate=True) 또는 Elasticsearch(hydrate=False)에서 조회합니다.
 
         Returns:
             Dict[str, Any]: 검색 결과
@@ -637,13 +648,26 @@ class KeywordSearchService:
                 "source": ["resume_id", "basic_info_names", "applicant_id", "keywords", "summary", "extracted_text", "indexed_at"]
             }
 
-            # Elasticsearch 검색 실행 (8.x 버전 호환)
-            response = self.es_client.search(
-                index=self.es_index,
-                **search_body
-            )
-
-            hits = response["hits"]["hits"]
+            # Elasticsearch 검색 실행 (8.x 버전 호환, 캐시된 순위가 있으면 재사용)
+            # 캐시에는 순위(resume_id/점수/하이라이트)만 저장하고 문서 본문은 읽을 때 다시 조회
+            cache_key = search_result_cache.make_key("keyword", query, {"index": self.es_index}, limit=limit)
+            cached = search_result_cache.get(cache_key)
+            sources = None
+            if cached:
+                hits = cached["ranking"]
+            else:
+                response = await asyncio.to_thread(
+                    self.es_client.search,
+                    index=self.es_index,
+                    **search_body
+                )
+                hits = [
+                    {"resume_id": hit["_source"]["resume_id"], "_score": hit["_score"],
+                     "highlight": hit.get("highlight", {})}
+                    for hit in response["hits"]["hits"]
+                ]
+                sources = {hit["_source"]["resume_id"]: hit["_source"] for hit in response["hits"]["hits"]}
+                search_result_cache.set(cache_key, hits)
 
             if not hits:
                 return {
@@ -653,16 +677,31 @@ class KeywordSearchService:
                     "total": 0
                 }
 
-            # MongoDB에서 상세 정보 조회
-            resume_ids = [ObjectId(hit["_source"]["resume_id"]) for hit in hits]
-            resume_cursor = collection.find({"_id": {"$in": resume_ids}})
-            resume_list = await resume_cursor.to_list(length=None)
-            resumes = {str(r["_id"]): r for r in resume_list}
+            # MongoDB에서 상세 정보 조회 (hydrate=False 이면 색인 필드 사용)
+            if hydrate:
+                resume_ids = [ObjectId(hit["resume_id"]) for hit in hits]
+                resume_cursor = collection.find({"_id": {"$in": resume_ids}})
+                resume_list = await resume_cursor.to_list(length=None)
+                resumes = {str(r["_id"]): r for r in resume_list}
+            else:
+                if sources is None:
+                    # 캐시된 순위는 색인 문서 ID(= resume_id)로 필요한 필드만 한 번에 조회
+                    response = await asyncio.to_thread(
+                        self.es_client.mget,
+                        index=self.es_index,
+                        ids=[hit["resume_id"] for hit in hits],
+                        source=search_body["source"]
+                    )
+                    sources = {doc["_id"]: doc["_source"] for doc in response["docs"] if doc.get("found")}
+                resumes = {
+                    resume_id: {**source, "_id": resume_id}
+                    for resume_id, source in sources.items()
+                }
 
             # 결과 매핑
             results = []
             for hit in hits:
-                resume_id = hit["_source"]["resume_id"]
+                resume_id = hit["resume_id"]
                 score = hit["_score"]
 
                 resume = resumes.get(resume_id)
@@ -675,12 +714,12 @@ class KeywordSearchService:
                         resume["resume_id"] = str(resume["_id"])
 
                     # 날짜 변환
-                    if "created_at" in resume:
+                    if hasattr(resume.get("created_at"), "isoformat"):
                         resume["created_at"] = resume["created_at"].isoformat()
 
                     # 하이라이트 텍스트 추출
                     highlight_text = ""
-                    if "highlight" in hit:
+                    if hit.get("highlight"):
                         highlight_parts = []
                         for field, highlights in hit["highlight"].items():
                             highlight_parts.extend(highlights)
@@ -764,6 +803,7 @@ class KeywordSearchService:
             )
 
             self.logger.info(f"문서 삭제 완료: {resume_id}")
+            search_result_cache.bump_generation(f"resume deleted {resume_id}")
 
             return {
                 "success": True,
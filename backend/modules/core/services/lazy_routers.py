@@ -0,0 +1,151 @@
+"""
+지연 라우터 등록
+
+무거운 라우터 모듈(LangChain/LangGraph, Selenium, Kiwi 등을 끌어오는 모듈)을 앱 로드 시점에 import 하지 않고,
+경로 접두사만 등록해 두었다가 해당 경로로 첫 요청이 오거나 백그라운드 워밍업이 돌 때 import 합니다.
+
+- LAZY_ROUTERS=true (기본값: FAST_STARTUP 값)일 때만 지연 등록, 아니면 기존처럼 즉시 등록
+- 라우터별 import 시간/로드 경로를 기록해 시작 시간 예산 확인에 사용
+"""
+
+import asyncio
+import importlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LAZY_ROUTERS_ENABLED = os.getenv("LAZY_ROUTERS", os.getenv("FAST_STARTUP", "false")).lower() == "true"
+LAZY_ROUTER_WARMUP_DELAY = float(os.getenv("LAZY_ROUTER_WARMUP_DELAY", "1.0"))
+
+
+@dataclass
+class RouterSpec:
+    """라우터 등록 정보
+
+    path_prefixes 는 라우터의 최종 경로 접두사 (include_router prefix + APIRouter prefix)로,
+    지연 모드에서 어떤 요청이 이 라우터를 필요로 하는지 판단하는 데 사용합니다.
+    main.py 에 직접 정의된 경로와 겹치는 라우터는 등록 순서가 매칭에 영향을 주므로 eager=True 로 둡니다.
+    """
+    module: str
+    path_prefixes: Tuple[str, ...]
+    include_kwargs: Dict[str, Any] = field(default_factory=dict)
+    attr: str = "router"
+    optional: bool = True
+    eager: bool = False
+    status: str = "pending"
+    loaded_by: Optional[str] = None
+    import_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+    def matches(self, path: str) -> bool:
+        return any(path == prefix or path.startswith(prefix.rstrip("/") + "/") for prefix in self.path_prefixes)
+
+
+class LazyRouterRegistry:
+    """라우터 지연 등록/로드 관리자 (앱당 1개)"""
+
+    def __init__(self, app, lazy: bool = LAZY_ROUTERS_ENABLED):
+        self.app = app
+        self.lazy = lazy
+        self.specs: List[RouterSpec] = []
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def pending(self) -> List[RouterSpec]:
+        return [spec for spec in self.specs if spec.status == "pending"]
+
+    def register(self, spec: RouterSpec) -> None:
+        self.specs.append(spec)
+        if not self.lazy or spec.eager:
+            self._include(spec, self._import(spec), "startup")
+
+    def _import(self, spec: RouterSpec) -> Optional[Any]:
+        started = time.perf_counter()
+        try:
+            module = importlib.import_module(spec.module)
+            return getattr(module, spec.attr)
+        except ImportError as e:
+            spec.error = str(e)
+            if not spec.optional and not self.lazy:
+                raise
+            return None
+        finally:
+            spec.import_seconds = round(time.perf_counter() - started, 4)
+
+    def _include(self, spec: RouterSpec, router: Optional[Any], loaded_by: str) -> None:
+        """import 된 라우터 등록 (이벤트 루프 스레드에서 호출)"""
+        spec.loaded_by = loaded_by
+        if router is None:
+            spec.status = "unavailable"
+            level = logging.WARNING if spec.optional else logging.ERROR
+            logger.log(level, "라우터 로드 실패: %s (%s)", spec.module, spec.error)
+            return
+        self.app.include_router(router, **spec.include_kwargs)
+        # 새 경로가 문서에 반영되도록 OpenAPI 스키마 캐시 초기화
+        self.app.openapi_schema = None
+        spec.status = "loaded"
+        if loaded_by != "startup":
+            logger.info("라우터 지연 로드: %s (%.3fs, %s)", spec.module, spec.import_seconds, loaded_by)
+
+    async def load(self, spec: RouterSpec, loaded_by: str) -> None:
+        """import 는 스레드에서, 라우터 등록은 루프에서 (동시 요청은 잠금으로 1회만 로드)"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if spec.status != "pending":
+                return
+            router = await asyncio.to_thread(self._import, spec)
+            self._include(spec, router, loaded_by)
+
+    async def ensure_loaded(self, path: str) -> None:
+        for spec in self.pending:
+            if spec.matches(path):
+                await self.load(spec, "request")
+
+    async def warm_up(self, delay: float = LAZY_ROUTER_WARMUP_DELAY) -> None:
+        """포트가 열린 뒤 남은 라우터를 순서대로 로드 (lifespan 에서 백그라운드 태스크로 실행)"""
+        if not self.pending:
+            return
+        await asyncio.sleep(delay)
+        for spec in self.pending:
+            await self.load(spec, "warmup")
+        logger.info("라우터 워밍업 완료: %s", self.summary())
+
+    def summary(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        for spec in self.specs:
+            counts[spec.status] = counts.get(spec.status, 0) + 1
+        return {
+            "lazy": self.lazy,
+            "counts": counts,
+            "import_seconds": round(sum(spec.import_seconds or 0.0 for spec in self.specs), 4)
+        }
+
+    def report(self) -> List[Dict[str, Any]]:
+        """라우터별 상태/import 시간 (느린 순)"""
+        rows = [{
+            "module": spec.module,
+            "path_prefixes": list(spec.path_prefixes),
+            "status": spec.status,
+            "loaded_by": spec.loaded_by,
+            "import_seconds": spec.import_seconds,
+            "error": spec.error
+        } for spec in self.specs]
+        return sorted(rows, key=lambda row: row["import_seconds"] or 0.0, reverse=True)
+
+
+class LazyRouterMiddleware:
+    """라우팅 전에 요청 경로에 해당하는 지연 라우터를 로드하는 ASGI 미들웨어"""
+
+    def __init__(self, app, registry: LazyRouterRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket") and self.registry.pending:
+            await self.registry.ensure_loaded(scope["path"])
+        await self.app(scope, receive, send)
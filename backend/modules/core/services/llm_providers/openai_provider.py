@@ -21,6 +21,8 @@ except ImportError:
     OPENAI_AVAILABLE = False
     logging.warning("openai 라이브러리가 설치되지 않았습니다.")
 
+from modules.token_monitor import llm_instrumentation
+
 from .base_provider import LLMProvider, LLMProviderFactory, LLMResponse
 
 logger = logging.getLogger(__name__)
@@ -54,8 +56,8 @@ class OpenAIProvider(LLMProvider):
             # 클라이언트 설정 구성
             client_config = self._build_client_config()
 
-            # 클라이언트 생성
-            self.client = AsyncOpenAI(**client_config)
+            # 클라이언트 생성 (호출마다 토큰 사용량 기록)
+            self.client = llm_instrumentation.instrument(AsyncOpenAI(**client_config), __name__)
 
             # 연결 테스트
             self._test_connection()
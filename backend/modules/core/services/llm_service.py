@@ -4,6 +4,11 @@ from typing import Any, Dict, List
 
 import httpx
 from dotenv import load_dotenv
+from modules.token_monitor import (AdmissionRejected, admission_controller,
+                                   estimate_message_tokens,
+                                   llm_instrumentation)
+
+from .passage_alignment import alignment_coverage, classify_alignment
 
 # .env 파일 로드
 load_dotenv()
@@ -44,6 +49,22 @@ class LLMService:
             print(f"[LLMService] Ollama 모델: {self.ollama_model}")
             print(f"[LLMService] === LLM 서비스 초기화 완료 ===")
 
+        self._openai_client = None
+
+    def _get_openai_client(self):
+        """OpenAI 클라이언트 (커넥션 풀 재사용을 위해 인스턴스당 1회 생성, 호출마다 토큰 사용량 기록)"""
+        if self._openai_client is None:
+            self._openai_client = llm_instrumentation.instrument(
+                openai.OpenAI(api_key=self.openai_api_key), __name__
+            )
+        return self._openai_client
+
+    def warm_up(self) -> str:
+        """첫 요청 전에 클라이언트를 미리 생성 (네트워크 호출 없음)"""
+        if self.primary_llm == "openai" and openai:
+            self._get_openai_client()
+        return self.primary_llm
+
     async def chat_completion(self, messages: List[Dict[str, str]], max_tokens: int = 300, temperature: float = 1.0) -> str:
         """LLM API를 사용하여 대화 응답을 생성합니다."""
         try:
@@ -60,14 +81,19 @@ class LLMService:
             if not openai:
                 return "OpenAI 라이브러리가 설치되지 않았습니다."
 
-            # OpenAI 클라이언트 설정
-            client = openai.OpenAI(api_key=self.openai_api_key)
+            # OpenAI 클라이언트 (재사용)
+            client = self._get_openai_client()
+
+            # max_tokens 최소값 보장 (너무 작으면 응답이 잘림)
+            safe_max_tokens = max(max_tokens, 500)  # 최소값을 500으로 증가
+
+            # 호출 전 허용 제어 (분당 한도/월 예산, 일괄 작업은 대화 요청에 양보)
+            prompt_tokens = estimate_message_tokens(messages, self.openai_model)
+            admission = await admission_controller.admit(self.openai_model, prompt_tokens, safe_max_tokens)
+            safe_max_tokens = admission.max_tokens
 
             # 속도 최적화: 재시도 로직 제거, 타임아웃 설정
             try:
-                # max_tokens 최소값 보장 (너무 작으면 응답이 잘림)
-                safe_max_tokens = max(max_tokens, 500)  # 최소값을 500으로 증가
-
                 # OpenAI API 호출 (타임아웃 15초로 증가)
                 response = client.chat.completions.create(
                     model=self.openai_model,
@@ -79,8 +105,12 @@ class LLMService:
 
             except Exception as e:
                 print(f"[LLMService] OpenAI API 호출 실패: {e}")
+                admission_controller.settle(admission, prompt_tokens)
                 raise e
 
+            usage = getattr(response, 'usage', None)
+            admission_controller.settle(admission, usage.total_tokens if usage else None)
+
             # choices 유효성 검사
             if not response or not hasattr(response, 'choices') or len(response.choices) == 0:
                 print(f"[LLMService] OpenAI 빈 choices 배열 감지, 기본 JSON 응답 반환")
@@ -89,18 +119,24 @@ class LLMService:
 
             # finish_reason 확인
             choice = response.choices[0]
-            if choice.finish_reason == 'length':
+            # 월 한도 근접으로 응답 길이를 줄인 경우 재시도하지 않음
+            if choice.finish_reason == 'length' and not admission.degraded:
                 print(f"[LLMService] OpenAI 응답이 토큰 길이 제한으로 잘림 (finish_reason: length)")
                 print(f"[LLMService] 현재 max_tokens: {safe_max_tokens}, 더 큰 값으로 재시도 필요")
                 # 토큰 길이 제한으로 잘린 경우 더 큰 토큰으로 재시도
                 try:
+                    retry_admission = await admission_controller.admit(
+                        self.openai_model, prompt_tokens, safe_max_tokens * 2
+                    )
                     retry_response = client.chat.completions.create(
                         model=self.openai_model,
                         messages=messages,
-                        max_completion_tokens=safe_max_tokens * 2,  # 2배로 증가
+                        max_completion_tokens=retry_admission.max_tokens,  # 2배로 증가
                         temperature=temperature,
                         timeout=15.0
                     )
+                    retry_usage = getattr(retry_response, 'usage', None)
+                    admission_controller.settle(retry_admission, retry_usage.total_tokens if retry_usage else None)
                     if retry_response.choices and retry_response.choices[0].message.content:
                         content = retry_response.choices[0].message.content
                         print(f"[LLMService] 재시도 성공: 응답 길이 {len(content)}")
@@ -125,6 +161,9 @@ class LLMService:
             print(f"[LLMService] OpenAI 응답 생성 완료 (길이: {len(content)})")
             return content
 
+        except AdmissionRejected as e:
+            print(f"[LLMService] OpenAI 호출 보류 ({e.reason}): {e}")
+            return f"죄송합니다. {e}"
         except Exception as e:
             print(f"[LLMService] OpenAI API 오류: {str(e)}")
             return f"OpenAI API 오류: {str(e)}"
@@ -254,6 +293,10 @@ class LLMService:
                     "recommendations": []
                 }
 
+            # 구간 정렬 결과가 있으면 커버리지로 판정하고 경계 사례만 LLM 검토
+            if all(doc.get("alignment") for doc in similar_resumes):
+                return await self._analyze_aligned_plagiarism(similar_resumes, document_type)
+
             # 최고 유사도 점수 확인 (API 응답 구조에 맞게 수정)
             similarities = []
             for resume in similar_resumes:
@@ -315,6 +358,82 @@ class LLMService:
                 "analyzed_at": datetime.now().isoformat()
             }
 
+    async def _analyze_aligned_plagiarism(self, similar_documents: List[Dict[str, Any]],
+                                          document_type: str) -> Dict[str, Any]:
+        """
+        PassageAligner 결과(일치 구간, 커버리지)로 표절 의심도를 판정합니다.
+
+        커버리지가 명확히 높거나 낮으면 규칙 기반으로 설명하고,
+        경계 구간(BORDERLINE)일 때만 일치 구간 발췌문을 LLM에 전달합니다.
+        """
+        ranked = sorted(similar_documents, key=lambda doc: alignment_coverage(doc["alignment"]), reverse=True)
+        top_alignment = ranked[0]["alignment"]
+        suspicion_score = alignment_coverage(top_alignment)
+        verdict = classify_alignment(top_alignment)
+        suspicion_level = {"HIGH": "HIGH", "BORDERLINE": "MEDIUM", "LOW": "LOW"}[verdict]
+
+        passages = [passage for doc in ranked[:3] for passage in doc["alignment"]["passages"][:2]]
+        llm_escalated = verdict == "BORDERLINE" and bool(passages)
+        if llm_escalated:
+            analysis = await self._generate_passage_plagiarism_analysis(passages, document_type)
+        else:
+            analysis = self._describe_aligned_passages(passages, suspicion_level, suspicion_score, document_type)
+
+        print(f"[LLMService] 구간 정렬 기반 판정: {suspicion_level} (커버리지: {suspicion_score:.3f}, LLM 검토: {llm_escalated})")
+
+        return {
+            "success": True,
+            "suspicion_level": suspicion_level,
+            "suspicion_score": suspicion_score,
+            "suspicion_score_percent": int(suspicion_score * 100),
+            "analysis": analysis,
+            "recommendations": [],
+            "similar_count": len(similar_documents),
+            "matched_passages": passages,
+            "llm_escalated": llm_escalated,
+            "analyzed_at": datetime.now().isoformat()
+        }
+
+    def _describe_aligned_passages(self, passages: List[Dict[str, Any]], suspicion_level: str,
+                                   coverage: float, document_type: str) -> str:
+        """일치 구간을 인용한 규칙 기반 분석 문장"""
+        if not passages:
+            return f"다른 {document_type}와 일치하는 문장 구간이 발견되지 않았습니다. 표절 의심도가 낮습니다."
+
+        excerpt = passages[0]["source_excerpt"]
+        if suspicion_level == "HIGH":
+            return (f"‘{excerpt[:80]}’ 등 {len(passages)}개 구간이 다른 {document_type}와 그대로 일치하며, "
+                    f"본문의 {coverage:.0%}가 일치 구간입니다. 표절 여부에 대한 검토가 필요합니다.")
+        return (f"‘{excerpt[:80]}’ 구간이 다른 {document_type}와 일치하지만 본문의 {coverage:.0%}에 그칩니다. "
+                f"관용적 표현일 가능성이 높아 표절 의심도가 낮습니다.")
+
+    async def _generate_passage_plagiarism_analysis(self, passages: List[Dict[str, Any]], document_type: str) -> str:
+        """경계 사례의 일치 구간 발췌문만 LLM에 전달해 분석 문장을 생성합니다."""
+        excerpts = "\n".join(
+            f"{index}. 기준: \"{passage['source_excerpt']}\" / 비교: \"{passage['target_excerpt']}\""
+            for index, passage in enumerate(passages, 1)
+        )
+        prompt = f"""다음은 기준 {document_type}와 다른 {document_type}에서 글자 단위로 일치한 구간입니다.
+
+{excerpts}
+
+각 구간이 관용적 표현인지, 고유한 경험/서술을 복사한 것인지 판단해 3줄 이내로 설명하세요.
+유사도 수치는 말하지 말고, 마지막 줄에는 중립적인 평가 문장("검토 권장" 등)을 넣으세요."""
+
+        analysis_text = await self.chat_completion(
+            [
+                {"role": "system", "content": "당신은 문서 표절 분석 전문가입니다. 제시된 일치 구간만 근거로 판단해주세요."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=200,
+            temperature=0.3
+        )
+        if analysis_text.startswith("죄송합니다"):
+            # 폴백: 발췌문만 인용
+            return (f"‘{passages[0]['source_excerpt'][:80]}’ 등 {len(passages)}개 구간이 다른 {document_type}와 일치합니다. "
+                    f"일부 구간이 겹치므로 표절 여부에 대한 검토가 권장됩니다.")
+        return "\n".join(analysis_text.strip().split("\n")[:3])
+
     async def analyze_ideal_candidate(self, applicant_info: Dict[str, Any]) -> Dict[str, Any]:
         """
         지원자 정보를 바탕으로 이상적인 인재상 LLM 분석 수행
@@ -333,7 +452,7 @@ class LLMService:
             prompt = self._create_ideal_candidate_analysis_prompt(applicant_info)
 
             # OpenAI API 호출
-            client = openai.OpenAI(api_key=self.openai_api_key)
+            client = self._get_openai_client()
             response = client.chat.completions.create(
                 model=self.openai_model,
                 messages=[
@@ -396,7 +515,7 @@ class LLMService:
             prompt = self._create_similar_applicants_analysis_prompt(target_applicant, similar_applicants)
 
             # OpenAI API 호출
-            client = openai.OpenAI(api_key=self.openai_api_key)
+            client = self._get_openai_client()
             response = client.chat.completions.create(
                 model=self.openai_model,
                 messages=[
@@ -635,7 +754,7 @@ class LLMService:
 """
 
             # OpenAI API 호출
-            client = openai.OpenAI(api_key=self.openai_api_key)
+            client = self._get_openai_client()
             response = client.chat.completions.create(
                 model=self.openai_model,
                 messages=[
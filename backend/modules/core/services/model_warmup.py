@@ -0,0 +1,109 @@
+"""
+모델 워밍업 오케스트레이터
+
+설정(fast_startup, preload_models, lazy_loading_enabled, background_preload)을 한곳에서 해석해
+모델/클라이언트 로딩을 background_preloader 의 우선순위 작업으로 예약합니다.
+
+- background: 포트를 먼저 열고 시작 직후 백그라운드에서 로딩 (background_preload 또는 fast_startup)
+- blocking: 시작 단계에서 로딩을 끝낸 뒤 요청 수신 (background_preload=false)
+- on_demand: 사전 로딩 없음, 첫 요청 시 로딩 (preload_models=false 또는 lazy_loading_enabled)
+
+어느 모드든 요청은 ensure_model() 로 모델을 받으며, 로딩 중이면 같은 Future 를 기다립니다.
+"""
+
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from modules.config.settings import get_settings
+
+from .background_preloader import background_preloader, register_preload_task
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_FALLBACK_MODEL = "embedding_fallback_model"
+HUGGINGFACE_ANALYZER = "huggingface_analyzer"
+
+MODEL_WARMUP_TIMEOUT = float(os.getenv("MODEL_WARMUP_TIMEOUT_SECONDS", "300"))
+
+_warmup_mode: Optional[str] = None
+
+
+def _load_embedding_fallback_model():
+    from modules.core.services.embedding_service import load_fallback_model
+    return load_fallback_model()
+
+
+def _load_huggingface_analyzer():
+    from modules.ai.huggingface_analyzer import HuggingFaceResumeAnalyzer
+    return HuggingFaceResumeAnalyzer()
+
+
+def register_model_preload_tasks() -> None:
+    """모델 로딩 작업 등록 (여러 번 호출해도 1회만 등록)"""
+    register_preload_task(
+        name=EMBEDDING_FALLBACK_MODEL,
+        priority=8,
+        load_function=_load_embedding_fallback_model,
+        estimated_load_time=15.0
+    )
+    register_preload_task(
+        name=HUGGINGFACE_ANALYZER,
+        priority=7,
+        load_function=_load_huggingface_analyzer,
+        estimated_load_time=45.0
+    )
+
+
+def resolve_warmup_mode(settings=None) -> str:
+    settings = settings or get_settings()
+    if not settings.preload_models or settings.lazy_loading_enabled:
+        return "on_demand"
+    if settings.background_preload or settings.fast_startup:
+        return "background"
+    return "blocking"
+
+
+async def start_model_warmup(settings=None) -> str:
+    """설정에 따라 모델 로딩 예약 (lifespan 시작 시 호출)"""
+    global _warmup_mode
+    register_model_preload_tasks()
+    _warmup_mode = resolve_warmup_mode(settings)
+
+    background_preloader.preload_enabled = _warmup_mode != "on_demand"
+    await background_preloader.start()
+    if _warmup_mode == "blocking":
+        try:
+            await background_preloader.wait_until_loaded(MODEL_WARMUP_TIMEOUT)
+        except Exception as e:
+            logger.warning("모델 사전 로딩이 시간 내에 끝나지 않음, 나머지는 백그라운드에서 계속: %s", e)
+
+    logger.info("모델 워밍업 모드: %s, 상태: %s", _warmup_mode, background_preloader.get_readiness())
+    return _warmup_mode
+
+
+async def ensure_model(name: str) -> Any:
+    """모델 반환 (로딩 중이면 진행 중인 로딩을 기다리고, 로딩 전이면 지금 로딩)"""
+    if name not in background_preloader.tasks:
+        register_model_preload_tasks()
+    return await background_preloader.ensure_loaded(name)
+
+
+def get_loaded_model(name: str) -> Optional[Any]:
+    """이미 로딩된 모델 (없으면 None, 로딩을 시작하지 않음)"""
+    return background_preloader.get_loaded(name)
+
+
+def get_readiness() -> Dict[str, Any]:
+    """구성 요소별 준비 상태 (/health 응답용)
+
+    ready 는 백그라운드로 예약된 구성 요소가 모두 로딩을 마쳤는지 (on_demand/failed 는 대기 대상 아님)
+    """
+    components = background_preloader.get_readiness()
+    return {
+        "mode": _warmup_mode or "not_started",
+        "ready": _warmup_mode is not None and not any(
+            status in ("loading", "pending") for status in components.values()
+        ),
+        "components": components
+    }
@@ -1,14 +1,67 @@
+import asyncio
+import base64
+import json
 import os
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClient
 
+from modules.core.services.chunking_service import RESUME_SOURCE_FIELDS
+from modules.core.services.cohort_similarity_index import (COHORT_INDEX_FIELDS,
+                                                           schedule_cohort_sync)
+from modules.core.services.near_duplicate_index import CoverLetterNearDuplicateIndex
+
+# 목록 화면(테이블 행)에 필요한 필드만 조회하는 프로젝션
+APPLICANT_LIST_PROJECTION = {
+    "name": 1,
+    "email": 1,
+    "phone": 1,
+    "position": 1,
+    "department": 1,
+    "experience": 1,
+    "skills": 1,
+    "status": 1,
+    "analysisScore": 1,
+    "ranks": 1,
+    "job_posting_id": 1,
+    "resume_id": 1,
+    "cover_letter_id": 1,
+    "portfolio_id": 1,
+    "created_at": 1,
+    "updated_at": 1,
+    # 목록 화면의 분석 요약/성장 배경/지원일/첨부 문서 표시용
+    "resume_analysis": 1,
+    "cover_letter_analysis": 1,
+    "portfolio_analysis": 1,
+    "growthBackground": 1,
+    "appliedDate": 1,
+    "documents": 1,
+}
+
+# 이력서 청크에 들어가는 지원자 필드 (바뀌면 이력서 청크를 다시 계산)
+RESUME_APPLICANT_FIELDS = set(RESUME_SOURCE_FIELDS)
+# 임베딩에 실패해 다음 동기화에서 다시 임베딩할 청크의 content_hash
+CHUNK_HASH_PENDING = "pending"
+
+# 필터별 지원자 수 캐시: {필터 키: (count, 저장 시각)}
+APPLICANT_COUNT_CACHE_TTL = 30
+_applicant_count_cache: Dict[str, Any] = {}
+
+# 지원자 통계 물리화 문서 (applicant_stats 컬렉션)
+APPLICANT_STATS_DOC_ID = "overview"
+APPLICANT_STATS_RECENT_DAYS = 7
+APPLICANT_STATS_RECONCILE_INTERVAL = 600
+APPLICANT_STATS_PROJECTION = {"status": 1, "position": 1, "created_at": 1}
+
 
 class MongoService:
     """MongoDB 서비스 클래스"""
 
+    _applicant_indexes_ensured = False
+
     def __init__(self, mongo_uri: str = None):
         self.mongo_uri = mongo_uri or os.getenv("MONGODB_URI", "mongodb://localhost:27017/hireme")
         self.client = AsyncIOMotorClient(self.mongo_uri)
@@ -96,6 +149,9 @@ class MongoService:
         try:
             applicant_data["created_at"] = datetime.now()
             result = await self.db.applicants.insert_one(applicant_data)
+            _applicant_count_cache.clear()
+            await self._apply_applicant_stats_delta(self._applicant_stats_inc(applicant_data, 1))
+            schedule_cohort_sync(self.db, [result.inserted_id])
             return str(result.inserted_id)
         except Exception as e:
             print(f"지원자 저장 오류: {e}")
@@ -114,14 +170,127 @@ class MongoService:
                     {"_id": applicant_id},
                     {"$set": update_data}
                 )
-            return result.modified_count > 0
+            modified = result.modified_count > 0
+            # 이력서 청크에 들어가는 필드가 바뀌면 변경된 청크만 다시 임베딩
+            if modified and RESUME_APPLICANT_FIELDS.intersection(update_data):
+                await self.refresh_resume_chunks(applicant_id)
+            # 유사도 비교 필드나 채용공고가 바뀌면 코호트 인덱스 갱신
+            if modified and COHORT_INDEX_FIELDS.intersection(update_data):
+                schedule_cohort_sync(self.db, [applicant_id])
+            return modified
         except Exception as e:
             print(f"지원자 업데이트 오류: {e}")
             return False
 
-    async def get_applicants(self, skip: int = 0, limit: int = 20, status: str = None, position: str = None) -> Dict[str, Any]:
-        """지원자 목록 조회 (필터링 포함)"""
+    async def ensure_applicant_indexes(self) -> None:
+        """지원자 목록 키셋 페이지네이션 / 이메일 upsert 용 인덱스 생성 (프로세스당 1회)"""
+        if MongoService._applicant_indexes_ensured:
+            return
+        try:
+            await self.db.applicants.create_index(
+                [("created_at", -1), ("_id", -1)], name="created_at_-1__id_-1"
+            )
+            await self.db.applicants.create_index(
+                [("status", 1), ("created_at", -1), ("_id", -1)], name="status_1_created_at_-1__id_-1"
+            )
+            await self.db.applicants.create_index(
+                [("position", 1), ("created_at", -1), ("_id", -1)], name="position_1_created_at_-1__id_-1"
+            )
+            # 이메일 기준 지원자 upsert (DocumentUnitOfWork) 조회용
+            await self.db.applicants.create_index([("email", 1)], name="email_1")
+            MongoService._applicant_indexes_ensured = True
+        except Exception as e:
+            print(f"지원자 인덱스 생성 오류: {e}")
+
+    @staticmethod
+    def _encode_applicant_cursor(applicant: Dict[str, Any]) -> str:
+        """마지막 행의 (created_at, _id)를 불투명한 커서 문자열로 인코딩"""
+        created_at = applicant.get("created_at")
+        payload = {
+            "c": created_at.isoformat() if isinstance(created_at, datetime) else None,
+            "i": str(applicant["_id"]),
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_applicant_cursor(cursor: str) -> Dict[str, Any]:
+        """커서 문자열을 키셋 조건으로 변환
+
+        Raises:
+            ValueError: 커서 형식이 잘못된 경우
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+            created_at = datetime.fromisoformat(payload["c"]) if payload.get("c") else None
+            last_id = ObjectId(payload["i"]) if ObjectId.is_valid(payload["i"]) else str(payload["i"])
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+        # 정렬 순서 (created_at DESC, _id DESC) 에서 커서 이후 행만 선택
+        # created_at 이 없는 문서는 내림차순에서 가장 뒤에 위치하므로 같은 그룹 안에서만 이어서 조회
+        conditions = [{"created_at": created_at, "_id": {"$lt": last_id}}]
+        if created_at is not None:
+            conditions.append({"created_at": {"$lt": created_at}})
+            conditions.append({"created_at": None})
+        return {"$or": conditions}
+
+    async def _count_applicants_cached(self, filter_query: Dict[str, Any]) -> int:
+        """지원자 수 조회 (필터 없음: 추정치, 필터 있음: TTL 캐시)"""
+        if not filter_query:
+            return await self.db.applicants.estimated_document_count()
+
+        cache_key = json.dumps(filter_query, sort_keys=True, default=str)
+        cached = _applicant_count_cache.get(cache_key)
+        now = time.monotonic()
+        if cached and now - cached[1] < APPLICANT_COUNT_CACHE_TTL:
+            return cached[0]
+
+        count = await self.db.applicants.count_documents(filter_query)
+        _applicant_count_cache[cache_key] = (count, now)
+        return count
+
+    async def _get_job_posting_infos(self, job_posting_ids: List[Any]) -> Dict[str, Dict[str, Any]]:
+        """채용공고 요약 정보를 한 번의 $in 쿼리로 조회"""
+        object_ids = []
+        for job_posting_id in set(job_posting_ids):
+            if isinstance(job_posting_id, ObjectId):
+                object_ids.append(job_posting_id)
+            elif job_posting_id and ObjectId.is_valid(str(job_posting_id)):
+                object_ids.append(ObjectId(str(job_posting_id)))
+        if not object_ids:
+            return {}
+
+        cursor = self.db.job_postings.find(
+            {"_id": {"$in": object_ids}},
+            {"title": 1, "company": 1, "location": 1, "status": 1}
+        )
+        infos = {}
+        async for job_posting in cursor:
+            infos[str(job_posting["_id"])] = {
+                "id": str(job_posting["_id"]),
+                "title": job_posting.get("title", "제목 없음"),
+                "company": job_posting.get("company", "회사명 없음"),
+                "location": job_posting.get("location", "근무지 없음"),
+                "status": job_posting.get("status", "draft")
+            }
+        return infos
+
+    async def get_applicants(self, skip: int = 0, limit: int = 20, status: str = None, position: str = None,
+                             cursor: Optional[str] = None) -> Dict[str, Any]:
+        """지원자 목록 조회 (필터링 포함)
+
+        목록 화면용 경량 프로젝션(APPLICANT_LIST_PROJECTION)만 반환하며,
+        (created_at, _id) 내림차순으로 정렬합니다. cursor 가 주어지면 skip 대신
+        키셋 페이지네이션을 사용하고, 응답의 next_cursor 로 다음 페이지를 조회할 수 있습니다.
+
+        Raises:
+            ValueError: cursor 형식이 잘못된 경우
+        """
+        # 잘못된 커서는 빈 목록이 아니라 요청 오류로 알림
+        cursor_query = self._decode_applicant_cursor(cursor) if cursor else None
         try:
+            await self.ensure_applicant_indexes()
+
             # 필터 조건 구성 - 실제 DB 필드명 사용
             filter_query = {}
             if status:
@@ -129,8 +298,24 @@ class MongoService:
             if position:
                 filter_query["position"] = position
 
-            total_count = await self.db.applicants.count_documents(filter_query)
-            applicants = await self.db.applicants.find(filter_query).skip(skip).limit(limit).to_list(limit)
+            page_query = dict(filter_query)
+            if cursor_query:
+                page_query = {"$and": [filter_query, cursor_query]} if filter_query else cursor_query
+
+            find_cursor = self.db.applicants.find(page_query, APPLICANT_LIST_PROJECTION) \
+                .sort([("created_at", -1), ("_id", -1)])
+            if not cursor:
+                find_cursor = find_cursor.skip(skip)
+            # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+            applicants = await find_cursor.limit(limit + 1).to_list(limit + 1)
+            has_more = len(applicants) > limit
+            applicants = applicants[:limit]
+            next_cursor = self._encode_applicant_cursor(applicants[-1]) if has_more and applicants else None
+
+            total_count = await self._count_applicants_cached(filter_query)
+            job_posting_infos = await self._get_job_posting_infos(
+                [applicant.get("job_posting_id") for applicant in applicants if applicant.get("job_posting_id")]
+            )
 
             # MongoDB의 _id를 문자열로 변환
             for applicant in applicants:
@@ -140,74 +325,25 @@ class MongoService:
                 # ObjectId 필드들을 문자열로 변환
                 for field in ["job_posting_id", "resume_id", "cover_letter_id", "portfolio_id"]:
                     if field in applicant and applicant[field] is not None:
-                        if hasattr(applicant[field], '__str__'):
-                            applicant[field] = str(applicant[field])
+                        applicant[field] = str(applicant[field])
 
                 # DB 구조에 맞게 필드 매핑 (personal_info 없이 직접 필드 사용)
-                # name, email, phone, position, status는 이미 올바른 필드명
                 applicant["name"] = applicant.get("name", "이름 없음")
                 applicant["email"] = applicant.get("email", "이메일 없음")
                 applicant["phone"] = applicant.get("phone", "전화번호 없음")
                 applicant["position"] = applicant.get("position", "직무 없음")
                 applicant["status"] = applicant.get("status", "상태 없음")
 
-                # 채용공고 정보 가져오기 (job_posting_id가 있는 경우)
-                if applicant.get("job_posting_id"):
-                    try:
-                        # 안전한 ObjectId 변환
-                        if isinstance(applicant["job_posting_id"], ObjectId):
-                            job_posting_id = applicant["job_posting_id"]
-                        else:
-                            job_posting_id = ObjectId(applicant["job_posting_id"])
-
-                        job_posting = await self.db.job_postings.find_one({"_id": job_posting_id})
-                        if job_posting:
-                            applicant["job_posting_info"] = {
-                                "id": str(job_posting["_id"]),
-                                "title": job_posting.get("title", "제목 없음"),
-                                "company": job_posting.get("company", "회사명 없음"),
-                                "location": job_posting.get("location", "근무지 없음"),
-                                "status": job_posting.get("status", "draft")
-                            }
-                    except Exception as e:
-                        print(f"채용공고 정보 가져오기 실패 (ID: {applicant['job_posting_id']}): {e}")
-
-                # 자소서 내용 가져오기 (cover_letter_id가 있는 경우)
-                if applicant.get("cover_letter_id"):
-                    try:
-                        # 안전한 ObjectId 변환
-                        if isinstance(applicant["cover_letter_id"], ObjectId):
-                            cover_letter_id = applicant["cover_letter_id"]
-                        else:
-                            cover_letter_id = ObjectId(applicant["cover_letter_id"])
-
-                        cover_letter = await self.db.cover_letters.find_one({"_id": cover_letter_id})
-                        if cover_letter:
-                            applicant["cover_letter_content"] = cover_letter.get("content", cover_letter.get("extracted_text", "자소서 내용을 불러올 수 없습니다."))
-                    except Exception as e:
-                        print(f"자소서 내용 가져오기 실패 (ID: {applicant['cover_letter_id']}): {e}")
-
-                # 이력서 내용 가져오기 (resume_id가 있는 경우)
-                if applicant.get("resume_id"):
-                    try:
-                        # 안전한 ObjectId 변환
-                        if isinstance(applicant["resume_id"], ObjectId):
-                            resume_id = applicant["resume_id"]
-                        else:
-                            resume_id = ObjectId(applicant["resume_id"])
-
-                        resume = await self.db.resumes.find_one({"_id": resume_id})
-                        if resume:
-                            applicant["resume_content"] = resume.get("content", resume.get("extracted_text", "이력서 내용을 불러올 수 없습니다."))
-                    except Exception as e:
-                        print(f"이력서 내용 가져오기 실패 (ID: {applicant['resume_id']}): {e}")
+                if applicant.get("job_posting_id") in job_posting_infos:
+                    applicant["job_posting_info"] = job_posting_infos[applicant["job_posting_id"]]
 
             return {
                 "applicants": applicants,
                 "total_count": total_count,
                 "skip": skip,
                 "limit": limit,
-                "has_more": (skip + limit) < total_count
+                "has_more": has_more,
+                "next_cursor": next_cursor
             }
         except Exception as e:
             print(f"지원자 목록 조회 오류: {e}")
@@ -216,55 +352,40 @@ class MongoService:
                 "total_count": 0,
                 "skip": skip,
                 "limit": limit,
-                "has_more": False
+                "has_more": False,
+                "next_cursor": None
             }
 
     async def delete_applicant(self, applicant_id: str) -> bool:
         """지원자 삭제"""
         try:
             if len(applicant_id) == 24:
-                result = await self.db.applicants.delete_one({"_id": ObjectId(applicant_id)})
+                deleted = await self.db.applicants.find_one_and_delete(
+                    {"_id": ObjectId(applicant_id)}, projection=APPLICANT_STATS_PROJECTION
+                )
             else:
-                result = await self.db.applicants.delete_one({"_id": applicant_id})
-            return result.deleted_count > 0
+                deleted = await self.db.applicants.find_one_and_delete(
+                    {"_id": applicant_id}, projection=APPLICANT_STATS_PROJECTION
+                )
+            if deleted is None:
+                return False
+            _applicant_count_cache.clear()
+            await self._apply_applicant_stats_delta(self._applicant_stats_inc(deleted, -1))
+            schedule_cohort_sync(self.db, [deleted["_id"]], removed=True)
+            return True
         except Exception as e:
             print(f"지원자 삭제 오류: {e}")
             return False
 
     def get_applicant_by_id_sync(self, applicant_id: str) -> Optional[Dict[str, Any]]:
-        """지원자 ID로 지원자 정보 조회 (동기)"""
-        try:
-            import asyncio
+        """지원자 ID로 지원자 정보 조회 (동기, pymongo 클라이언트 사용)
 
-            # 이미 실행 중인 이벤트 루프가 있는지 확인
-            try:
-                loop = asyncio.get_running_loop()
-                # 이미 실행 중인 루프가 있으면 동기적으로 처리
-                return self._get_applicant_by_id_sync_impl(applicant_id)
-            except RuntimeError:
-                # 실행 중인 루프가 없으면 새 루프 생성
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    if len(applicant_id) == 24:
-                        applicant = loop.run_until_complete(self.db.applicants.find_one({"_id": ObjectId(applicant_id)}))
-                    else:
-                        applicant = loop.run_until_complete(self.db.applicants.find_one({"_id": applicant_id}))
-
-                    # ObjectId를 문자열로 변환
-                    if applicant and "_id" in applicant:
-                        applicant["id"] = str(applicant["_id"])
-                        del applicant["_id"]
-
-                    return applicant
-                finally:
-                    loop.close()
-        except Exception as e:
-            print(f"지원자 조회 오류: {e}")
-            return None
+        이벤트 루프를 만들지 않습니다. 비동기 핸들러에서는 asyncio.to_thread 로 감싸 호출하세요.
+        """
+        return self._get_applicant_by_id_sync_impl(applicant_id)
 
     def _get_applicant_by_id_sync_impl(self, applicant_id: str) -> Optional[Dict[str, Any]]:
-        """동기적으로 지원자 ID로 조회 (이미 실행 중인 루프가 있을 때)"""
+        """동기적으로 지원자 ID로 조회"""
         try:
             from bson import ObjectId
 
@@ -313,6 +434,9 @@ class MongoService:
             applicant_dict["created_at"] = datetime.now()
             result = await self.db.applicants.insert_one(applicant_dict)
             new_applicant_id = str(result.inserted_id)
+            _applicant_count_cache.clear()
+            await self._apply_applicant_stats_delta(self._applicant_stats_inc(applicant_dict, 1))
+            schedule_cohort_sync(self.db, [result.inserted_id])
 
             # 생성된 지원자 정보 조회
             new_applicant = await self.db.applicants.find_one({"_id": result.inserted_id})
@@ -329,29 +453,14 @@ class MongoService:
             raise
 
     def create_or_get_applicant_sync(self, applicant_data: Dict[str, Any]) -> Dict[str, Any]:
-        """지원자 생성 또는 기존 지원자 조회 (동기)"""
-        try:
-            import asyncio
+        """지원자 생성 또는 기존 지원자 조회 (동기, pymongo 클라이언트 사용)
 
-            # 이미 실행 중인 이벤트 루프가 있는지 확인
-            try:
-                loop = asyncio.get_running_loop()
-                # 이미 실행 중인 루프가 있으면 동기적으로 처리
-                return self._create_or_get_applicant_sync_impl(applicant_data)
-            except RuntimeError:
-                # 실행 중인 루프가 없으면 새 루프 생성
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    return loop.run_until_complete(self.create_or_get_applicant(applicant_data))
-                finally:
-                    loop.close()
-        except Exception as e:
-            print(f"지원자 생성/조회 오류: {e}")
-            raise
+        이벤트 루프를 만들지 않습니다. 비동기 코드에서는 create_or_get_applicant 를 사용하세요.
+        """
+        return self._create_or_get_applicant_sync_impl(applicant_data)
 
     def _create_or_get_applicant_sync_impl(self, applicant_data: Dict[str, Any]) -> Dict[str, Any]:
-        """동기적으로 지원자 생성 또는 조회 (이미 실행 중인 루프가 있을 때)"""
+        """동기적으로 지원자 생성 또는 조회"""
         try:
             from bson import ObjectId
 
@@ -382,6 +491,11 @@ class MongoService:
             applicant_dict["created_at"] = datetime.now()
             result = self.sync_db.applicants.insert_one(applicant_dict)
             new_applicant_id = str(result.inserted_id)
+            _applicant_count_cache.clear()
+            stats_delta = self._applicant_stats_inc(applicant_dict, 1)
+            self.sync_db.applicant_stats.update_one(
+                {"_id": APPLICANT_STATS_DOC_ID}, {"$inc": stats_delta}, upsert=True
+            )
 
             # 생성된 지원자 정보 조회
             new_applicant = self.sync_db.applicants.find_one({"_id": result.inserted_id})
@@ -421,44 +535,128 @@ class MongoService:
     async def update_applicant_status(self, applicant_id: str, new_status: str) -> bool:
         """지원자 상태 업데이트"""
         try:
-            if len(applicant_id) == 24:
-                result = await self.db.applicants.update_one(
-                    {"_id": ObjectId(applicant_id)},
-                    {"$set": {"status": new_status, "updated_at": datetime.now()}}
-                )
-            else:
-                result = await self.db.applicants.update_one(
-                    {"_id": applicant_id},
-                    {"$set": {"status": new_status, "updated_at": datetime.now()}}
-                )
-            return result.modified_count > 0
+            query_id = ObjectId(applicant_id) if len(applicant_id) == 24 else applicant_id
+            # 이전 상태를 함께 받아 통계 문서를 증분 갱신
+            previous = await self.db.applicants.find_one_and_update(
+                {"_id": query_id, "status": {"$ne": new_status}},
+                {"$set": {"status": new_status, "updated_at": datetime.now()}},
+                projection={"status": 1}
+            )
+            if previous is None:
+                return False
+
+            _applicant_count_cache.clear()
+            stats_delta = {}
+            if previous.get("status"):
+                stats_delta[f"status.{self._stats_key(previous['status'])}"] = -1
+            if new_status:
+                stats_delta[f"status.{self._stats_key(new_status)}"] = 1
+            await self._apply_applicant_stats_delta(stats_delta)
+            return True
         except Exception as e:
             print(f"지원자 상태 업데이트 오류: {e}")
             return False
 
-    async def get_applicant_stats(self) -> Dict[str, Any]:
-        """지원자 통계 조회"""
+    @staticmethod
+    def _stats_key(value: Any) -> str:
+        """통계 문서의 필드 경로로 쓸 수 있도록 '.'과 '$'를 전각 문자로 치환"""
+        return str(value).replace(".", "\uff0e").replace("$", "\uff04")
+
+    @staticmethod
+    def _stats_label(key: str) -> str:
+        """_stats_key 로 치환한 키를 원래 값으로 복원"""
+        return key.replace("\uff0e", ".").replace("\uff04", "$")
+
+    def _applicant_stats_inc(self, applicant: Dict[str, Any], sign: int) -> Dict[str, int]:
+        """지원자 1명의 생성(+1)/삭제(-1)에 해당하는 통계 문서 $inc 연산 생성"""
+        inc = {"total": sign}
+        if applicant.get("status"):
+            inc[f"status.{self._stats_key(applicant['status'])}"] = sign
+        if applicant.get("position"):
+            inc[f"position.{self._stats_key(applicant['position'])}"] = sign
+        created_at = applicant.get("created_at")
+        if isinstance(created_at, datetime):
+            inc[f"daily.{created_at.strftime('%Y-%m-%d')}"] = sign
+        return inc
+
+    async def _apply_applicant_stats_delta(self, stats_delta: Dict[str, int]) -> None:
+        """통계 문서에 증분 반영 (실패해도 본 작업은 유지, 주기적 재계산에서 보정)"""
+        if not stats_delta:
+            return
         try:
-            # 전체 지원자 수
-            total_count = await self.db.applicants.count_documents({})
+            await self.db.applicant_stats.update_one(
+                {"_id": APPLICANT_STATS_DOC_ID},
+                {"$inc": stats_delta, "$set": {"updated_at": datetime.now()}},
+                upsert=True
+            )
+        except Exception as e:
+            print(f"지원자 통계 증분 갱신 오류: {e}")
+
+    async def rebuild_applicant_stats(self) -> Dict[str, Any]:
+        """전체 컬렉션을 집계하여 통계 문서를 재계산 (정합성 보정용)"""
+        # 오늘 포함 최근 APPLICANT_STATS_RECENT_DAYS 일 (자정 기준)
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        since = today - timedelta(days=APPLICANT_STATS_RECENT_DAYS - 1)
+        facets = await self.db.applicants.aggregate([
+            {"$facet": {
+                "total": [{"$count": "count"}],
+                "status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+                "position": [{"$group": {"_id": "$position", "count": {"$sum": 1}}}],
+                "daily": [
+                    {"$match": {"created_at": {"$gte": since}}},
+                    {"$group": {
+                        "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+                        "count": {"$sum": 1}
+                    }}
+                ]
+            }}
+        ]).to_list(1)
+        facet = facets[0] if facets else {}
+
+        stats_doc = {
+            "total": facet["total"][0]["count"] if facet.get("total") else 0,
+            "status": {self._stats_key(item["_id"]): item["count"] for item in facet.get("status", []) if item["_id"]},
+            "position": {self._stats_key(item["_id"]): item["count"] for item in facet.get("position", []) if item["_id"]},
+            "daily": {item["_id"]: item["count"] for item in facet.get("daily", []) if item["_id"]},
+            "updated_at": datetime.now(),
+            "reconciled_at": datetime.now()
+        }
+        await self.db.applicant_stats.replace_one({"_id": APPLICANT_STATS_DOC_ID}, stats_doc, upsert=True)
+        return stats_doc
+
+    async def run_applicant_stats_reconciler(self, interval: int = APPLICANT_STATS_RECONCILE_INTERVAL):
+        """통계 문서 주기적 재계산 루프 (백그라운드 태스크로 실행)"""
+        while True:
+            try:
+                await self.rebuild_applicant_stats()
+                await asyncio.sleep(interval)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                print(f"지원자 통계 재계산 오류: {e}")
+                await asyncio.sleep(interval)
 
-            # 상태별 지원자 수
-            status_stats = await self.db.applicants.aggregate([
-                {"$group": {"_id": "$status", "count": {"$sum": 1}}}
-            ]).to_list(None)
+    async def get_applicant_stats(self) -> Dict[str, Any]:
+        """지원자 통계 조회 (물리화된 통계 문서 1건 조회)"""
+        try:
+            stats_doc = await self.db.applicant_stats.find_one({"_id": APPLICANT_STATS_DOC_ID})
+            if stats_doc is None:
+                stats_doc = await self.rebuild_applicant_stats()
 
-            # 직무별 지원자 수
-            position_stats = await self.db.applicants.aggregate([
-                {"$group": {"_id": "$position", "count": {"$sum": 1}}}
-            ]).to_list(None)
+            # 상태별/직무별 지원자 수 (음수나 0이 된 버킷은 제외)
+            status_distribution = {
+                self._stats_label(key): count for key, count in stats_doc.get("status", {}).items() if count > 0
+            }
+            position_distribution = {
+                self._stats_label(key): count for key, count in stats_doc.get("position", {}).items() if count > 0
+            }
 
             # 최근 지원자 수 (7일)
-            recent_count = await self.db.applicants.count_documents({
-                "created_at": {"$gte": datetime.now() - timedelta(days=7)}
-            })
-
-            # 상태 분포를 세분화하여 계산
-            status_distribution = {item["_id"]: item["count"] for item in status_stats if item["_id"]}
+            today = datetime.now().date()
+            recent_days = {
+                (today - timedelta(days=offset)).strftime("%Y-%m-%d") for offset in range(APPLICANT_STATS_RECENT_DAYS)
+            }
+            recent_count = sum(count for day, count in stats_doc.get("daily", {}).items() if day in recent_days)
 
             # 서류합격과 최종합격을 구분
             document_passed = 0
@@ -485,8 +683,9 @@ class MongoService:
             rejected = (status_distribution.get('rejected', 0) +
                        status_distribution.get('failed', 0))
 
+            updated_at = stats_doc.get("updated_at")
             return {
-                "total_applicants": total_count,
+                "total_applicants": stats_doc.get("total", 0),
                 "status_distribution": {
                     **status_distribution,
                     "document_passed": document_passed,
@@ -494,9 +693,9 @@ class MongoService:
                     "pending": pending,
                     "rejected": rejected
                 },
-                "position_distribution": {item["_id"]: item["count"] for item in position_stats if item["_id"]},
+                "position_distribution": position_distribution,
                 "recent_applicants": recent_count,
-                "last_updated": datetime.now().isoformat()
+                "last_updated": updated_at.isoformat() if isinstance(updated_at, datetime) else datetime.now().isoformat()
             }
         except Exception as e:
             print(f"지원자 통계 조회 오류: {e}")
@@ -542,6 +741,11 @@ class MongoService:
 
             cover_letter_dict["created_at"] = datetime.now()
             result = self.sync_db.cover_letters.insert_one(cover_letter_dict)
+            # 표절 후보 검색용 서명 인덱싱 (실패해도 저장은 유지, 누락분은 재구성 시 보정)
+            try:
+                CoverLetterNearDuplicateIndex(self.sync_db).index_cover_letter_sync(cover_letter_dict)
+            except Exception as e:
+                print(f"자기소개서 서명 인덱싱 오류: {e}")
             cover_letter_dict["id"] = str(result.inserted_id)
             return cover_letter_dict
         except Exception as e:
@@ -628,9 +832,101 @@ class MongoService:
             print(f"포트폴리오 청킹 업데이트 오류: {e}")
             return False
 
+    async def sync_document_chunks(self, collection_name: str, document_id: str, chunks: list,
+                                   vector_service, embedding_service, document_type: Optional[str] = None,
+                                   previous_chunks: Optional[list] = None, chunks_stored: bool = False,
+                                   chunking_service=None) -> Dict[str, Any]:
+        """저장된 청크와 새 청크를 비교해 변경분만 벡터 DB 에 반영하고, 청크와 내용 해시를 문서에 저장합니다.
+
+        임베딩에 실패한 청크는 content_hash 를 CHUNK_HASH_PENDING 으로 저장해 다음 동기화에서 다시 임베딩합니다.
+
+        Args:
+            document_type: 지정 시 벡터의 chunk_type 을 문서 타입으로 통일
+            previous_chunks: 비교 기준 청크 (기본값: 문서에 저장된 청크)
+            chunks_stored: 호출 전에 chunks 를 이미 문서에 저장했으면 True (임베딩 실패 표시만 기록)
+
+        Returns:
+            {"diff": ChunkingService.diff_chunks 결과, "upserted_ids": [...], "deleted_ids": [...]}
+        """
+        if chunking_service is None:
+            from modules.core.services.chunking_service import ChunkingService
+            chunking_service = ChunkingService()
+
+        query_id = ObjectId(document_id) if ObjectId.is_valid(str(document_id)) else document_id
+        if previous_chunks is None:
+            stored = await self.db[collection_name].find_one({"_id": query_id}, {"chunks": 1})
+            previous_chunks = (stored or {}).get("chunks") or []
+        diff = chunking_service.diff_chunks(previous_chunks, chunks)
+
+        vector_diff = diff
+        if document_type:
+            vector_diff = dict(diff, **{
+                key: [dict(chunk, chunk_type=document_type) for chunk in diff[key]] for key in ("added", "changed")
+            })
+        vector_result = await vector_service.apply_chunk_diff(vector_diff, embedding_service)
+
+        embedded_ids = set(vector_result["upserted_ids"])
+        pending_ids = {chunk["chunk_id"] for chunk in diff["added"] + diff["changed"]} - embedded_ids
+        if pending_ids or (not chunks_stored and (diff["added"] or diff["changed"] or diff["removed"])):
+            stored_chunks = [
+                dict(chunk, content_hash=CHUNK_HASH_PENDING) if chunk["chunk_id"] in pending_ids else chunk
+                for chunk in chunks
+            ]
+            await self.db[collection_name].update_one(
+                {"_id": query_id},
+                {"$set": {"chunks": stored_chunks, "chunks_updated_at": datetime.now()}}
+            )
+
+        if embedded_ids or vector_result["deleted_ids"]:
+            from modules.core.services.search_result_cache import search_result_cache
+            search_result_cache.bump_generation(f"{collection_name} vectors updated {document_id}")
+        return {"diff": diff, **vector_result}
+
+    async def refresh_resume_chunks(self, applicant_id: str) -> Optional[Dict[str, Any]]:
+        """지원자 정보가 바뀐 뒤 이력서 청크를 다시 만들어 변경분만 벡터 DB 에 반영 (이력서가 없으면 None)"""
+        try:
+            from modules.core.services.chunking_service import ChunkingService
+            from modules.core.services.embedding_service import EmbeddingService
+            from modules.core.services.vector_service import VectorService
+
+            query_id = ObjectId(applicant_id) if len(applicant_id) == 24 else applicant_id
+            applicant = await self.db.applicants.find_one({"_id": query_id})
+            resume_id = (applicant or {}).get("resume_id")
+            if not resume_id:
+                return None
+            resume_query_id = ObjectId(str(resume_id)) if ObjectId.is_valid(str(resume_id)) else resume_id
+            resume = await self.db.resumes.find_one({"_id": resume_query_id}, {"extracted_text": 1, "chunks": 1})
+            if not resume:
+                return None
+
+            chunking_service = ChunkingService()
+            chunks = chunking_service.chunk_resume_text(
+                ChunkingService.build_resume_source(str(resume["_id"]), applicant, resume.get("extracted_text", ""))
+            )
+            return await self.sync_document_chunks(
+                "resumes", str(resume["_id"]), chunks, VectorService(), EmbeddingService(),
+                document_type="resume", previous_chunks=resume.get("chunks") or [],
+                chunking_service=chunking_service
+            )
+        except Exception as e:
+            print(f"이력서 청크 갱신 오류: {e}")
+            return None
+
     def close(self):
         """MongoDB 연결 종료"""
         if hasattr(self, 'client'):
             self.client.close()
         if hasattr(self, 'sync_client') and self.sync_client is not None:
             self.sync_client.close()
+
+
+# 프로세스 공용 인스턴스 (생성할 때마다 Motor/pymongo 커넥션 풀이 새로 열리므로 백그라운드 작업/기본값은 이것을 사용)
+_shared_mongo_service: Optional[MongoService] = None
+
+
+def get_shared_mongo_service() -> MongoService:
+    """프로세스 공용 MongoService 반환 (최초 호출 시 생성)"""
+    global _shared_mongo_service
+    if _shared_mongo_service is None:
+        _shared_mongo_service = MongoService()
+    return _shared_mongo_service
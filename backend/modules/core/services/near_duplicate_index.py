@@ -0,0 +1,224 @@
+import asyncio
+import hashlib
+import zlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from bson import Binary, Int64, ObjectId
+from pymongo import UpdateOne
+
+# MinHash 설정: 126개 해시를 2행 x 63밴드로 나눔. 목표는 표절 체크 기준(단어 Jaccard 0.3)에서
+# 후보 재현율 99% 이상: 1 - (1 - 0.3^2)^63 ≈ 0.997 (3행 x 42밴드는 ≈ 0.68 로 표절을 놓침).
+# 후보 임계값은 (1/63)^(1/2) ≈ 0.13 이라 오탐 후보가 늘지만 정확한 Jaccard 재계산으로 걸러짐
+MINHASH_NUM_PERM = 126
+MINHASH_BANDS = 63
+MINHASH_SEED = 20240901
+# 서명 방식이 바뀌면 인덱스를 다시 구축하도록 완성 표시에 기록하는 버전
+MINHASH_INDEX_VERSION = f"minhash-{MINHASH_NUM_PERM}x{MINHASH_BANDS}-{MINHASH_SEED}"
+# 인덱스 완성 표시 (재구성이 끝났고 이후 쓰기 경로가 모두 인덱싱함)
+INDEX_STATE_COLLECTION = "near_duplicate_index_state"
+_MERSENNE_PRIME = np.uint64(4294967311)  # 2^32 + 15
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+
+def cover_letter_full_text(cover_letter: Dict[str, Any]) -> str:
+    """자소서에서 표절 비교에 사용하는 전체 텍스트를 추출합니다."""
+    text_parts = []
+
+    # 다양한 텍스트 필드에서 내용 추출
+    for field in ("extracted_text", "growthBackground", "motivation", "careerHistory"):
+        if cover_letter.get(field):
+            text_parts.append(cover_letter[field])
+
+    # 모든 텍스트를 결합
+    return ' '.join(text_parts).strip()
+
+
+def word_set(text: str) -> set:
+    """단어 집합 (SimilarityService.calculate_simple_similarity 와 같은 토큰화)"""
+    return set(text.lower().split()) if text else set()
+
+
+class MinHasher:
+    """단어 집합의 MinHash 서명(uint32 배열) 생성기"""
+
+    def __init__(self, num_perm: int = MINHASH_NUM_PERM, seed: int = MINHASH_SEED):
+        self.num_perm = num_perm
+        generator = np.random.RandomState(seed)
+        # a < 2^31, 해시값 < 2^32 이므로 a * h + b 가 uint64 범위를 넘지 않음
+        self._a = generator.randint(1, 2 ** 31 - 1, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = generator.randint(0, 2 ** 32 - 1, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+    def signature(self, words: set) -> Optional[np.ndarray]:
+        """단어 집합의 MinHash 서명. 단어가 없으면 None"""
+        if not words:
+            return None
+        hashes = np.fromiter(
+            (zlib.crc32(word.encode("utf-8")) for word in words), dtype=np.uint64, count=len(words)
+        )
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME
+        return (permuted.min(axis=0) & _MAX_HASH).astype(np.uint32)
+
+    @staticmethod
+    def estimate_jaccard(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+        """두 서명에서 Jaccard 유사도 추정"""
+        return float(np.count_nonzero(signature_a == signature_b)) / len(signature_a)
+
+
+class CoverLetterNearDuplicateIndex:
+    """자소서 근접 중복(표절 후보) 인덱스
+
+    cover_letter_minhash 컬렉션에 자소서별 MinHash 서명(uint32 바이너리)과 LSH 밴드 키를 저장하고,
+    밴드 키의 멀티키 인덱스로 전체 스캔 없이 후보를 찾습니다. 최종 판정은 후보에 대해서만
+    정확한 Jaccard 로 검증합니다.
+    """
+
+    collection_name = "cover_letter_minhash"
+    _indexes_ensured = False
+
+    def __init__(self, db, num_perm: int = MINHASH_NUM_PERM, bands: int = MINHASH_BANDS):
+        self.db = db
+        self.collection = db[self.collection_name]
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+
+    async def ensure_indexes(self) -> None:
+        """밴드 키 멀티키 인덱스 생성 (프로세스당 1회)"""
+        if CoverLetterNearDuplicateIndex._indexes_ensured:
+            return
+        await self.collection.create_index("bands", name="bands_1")
+        CoverLetterNearDuplicateIndex._indexes_ensured = True
+
+    def band_keys(self, signature: np.ndarray) -> List[Int64]:
+        """서명을 밴드별로 나누어 64비트 버킷 키 생성 (밴드 번호 포함)"""
+        keys = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(rows.tobytes(), digest_size=8, salt=band.to_bytes(2, "big")).digest()
+            keys.append(Int64(int.from_bytes(digest, "big", signed=True)))
+        return keys
+
+    def _index_entry(self, cover_letter: Dict[str, Any]) -> Tuple[Any, Dict[str, Any], bool]:
+        """자소서의 (ID, 서명 문서, 서명 생성 여부)"""
+        cover_letter_id = cover_letter["_id"]
+        if isinstance(cover_letter_id, str) and ObjectId.is_valid(cover_letter_id):
+            cover_letter_id = ObjectId(cover_letter_id)
+
+        text = cover_letter_full_text(cover_letter)
+        signature = self.hasher.signature(word_set(text))
+        # 텍스트가 없는 자소서도 빈 밴드로 기록
+        entry = {
+            "signature": Binary(signature.tobytes()) if signature is not None else None,
+            "bands": self.band_keys(signature) if signature is not None else [],
+            "text_hash": hashlib.sha1(text.encode("utf-8")).hexdigest(),
+            "updated_at": datetime.now()
+        }
+        return cover_letter_id, entry, signature is not None
+
+    async def index_cover_letter(self, cover_letter: Dict[str, Any], session=None) -> bool:
+        """자소서 서명을 저장/갱신합니다. 서명이 생성되면 True"""
+        cover_letter_id, entry, signed = self._index_entry(cover_letter)
+        await self.collection.update_one({"_id": cover_letter_id}, {"$set": entry}, upsert=True, session=session)
+        return signed
+
+    def index_cover_letter_sync(self, cover_letter: Dict[str, Any]) -> bool:
+        """index_cover_letter 의 동기 버전 (pymongo 데이터베이스로 생성한 인덱스용)"""
+        cover_letter_id, entry, signed = self._index_entry(cover_letter)
+        self.collection.update_one({"_id": cover_letter_id}, {"$set": entry}, upsert=True)
+        return signed
+
+    async def index_cover_letters(self, cover_letters: List[Dict[str, Any]]) -> int:
+        """여러 자소서 서명을 bulk_write 1회로 저장/갱신, 서명이 생성된 수 반환"""
+        if not cover_letters:
+            return 0
+        operations = []
+        signed_count = 0
+        for cover_letter in cover_letters:
+            cover_letter_id, entry, signed = self._index_entry(cover_letter)
+            operations.append(UpdateOne({"_id": cover_letter_id}, {"$set": entry}, upsert=True))
+            signed_count += signed
+        await self.collection.bulk_write(operations, ordered=False)
+        return signed_count
+
+    async def remove_cover_letter(self, cover_letter_id: Any, session=None) -> None:
+        """삭제된 자소서의 서명을 제거합니다."""
+        if isinstance(cover_letter_id, str) and ObjectId.is_valid(cover_letter_id):
+            cover_letter_id = ObjectId(cover_letter_id)
+        await self.collection.delete_one({"_id": cover_letter_id}, session=session)
+
+    async def find_candidates(self, cover_letter_id: Any, text: str,
+                              min_estimate: float = 0.0) -> List[Tuple[Any, float]]:
+        """LSH 버킷을 공유하는 후보 자소서와 추정 Jaccard 를 반환합니다. (추정치 내림차순)"""
+        await self.ensure_indexes()
+        signature = self.hasher.signature(word_set(text))
+        if signature is None:
+            return []
+
+        candidates = []
+        async for entry in self.collection.find(
+            {"bands": {"$in": self.band_keys(signature)}, "_id": {"$ne": cover_letter_id}},
+            {"signature": 1}
+        ):
+            candidate_signature = np.frombuffer(entry["signature"], dtype=np.uint32)
+            estimate = self.hasher.estimate_jaccard(signature, candidate_signature)
+            if estimate >= min_estimate:
+                candidates.append((entry["_id"], estimate))
+
+        candidates.sort(key=lambda item: item[1], reverse=True)
+        return candidates
+
+    async def is_complete(self) -> bool:
+        """재구성이 끝나 인덱스가 모든 자소서를 담고 있는지 (현재 서명 버전의 완성 표시 확인)"""
+        state = await self.db[INDEX_STATE_COLLECTION].find_one({"_id": self.collection_name})
+        return bool(state and state.get("complete") and state.get("version") == MINHASH_INDEX_VERSION)
+
+    async def rebuild(self, cover_letters_collection, batch_size: int = 500) -> int:
+        """자소서 컬렉션 전체로 인덱스를 재구성하고 완성 표시를 남깁니다. (최초 구축/버전 변경/정합성 보정용)"""
+        await self.ensure_indexes()
+        started_at = datetime.now()
+        indexed = 0
+        batch = []
+        projection = {"extracted_text": 1, "growthBackground": 1, "motivation": 1, "careerHistory": 1}
+        async for cover_letter in cover_letters_collection.find({}, projection).batch_size(batch_size):
+            batch.append(cover_letter)
+            if len(batch) >= batch_size:
+                indexed += await self.index_cover_letters(batch)
+                batch = []
+        indexed += await self.index_cover_letters(batch)
+
+        await self.db[INDEX_STATE_COLLECTION].replace_one(
+            {"_id": self.collection_name},
+            {"complete": True, "version": MINHASH_INDEX_VERSION, "started_at": started_at, "built_at": datetime.now()},
+            upsert=True
+        )
+        print(f"[NearDuplicateIndex] 자소서 서명 인덱스 재구성 완료: {indexed}건")
+        return indexed
+
+    async def ensure_complete(self, cover_letters_collection) -> bool:
+        """완성 표시가 없으면 재구성 (시작 시 백그라운드 백필용), 재구성했으면 True"""
+        if await self.is_complete():
+            return False
+        await self.rebuild(cover_letters_collection)
+        return True
+
+
+_backfill_task: Optional[asyncio.Task] = None
+
+
+def schedule_near_duplicate_backfill(db) -> asyncio.Task:
+    """인덱스 백필을 백그라운드 태스크로 예약 (이미 진행 중이면 그 태스크 반환)"""
+    global _backfill_task
+    if _backfill_task is None or _backfill_task.done():
+        _backfill_task = asyncio.create_task(_run_backfill(db))
+    return _backfill_task
+
+
+async def _run_backfill(db) -> None:
+    try:
+        await CoverLetterNearDuplicateIndex(db).ensure_complete(db.cover_letters)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"[NearDuplicateIndex] 자소서 서명 인덱스 백필 실패: {e}")
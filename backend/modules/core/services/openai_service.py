@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional
 
 import openai
 from dotenv import load_dotenv
-from modules.token_monitor import token_monitor
+from modules.token_monitor import llm_instrumentation
 
 load_dotenv()
 
@@ -24,7 +24,8 @@ class OpenAIService:
                 raise Exception("OPENAI_API_KEY가 설정되지 않았습니다.")
 
             openai.api_key = self.api_key
-            self.client = openai.AsyncOpenAI(api_key=self.api_key)
+            # 토큰 사용량은 계측된 클라이언트가 호출마다 기록
+            self.client = llm_instrumentation.instrument(openai.AsyncOpenAI(api_key=self.api_key), __name__)
             print(f"[SUCCESS] OpenAI 서비스 초기화 성공 (모델: {model_name})")
         except Exception as e:
             print(f"[ERROR] OpenAI 서비스 초기화 실패: {e}")
@@ -72,16 +73,6 @@ class OpenAIService:
             )
 
             if response.choices and response.choices[0].message.content:
-                # 토큰 사용량 로깅
-                if hasattr(response, 'usage') and response.usage:
-                    usage = token_monitor.create_usage_record(
-                        model=self.model_name,
-                        input_tokens=response.usage.prompt_tokens,
-                        output_tokens=response.usage.completion_tokens,
-                        endpoint="chat_completion"
-                    )
-                    token_monitor.log_usage(usage)
-
                 return response.choices[0].message.content
             return "응답을 생성할 수 없습니다."
 
@@ -126,16 +117,6 @@ class OpenAIService:
             )
 
             if response.choices and response.choices[0].message.content:
-                # 토큰 사용량 로깅
-                if hasattr(response, 'usage') and response.usage:
-                    usage = token_monitor.create_usage_record(
-                        model=self.model_name,
-                        input_tokens=response.usage.prompt_tokens,
-                        output_tokens=response.usage.completion_tokens,
-                        endpoint="json_completion"
-                    )
-                    token_monitor.log_usage(usage)
-
                 return response.choices[0].message.content
             return '{"error": "응답을 생성할 수 없습니다."}'
 
@@ -13,8 +13,9 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from .background_preloader import background_preloader, register_preload_task
+from .background_preloader import background_preloader
 from .intelligent_cache_service import intelligent_cache
+from .model_warmup import register_model_preload_tasks, resolve_warmup_mode
 from .performance_monitor import monitor_performance, performance_monitor
 
 
@@ -76,68 +77,13 @@ class OptimizationService:
             raise
 
     async def _setup_background_preloading(self):
-        """백그라운드 프리로딩 작업 설정"""
-        # EmbeddingService 백업 모델 프리로딩
-        register_preload_task(
-            name="embedding_fallback_model",
-            priority=8,
-            load_function=self._load_embedding_fallback_model,
-            estimated_load_time=15.0
-        )
-
-        # HuggingFace 분석기 프리로딩
-        register_preload_task(
-            name="huggingface_analyzer",
-            priority=7,
-            load_function=self._load_huggingface_analyzer,
-            dependencies=["embedding_fallback_model"],
-            estimated_load_time=45.0
-        )
-
-        # 자주 사용되는 모델들 프리로딩
-        register_preload_task(
-            name="sentence_transformer_models",
-            priority=6,
-            load_function=self._load_sentence_transformer_models,
-            estimated_load_time=20.0
-        )
-
-    async def _load_embedding_fallback_model(self):
-        """EmbeddingService 백업 모델 로딩"""
-        try:
-            from modules.core.services.embedding_service import EmbeddingService
-            service = EmbeddingService(lazy_loading=False)
-            service._load_fallback_model()
-            print("✅ EmbeddingService 백업 모델 프리로딩 완료")
-        except Exception as e:
-            print(f"❌ EmbeddingService 백업 모델 프리로딩 실패: {e}")
-
-    async def _load_huggingface_analyzer(self):
-        """HuggingFace 분석기 로딩"""
-        try:
-            from modules.ai.huggingface_analyzer import HuggingFaceResumeAnalyzer
-            analyzer = HuggingFaceResumeAnalyzer()
-            print("✅ HuggingFace 분석기 프리로딩 완료")
-        except Exception as e:
-            print(f"❌ HuggingFace 분석기 프리로딩 실패: {e}")
+        """백그라운드 프리로딩 작업 설정
 
-    async def _load_sentence_transformer_models(self):
-        """SentenceTransformer 모델들 로딩"""
-        try:
-            from sentence_transformers import SentenceTransformer
-
-            # 자주 사용되는 모델들
-            models = [
-                'paraphrase-multilingual-MiniLM-L12-v2',
-                'multi-qa-MiniLM-L6-cos-v1'
-            ]
-
-            for model_name in models:
-                SentenceTransformer(model_name)
-                print(f"✅ {model_name} 모델 로딩 완료")
-
-        except Exception as e:
-            print(f"❌ SentenceTransformer 모델 프리로딩 실패: {e}")
+        모델 로딩 작업은 model_warmup 에서 등록합니다. 로딩 결과가 공용 인스턴스로 남아
+        이후 요청이 같은 모델을 재사용합니다.
+        """
+        register_model_preload_tasks()
+        background_preloader.preload_enabled = resolve_warmup_mode() != "on_demand"
 
     async def _auto_tuning_loop(self):
         """자동 튜닝 루프"""
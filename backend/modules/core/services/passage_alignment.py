@@ -0,0 +1,190 @@
+import os
+import zlib
+from typing import Any, Dict, List, Tuple
+
+# 정규화(소문자, 공백/문장부호 제거) 문자 기준 설정
+ALIGNMENT_KGRAM = 12          # 지문(fingerprint) k-gram 길이
+ALIGNMENT_WINDOW = 8          # winnowing 윈도우 크기 (k + w - 1 = 19자 이상 일치는 반드시 검출)
+# 표절 구간으로 인정하는 최소 일치 길이 (검출 보장 길이 19자보다 길고, 짧은 한국어 문장 한 개 정도)
+ALIGNMENT_MIN_PASSAGE = int(os.getenv("ALIGNMENT_MIN_PASSAGE", "20"))
+ALIGNMENT_MAX_OCCURRENCES = 8  # 한 문서에 이보다 자주 나오는 지문은 반복 패턴으로 보고 시드에서 제외
+ALIGNMENT_EXCERPT_CHARS = 200
+
+# 커버리지(원문 대비 일치 구간 비율) 판정 기준: 사이 구간만 LLM 검토
+PLAGIARISM_COVERAGE_HIGH = 0.5
+PLAGIARISM_COVERAGE_LOW = 0.15
+
+
+def normalize_with_offsets(text: str) -> Tuple[str, List[int]]:
+    """영숫자/한글만 남기고 소문자화한 문자열과, 각 문자의 원문 오프셋 목록"""
+    chars = []
+    offsets = []
+    for index, char in enumerate(text or ""):
+        if char.isalnum():
+            chars.append(char.lower())
+            offsets.append(index)
+    return "".join(chars), offsets
+
+
+class PassageAligner:
+    """두 문서 사이의 복사된 구간(passage)을 찾는 로컬 정렬 엔진
+
+    1. 정규화 문자열의 k-gram 해시를 winnowing 으로 골라 지문 생성
+    2. 양쪽에 공통으로 나타나는 지문을 시드로 좌우 확장 (seed-and-extend)
+    3. 일치 구간을 원문 오프셋으로 되돌리고 양쪽 커버리지 비율 계산
+    """
+
+    def __init__(self, kgram: int = ALIGNMENT_KGRAM, window: int = ALIGNMENT_WINDOW,
+                 min_passage: int = ALIGNMENT_MIN_PASSAGE, max_occurrences: int = ALIGNMENT_MAX_OCCURRENCES):
+        self.kgram = kgram
+        self.window = window
+        self.min_passage = max(min_passage, kgram)
+        self.max_occurrences = max_occurrences
+
+    def fingerprints(self, normalized: str) -> List[Tuple[int, int]]:
+        """winnowing 으로 선택한 (해시, 위치) 목록"""
+        if len(normalized) < self.kgram:
+            return []
+
+        hashes = [
+            zlib.crc32(normalized[position:position + self.kgram].encode("utf-8"))
+            for position in range(len(normalized) - self.kgram + 1)
+        ]
+        if len(hashes) <= self.window:
+            position = min(range(len(hashes)), key=lambda index: (hashes[index], -index))
+            return [(hashes[position], position)]
+
+        selected = []
+        last_position = -1
+        for start in range(len(hashes) - self.window + 1):
+            # 윈도우 내 최솟값 (동률이면 가장 오른쪽)
+            position = start
+            for index in range(start + 1, start + self.window):
+                if hashes[index] <= hashes[position]:
+                    position = index
+            if position != last_position:
+                selected.append((hashes[position], position))
+                last_position = position
+        return selected
+
+    def align(self, source_text: str, target_text: str) -> Dict[str, Any]:
+        """source 와 target 의 일치 구간과 커버리지 비율을 계산합니다.
+
+        Returns:
+            {"passages": [{"source_start", "source_end", "target_start", "target_end",
+                           "length", "source_excerpt", "target_excerpt"}, ...],
+             "source_coverage", "target_coverage", "matched_chars"}
+            오프셋은 원문 기준이며 end 는 포함하지 않습니다.
+        """
+        source, source_offsets = normalize_with_offsets(source_text)
+        target, target_offsets = normalize_with_offsets(target_text)
+
+        target_index: Dict[int, List[int]] = {}
+        for fingerprint, position in self.fingerprints(target):
+            target_index.setdefault(fingerprint, []).append(position)
+
+        source_fingerprints = self.fingerprints(source)
+        source_counts: Dict[int, int] = {}
+        for fingerprint, _ in source_fingerprints:
+            source_counts[fingerprint] = source_counts.get(fingerprint, 0) + 1
+
+        # 시드 확장: 같은 대각선(source - target 위치 차)에서 이미 확장한 구간은 건너뜀
+        # 반복 텍스트("ㅋㅋㅋ...", 표 구분선 등)의 지문은 시드 조합이 제곱으로 늘어나므로 제외
+        extended_until: Dict[int, int] = {}
+        matches = []
+        for fingerprint, source_position in source_fingerprints:
+            target_positions = target_index.get(fingerprint, ())
+            if len(target_positions) > self.max_occurrences or source_counts[fingerprint] > self.max_occurrences:
+                continue
+            for target_position in target_positions:
+                diagonal = source_position - target_position
+                if extended_until.get(diagonal, -1) > source_position:
+                    continue
+                if source[source_position:source_position + self.kgram] != target[target_position:target_position + self.kgram]:
+                    continue
+
+                source_start, target_start = source_position, target_position
+                while source_start > 0 and target_start > 0 and source[source_start - 1] == target[target_start - 1]:
+                    source_start -= 1
+                    target_start -= 1
+                source_end = source_position + self.kgram
+                target_end = target_position + self.kgram
+                while source_end < len(source) and target_end < len(target) and source[source_end] == target[target_end]:
+                    source_end += 1
+                    target_end += 1
+
+                extended_until[diagonal] = source_end
+                if source_end - source_start >= self.min_passage:
+                    matches.append((source_start, source_end, target_start, target_end))
+
+        passages = self._select_passages(matches)
+        source_covered = self._covered_length([(match[0], match[1]) for match in passages])
+        target_covered = self._covered_length([(match[2], match[3]) for match in passages])
+
+        return {
+            "passages": [
+                self._to_passage(match, source_text, source_offsets, target_text, target_offsets)
+                for match in passages
+            ],
+            "source_coverage": round(source_covered / len(source), 4) if source else 0.0,
+            "target_coverage": round(target_covered / len(target), 4) if target else 0.0,
+            "matched_chars": source_covered
+        }
+
+    @staticmethod
+    def _select_passages(matches: List[Tuple[int, int, int, int]]) -> List[Tuple[int, int, int, int]]:
+        """긴 구간부터 선택하고 source 기준으로 완전히 포함되는 구간은 제거"""
+        selected = []
+        for match in sorted(set(matches), key=lambda m: (m[0] - m[1], m[0])):
+            if any(kept[0] <= match[0] and match[1] <= kept[1] for kept in selected):
+                continue
+            selected.append(match)
+        selected.sort()
+        return selected
+
+    @staticmethod
+    def _covered_length(intervals: List[Tuple[int, int]]) -> int:
+        """구간 합집합의 길이"""
+        covered = 0
+        current_start, current_end = None, None
+        for start, end in sorted(intervals):
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    covered += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            covered += current_end - current_start
+        return covered
+
+    @staticmethod
+    def _to_passage(match: Tuple[int, int, int, int], source_text: str, source_offsets: List[int],
+                    target_text: str, target_offsets: List[int]) -> Dict[str, Any]:
+        source_start, source_end, target_start, target_end = match
+        original_source = (source_offsets[source_start], source_offsets[source_end - 1] + 1)
+        original_target = (target_offsets[target_start], target_offsets[target_end - 1] + 1)
+        return {
+            "source_start": original_source[0],
+            "source_end": original_source[1],
+            "target_start": original_target[0],
+            "target_end": original_target[1],
+            "length": source_end - source_start,
+            "source_excerpt": source_text[original_source[0]:original_source[1]][:ALIGNMENT_EXCERPT_CHARS],
+            "target_excerpt": target_text[original_target[0]:original_target[1]][:ALIGNMENT_EXCERPT_CHARS]
+        }
+
+
+def alignment_coverage(alignment: Dict[str, Any]) -> float:
+    """판정에 사용하는 커버리지 (어느 한쪽 문서가 대부분 복사된 경우도 포함)"""
+    return max(alignment.get("source_coverage", 0.0), alignment.get("target_coverage", 0.0))
+
+
+def classify_alignment(alignment: Dict[str, Any]) -> str:
+    """커버리지로 HIGH / BORDERLINE / LOW 판정 (BORDERLINE 만 LLM 검토 대상)"""
+    coverage = alignment_coverage(alignment)
+    if coverage >= PLAGIARISM_COVERAGE_HIGH:
+        return "HIGH"
+    if coverage >= PLAGIARISM_COVERAGE_LOW:
+        return "BORDERLINE"
+    return "LOW"
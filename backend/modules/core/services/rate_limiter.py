@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """분당 요청 수 제한 (토큰 버킷)
+
+    고정 sleep 대신 버킷에 토큰이 남아 있으면 바로 통과시키고,
+    비어 있을 때만 다음 토큰이 채워질 때까지 기다립니다.
+    """
+
+    def __init__(self, requests_per_minute: int, burst: int = None):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst or max(1, requests_per_minute // 10))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """토큰이 확보될 때까지 대기"""
+        async with self._lock:
+            self._refill()
+            while self.tokens < tokens:
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= tokens
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
@@ -0,0 +1,81 @@
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+# 하이브리드 검색 결과 융합 방식
+#   rrf    : 순위 기반 (Reciprocal Rank Fusion) - 점수 스케일과 무관
+#   minmax : 검색기별 점수를 최소/최대로 0~1 정규화
+#   zscore : 검색기별 점수를 z-score 로 표준화한 뒤 정규분포 CDF 로 0~1 변환
+FUSION_METHODS = ("rrf", "minmax", "zscore")
+RRF_K = 60
+
+
+class ScoreFusion:
+    """벡터/키워드 등 여러 검색기의 순위 목록을 하나의 순위로 융합합니다.
+
+    검색기마다 점수 스케일이 달라도(BM25 등) 보정된 0~1 점수를 가중 합산하므로
+    고정 나눗셈 정규화에 의존하지 않습니다.
+    """
+
+    def __init__(self, method: str = "rrf", weights: Optional[Dict[str, float]] = None, rrf_k: int = RRF_K):
+        if method not in FUSION_METHODS:
+            raise ValueError(f"지원하지 않는 융합 방식입니다: {method} (가능: {', '.join(FUSION_METHODS)})")
+        self.method = method
+        self.weights = weights or {}
+        self.rrf_k = rrf_k
+
+    def calibrate(self, scores: List[float]) -> List[float]:
+        """점수 내림차순으로 정렬된 목록의 보정 점수 (0~1, 1위 기준)"""
+        if not scores:
+            return []
+
+        if self.method == "rrf":
+            # 1위가 1.0 이 되도록 (k + 1) 을 곱해 스케일 조정
+            return [(self.rrf_k + 1) / (self.rrf_k + rank + 1) for rank in range(len(scores))]
+
+        if self.method == "minmax":
+            low, high = min(scores), max(scores)
+            if high == low:
+                return [1.0] * len(scores)
+            return [(score - low) / (high - low) for score in scores]
+
+        mean = sum(scores) / len(scores)
+        std = math.sqrt(sum((score - mean) ** 2 for score in scores) / len(scores))
+        if std == 0:
+            return [0.5] * len(scores)
+        return [0.5 * (1 + math.erf((score - mean) / std / math.sqrt(2))) for score in scores]
+
+    def fuse(self, ranked_lists: Dict[str, List[Tuple[str, float]]], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        검색기별 (문서 ID, 원점수) 목록을 융합합니다.
+
+        Args:
+            ranked_lists: {"vector": [(id, score), ...], "keyword": [...]}
+            limit: 반환할 최대 결과 수
+
+        Returns:
+            최종 점수 내림차순의 {"id", "final_score", "scores", "raw_scores", "ranks"} 목록
+        """
+        total_weight = sum(self.weights.get(source, 1.0) for source in ranked_lists) or 1.0
+        fused: Dict[str, Dict[str, Any]] = {}
+
+        for source, items in ranked_lists.items():
+            # 같은 문서가 여러 번 나오면(청크 단위 결과 등) 가장 높은 점수만 사용
+            best: Dict[str, float] = {}
+            for document_id, score in items:
+                if document_id and (document_id not in best or score > best[document_id]):
+                    best[document_id] = score
+            ordered = sorted(best.items(), key=lambda item: item[1], reverse=True)
+
+            weight = self.weights.get(source, 1.0) / total_weight
+            calibrated = self.calibrate([score for _, score in ordered])
+            for rank, ((document_id, score), calibrated_score) in enumerate(zip(ordered, calibrated)):
+                entry = fused.setdefault(document_id, {
+                    "id": document_id, "final_score": 0.0, "scores": {}, "raw_scores": {}, "ranks": {}
+                })
+                entry["final_score"] += weight * calibrated_score
+                entry["scores"][source] = calibrated_score
+                entry["raw_scores"][source] = score
+                entry["ranks"][source] = rank + 1
+
+        results = sorted(fused.values(), key=lambda entry: entry["final_score"], reverse=True)
+        return results[:limit] if limit is not None else results
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# 검색 결과 캐시 설정
+SEARCH_CACHE_TTL = 300          # 초 (다른 워커의 색인 변경까지 반영되는 최대 지연)
+SEARCH_CACHE_MAX_ENTRIES = 512
+SEARCH_CACHE_PAGES = 5          # 한 번 검색할 때 미리 순위를 매겨 둘 페이지 수
+
+
+def normalize_query(query: str) -> str:
+    """대소문자/공백 차이를 무시한 캐시용 검색어"""
+    return " ".join((query or "").lower().split())
+
+
+class SearchResultCache:
+    """하이브리드/키워드 검색 결과 캐시
+
+    문서 전체가 아니라 순위가 매겨진 ID 목록(과 점수)만 저장하고, 페이지를 넘길 때는
+    캐시된 순위에서 해당 구간만 잘라 MongoDB 에서 조회합니다.
+    이력서 색인/삭제 시 bump_generation() 으로 세대 번호를 올리면 이전 세대 항목은 모두 무효가 됩니다.
+    """
+
+    def __init__(self, ttl: int = SEARCH_CACHE_TTL, max_entries: int = SEARCH_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.generation = 0
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hit_count = 0
+        self.miss_count = 0
+
+    @staticmethod
+    def make_key(namespace: str, query: str, filters: Optional[Dict[str, Any]] = None,
+                 weights: Optional[Dict[str, Any]] = None, limit: Optional[int] = None) -> str:
+        """(정규화 검색어, 필터, 가중치, 개수) 기반 캐시 키"""
+        payload = json.dumps(
+            [namespace, normalize_query(query), filters or {}, weights or {}, limit],
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """현재 세대의 유효한 항목 (없으면 None)"""
+        entry = self._entries.get(key)
+        if entry is None or entry["generation"] != self.generation or time.time() - entry["cached_at"] > self.ttl:
+            if entry is not None:
+                del self._entries[key]
+            self.miss_count += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hit_count += 1
+        return entry
+
+    def set(self, key: str, ranking: List[Dict[str, Any]], meta: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """순위 목록 저장 (LRU 초과분 제거)"""
+        entry = {
+            "ranking": ranking,
+            "meta": meta or {},
+            "generation": self.generation,
+            "cached_at": time.time()
+        }
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def bump_generation(self, reason: str = "") -> int:
+        """색인 변경 시 호출 - 기존 캐시 항목을 모두 무효화"""
+        self.generation += 1
+        self._entries.clear()
+        if reason:
+            print(f"[SearchResultCache] 검색 캐시 무효화 (세대 {self.generation}): {reason}")
+        return self.generation
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hit_count + self.miss_count
+        return {
+            "generation": self.generation,
+            "entries": len(self._entries),
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "hit_rate": round(self.hit_count / total, 4) if total else 0.0
+        }
+
+
+# 프로세스 공용 인스턴스 (서비스 객체는 요청마다 생성될 수 있음)
+search_result_cache = SearchResultCache()
@@ -1,24 +1,56 @@
 import asyncio
+import logging
 import re
 from collections import Counter
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from bson import ObjectId
+from modules.config.settings import get_settings
+from modules.token_monitor import (PRIORITY_BATCH, AdmissionRejected,
+                                   llm_call_context)
 from pymongo.collection import Collection
 
 from .chunking_service import ChunkingService
-from .embedding_service import EmbeddingService
+from .embedding_service import EmbeddingService, EmbeddingType
 from .keyword_search_service import KeywordSearchService
 from .llm_service import LLMService
+from .near_duplicate_index import (
+    CoverLetterNearDuplicateIndex,
+    cover_letter_full_text,
+    schedule_near_duplicate_backfill,
+)
+from .passage_alignment import PassageAligner
+from .rate_limiter import AsyncRateLimiter
+from .search_fusion import ScoreFusion
+from .search_result_cache import SEARCH_CACHE_PAGES, search_result_cache
 from .vector_service import VectorService
 
+logger = logging.getLogger(__name__)
+
 try:
     from modules.ai.services.langchain_hybrid_service import LangChainHybridService
     LANGCHAIN_HYBRID_AVAILABLE = True
 except ImportError:
     LANGCHAIN_HYBRID_AVAILABLE = False
-    print("LangChain 하이브리드 서비스를 사용할 수 없습니다.")
+    logger.warning("LangChain 하이브리드 서비스를 사용할 수 없습니다.")
+
+# 자소서 표절 후보 기준 (단어 Jaccard) 과 MinHash 추정 오차 여유
+PLAGIARISM_JACCARD_THRESHOLD = 0.3
+PLAGIARISM_MINHASH_MARGIN = 0.1
+
+# 하이브리드 검색 결과 재정렬 허용 필드
+SEARCH_SORT_FIELDS = ("final_score", "vector_score", "keyword_score")
+
+# 임베딩 API 분당 요청 제한 (프로세스 공용, 최초 사용 시 생성)
+_embedding_limiter: Optional[AsyncRateLimiter] = None
+
+
+def _embedding_rate_limiter() -> AsyncRateLimiter:
+    global _embedding_limiter
+    if _embedding_limiter is None:
+        _embedding_limiter = AsyncRateLimiter(get_settings().embedding_requests_per_minute)
+    return _embedding_limiter
 
 class SimilarityService:
     def __init__(self, embedding_service: EmbeddingService, vector_service: VectorService, llm_service: LLMService = None):
@@ -35,15 +67,16 @@ class SimilarityService:
         self.chunking_service = ChunkingService()
         self.llm_service = llm_service or LLMService()
         self.keyword_search_service = KeywordSearchService()
+        self.passage_aligner = PassageAligner()
 
         # LangChain 하이브리드 서비스 초기화
         self.langchain_hybrid = None
         if LANGCHAIN_HYBRID_AVAILABLE:
             try:
                 self.langchain_hybrid = LangChainHybridService()
-                print("[SimilarityService] LangChain 하이브리드 서비스 활성화")
+                logger.debug("[SimilarityService] LangChain 하이브리드 서비스 활성화")
             except Exception as e:
-                print(f"[SimilarityService] LangChain 하이브리드 서비스 초기화 실패: {e}")
+                logger.warning("[SimilarityService] LangChain 하이브리드 서비스 초기화 실패: %s", e)
 
         # 유사도 임계값 설정
         self.similarity_threshold = 0.3   # 30%로 설정
@@ -59,19 +92,26 @@ class SimilarityService:
             'vector': 0.5,    # 벡터 검색 50%
             'keyword': 0.5    # 키워드 검색 50%
         }
+        self.score_fusion = ScoreFusion(get_settings().search_fusion_method, self.search_weights)
 
-    async def save_resume_chunks(self, resume: Dict[str, Any]) -> Dict[str, Any]:
+    async def save_resume_chunks(self, resume: Dict[str, Any],
+                                 previous_chunks: Optional[List[Dict[str, Any]]] = None,
+                                 mongo_service=None) -> Dict[str, Any]:
         """
         이력서를 청킹하여 벡터 저장하고 Elasticsearch에 인덱싱합니다.
+        MongoDB 에 저장된 청크와 내용 해시를 비교해 추가/변경/삭제된 청크만 벡터 DB에 반영하고,
+        새 청크와 해시를 resumes 문서에 다시 저장합니다.
 
         Args:
             resume (Dict[str, Any]): 이력서 데이터
+            previous_chunks (Optional[List[Dict[str, Any]]]): 기존 청크 (기본값: resumes 문서에 저장된 청크)
+            mongo_service: MongoService (기본값: 프로세스 공용 인스턴스)
 
         Returns:
             Dict[str, Any]: 저장 결과
         """
         try:
-            print(f"[SimilarityService] === 청킹 기반 벡터 저장 시작 ===")
+            logger.debug("[SimilarityService] === 청킹 기반 벡터 저장 시작 ===")
             resume_id = str(resume["_id"])
 
             # 이력서를 청크로 분할
@@ -84,32 +124,42 @@ class SimilarityService:
                     "chunks_count": 0
                 }
 
-            # 청크별 벡터 저장
-            stored_vector_ids = await self.vector_service.save_chunk_vectors(chunks, self.embedding_service)
+            # 변경된 청크만 벡터 저장 후 청크/해시를 문서에 반영 (기존 청크가 없으면 전체가 added)
+            if mongo_service is None:
+                from .mongo_service import get_shared_mongo_service
+                mongo_service = get_shared_mongo_service()
+            sync_result = await mongo_service.sync_document_chunks(
+                "resumes", resume_id, chunks, self.vector_service, self.embedding_service,
+                previous_chunks=previous_chunks, chunking_service=self.chunking_service
+            )
+            stored_vector_ids = sync_result["upserted_ids"]
 
             # Elasticsearch에 이력서 인덱싱
             try:
                 es_result = await self.keyword_search_service.index_document(resume)
                 if es_result["success"]:
-                    print(f"[SimilarityService] Elasticsearch 인덱싱 성공: {resume_id}")
+                    logger.debug("[SimilarityService] Elasticsearch 인덱싱 성공: %s", resume_id)
                 else:
-                    print(f"[SimilarityService] Elasticsearch 인덱싱 실패: {es_result.get('message', 'Unknown error')}")
+                    logger.warning("[SimilarityService] Elasticsearch 인덱싱 실패: %s",
+                                   es_result.get('message', 'Unknown error'))
             except Exception as es_error:
-                print(f"[SimilarityService] Elasticsearch 인덱싱 중 오류: {str(es_error)}")
+                logger.warning("[SimilarityService] Elasticsearch 인덱싱 중 오류: %s", str(es_error))
 
-            print(f"[SimilarityService] 총 {len(stored_vector_ids)}개 청크 벡터 저장 완료")
-            print(f"[SimilarityService] === 청킹 기반 벡터 저장 완료 ===")
+            logger.debug("[SimilarityService] 총 %s개 청크 벡터 저장 완료", len(stored_vector_ids))
+            logger.debug("[SimilarityService] === 청킹 기반 벡터 저장 완료 ===")
 
             return {
                 "success": True,
                 "resume_id": resume_id,
                 "chunks_count": len(chunks),
                 "stored_vectors": len(stored_vector_ids),
-                "vector_ids": stored_vector_ids
+                "vector_ids": stored_vector_ids,
+                "deleted_vector_ids": sync_result["deleted_ids"],
+                "unchanged_chunks": sync_result["unchanged_count"]
             }
 
         except Exception as e:
-            print(f"[SimilarityService] 청킹 기반 벡터 저장 실패: {str(e)}")
+            logger.warning("[SimilarityService] 청킹 기반 벡터 저장 실패: %s", str(e))
             return {
                 "success": False,
                 "error": str(e),
@@ -131,13 +181,13 @@ class SimilarityService:
             Dict[str, Any]: 유사도 검색 결과
         """
         try:
-            print(f"[SimilarityService] === 청킹 기반 유사도 검색 시작 ===")
-            print(f"[SimilarityService] 문서 ID: {document_id}")
-            print(f"[SimilarityService] 문서 타입: {document_type}")
+            logger.debug("[SimilarityService] === 청킹 기반 유사도 검색 시작 ===")
+            logger.debug("[SimilarityService] 문서 ID: %s", document_id)
+            logger.debug("[SimilarityService] 문서 타입: %s", document_type)
 
-            # MongoDB 연결 생성
-            from .mongo_service import MongoService
-            mongo_service = MongoService()
+            # 공용 MongoDB 연결 사용
+            from .mongo_service import get_shared_mongo_service
+            mongo_service = get_shared_mongo_service()
             db = mongo_service.db
 
             # 해당 문서 조회
@@ -162,12 +212,12 @@ class SimilarityService:
             if not query_chunks:
                 raise ValueError("검색할 청크가 없습니다.")
 
-            print(f"[SimilarityService] 검색 청크 수: {len(query_chunks)}")
+            logger.debug("[SimilarityService] 검색 청크 수: %s", len(query_chunks))
 
             # 각 청크별로 유사 벡터 검색
             chunk_similarities = {}
             for chunk in query_chunks:
-                print(f"[SimilarityService] 청크 '{chunk['chunk_type']}' 검색 중...")
+                logger.debug("[SimilarityService] 청크 '%s' 검색 중...", chunk['chunk_type'])
 
                 # 청크 텍스트로 쿼리 임베딩 생성
                 query_embedding = await self.embedding_service.create_query_embedding(chunk["text"])
@@ -278,8 +328,8 @@ class SimilarityService:
                 similar_resumes=results
             )
 
-            print(f"[SimilarityService] 최종 유사 {document_type} 수: {len(results)}")
-            print(f"[SimilarityService] === 청킹 기반 유사도 검색 완료 ===")
+            logger.debug("[SimilarityService] 최종 유사 %s 수: %s", document_type, len(results))
+            logger.debug("[SimilarityService] === 청킹 기반 유사도 검색 완료 ===")
 
             return {
                 "success": True,
@@ -298,7 +348,7 @@ class SimilarityService:
             }
 
         except Exception as e:
-            print(f"[SimilarityService] 청킹 기반 유사도 검색 실패: {str(e)}")
+            logger.warning("[SimilarityService] 청킹 기반 유사도 검색 실패: %s", str(e))
             raise e
 
     async def find_similar_documents(self, document_id: str, collection: Collection,
@@ -321,7 +371,7 @@ class SimilarityService:
                 return await self._check_cover_letter_plagiarism(document_id, collection, limit)
             else:
                 # 이력서/포트폴리오 유사도 검사는 제거됨
-                print(f"[SimilarityService] {document_type} 유사도 검사는 더 이상 지원되지 않습니다.")
+                logger.debug("[SimilarityService] %s 유사도 검사는 더 이상 지원되지 않습니다.", document_type)
                 return {
                     "similar_documents": [],
                     "total_found": 0,
@@ -329,21 +379,21 @@ class SimilarityService:
                 }
 
         except Exception as e:
-            print(f"[SimilarityService] 문서 유사도 검색 실패: {str(e)}")
+            logger.warning("[SimilarityService] 문서 유사도 검색 실패: %s", str(e))
             raise e
 
     async def _check_cover_letter_plagiarism(self, cover_letter_id: str, collection: Collection, limit: int = 5) -> Dict[str, Any]:
         """자소서 표절체크 전용 메서드"""
         try:
-            print(f"[SimilarityService] === 자소서 표절체크 시작 ===")
-            print(f"[SimilarityService] 자소서 ID: {cover_letter_id}")
+            logger.debug("[SimilarityService] === 자소서 표절체크 시작 ===")
+            logger.debug("[SimilarityService] 자소서 ID: %s", cover_letter_id)
 
             # 자소서 조회
             cover_letter = await collection.find_one({"_id": ObjectId(cover_letter_id)})
             if not cover_letter:
                 raise ValueError("자소서를 찾을 수 없습니다.")
 
-            print(f"[SimilarityService] 자소서 찾음")
+            logger.debug("[SimilarityService] 자소서 찾음")
 
             # 자소서 텍스트 추출
             cover_letter_text = self._extract_cover_letter_text(cover_letter)
@@ -361,7 +411,7 @@ class SimilarityService:
                 # Pinecone에서 현재 자소서 벡터 확인
                 existing_vector = self.vector_service.index.fetch([cover_letter_vector_id])
                 if not existing_vector.vectors or cover_letter_vector_id not in existing_vector.vectors:
-                    print(f"[SimilarityService] 자소서 벡터 없음. 벡터 DB에 저장 중...")
+                    logger.debug("[SimilarityService] 자소서 벡터 없음. 벡터 DB에 저장 중...")
 
                     # 벡터 저장 (직접 upsert 사용하여 고정 ID 지정)
                     vector_data = {
@@ -378,13 +428,13 @@ class SimilarityService:
                     }
 
                     self.vector_service.index.upsert(vectors=[vector_data])
-                    print(f"[SimilarityService] 자소서 벡터 저장 완료: {cover_letter_vector_id}")
+                    logger.debug("[SimilarityService] 자소서 벡터 저장 완료: %s", cover_letter_vector_id)
                 else:
-                    print(f"[SimilarityService] 자소서 벡터 이미 존재: {cover_letter_vector_id}")
+                    logger.debug("[SimilarityService] 자소서 벡터 이미 존재: %s", cover_letter_vector_id)
             except Exception as e:
-                print(f"[SimilarityService] 벡터 확인/저장 중 오류: {e}")
+                logger.warning("[SimilarityService] 벡터 확인/저장 중 오류: %s", e)
                 # 오류 발생 시 강제로 벡터 저장
-                print(f"[SimilarityService] 오류로 인해 자소서 벡터 강제 저장...")
+                logger.warning("[SimilarityService] 오류로 인해 자소서 벡터 강제 저장...")
                 vector_data = {
                     "id": cover_letter_vector_id,
                     "values": query_embedding,
@@ -399,7 +449,7 @@ class SimilarityService:
                 }
 
                 self.vector_service.index.upsert(vectors=[vector_data])
-                print(f"[SimilarityService] 자소서 벡터 강제 저장 완료: {cover_letter_vector_id}")
+                logger.debug("[SimilarityService] 자소서 벡터 강제 저장 완료: %s", cover_letter_vector_id)
 
             # Pinecone에서 유사한 벡터 검색 (표절 의심 수준으로 높은 임계값 사용)
             search_result = await self.vector_service.search_similar_vectors(
@@ -420,10 +470,13 @@ class SimilarityService:
                 # 자기 자신 제외하고 높은 유사도만 포함
                 if match_id != cover_letter_id and similarity_score >= plagiarism_threshold:
                     suspected_plagiarism.append(match)
-                    print(f"[SimilarityService] 표절 의심: ID={match_id}, 유사도={similarity_score:.1%}")
+                    logger.debug("[SimilarityService] 표절 의심: ID=%s, 유사도=%.1f%%", match_id, similarity_score * 100)
 
             if len(suspected_plagiarism) > 0:
-                print(f"[SimilarityService] 표절 의심 자소서 {len(suspected_plagiarism)}개 발견")
+                logger.debug("[SimilarityService] 표절 의심 자소서 %s개 발견", len(suspected_plagiarism))
+
+            # 구간 정렬은 원문(오프셋 기준) 텍스트로 수행
+            original_full_text = self._get_cover_letter_full_text(cover_letter)
 
             # MongoDB에서 상세 정보 조회
             results = []
@@ -444,10 +497,14 @@ class SimilarityService:
                             elif key == "_id":
                                 cover_letter_detail[key] = str(value)  # ObjectId도 문자열로
 
-                        # 표절 위험도 분석
+                        # 일치 구간 정렬 후 표절 위험도 분석 (경계 사례만 LLM 검토)
+                        alignment = self.passage_aligner.align(
+                            original_full_text, self._get_cover_letter_full_text(cover_letter_detail)
+                        )
                         plagiarism_analysis = await self.llm_service.analyze_plagiarism_suspicion(
                             original_resume=cover_letter,
-                            similar_resumes=[{"resume": cover_letter_detail, "similarity_score": match["score"]}]
+                            similar_resumes=[{"resume": cover_letter_detail, "similarity_score": match["score"],
+                                              "alignment": alignment}]
                         )
 
                         results.append({
@@ -455,14 +512,15 @@ class SimilarityService:
                             "similarity_percentage": round(match["score"] * 100, 1),
                             "suspicion_risk": "HIGH" if match["score"] >= 0.85 else "MEDIUM",
                             "cover_letter": cover_letter_detail,
+                            "alignment": alignment,
                             "suspicion_analysis": plagiarism_analysis
                         })
 
             # 유사도 점수로 정렬
             results.sort(key=lambda x: x["similarity_score"], reverse=True)
 
-            print(f"[SimilarityService] 표절 의심 자소서 수: {len(results)}")
-            print(f"[SimilarityService] === 자소서 표절체크 완료 ===")
+            logger.debug("[SimilarityService] 표절 의심 자소서 수: %s", len(results))
+            logger.debug("[SimilarityService] === 자소서 표절체크 완료 ===")
 
             # 원본 자소서도 datetime 처리
             original_data = {
@@ -492,7 +550,7 @@ class SimilarityService:
             }
 
         except Exception as e:
-            print(f"[SimilarityService] 자소서 표절체크 실패: {str(e)}")
+            logger.warning("[SimilarityService] 자소서 표절체크 실패: %s", str(e))
             raise e
 
 
@@ -515,31 +573,31 @@ class SimilarityService:
                 raise ValueError("검색어를 입력해주세요.")
 
             # 쿼리 텍스트 임베딩 생성
-            print(f"=== 검색 임베딩 처리 시작 ===")
-            print(f"검색 쿼리: {query}")
-            print(f"검색 타입: {search_type}")
-            print(f"검색 제한: {limit}")
+            logger.debug("=== 검색 임베딩 처리 시작 ===")
+            logger.debug("검색 쿼리: %s", query)
+            logger.debug("검색 타입: %s", search_type)
+            logger.debug("검색 제한: %s", limit)
 
             query_embedding = await self.embedding_service.create_query_embedding(query)
 
             if not query_embedding:
-                print(f"검색어 임베딩 생성 실패!")
+                logger.warning("검색어 임베딩 생성 실패!")
                 raise ValueError("검색어 임베딩 생성에 실패했습니다.")
 
-            print(f"검색어 임베딩 생성 성공!")
-            print(f"검색 임베딩 차원: {len(query_embedding)}")
+            logger.debug("검색어 임베딩 생성 성공!")
+            logger.debug("검색 임베딩 차원: %s", len(query_embedding))
 
             # Pinecone에서 유사한 벡터 검색
-            print(f"Pinecone 검색 시작...")
+            logger.debug("Pinecone 검색 시작...")
             search_result = await self.vector_service.search_similar_vectors(
                 query_embedding=query_embedding,
                 top_k=limit,
                 filter_type=search_type
             )
 
-            print(f"Pinecone 검색 완료!")
-            print(f"검색 결과 수: {len(search_result['matches'])}")
-            print(f"=== 검색 임베딩 처리 완료 ===")
+            logger.debug("Pinecone 검색 완료!")
+            logger.debug("검색 결과 수: %s", len(search_result['matches']))
+            logger.debug("=== 검색 임베딩 처리 완료 ===")
 
             # MongoDB에서 상세 정보 조회 (벡터 타입에 따라 ID 필드 결정)
             document_ids = []
@@ -590,7 +648,7 @@ class SimilarityService:
             }
 
         except Exception as e:
-            print(f"이력서 검색 중 오류: {str(e)}")
+            logger.warning("이력서 검색 중 오류: %s", str(e))
             raise e
 
     def _extract_cover_letter_text(self, cover_letter: Dict[str, Any]) -> str:
@@ -748,51 +806,134 @@ class SimilarityService:
             return intersection / union if union > 0 else 0.0
 
         except Exception as e:
-            print(f"[SimilarityService] 기술스택 유사도 계산 중 오류: {str(e)}")
+            logger.warning("[SimilarityService] 기술스택 유사도 계산 중 오류: %s", str(e))
             return 0.0
 
 
 
 
     async def search_resumes_multi_hybrid(self, query: str, collection: Collection,
-                                        search_type: str = "resume", limit: int = 10) -> Dict[str, Any]:
+                                        search_type: str = "resume", limit: int = 10,
+                                        offset: int = 0, sort_by: str = "final_score") -> Dict[str, Any]:
         """
         다중 하이브리드 검색: LangChain EnsembleRetriever 또는 기존 방식을 사용합니다.
 
+        융합된 순위(ID/점수)는 (검색어, 필터, 가중치, 페이지 크기) 기준으로 캐시되어
+        같은 검색의 페이지 이동/재정렬은 캐시된 순위에서 해당 페이지만 조회합니다.
+
         Args:
             query (str): 검색할 쿼리 텍스트
             collection (Collection): MongoDB 컬렉션
             search_type (str): 검색할 타입
-            limit (int): 반환할 최대 결과 수
+            limit (int): 페이지 크기
+            offset (int): 캐시된 순위에서 건너뛸 결과 수
+            sort_by (str): 정렬 기준 (final_score / vector_score / keyword_score)
 
         Returns:
             Dict[str, Any]: 다중 하이브리드 검색 결과
         """
         try:
-            print(f"[SimilarityService] === 다중 하이브리드 검색 시작 ===")
-            print(f"[SimilarityService] 검색 쿼리: {query}")
+            logger.debug("[SimilarityService] === 다중 하이브리드 검색 시작 ===")
+            logger.debug("[SimilarityService] 검색 쿼리: %s", query)
 
             if not query or not query.strip():
                 raise ValueError("검색어를 입력해주세요.")
+            if sort_by not in SEARCH_SORT_FIELDS:
+                raise ValueError(f"지원하지 않는 정렬 기준입니다: {sort_by}")
+
+            cache_key = search_result_cache.make_key(
+                "multi_hybrid", query,
+                {"type": search_type, "collection": getattr(collection, "name", None)},
+                {**self.search_weights, "fusion": self.score_fusion.method},
+                limit
+            )
+            cached = search_result_cache.get(cache_key)
+            documents = None
+            if cached is None:
+                # 여러 페이지 분량의 순위를 한 번에 계산해 캐시
+                depth = limit * SEARCH_CACHE_PAGES
+                if self.langchain_hybrid:
+                    logger.debug("[SimilarityService] LangChain 하이브리드 검색 사용")
+                    result = await self._search_with_langchain_hybrid(query, collection, search_type, depth)
+                else:
+                    logger.debug("[SimilarityService] 기존 하이브리드 검색 사용 (폴백)")
+                    result = await self._search_with_manual_hybrid(query, collection, search_type, depth)
+                if not result.get("success"):
+                    return result
+
+                results = result["data"]["results"]
+                ranking = [
+                    {**{key: value for key, value in item.items() if key != "resume"}, "id": item["resume"]["_id"]}
+                    for item in results
+                ]
+                meta = {key: value for key, value in result["data"].items() if key not in ("results", "total")}
+                cached = search_result_cache.set(cache_key, ranking, meta)
+                documents = {item["resume"]["_id"]: item["resume"] for item in results}
+            else:
+                logger.debug("[SimilarityService] 캐시된 검색 순위 사용 (세대 %s)", cached['generation'])
 
-            # LangChain 하이브리드 서비스 우선 사용
-            if self.langchain_hybrid:
-                print(f"[SimilarityService] LangChain 하이브리드 검색 사용")
-                return await self._search_with_langchain_hybrid(query, collection, search_type, limit)
-
-            # 기존 방식 폴백
-            print(f"[SimilarityService] 기존 하이브리드 검색 사용 (폴백)")
-            return await self._search_with_manual_hybrid(query, collection, search_type, limit)
+            return await self._page_cached_ranking(cached, collection, query, limit, offset, sort_by, documents)
 
         except Exception as e:
-            print(f"[SimilarityService] 다중 하이브리드 검색 실패: {str(e)}")
+            logger.warning("[SimilarityService] 다중 하이브리드 검색 실패: %s", str(e))
             raise e
 
+    async def _page_cached_ranking(self, cached: Dict[str, Any], collection: Collection, query: str,
+                                   limit: int, offset: int, sort_by: str,
+                                   documents: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """캐시된 순위에서 한 페이지를 잘라 이력서를 조회합니다. (documents 가 있으면 조회 생략)"""
+        ranking = cached["ranking"]
+        if sort_by != "final_score":
+            ranking = sorted(ranking, key=lambda entry: entry.get(sort_by, 0.0), reverse=True)
+        page = ranking[offset:offset + limit]
+
+        from_cache = documents is None
+        if from_cache:
+            page_ids = [ObjectId(entry["id"]) for entry in page if ObjectId.is_valid(entry["id"])]
+            resumes = await collection.find({"_id": {"$in": page_ids}}).to_list(len(page_ids))
+            documents = {str(resume["_id"]): self._format_search_document(resume) for resume in resumes}
+
+        results = [
+            {**{key: value for key, value in entry.items() if key != "id"}, "resume": documents[entry["id"]]}
+            for entry in page if entry["id"] in documents
+        ]
+
+        return {
+            "success": True,
+            "data": {
+                **cached["meta"],
+                "query": query,
+                "results": results,
+                "total": len(results),
+                "offset": offset,
+                "limit": limit,
+                "sort_by": sort_by,
+                "total_ranked": len(ranking),
+                "has_more": offset + limit < len(ranking),
+                "from_cache": from_cache
+            }
+        }
+
+    @staticmethod
+    def _format_search_document(resume: Dict[str, Any]) -> Dict[str, Any]:
+        """검색 결과용 이력서 포맷팅 (ID 문자열화, datetime → ISO 문자열)"""
+        resume["_id"] = str(resume["_id"])
+        if "resume_id" in resume:
+            resume["resume_id"] = str(resume["resume_id"])
+        else:
+            resume["resume_id"] = str(resume["_id"])
+
+        # 모든 datetime 필드를 문자열로 변환 (JSON 직렬화를 위해)
+        for key, value in list(resume.items()):
+            if hasattr(value, 'isoformat'):  # datetime 객체인지 확인
+                resume[key] = value.isoformat()
+        return resume
+
     async def _search_with_langchain_hybrid(self, query: str, collection: Collection,
                                           search_type: str, limit: int) -> Dict[str, Any]:
         """LangChain 하이브리드 검색을 사용합니다."""
         try:
-            print(f"[SimilarityService] LangChain 하이브리드 검색 수행")
+            logger.debug("[SimilarityService] LangChain 하이브리드 검색 수행")
 
             # LangChain 하이브리드 검색 (벡터 + 키워드)
             result = await self.langchain_hybrid.search_resumes_langchain_hybrid(
@@ -803,40 +944,41 @@ class SimilarityService:
             )
 
             if result and result.get("success"):
-                print(f"[SimilarityService] LangChain 하이브리드 검색 성공: {result['data']['total']}개 결과")
+                logger.debug("[SimilarityService] LangChain 하이브리드 검색 성공: %s개 결과", result['data']['total'])
                 return result
             else:
-                print(f"[SimilarityService] LangChain 하이브리드 검색 실패, 폴백 사용")
+                logger.warning("[SimilarityService] LangChain 하이브리드 검색 실패, 폴백 사용")
                 return await self._search_with_manual_hybrid(query, collection, search_type, limit)
 
+        except AdmissionRejected:
+            raise
         except Exception as e:
-            print(f"[SimilarityService] LangChain 하이브리드 검색 오류: {e}, 폴백 사용")
+            logger.warning("[SimilarityService] LangChain 하이브리드 검색 오류: %s, 폴백 사용", e)
             return await self._search_with_manual_hybrid(query, collection, search_type, limit)
 
     async def _search_with_manual_hybrid(self, query: str, collection: Collection,
                                        search_type: str, limit: int) -> Dict[str, Any]:
         """기존 수동 하이브리드 검색을 사용합니다."""
         try:
-            print(f"[SimilarityService] 기존 하이브리드 검색 수행")
-            print(f"[SimilarityService] 가중치 - 벡터: {self.search_weights['vector']}, "
-                  f"키워드: {self.search_weights['keyword']}")
-
-            # 1. 벡터 검색 수행
-            print(f"[SimilarityService] 1단계: 벡터 검색 수행")
-            vector_results = await self._perform_vector_search(query, collection, search_type, limit * 2)
-
-            # 2. 키워드 검색 수행
-            print(f"[SimilarityService] 2단계: 키워드 검색 수행")
-            keyword_results = await self._perform_keyword_search(query, collection, limit * 2)
+            logger.debug("[SimilarityService] 기존 하이브리드 검색 수행")
+            logger.debug("[SimilarityService] 가중치 - 벡터: %s, 키워드: %s",
+                         self.search_weights['vector'], self.search_weights['keyword'])
+
+            # 1. 벡터 검색 + 키워드 검색 동시 수행
+            logger.debug("[SimilarityService] 1단계: 벡터/키워드 검색 동시 수행")
+            vector_results, keyword_results = await asyncio.gather(
+                self._perform_vector_search(query, collection, search_type, limit * 2),
+                self._perform_keyword_search(query, collection, limit * 2)
+            )
 
-            # 3. 검색 결과 융합
-            print(f"[SimilarityService] 3단계: 검색 결과 융합")
+            # 2. 검색 결과 융합
+            logger.debug("[SimilarityService] 2단계: 검색 결과 융합 (%s)", self.score_fusion.method)
             fused_results = await self._fuse_search_results(
                 vector_results, keyword_results, collection, query, limit
             )
 
-            print(f"[SimilarityService] 최종 결과 수: {len(fused_results)}")
-            print(f"[SimilarityService] === 기존 하이브리드 검색 완료 ===")
+            logger.debug("[SimilarityService] 최종 결과 수: %s", len(fused_results))
+            logger.debug("[SimilarityService] === 기존 하이브리드 검색 완료 ===")
 
             return {
                 "success": True,
@@ -844,6 +986,7 @@ class SimilarityService:
                     "query": query,
                     "search_method": "manual_hybrid",
                     "weights": self.search_weights,
+                    "fusion_method": self.score_fusion.method,
                     "results": fused_results,
                     "total": len(fused_results),
                     "vector_count": len(vector_results),
@@ -852,7 +995,7 @@ class SimilarityService:
             }
 
         except Exception as e:
-            print(f"[SimilarityService] 기존 하이브리드 검색 실패: {str(e)}")
+            logger.warning("[SimilarityService] 기존 하이브리드 검색 실패: %s", str(e))
             raise e
 
     async def _perform_vector_search(self, query: str, collection: Collection,
@@ -864,23 +1007,6 @@ class SimilarityService:
             if not query_embedding:
                 return []
 
-            # Pinecone에 저장된 벡터 확인 (디버깅)
-            try:
-                stats = self.vector_service.get_stats()
-                print(f"[SimilarityService] Pinecone 통계: {stats}")
-
-                # 필터 없이 전체 검색해보기
-                all_search_result = await self.vector_service.search_similar_vectors(
-                    query_embedding=query_embedding,
-                    top_k=10,
-                    filter_type=None
-                )
-                print(f"[SimilarityService] 필터 없는 전체 검색 결과: {len(all_search_result['matches'])}개")
-                for match in all_search_result['matches'][:3]:
-                    print(f"  - ID: {match['id']}, Score: {match['score']:.3f}, Type: {match['metadata'].get('chunk_type', 'unknown')}")
-            except Exception as e:
-                print(f"[SimilarityService] 디버깅 검색 실패: {e}")
-
             # Pinecone 벡터 검색
             search_result = await self.vector_service.search_similar_vectors(
                 query_embedding=query_embedding,
@@ -899,11 +1025,13 @@ class SimilarityService:
                     "search_method": "vector"
                 })
 
-            print(f"[SimilarityService] 벡터 검색 결과: {len(vector_results)}개")
+            logger.debug("[SimilarityService] 벡터 검색 결과: %s개", len(vector_results))
             return vector_results
 
+        except AdmissionRejected:
+            raise
         except Exception as e:
-            print(f"[SimilarityService] 벡터 검색 실패: {str(e)}")
+            logger.warning("[SimilarityService] 벡터 검색 실패: %s", str(e))
             return []
 
     async def _perform_keyword_search(self, query: str, collection: Collection,
@@ -914,7 +1042,8 @@ class SimilarityService:
             keyword_result = await self.keyword_search_service.search_by_keywords(
                 query=query,
                 collection=collection,
-                limit=limit
+                limit=limit,
+                hydrate=False  # 융합 후 상위 후보만 한 번에 조회
             )
 
             if not keyword_result["success"]:
@@ -930,95 +1059,50 @@ class SimilarityService:
                     "highlight": result.get("highlight", "")
                 })
 
-            print(f"[SimilarityService] 키워드 검색 결과: {len(keyword_results)}개")
+            logger.debug("[SimilarityService] 키워드 검색 결과: %s개", len(keyword_results))
             return keyword_results
 
         except Exception as e:
-            print(f"[SimilarityService] 키워드 검색 실패: {str(e)}")
+            logger.warning("[SimilarityService] 키워드 검색 실패: %s", str(e))
             return []
 
     async def _fuse_search_results(self, vector_results: List[Dict[str, Any]],
                                  keyword_results: List[Dict[str, Any]],
                                  collection: Collection, query: str,
                                  limit: int) -> List[Dict[str, Any]]:
-        """여러 검색 결과를 융합합니다."""
+        """여러 검색 결과를 융합합니다. (ScoreFusion 순위 융합 → 상위 후보만 1회 조회)"""
         try:
-            # 모든 unique resume_id 수집
-            all_resume_ids = set()
-            vector_scores = {}
-            keyword_scores = {}
-
-            # 벡터 검색 결과 처리
-            for result in vector_results:
-                resume_id = result["resume_id"]
-                all_resume_ids.add(resume_id)
-                vector_scores[resume_id] = result["vector_score"]
-
-            # 키워드 검색 결과 처리
-            for result in keyword_results:
-                resume_id = result["resume_id"]
-                all_resume_ids.add(resume_id)
-                keyword_scores[resume_id] = result["keyword_score"]
-
-            # MongoDB에서 상세 정보 조회
-            resume_ids_obj = [ObjectId(rid) for rid in all_resume_ids]
-            resumes = await collection.find({"_id": {"$in": resume_ids_obj}}).to_list(1000)
-
-            # 융합 점수 계산
-            fused_results = []
-            for resume in resumes:
-                resume_id = str(resume["_id"])
-
-                # 각 검색 방법의 점수 가져오기 (없으면 0)
-                v_score = vector_scores.get(resume_id, 0.0)
-                k_score = keyword_scores.get(resume_id, 0.0)
-
-                # 키워드 점수 정규화 (BM25 점수는 보통 0-10 범위)
-                k_score_normalized = min(k_score / 10.0, 1.0) if k_score > 0 else 0.0
-
-                # 가중 평균으로 최종 점수 계산 (벡터 + 키워드만)
-                final_score = (
-                    v_score * self.search_weights['vector'] +
-                    k_score_normalized * self.search_weights['keyword']
-                )
-
-                # 점수가 0보다 큰 경우만 포함
-                if final_score > 0:
-                    # 이력서 데이터 포맷팅
-                    resume["_id"] = str(resume["_id"])
-                    if "resume_id" in resume:
-                        resume["resume_id"] = str(resume["resume_id"])
-                    else:
-                        resume["resume_id"] = str(resume["_id"])
-
-                    # 모든 datetime 필드를 문자열로 변환 (JSON 직렬화를 위해)
-                    for key, value in list(resume.items()):
-                        if hasattr(value, 'isoformat'):  # datetime 객체인지 확인
-                            resume[key] = value.isoformat()
-                        elif key == "_id":
-                            resume[key] = str(value)  # ObjectId도 문자열로
-
-                    fused_results.append({
-                        "final_score": final_score,
-                        "vector_score": v_score,
-                        "keyword_score": k_score_normalized,
-                        "original_keyword_score": k_score,
-                        "resume": resume,
-                        "search_methods": [
-                            method for method, score in [
-                                ("vector", v_score),
-                                ("keyword", k_score_normalized)
-                            ] if score > 0
-                        ]
-                    })
-
-            # 최종 점수 기준으로 정렬
-            fused_results.sort(key=lambda x: x["final_score"], reverse=True)
+            fused = self.score_fusion.fuse({
+                "vector": [(result["resume_id"], result["vector_score"]) for result in vector_results],
+                "keyword": [(result["resume_id"], result["keyword_score"]) for result in keyword_results]
+            }, limit=limit)
+
+            # MongoDB에서 융합된 상위 후보만 한 번에 조회
+            resume_ids_obj = [ObjectId(entry["id"]) for entry in fused if ObjectId.is_valid(entry["id"])]
+            resumes = await collection.find({"_id": {"$in": resume_ids_obj}}).to_list(len(resume_ids_obj))
+            resumes_by_id = {str(resume["_id"]): resume for resume in resumes}
+
+            final_results = []
+            for entry in fused:
+                resume = resumes_by_id.get(entry["id"])
+                if not resume:
+                    continue
 
-            # 상위 결과만 반환
-            final_results = fused_results[:limit]
+                resume = self._format_search_document(resume)
+
+                final_results.append({
+                    "final_score": entry["final_score"],
+                    "vector_score": entry["raw_scores"].get("vector", 0.0),
+                    "keyword_score": entry["raw_scores"].get("keyword", 0.0),
+                    "vector_fused_score": entry["scores"].get("vector", 0.0),
+                    "keyword_fused_score": entry["scores"].get("keyword", 0.0),
+                    "original_keyword_score": entry["raw_scores"].get("keyword", 0.0),
+                    "ranks": entry["ranks"],
+                    "resume": resume,
+                    "search_methods": list(entry["scores"].keys())
+                })
 
-            print(f"[SimilarityService] 융합 결과: {len(final_results)}개 (전체 후보: {len(fused_results)}개)")
+            logger.debug("[SimilarityService] 융합 결과: %s개 (방식: %s)", len(final_results), self.score_fusion.method)
             for i, result in enumerate(final_results[:3]):  # 상위 3개만 로그
                 # name 필드 처리 (실제 DB 구조에 맞게)
                 name = '이름미상'
@@ -1028,18 +1112,17 @@ class SimilarityService:
                     names = result['resume']['basic_info']['names']
                     name = names[0] if names and len(names) > 0 else '이름미상'
 
-                print(f"[SimilarityService] #{i+1}: {name} "
-                      f"(최종:{result['final_score']:.3f}, V:{result['vector_score']:.3f}, "
-                      f"K:{result['keyword_score']:.3f})")
+                logger.debug("[SimilarityService] #%s: %s (최종:%.3f, V:%.3f, K:%.3f)",
+                             i + 1, name, result['final_score'], result['vector_score'], result['keyword_score'])
 
             return final_results
 
         except Exception as e:
-            print(f"[SimilarityService] 검색 결과 융합 실패: {str(e)}")
-            print(f"[SimilarityService] 벡터 결과 수: {len(vector_results)}")
-            print(f"[SimilarityService] 키워드 결과 수: {len(keyword_results)}")
+            logger.warning("[SimilarityService] 검색 결과 융합 실패: %s", str(e))
+            logger.debug("[SimilarityService] 벡터 결과 수: %s", len(vector_results))
+            logger.debug("[SimilarityService] 키워드 결과 수: %s", len(keyword_results))
             if vector_results:
-                print(f"[SimilarityService] 첫번째 벡터 결과: {vector_results[0]}")
+                logger.debug("[SimilarityService] 첫번째 벡터 결과: %s", vector_results[0])
             return []
 
     async def _store_applicant_vector_if_needed(self, applicant: Dict[str, Any]) -> bool:
@@ -1062,10 +1145,10 @@ class SimilarityService:
                 if existing_vector and existing_vector.get("vectors"):
                     vector_info = existing_vector["vectors"].get(vector_id)
                     if vector_info and vector_info.get("metadata", {}).get("text"):
-                        print(f"[SimilarityService] 지원자 벡터 이미 존재 (text 필드 포함): {vector_id}")
+                        logger.debug("[SimilarityService] 지원자 벡터 이미 존재 (text 필드 포함): %s", vector_id)
                         return True
                     else:
-                        print(f"[SimilarityService] 기존 벡터에 text 필드 없음, 업데이트 필요: {vector_id}")
+                        logger.debug("[SimilarityService] 기존 벡터에 text 필드 없음, 업데이트 필요: %s", vector_id)
             except Exception:
                 pass  # 벡터가 없으면 새로 생성
 
@@ -1114,7 +1197,7 @@ class SimilarityService:
                 text_parts.append(f"기타정보: {applicant['notes']}")
 
             if not text_parts:
-                print(f"[SimilarityService] 지원자 정보 부족으로 벡터 생성 스킵: {applicant.get('name', 'Unknown')}")
+                logger.debug("[SimilarityService] 지원자 정보 부족으로 벡터 생성 스킵: %s", applicant.get('name', 'Unknown'))
                 return False
 
             applicant_text = " ".join(text_parts)
@@ -1122,7 +1205,7 @@ class SimilarityService:
             # 임베딩 생성
             query_embedding = await self.embedding_service.create_document_embedding(applicant_text)
             if not query_embedding:
-                print(f"[SimilarityService] 지원자 임베딩 생성 실패: {applicant.get('name', 'Unknown')}")
+                logger.warning("[SimilarityService] 지원자 임베딩 생성 실패: %s", applicant.get('name', 'Unknown'))
                 return False
 
             # Pinecone에 벡터 저장
@@ -1145,11 +1228,11 @@ class SimilarityService:
             }
 
             self.vector_service.index.upsert(vectors=[vector_data])
-            print(f"[SimilarityService] 지원자 벡터 저장 완료: {applicant.get('name', 'Unknown')} ({vector_id})")
+            logger.debug("[SimilarityService] 지원자 벡터 저장 완료: %s (%s)", applicant.get('name', 'Unknown'), vector_id)
             return True
 
         except Exception as e:
-            print(f"[SimilarityService] 지원자 벡터 저장 실패: {e}")
+            logger.warning("[SimilarityService] 지원자 벡터 저장 실패: %s", e)
             return False
 
     async def _analyze_ideal_candidate_with_llm(self, target_applicant: Dict[str, Any]) -> Dict[str, Any]:
@@ -1163,8 +1246,8 @@ class SimilarityService:
             Dict: LLM 분석 결과
         """
         try:
-            print(f"[SimilarityService] === LLM 기반 이상적인 인재상 분석 시작 ===")
-            print(f"[SimilarityService] 기준 지원자: {target_applicant.get('name', 'N/A')}")
+            logger.debug("[SimilarityService] === LLM 기반 이상적인 인재상 분석 시작 ===")
+            logger.debug("[SimilarityService] 기준 지원자: %s", target_applicant.get('name', 'N/A'))
 
             # 지원자 정보 수집
             applicant_info = {
@@ -1183,8 +1266,8 @@ class SimilarityService:
             if target_applicant.get('resume_id'):
                 try:
                     from bson import ObjectId
-                    from .mongo_service import MongoService
-                    mongo_service = MongoService()
+                    from .mongo_service import get_shared_mongo_service
+                    mongo_service = get_shared_mongo_service()
                     resume = await mongo_service.db.resumes.find_one({"_id": ObjectId(target_applicant['resume_id'])})
                     if resume:
                         if resume.get('extracted_text'):
@@ -1194,16 +1277,16 @@ class SimilarityService:
                         if resume.get('keywords'):
                             applicant_info["resume_keywords"] = resume['keywords']
                 except Exception as e:
-                    print(f"[SimilarityService] 이력서 조회 실패: {e}")
+                    logger.warning("[SimilarityService] 이력서 조회 실패: %s", e)
 
             # LLM 분석 요청
             analysis_result = await self.llm_service.analyze_ideal_candidate(applicant_info)
 
-            print(f"[SimilarityService] LLM 분석 완료: 이상적인 인재상 분석")
+            logger.debug("[SimilarityService] LLM 분석 완료: 이상적인 인재상 분석")
             return analysis_result
 
         except Exception as e:
-            print(f"[SimilarityService] LLM 분석 실패: {str(e)}")
+            logger.warning("[SimilarityService] LLM 분석 실패: %s", str(e))
             return {
                 "success": False,
                 "error": str(e),
@@ -1223,7 +1306,7 @@ class SimilarityService:
             Dict: LLM 분석 결과
         """
         try:
-            print(f"[SimilarityService] === LLM 기반 유사 지원자 분석 시작 ===")
+            logger.debug("[SimilarityService] === LLM 기반 유사 지원자 분석 시작 ===")
 
             if not similar_applicants:
                 return {
@@ -1257,9 +1340,9 @@ class SimilarityService:
                 })
 
             # LLM 분석에 전달되는 인재 정보 로깅
-            print(f"[SimilarityService] LLM 분석에 전달할 인재들:")
+            logger.debug("[SimilarityService] LLM 분석에 전달할 인재들:")
             for info in similar_info:
-                print(f"  - {info['name']} ({info['position']})")
+                logger.debug("  - %s (%s)", info['name'], info['position'])
 
             # LLM 분석 요청
             analysis_result = await self.llm_service.analyze_similar_applicants(
@@ -1267,11 +1350,11 @@ class SimilarityService:
                 similar_applicants=similar_info
             )
 
-            print(f"[SimilarityService] LLM 분석 완료: {len(similar_applicants)}명 지원자 분석")
+            logger.debug("[SimilarityService] LLM 분석 완료: %s명 지원자 분석", len(similar_applicants))
             return analysis_result
 
         except Exception as e:
-            print(f"[SimilarityService] LLM 분석 실패: {str(e)}")
+            logger.warning("[SimilarityService] LLM 분석 실패: %s", str(e))
             return {
                 "success": False,
                 "error": str(e),
@@ -1293,12 +1376,12 @@ class SimilarityService:
             Dict[str, Any]: 유사 지원자 검색 결과
         """
         try:
-            print(f"[SimilarityService] === 지원자 기반 유사 인재 추천 시작 ===")
-            print(f"[SimilarityService] 기준 지원자: {target_applicant.get('name', 'N/A')}")
-            print(f"[SimilarityService] 지원직무: {target_applicant.get('position', 'N/A')}")
+            logger.debug("[SimilarityService] === 지원자 기반 유사 인재 추천 시작 ===")
+            logger.debug("[SimilarityService] 기준 지원자: %s", target_applicant.get('name', 'N/A'))
+            logger.debug("[SimilarityService] 지원직무: %s", target_applicant.get('position', 'N/A'))
 
             # 0. 기준 지원자의 벡터 저장 (text 필드 업데이트 포함)
-            print(f"[SimilarityService] 기준 지원자 벡터 업데이트 중...")
+            logger.debug("[SimilarityService] 기준 지원자 벡터 업데이트 중...")
             await self._store_applicant_vector_if_needed(target_applicant)
 
             # 1. 벡터 검색용 텍스트 (지원자 정보: position, experience, skills)
@@ -1315,7 +1398,7 @@ class SimilarityService:
                 vector_text_parts.append(f"기술스택: {skills_text}")
 
             vector_query_text = " ".join(vector_text_parts)
-            print(f"[SimilarityService] 벡터 검색용 텍스트: {vector_query_text}")
+            logger.debug("[SimilarityService] 벡터 검색용 텍스트: %s", vector_query_text)
 
             # 2. 키워드 검색용 텍스트 (이력서 내용: extracted_text 기반)
             keyword_text_parts = []
@@ -1325,11 +1408,11 @@ class SimilarityService:
                 try:
                     from bson import ObjectId
 
-                    from .mongo_service import MongoService
-                    mongo_service = MongoService()
+                    from .mongo_service import get_shared_mongo_service
+                    mongo_service = get_shared_mongo_service()
                     resume = await mongo_service.db.resumes.find_one({"_id": ObjectId(target_applicant['resume_id'])})
                     if resume:
-                        print(f"[SimilarityService] 연결된 이력서에서 키워드 검색용 텍스트 추출 중...")
+                        logger.debug("[SimilarityService] 연결된 이력서에서 키워드 검색용 텍스트 추출 중...")
                         # OCR 추출된 텍스트 사용
                         if resume.get('extracted_text'):
                             keyword_text_parts.append(resume['extracted_text'])
@@ -1341,7 +1424,7 @@ class SimilarityService:
                             keywords_text = " ".join(resume['keywords'])
                             keyword_text_parts.append(keywords_text)
                 except Exception as e:
-                    print(f"[SimilarityService] 이력서 조회 실패: {e}")
+                    logger.warning("[SimilarityService] 이력서 조회 실패: %s", e)
 
             # 지원자 정보의 이력서 내용도 확인 (백업 - OCR 이전 데이터용)
             if target_applicant.get('growthBackground'):
@@ -1352,11 +1435,11 @@ class SimilarityService:
                 keyword_text_parts.append(target_applicant['careerHistory'])
 
             keyword_query_text = " ".join(keyword_text_parts)
-            print(f"[SimilarityService] 키워드 검색용 텍스트 길이: {len(keyword_query_text)}")
+            logger.debug("[SimilarityService] 키워드 검색용 텍스트 길이: %s", len(keyword_query_text))
 
             # 최소한의 검색 텍스트 확보 확인
             if not vector_query_text and not keyword_query_text:
-                print(f"[SimilarityService] ❌ 검색 가능한 정보가 없음")
+                logger.warning("[SimilarityService] ❌ 검색 가능한 정보가 없음")
                 return {
                     "success": False,
                     "message": "검색 가능한 정보가 없습니다. 지원자 정보나 이력서 내용이 필요합니다.",
@@ -1368,7 +1451,7 @@ class SimilarityService:
             # 3. 벡터 검색 수행 (지원자 정보 기반)
             vector_results = []
             if vector_query_text:
-                print(f"[SimilarityService] 벡터 검색 수행 (지원자 정보 기반)...")
+                logger.debug("[SimilarityService] 벡터 검색 수행 (지원자 정보 기반)...")
                 vector_embedding = await self.embedding_service.create_query_embedding(vector_query_text)
                 if vector_embedding:
                     vector_search_result = await self.vector_service.search_similar_vectors(
@@ -1378,16 +1461,16 @@ class SimilarityService:
                     )
                     vector_results = vector_search_result.get("matches", [])
                 else:
-                    print(f"[SimilarityService] ❌ 벡터 임베딩 생성 실패")
+                    logger.warning("[SimilarityService] ❌ 벡터 임베딩 생성 실패")
 
-            print(f"[SimilarityService] 벡터 검색 결과: {len(vector_results)}개")
+            logger.debug("[SimilarityService] 벡터 검색 결과: %s개", len(vector_results))
 
             # 4. LangChain 하이브리드 검색 시도 (우선 - 키워드 검색 포함)
             if self.langchain_hybrid and vector_query_text:
-                print(f"[SimilarityService] LangChain 하이브리드 검색 사용")
+                logger.debug("[SimilarityService] LangChain 하이브리드 검색 사용")
                 # 이력서 컬렉션 가져오기 (키워드 검색용)
-                from .mongo_service import MongoService
-                mongo_service = MongoService()
+                from .mongo_service import get_shared_mongo_service
+                mongo_service = get_shared_mongo_service()
                 resumes_collection = mongo_service.db.resumes
 
                 langchain_result = await self.langchain_hybrid.search_similar_applicants_langchain(
@@ -1401,23 +1484,23 @@ class SimilarityService:
 
                 # LLM 분석 추가 (이상적인 인재상 분석으로 변경)
                 if langchain_result and langchain_result.get("success"):
-                    print(f"[SimilarityService] 이상적인 인재상 LLM 분석 수행...")
+                    logger.debug("[SimilarityService] 이상적인 인재상 LLM 분석 수행...")
                     llm_analysis = await self._analyze_ideal_candidate_with_llm(target_applicant)
                     langchain_result["data"]["llm_analysis"] = llm_analysis
 
                 return langchain_result
 
             # 5. 기존 방식 폴백 (LangChain 실패 시) - 키워드 검색 수행
-            print(f"[SimilarityService] 기존 하이브리드 검색 사용 (폴백)")
+            logger.debug("[SimilarityService] 기존 하이브리드 검색 사용 (폴백)")
             
             # 폴백 시에만 키워드 검색 수행 (이력서 내용 기반)
             keyword_results = []
             if keyword_query_text:
-                print(f"[SimilarityService] 폴백: 키워드 검색 수행 (이력서 내용 기반)...")
+                logger.debug("[SimilarityService] 폴백: 키워드 검색 수행 (이력서 내용 기반)...")
                 
                 # 이력서 컬렉션에서 검색
-                from .mongo_service import MongoService
-                mongo_service = MongoService()
+                from .mongo_service import get_shared_mongo_service
+                mongo_service = get_shared_mongo_service()
                 resumes_collection = mongo_service.db.resumes
                 
                 # Elasticsearch 기반 BM25 검색 실행 (이력서 컬렉션 대상)
@@ -1441,17 +1524,19 @@ class SimilarityService:
                         except Exception:
                             continue
             else:
-                print(f"[SimilarityService] 폴백: 키워드 검색 스킵 (이력서 내용 없음)")
+                logger.debug("[SimilarityService] 폴백: 키워드 검색 스킵 (이력서 내용 없음)")
 
-            print(f"[SimilarityService] 폴백: 키워드 검색 결과: {len(keyword_results)}개")
+            logger.debug("[SimilarityService] 폴백: 키워드 검색 결과: %s개", len(keyword_results))
             
             return await self._fuse_applicant_search_results(
                 vector_results, keyword_results, applicants_collection,
                 target_applicant, vector_query_text, limit
             )
 
+        except AdmissionRejected:
+            raise
         except Exception as e:
-            print(f"[SimilarityService] 지원자 기반 유사 인재 추천 실패: {str(e)}")
+            logger.warning("[SimilarityService] 지원자 기반 유사 인재 추천 실패: %s", str(e))
             return {
                 "success": False,
                 "error": str(e),
@@ -1465,25 +1550,25 @@ class SimilarityService:
         지원자 기반 벡터 + 키워드 검색 결과 융합
         """
         try:
-            print(f"🔗 [SimilarityService] === 지원자 기반 결과 융합 시작 ===")
-            print(f"📊 [SimilarityService] 입력 데이터:")
-            print(f"  - 벡터 결과 수: {len(vector_results)}")
-            print(f"  - 키워드 결과 수: {len(keyword_results)}")
-            print(f"  - 검색 제한: {limit}명")
-            print(f"  - 기준 지원자: {target_applicant.get('name', 'N/A')}")
+            logger.debug("🔗 [SimilarityService] === 지원자 기반 결과 융합 시작 ===")
+            logger.debug("📊 [SimilarityService] 입력 데이터:")
+            logger.debug("  - 벡터 결과 수: %s", len(vector_results))
+            logger.debug("  - 키워드 결과 수: %s", len(keyword_results))
+            logger.debug("  - 검색 제한: %s명", limit)
+            logger.debug("  - 기준 지원자: %s", target_applicant.get('name', 'N/A'))
 
             # 벡터 결과를 지원자 ID 기반으로 변환
-            print(f"🔄 [SimilarityService] 1단계: 벡터 결과 변환")
+            logger.debug("🔄 [SimilarityService] 1단계: 벡터 결과 변환")
             vector_applicant_scores = {}
             for i, match in enumerate(vector_results):
-                print(f"  - 벡터 결과 #{i+1} 처리:")
-                print(f"    - 메타데이터: {match.get('metadata', {})}")
-                print(f"    - 점수: {match.get('score', 0)}")
+                logger.debug("  - 벡터 결과 #%s 처리:", i + 1)
+                logger.debug("    - 메타데이터: %s", match.get('metadata', {}))
+                logger.debug("    - 점수: %s", match.get('score', 0))
                 
                 # 지원자 벡터의 경우 document_id가 applicant_id임
                 applicant_id = match["metadata"].get("document_id")
                 if applicant_id and applicant_id != str(target_applicant.get("_id")):
-                    print(f"    - 지원자 ID: {applicant_id}")
+                    logger.debug("    - 지원자 ID: %s", applicant_id)
                     
                     # applicant_id로 지원자 찾기
                     from bson import ObjectId
@@ -1494,23 +1579,23 @@ class SimilarityService:
                                 "score": match["score"],
                                 "applicant": applicant
                             }
-                            print(f"    ✅ 지원자 매칭 성공: {applicant.get('name', 'N/A')}")
+                            logger.debug("    ✅ 지원자 매칭 성공: %s", applicant.get('name', 'N/A'))
                         else:
-                            print(f"    ⚠️ 중복 지원자 ID (기존 점수 유지)")
+                            logger.debug("    ⚠️ 중복 지원자 ID (기존 점수 유지)")
                     else:
-                        print(f"    ❌ 지원자 조회 실패: {applicant_id}")
+                        logger.warning("    ❌ 지원자 조회 실패: %s", applicant_id)
                 else:
-                    print(f"    ⚠️ 유효하지 않은 지원자 ID 또는 기준 지원자와 동일")
+                    logger.debug("    ⚠️ 유효하지 않은 지원자 ID 또는 기준 지원자와 동일")
 
-            print(f"  - 벡터 검색으로 매칭된 지원자 수: {len(vector_applicant_scores)}")
+            logger.debug("  - 벡터 검색으로 매칭된 지원자 수: %s", len(vector_applicant_scores))
 
             # 키워드 결과를 지원자 ID 기반으로 변환
-            print(f"🔄 [SimilarityService] 2단계: 키워드 결과 변환")
+            logger.debug("🔄 [SimilarityService] 2단계: 키워드 결과 변환")
             keyword_applicant_scores = {}
             for i, result in enumerate(keyword_results):
-                print(f"  - 키워드 결과 #{i+1} 처리:")
-                print(f"    - 이력서 ID: {result.get('_id')}")
-                print(f"    - 원본 점수: {result.get('_score', 0)}")
+                logger.debug("  - 키워드 결과 #%s 처리:", i + 1)
+                logger.debug("    - 이력서 ID: %s", result.get('_id'))
+                logger.debug("    - 원본 점수: %s", result.get('_score', 0))
                 
                 resume_id = result.get("_id")
                 if resume_id and resume_id != target_applicant.get("resume_id"):
@@ -1528,44 +1613,46 @@ class SimilarityService:
                                 "original_score": bm25_score,
                                 "applicant": applicant
                             }
-                            print(f"    ✅ 지원자 매칭 성공: {applicant.get('name', 'N/A')} (정규화 점수: {normalized_score:.3f})")
+                            logger.debug("    ✅ 지원자 매칭 성공: %s (정규화 점수: %.3f)",
+                                         applicant.get('name', 'N/A'), normalized_score)
                         else:
-                            print(f"    ⚠️ 중복 지원자 ID (기존 점수 유지)")
+                            logger.debug("    ⚠️ 중복 지원자 ID (기존 점수 유지)")
                     else:
-                        print(f"    ❌ 지원자 조회 실패 (resume_id: {resume_id})")
+                        logger.warning("    ❌ 지원자 조회 실패 (resume_id: %s)", resume_id)
                 else:
-                    print(f"    ⚠️ 유효하지 않은 이력서 ID 또는 기준 지원자와 동일")
+                    logger.debug("    ⚠️ 유효하지 않은 이력서 ID 또는 기준 지원자와 동일")
 
-            print(f"  - 키워드 검색으로 매칭된 지원자 수: {len(keyword_applicant_scores)}")
+            logger.debug("  - 키워드 검색으로 매칭된 지원자 수: %s", len(keyword_applicant_scores))
 
             # 결과 융합
-            print(f"🔗 [SimilarityService] 3단계: 결과 융합")
+            logger.debug("🔗 [SimilarityService] 3단계: 결과 융합")
             fused_results = []
             all_applicant_ids = set(vector_applicant_scores.keys()) | set(keyword_applicant_scores.keys())
-            print(f"  - 총 고유 지원자 수: {len(all_applicant_ids)}")
+            logger.debug("  - 총 고유 지원자 수: %s", len(all_applicant_ids))
 
             for applicant_id in all_applicant_ids:
-                print(f"  - 지원자 ID {applicant_id} 융합:")
+                logger.debug("  - 지원자 ID %s 융합:", applicant_id)
                 
                 v_score = vector_applicant_scores.get(applicant_id, {}).get("score", 0)
                 k_score_data = keyword_applicant_scores.get(applicant_id, {})
                 k_score_normalized = k_score_data.get("score", 0)
                 k_score = k_score_data.get("original_score", 0)
 
-                print(f"    - 벡터 점수: {v_score:.3f}")
-                print(f"    - 키워드 정규화 점수: {k_score_normalized:.3f}")
-                print(f"    - 키워드 원본 점수: {k_score:.3f}")
+                logger.debug("    - 벡터 점수: %.3f", v_score)
+                logger.debug("    - 키워드 정규화 점수: %.3f", k_score_normalized)
+                logger.debug("    - 키워드 원본 점수: %.3f", k_score)
 
                 # 가중 평균으로 최종 점수 계산
                 final_score = (v_score * self.search_weights['vector']) + (k_score_normalized * self.search_weights['keyword'])
-                print(f"    - 최종 점수: {final_score:.3f} (가중치: V={self.search_weights['vector']}, K={self.search_weights['keyword']})")
+                logger.debug("    - 최종 점수: %.3f (가중치: V=%s, K=%s)",
+                             final_score, self.search_weights['vector'], self.search_weights['keyword'])
 
                 # 지원자 정보 가져오기
                 applicant = vector_applicant_scores.get(applicant_id, {}).get("applicant") or \
                            keyword_applicant_scores.get(applicant_id, {}).get("applicant")
 
                 if applicant and final_score > 0:
-                    print(f"    ✅ 유효한 지원자: {applicant.get('name', 'N/A')}")
+                    logger.debug("    ✅ 유효한 지원자: %s", applicant.get('name', 'N/A'))
                     
                     # ID와 datetime 필드 처리
                     applicant["_id"] = str(applicant["_id"])
@@ -1597,22 +1684,21 @@ class SimilarityService:
                         "search_methods": search_methods
                     })
                     
-                    print(f"    ✅ 융합 결과 추가 완료")
+                    logger.debug("    ✅ 융합 결과 추가 완료")
                 else:
-                    print(f"    ❌ 유효하지 않은 지원자 또는 점수 0")
+                    logger.warning("    ❌ 유효하지 않은 지원자 또는 점수 0")
 
             # 최종 점수 기준으로 정렬
-            print(f"📊 [SimilarityService] 4단계: 결과 정렬")
+            logger.debug("📊 [SimilarityService] 4단계: 결과 정렬")
             fused_results.sort(key=lambda x: x["final_score"], reverse=True)
             final_results = fused_results[:limit]
 
-            print(f"  - 융합 결과: {len(final_results)}개 지원자")
+            logger.debug("  - 융합 결과: %s개 지원자", len(final_results))
             for i, result in enumerate(final_results[:3]):
                 applicant_name = result['applicant'].get('name', '이름미상')
                 applicant_position = result['applicant'].get('position', 'N/A')
-                print(f"  #{i+1}: {applicant_name} ({applicant_position}) "
-                      f"(최종:{result['final_score']:.3f}, V:{result['vector_score']:.3f}, "
-                      f"K:{result['keyword_score']:.3f}, 방법:{result['search_methods']})")
+                logger.debug("  #%s: %s (%s) (최종:%.3f, V:%.3f, K:%.3f, 방법:%s)",
+                             i + 1, applicant_name, applicant_position, result['final_score'], result['vector_score'], result['keyword_score'], result['search_methods'])
 
             # 응답 구성
             response_data = {
@@ -1637,13 +1723,13 @@ class SimilarityService:
                 }
             }
 
-            print(f"✅ [SimilarityService] === 지원자 기반 결과 융합 완료 ===")
+            logger.debug("✅ [SimilarityService] === 지원자 기반 결과 융합 완료 ===")
             return response_data
 
         except Exception as e:
-            print(f"❌ [SimilarityService] 지원자 기반 결과 융합 실패: {str(e)}")
+            logger.warning("❌ [SimilarityService] 지원자 기반 결과 융합 실패: %s", str(e))
             import traceback
-            print(f"  - 상세 스택 트레이스:")
+            logger.debug("  - 상세 스택 트레이스:")
             traceback.print_exc()
             return {
                 "success": False,
@@ -1669,17 +1755,18 @@ class SimilarityService:
             Dict[str, Any]: 삭제 결과
         """
         try:
-            print(f"[SimilarityService] === 이력서 데이터 삭제 시작: {resume_id} ===")
+            logger.debug("[SimilarityService] === 이력서 데이터 삭제 시작: %s ===", resume_id)
 
             # 벡터 DB에서 삭제
             vector_result = await self.vector_service.delete_vectors_by_resume_id(resume_id)
+            search_result_cache.bump_generation(f"resume deleted {resume_id}")
 
             # Elasticsearch에서 삭제
             es_result = await self.keyword_search_service.delete_document(resume_id)
 
-            print(f"[SimilarityService] 벡터 삭제 결과: {vector_result}")
-            print(f"[SimilarityService] Elasticsearch 삭제 결과: {es_result['success']}")
-            print(f"[SimilarityService] === 이력서 데이터 삭제 완료: {resume_id} ===")
+            logger.debug("[SimilarityService] 벡터 삭제 결과: %s", vector_result)
+            logger.debug("[SimilarityService] Elasticsearch 삭제 결과: %s", es_result['success'])
+            logger.debug("[SimilarityService] === 이력서 데이터 삭제 완료: %s ===", resume_id)
 
             return {
                 "success": True,
@@ -1690,7 +1777,7 @@ class SimilarityService:
             }
 
         except Exception as e:
-            print(f"[SimilarityService] 이력서 데이터 삭제 실패: {str(e)}")
+            logger.warning("[SimilarityService] 이력서 데이터 삭제 실패: %s", str(e))
             return {
                 "success": False,
                 "resume_id": resume_id,
@@ -1698,101 +1785,168 @@ class SimilarityService:
                 "message": "이력서 데이터 삭제 중 오류가 발생했습니다."
             }
 
-    async def batch_store_cover_letter_vectors(self, cover_letters_collection) -> Dict[str, Any]:
+    async def batch_store_cover_letter_vectors(self, cover_letters_collection, page_size: int = 100,
+                                               concurrency: int = 2, restart: bool = False) -> Dict[str, Any]:
         """
         모든 자소서를 벡터 DB에 일괄 저장합니다.
 
+        컬렉션을 _id 순 커서로 읽어 page_size 단위로 처리합니다. 페이지마다 Pinecone 존재 확인 1회,
+        임베딩은 설정된 배치 크기와 분당 요청 제한 안에서 일괄 생성, upsert 1회로 저장하고
+        오류 없이 끝난 페이지까지의 마지막 _id 를 체크포인트로 남겨 재실행 시 이어서 처리합니다.
+
         Args:
             cover_letters_collection: MongoDB 자소서 컬렉션
+            page_size (int): 존재 확인/upsert 단위 (Pinecone fetch 1회당 ID 수)
+            concurrency (int): 동시에 처리할 페이지 수
+            restart (bool): True 이면 체크포인트를 무시하고 처음부터 처리
 
         Returns:
             Dict[str, Any]: 저장 결과
         """
         try:
-            print(f"[SimilarityService] === 자소서 벡터 일괄 저장 시작 ===")
-
-            # 모든 자소서 조회
-            cover_letters = await cover_letters_collection.find({}).to_list(10000)
-            print(f"[SimilarityService] 총 {len(cover_letters)}개 자소서 발견")
-
-            stored_count = 0
-            skipped_count = 0
-            error_count = 0
-
-            for cover_letter in cover_letters:
-                try:
-                    cover_letter_id = str(cover_letter["_id"])
-                    cover_letter_vector_id = f"cover_letter_{cover_letter_id}"
-
-                    # 이미 존재하는지 확인
-                    try:
-                        existing_vector = self.vector_service.index.fetch([cover_letter_vector_id])
-                        if existing_vector.vectors and cover_letter_vector_id in existing_vector.vectors:
-                            print(f"[SimilarityService] 스킵 (이미 존재): {cover_letter_vector_id}")
-                            skipped_count += 1
-                            continue
-                    except:
-                        pass  # 존재하지 않으면 새로 저장
-
-                    # 자소서 텍스트 추출
-                    cover_letter_text = self._extract_cover_letter_text(cover_letter)
-                    if not cover_letter_text or len(cover_letter_text.strip()) < 10:
-                        print(f"[SimilarityService] 스킵 (텍스트 부족): {cover_letter_vector_id}")
-                        skipped_count += 1
-                        continue
+            logger.debug("[SimilarityService] === 자소서 벡터 일괄 저장 시작 ===")
+
+            checkpoints = cover_letters_collection.database.backfill_checkpoints
+            checkpoint_id = "cover_letter_vectors"
+            last_id = None
+            if not restart:
+                checkpoint = await checkpoints.find_one({"_id": checkpoint_id})
+                last_id = checkpoint.get("last_id") if checkpoint else None
+            if last_id is not None:
+                logger.debug("[SimilarityService] 체크포인트에서 재개: %s", last_id)
+
+            counts = {"total": 0, "stored": 0, "skipped": 0, "errors": 0}
+            query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+            projection = {"extracted_text": 1, "careerHistory": 1, "growthBackground": 1,
+                          "motivation": 1, "applicant_id": 1}
+            cursor = cover_letters_collection.find(query, projection).sort("_id", 1).batch_size(page_size)
+
+            # 페이지를 동시에 처리하되 체크포인트는 읽은 순서대로 기록
+            # 오류가 난 페이지 이후로는 체크포인트를 올리지 않아 재실행 시 다시 시도 (저장된 벡터는 존재 확인으로 스킵)
+            in_flight = []
+            checkpoint_state = {"held": False}
+
+            async def complete_oldest():
+                page_last_id = in_flight[0][1]
+                page_counts = await in_flight.pop(0)[0]
+                for key, value in page_counts.items():
+                    counts[key] += value
+                if page_counts["errors"]:
+                    checkpoint_state["held"] = True
+                if checkpoint_state["held"]:
+                    return
+                await checkpoints.update_one(
+                    {"_id": checkpoint_id},
+                    {"$set": {"last_id": page_last_id, "updated_at": datetime.now()}},
+                    upsert=True
+                )
+                logger.debug("[SimilarityService] 진행: %s개 처리 (저장 %s개)", counts['total'], counts['stored'])
 
-                    # 임베딩 생성
-                    query_embedding = await self.embedding_service.create_query_embedding(cover_letter_text)
-                    if not query_embedding:
-                        print(f"[SimilarityService] 스킵 (임베딩 실패): {cover_letter_vector_id}")
-                        error_count += 1
+            page = []
+            try:
+                async for cover_letter in cursor:
+                    page.append(cover_letter)
+                    if len(page) < page_size:
                         continue
-
-                    # 벡터 저장
-                    vector_data = {
-                        "id": cover_letter_vector_id,
-                        "values": query_embedding,
-                        "metadata": {
-                            "document_id": cover_letter_id,
-                            "document_type": "cover_letter",
-                            "chunk_type": "cover_letter",
-                            "applicant_id": cover_letter.get("applicant_id", ""),
-                            "text_preview": cover_letter_text[:100] + "..." if len(cover_letter_text) > 100 else cover_letter_text,
-                            "created_at": datetime.now().isoformat()
-                        }
-                    }
-
-                    self.vector_service.index.upsert(vectors=[vector_data])
-                    stored_count += 1
-                    print(f"[SimilarityService] 저장 완료: {cover_letter_vector_id} ({stored_count}/{len(cover_letters)})")
-
-                    # 너무 빠르게 요청하지 않도록 짧은 대기
-                    await asyncio.sleep(0.1)
-
-                except Exception as e:
-                    error_count += 1
-                    print(f"[SimilarityService] 저장 실패: {cover_letter.get('_id')} - {str(e)}")
-
-            print(f"[SimilarityService] === 자소서 벡터 일괄 저장 완료 ===")
-            print(f"[SimilarityService] 저장: {stored_count}개, 스킵: {skipped_count}개, 오류: {error_count}개")
+                    in_flight.append((asyncio.create_task(self._store_cover_letter_vector_page(page)), page[-1]["_id"]))
+                    page = []
+                    if len(in_flight) >= concurrency:
+                        await complete_oldest()
+                if page:
+                    in_flight.append((asyncio.create_task(self._store_cover_letter_vector_page(page)), page[-1]["_id"]))
+                while in_flight:
+                    await complete_oldest()
+            finally:
+                # 중간에 예외(예: AdmissionRejected)로 빠져나오면 남은 페이지 작업을 취소하고 종료를 기다림
+                pending = [task for task, _ in in_flight]
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+            logger.debug("[SimilarityService] === 자소서 벡터 일괄 저장 완료 ===")
+            logger.warning("[SimilarityService] 저장: %s개, 스킵: %s개, 오류: %s개",
+                           counts['stored'], counts['skipped'], counts['errors'])
 
             return {
                 "success": True,
-                "total_cover_letters": len(cover_letters),
-                "stored_count": stored_count,
-                "skipped_count": skipped_count,
-                "error_count": error_count,
-                "message": f"자소서 벡터 일괄 저장 완료: {stored_count}개 저장됨"
+                "total_cover_letters": counts["total"],
+                "stored_count": counts["stored"],
+                "skipped_count": counts["skipped"],
+                "error_count": counts["errors"],
+                "resumed_from": str(last_id) if last_id is not None else None,
+                "checkpoint_held": checkpoint_state["held"],
+                "message": f"자소서 벡터 일괄 저장 완료: {counts['stored']}개 저장됨"
             }
 
         except Exception as e:
-            print(f"[SimilarityService] 자소서 벡터 일괄 저장 실패: {str(e)}")
+            logger.warning("[SimilarityService] 자소서 벡터 일괄 저장 실패: %s", str(e))
             return {
                 "success": False,
                 "error": str(e),
                 "message": "자소서 벡터 일괄 저장 중 오류가 발생했습니다."
             }
 
+    async def _store_cover_letter_vector_page(self, cover_letters: List[Dict[str, Any]]) -> Dict[str, int]:
+        """자소서 한 페이지: 존재 확인 1회 → 배치 임베딩 → upsert 1회"""
+        counts = {"total": len(cover_letters), "stored": 0, "skipped": 0, "errors": 0}
+        vector_ids = [f"cover_letter_{cover_letter['_id']}" for cover_letter in cover_letters]
+
+        # 이미 존재하는 벡터 확인 (페이지당 fetch 1회)
+        existing_ids = set()
+        try:
+            existing = await asyncio.to_thread(self.vector_service.index.fetch, vector_ids)
+            existing_ids = set(existing.vectors.keys()) if existing.vectors else set()
+        except Exception as e:
+            logger.warning("[SimilarityService] 존재 확인 실패 (전체 저장 시도): %s", e)
+
+        pending = []
+        for cover_letter, vector_id in zip(cover_letters, vector_ids):
+            if vector_id in existing_ids:
+                counts["skipped"] += 1
+                continue
+            cover_letter_text = self._extract_cover_letter_text(cover_letter)
+            if not cover_letter_text or len(cover_letter_text.strip()) < 10:
+                counts["skipped"] += 1
+                continue
+            pending.append((cover_letter, vector_id, cover_letter_text))
+
+        vectors = []
+        batch_size = self.embedding_service.settings.embedding_batch_size
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            # 백필은 일괄 작업 우선순위 (대화 요청에 분당 한도를 양보)
+            with llm_call_context(priority=PRIORITY_BATCH):
+                async with _embedding_rate_limiter():
+                    embeddings = await self.embedding_service.create_embeddings(
+                        [text for _, _, text in batch], EmbeddingType.QUERY
+                    )
+            for (cover_letter, vector_id, cover_letter_text), embedding in zip(batch, embeddings):
+                if not embedding:
+                    counts["errors"] += 1
+                    continue
+                vectors.append({
+                    "id": vector_id,
+                    "values": embedding,
+                    "metadata": {
+                        "document_id": str(cover_letter["_id"]),
+                        "document_type": "cover_letter",
+                        "chunk_type": "cover_letter",
+                        "applicant_id": cover_letter.get("applicant_id", ""),
+                        "text_preview": cover_letter_text[:100] + "..." if len(cover_letter_text) > 100 else cover_letter_text,
+                        "created_at": datetime.now().isoformat()
+                    }
+                })
+
+        if vectors:
+            try:
+                await asyncio.to_thread(self.vector_service.index.upsert, vectors=vectors)
+                counts["stored"] += len(vectors)
+            except Exception as e:
+                counts["errors"] += len(vectors)
+                logger.warning("[SimilarityService] 페이지 upsert 실패 (%s개): %s", len(vectors), e)
+
+        return counts
+
     async def find_similar_applicants(self, position: str = "", skills: str = "",
                                     experience: str = "", department: str = "",
                                     limit: int = 10) -> List[Dict[str, Any]]:
@@ -1810,8 +1964,9 @@ class SimilarityService:
             List[Dict[str, Any]]: 유사한 지원자 목록
         """
         try:
-            print(f"[SimilarityService] === 검색 기준 기반 유사 지원자 검색 시작 ===")
-            print(f"[SimilarityService] 검색 기준 - 직무: {position}, 기술: {skills}, 경력: {experience}, 부서: {department}")
+            logger.debug("[SimilarityService] === 검색 기준 기반 유사 지원자 검색 시작 ===")
+            logger.debug("[SimilarityService] 검색 기준 - 직무: %s, 기술: %s, 경력: %s, 부서: %s",
+                         position, skills, experience, department)
 
             # 검색 기준 텍스트 구성
             search_criteria = []
@@ -1825,16 +1980,16 @@ class SimilarityService:
                 search_criteria.append(f"부서: {department}")
 
             if not search_criteria:
-                print(f"[SimilarityService] ❌ 검색 기준이 없습니다.")
+                logger.warning("[SimilarityService] ❌ 검색 기준이 없습니다.")
                 return []
 
             search_text = " ".join(search_criteria)
-            print(f"[SimilarityService] 검색 텍스트: {search_text}")
+            logger.debug("[SimilarityService] 검색 텍스트: %s", search_text)
 
             # 임베딩 생성
             query_embedding = await self.embedding_service.create_query_embedding(search_text)
             if not query_embedding:
-                print(f"[SimilarityService] ❌ 임베딩 생성 실패")
+                logger.warning("[SimilarityService] ❌ 임베딩 생성 실패")
                 return []
 
             # 벡터 검색 수행
@@ -1845,12 +2000,12 @@ class SimilarityService:
             )
 
             vector_matches = vector_search_result.get("matches", [])
-            print(f"[SimilarityService] 벡터 검색 결과: {len(vector_matches)}개")
+            logger.debug("[SimilarityService] 벡터 검색 결과: %s개", len(vector_matches))
 
             # MongoDB에서 지원자 정보 조회
             try:
-                from .mongo_service import MongoService
-                mongo_service = MongoService()
+                from .mongo_service import get_shared_mongo_service
+                mongo_service = get_shared_mongo_service()
 
                 similar_applicants = []
                 processed_ids = set()
@@ -1881,15 +2036,17 @@ class SimilarityService:
                 # 유사도 점수로 정렬
                 similar_applicants.sort(key=lambda x: x.get("similarity_score", 0), reverse=True)
 
-                print(f"[SimilarityService] 최종 유사 지원자: {len(similar_applicants)}명")
+                logger.debug("[SimilarityService] 최종 유사 지원자: %s명", len(similar_applicants))
                 return similar_applicants
 
             except Exception as e:
-                print(f"[SimilarityService] MongoDB 조회 실패: {str(e)}")
+                logger.warning("[SimilarityService] MongoDB 조회 실패: %s", str(e))
                 return []
 
+        except AdmissionRejected:
+            raise
         except Exception as e:
-            print(f"[SimilarityService] 유사 지원자 검색 실패: {str(e)}")
+            logger.warning("[SimilarityService] 유사 지원자 검색 실패: %s", str(e))
             return []
 
     def _calculate_similarity_score(self, applicant: Dict[str, Any],
@@ -1966,7 +2123,7 @@ class SimilarityService:
             return score / total_weight
 
         except Exception as e:
-            print(f"[SimilarityService] 유사도 점수 계산 실패: {str(e)}")
+            logger.warning("[SimilarityService] 유사도 점수 계산 실패: %s", str(e))
             return 0.0
 
     async def check_cover_letter_plagiarism(self, cover_letter_id: str, db) -> Dict[str, Any]:
@@ -1981,7 +2138,7 @@ class SimilarityService:
             Dict[str, Any]: 표절 체크 결과
         """
         try:
-            print(f"[INFO] 자소서 표절 체크 요청 - cover_letter_id: {cover_letter_id}")
+            logger.debug("[INFO] 자소서 표절 체크 요청 - cover_letter_id: %s", cover_letter_id)
 
             # 자소서 ID 유효성 검사
             if not ObjectId.is_valid(cover_letter_id):
@@ -1993,27 +2150,42 @@ class SimilarityService:
                 raise ValueError("자소서를 찾을 수 없습니다.")
 
             cover_letter_name = original_cover_letter.get('basic_info_names') or original_cover_letter.get('name', 'Unknown')
-            print(f"[INFO] 원본 자소서 조회 완료: {cover_letter_name}")
+            logger.debug("[INFO] 원본 자소서 조회 완료: %s", cover_letter_name)
 
-            # 유사한 자소서 검색 (간단한 텍스트 유사도 기반)
+            # 유사한 자소서 검색 (MinHash/LSH 후보 → 정확한 Jaccard 검증)
             similar_cover_letters = []
-            async for doc in db.cover_letters.find({"_id": {"$ne": ObjectId(cover_letter_id)}}):
-                # 자소서에서 실제 텍스트 추출
-                original_text = self._get_cover_letter_full_text(original_cover_letter)
+            original_text = self._get_cover_letter_full_text(original_cover_letter)
+            near_duplicate_index = CoverLetterNearDuplicateIndex(db)
+
+            if await near_duplicate_index.is_complete():
+                candidates = await near_duplicate_index.find_candidates(
+                    original_cover_letter["_id"], original_text,
+                    min_estimate=PLAGIARISM_JACCARD_THRESHOLD - PLAGIARISM_MINHASH_MARGIN
+                )
+                candidate_docs = db.cover_letters.find({"_id": {"$in": [candidate_id for candidate_id, _ in candidates]}})
+                logger.debug("[INFO] LSH 후보 자소서 %s개 검증", len(candidates))
+            else:
+                # 인덱스가 아직 구축되지 않은 경우 백필은 백그라운드에 맡기고 이번 요청은 읽기 전용 전체 스캔
+                schedule_near_duplicate_backfill(db)
+                candidate_docs = db.cover_letters.find({"_id": {"$ne": ObjectId(cover_letter_id)}})
+                logger.debug("[INFO] 자소서 서명 인덱스 미완성 - 전체 스캔 (백그라운드 백필 예약)")
+
+            async for doc in candidate_docs:
                 doc_text = self._get_cover_letter_full_text(doc)
 
                 # 간단한 유사도 계산
                 similarity_score = self.calculate_simple_similarity(original_text, doc_text)
 
-                if similarity_score > 0.3:  # 30% 이상 유사한 경우만
+                if similarity_score > PLAGIARISM_JACCARD_THRESHOLD:  # 30% 이상 유사한 경우만
                     similar_cover_letters.append({
                         'document': doc,
-                        'similarity_score': similarity_score
+                        'similarity_score': similarity_score,
+                        'alignment': self.passage_aligner.align(original_text, doc_text)
                     })
 
-            print(f"[INFO] 유사한 자소서 {len(similar_cover_letters)}개 발견")
+            logger.debug("[INFO] 유사한 자소서 %s개 발견", len(similar_cover_letters))
 
-            # LLM을 통한 표절 위험도 분석
+            # 일치 구간 커버리지 기반 표절 위험도 분석 (경계 사례만 LLM 검토)
             plagiarism_analysis = await self.llm_service.analyze_plagiarism_suspicion(
                 original_cover_letter,
                 similar_cover_letters,
@@ -2044,13 +2216,15 @@ class SimilarityService:
                     "suspicion_score": plagiarism_analysis.get("suspicion_score", 0.0),
                     "analysis": plagiarism_analysis.get("analysis", "분석을 완료했습니다."),
                     "similar_count": plagiarism_analysis.get("similar_count", len(similarity_results)),
+                    "matched_passages": plagiarism_analysis.get("matched_passages", []),
+                    "llm_escalated": plagiarism_analysis.get("llm_escalated", True),
                     "analyzed_at": plagiarism_analysis.get("analyzed_at")
                 })
 
             return result
 
         except Exception as e:
-            print(f"[ERROR] 자소서 표절 체크 실패: {str(e)}")
+            logger.warning("[ERROR] 자소서 표절 체크 실패: %s", str(e))
             raise e
 
     def calculate_simple_similarity(self, text1: str, text2: str) -> float:
@@ -2091,21 +2265,4 @@ class SimilarityService:
         Returns:
             str: 추출된 전체 텍스트
         """
-        text_parts = []
-
-        # 다양한 텍스트 필드에서 내용 추출
-        if cover_letter.get('extracted_text'):
-            text_parts.append(cover_letter['extracted_text'])
-
-        if cover_letter.get('growthBackground'):
-            text_parts.append(cover_letter['growthBackground'])
-
-        if cover_letter.get('motivation'):
-            text_parts.append(cover_letter['motivation'])
-
-        if cover_letter.get('careerHistory'):
-            text_parts.append(cover_letter['careerHistory'])
-
-        # 모든 텍스트를 결합
-        combined_text = ' '.join(text_parts)
-        return combined_text.strip()
+        return cover_letter_full_text(cover_letter)
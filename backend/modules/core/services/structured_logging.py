@@ -0,0 +1,155 @@
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+# 요청 단위 상관관계 ID (미들웨어/에이전트 작업에서 설정)
+correlation_id_var: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+
+# LogRecord 기본 속성 (extra 필드 추출 시 제외)
+_RESERVED_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def new_correlation_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+
+def get_correlation_id() -> Optional[str]:
+    return correlation_id_var.get()
+
+
+def set_correlation_id(correlation_id: Optional[str] = None):
+    """상관관계 ID 설정 (없으면 새로 생성). 복원용 토큰 반환"""
+    return correlation_id_var.set(correlation_id or new_correlation_id())
+
+
+def reset_correlation_id(token) -> None:
+    correlation_id_var.reset(token)
+
+
+def _record_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    """extra 로 전달된 구조화 필드"""
+    return {key: value for key, value in vars(record).items()
+            if key not in _RESERVED_RECORD_ATTRS and key != "correlation_id"}
+
+
+class JsonLogFormatter(logging.Formatter):
+    """한 줄 JSON 레코드 포매터 (로그 수집기용)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        correlation_id = getattr(record, "correlation_id", None)
+        if correlation_id:
+            payload["correlation_id"] = correlation_id
+        payload.update(_record_fields(record))
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class ConsoleLogFormatter(logging.Formatter):
+    """사람이 읽기 위한 콘솔 포매터 (LOG_PRETTY=true 일 때만 사용)"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s | %(levelname)s | %(name)s | %(message)s", datefmt="%H:%M:%S")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        correlation_id = getattr(record, "correlation_id", None)
+        if correlation_id:
+            line = f"{line} [{correlation_id}]"
+        fields = _record_fields(record)
+        if fields:
+            line += "\n" + "\n".join(f"    └─ {key}: {value}" for key, value in fields.items())
+        return line
+
+
+class _CorrelationQueueHandler(logging.handlers.QueueHandler):
+    """호출 스레드에서는 메시지 인자 병합과 상관관계 ID 첨부만 하고,
+    JSON 직렬화와 출력은 리스너 스레드에서 수행합니다."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.correlation_id = correlation_id_var.get()
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # 트레이스백 객체가 리스너 스레드까지 프레임을 붙잡지 않도록 문자열로 고정
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(level: Optional[str] = None, pretty: Optional[bool] = None,
+                      extra_handlers: Optional[List[logging.Handler]] = None) -> logging.handlers.QueueListener:
+    """루트 로거를 큐 기반 비동기 핸들러로 설정 (프로세스당 1회, 재호출 시 기존 설정 유지)
+
+    Args:
+        level: 로그 레벨 (기본: LOG_LEVEL 환경변수, WARNING)
+        pretty: True 면 콘솔용 포맷, False 면 JSON 한 줄 (기본: LOG_PRETTY 환경변수, false)
+        extra_handlers: 리스너에서 함께 출력할 핸들러 (파일 등, 포매터 미지정 시 JSON)
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        return _queue_listener
+
+    level = (level or os.getenv("LOG_LEVEL", "WARNING")).upper()
+    if pretty is None:
+        pretty = os.getenv("LOG_PRETTY", "false").lower() == "true"
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(ConsoleLogFormatter() if pretty else JsonLogFormatter())
+    handlers = [stream_handler]
+    for handler in extra_handlers or []:
+        if handler.formatter is None:
+            handler.setFormatter(JsonLogFormatter())
+        handlers.append(handler)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_CorrelationQueueHandler(log_queue))
+    root.setLevel(level)
+
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    return _queue_listener
+
+
+def shutdown_logging() -> None:
+    """남은 레코드를 모두 출력하고 리스너 종료"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+def log_event(target: logging.Logger, level: int, message: str, *args: Any,
+              fields: Optional[Dict[str, Any]] = None,
+              lazy_fields: Optional[Callable[[], Dict[str, Any]]] = None) -> None:
+    """레벨이 꺼져 있으면 아무 것도 계산하지 않는 구조화 로그
+
+    fields 는 레코드 필드로 그대로 붙고, lazy_fields 는 레벨이 켜져 있을 때만 호출됩니다.
+    """
+    if not target.isEnabledFor(level):
+        return
+    extra = dict(fields or {})
+    if lazy_fields is not None:
+        extra.update(lazy_fields())
+    target.log(level, message, *args, extra={key: value for key, value in extra.items()
+                                              if key not in _RESERVED_RECORD_ATTRS})
@@ -1,16 +1,20 @@
 import os
 import asyncio
+import logging
 import time
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from bson import ObjectId
+from modules.token_monitor import AdmissionRejected
+
+logger = logging.getLogger(__name__)
 
 try:
     from pinecone import Pinecone, ServerlessSpec
     PINECONE_AVAILABLE = True
 except ImportError:
     PINECONE_AVAILABLE = False
-    print("Pinecone 라이브러리가 설치되지 않았습니다. pip install pinecone-client로 설치하세요.")
+    logger.warning("Pinecone 라이브러리가 설치되지 않았습니다. pip install pinecone-client로 설치하세요.")
 
 class VectorService:
     def __init__(self, api_key: str = None, index_name: str = None, environment: str = None):
@@ -37,9 +41,9 @@ class VectorService:
         try:
             self.pc = Pinecone(api_key=self.api_key)
             self._initialize_index()
-            print(f"Pinecone 벡터 서비스 초기화 완료 - 인덱스: {self.index_name}")
+            logger.debug("Pinecone 벡터 서비스 초기화 완료 - 인덱스: %s", self.index_name)
         except Exception as e:
-            print(f"Pinecone 초기화 실패: {e}")
+            logger.warning("Pinecone 초기화 실패: %s", e)
             raise
     
     def _initialize_index(self):
@@ -49,7 +53,7 @@ class VectorService:
             existing_indexes = [index.name for index in self.pc.list_indexes()]
             
             if self.index_name not in existing_indexes:
-                print(f"인덱스 '{self.index_name}'가 존재하지 않습니다. 새로 생성합니다...")
+                logger.debug("인덱스 '%s'가 존재하지 않습니다. 새로 생성합니다...", self.index_name)
                 # 인덱스 생성 (1536차원은 OpenAI text-embedding-3-small 모델 차원)
                 self.pc.create_index(
                     name=self.index_name,
@@ -60,15 +64,15 @@ class VectorService:
                         region=self.environment
                     )
                 )
-                print(f"인덱스 '{self.index_name}' 생성 완료")
+                logger.debug("인덱스 '%s' 생성 완료", self.index_name)
             else:
-                print(f"기존 인덱스 '{self.index_name}' 사용")
+                logger.debug("기존 인덱스 '%s' 사용", self.index_name)
             
             # 인덱스 연결
             self.index = self.pc.Index(self.index_name)
             
         except Exception as e:
-            print(f"Pinecone 인덱스 초기화 실패: {e}")
+            logger.warning("Pinecone 인덱스 초기화 실패: %s", e)
             raise
     
     async def save_chunk_vectors(self, chunks: List[Dict[str, Any]], embedding_service) -> List[str]:
@@ -82,8 +86,8 @@ class VectorService:
         Returns:
             List[str]: 저장된 벡터 ID 리스트
         """
-        print(f"[VectorService] === Pinecone 청크 벡터 저장 시작 ===")
-        print(f"[VectorService] 저장할 청크 수: {len(chunks)}")
+        logger.debug("[VectorService] === Pinecone 청크 벡터 저장 시작 ===")
+        logger.debug("[VectorService] 저장할 청크 수: %s", len(chunks))
         
         stored_vector_ids = []
         vectors_to_upsert = []
@@ -95,7 +99,7 @@ class VectorService:
                 embedding = await embedding_service.create_document_embedding(chunk["text"])
                 
                 if not embedding:
-                    print(f"[VectorService] 청크 '{chunk['chunk_id']}' 임베딩 생성 실패")
+                    logger.warning("[VectorService] 청크 '%s' 임베딩 생성 실패", chunk['chunk_id'])
                     continue
                 
                 # 문서 타입에 따라 적절한 ID 필드 선택
@@ -121,6 +125,7 @@ class VectorService:
                         "original_field": chunk["metadata"].get("original_field", ""),
                         "item_index": chunk["metadata"].get("item_index", 0),
                         "text_preview": chunk["text"][:100] + "..." if len(chunk["text"]) > 100 else chunk["text"],
+                        "content_hash": chunk.get("content_hash", ""),
                         "created_at": datetime.now().isoformat()
                     }
                 }
@@ -128,26 +133,68 @@ class VectorService:
                 vectors_to_upsert.append(vector_data)
                 stored_vector_ids.append(chunk["chunk_id"])
                 
-                print(f"[VectorService] 청크 준비: {chunk['chunk_id']} ({chunk['chunk_type']}) - {len(chunk['text'])} 문자")
+                logger.debug("[VectorService] 청크 준비: %s (%s) - %s 문자",
+                             chunk['chunk_id'], chunk['chunk_type'], len(chunk['text']))
                 
+            except AdmissionRejected as e:
+                # 한도 보류: 백업 모델로 대체하지 않고 남은 청크는 저장하지 않음
+                # (MongoService.sync_document_chunks 가 미저장 청크를 대기 상태로 표시해 다음 동기화에서 재시도)
+                logger.warning("[VectorService] 임베딩 한도 보류로 남은 청크 저장 중단: %s", e)
+                break
             except Exception as e:
-                print(f"[VectorService] 청크 '{chunk['chunk_id']}' 처리 중 오류: {e}")
+                logger.warning("[VectorService] 청크 '%s' 처리 중 오류: %s", chunk['chunk_id'], e)
                 continue
         
         # Pinecone에 배치 업로드
         if vectors_to_upsert:
             try:
                 self.index.upsert(vectors=vectors_to_upsert)
-                print(f"[VectorService] Pinecone 업로드 성공: {len(vectors_to_upsert)}개 벡터")
+                logger.debug("[VectorService] Pinecone 업로드 성공: %s개 벡터", len(vectors_to_upsert))
             except Exception as e:
-                print(f"[VectorService] Pinecone 업로드 실패: {e}")
+                logger.warning("[VectorService] Pinecone 업로드 실패: %s", e)
                 stored_vector_ids = []  # 실패시 빈 리스트 반환
         
-        print(f"[VectorService] 총 {len(stored_vector_ids)}개 청크 벡터 저장 완료")
-        print(f"[VectorService] === Pinecone 청크 벡터 저장 완료 ===")
+        logger.debug("[VectorService] 총 %s개 청크 벡터 저장 완료", len(stored_vector_ids))
+        logger.debug("[VectorService] === Pinecone 청크 벡터 저장 완료 ===")
         
         return stored_vector_ids
 
+    async def apply_chunk_diff(self, diff: Dict[str, Any], embedding_service) -> Dict[str, Any]:
+        """
+        청크 비교 결과(ChunkingService.diff_chunks)에서 변경분만 Pinecone에 반영합니다.
+        추가/변경된 청크만 임베딩하여 upsert 하고, 사라진 청크는 ID로 삭제합니다.
+        
+        Args:
+            diff (Dict[str, Any]): added / changed / unchanged / removed 청크 비교 결과
+            embedding_service: 임베딩 서비스
+            
+        Returns:
+            Dict[str, Any]: upsert/삭제/유지된 벡터 ID 정보
+        """
+        chunks_to_embed = diff.get("added", []) + diff.get("changed", [])
+        removed_ids = diff.get("removed", [])
+        
+        upserted_ids = []
+        if chunks_to_embed:
+            upserted_ids = await self.save_chunk_vectors(chunks_to_embed, embedding_service)
+        
+        deleted_ids = []
+        if removed_ids:
+            try:
+                self.index.delete(ids=removed_ids)
+                deleted_ids = removed_ids
+                logger.debug("[VectorService] Pinecone에서 %s개 청크 벡터 삭제 완료", len(removed_ids))
+            except Exception as e:
+                logger.warning("[VectorService] Pinecone 청크 벡터 삭제 실패: %s", e)
+        
+        logger.debug("[VectorService] 증분 반영 완료 - upsert %s개, 삭제 %s개, 유지 %s개",
+                     len(upserted_ids), len(deleted_ids), len(diff.get('unchanged', [])))
+        return {
+            "upserted_ids": upserted_ids,
+            "deleted_ids": deleted_ids,
+            "unchanged_count": len(diff.get("unchanged", []))
+        }
+
     async def save_vector(self, embedding: List[float], metadata: Dict[str, Any]) -> Optional[str]:
         """
         단일 벡터를 Pinecone에 저장합니다.
@@ -170,11 +217,11 @@ class VectorService:
             
             self.index.upsert(vectors=[vector_data])
             
-            print(f"[VectorService] Pinecone 벡터 저장 완료: {vector_id}")
+            logger.debug("[VectorService] Pinecone 벡터 저장 완료: %s", vector_id)
             return vector_id
             
         except Exception as e:
-            print(f"[VectorService] Pinecone 벡터 저장 실패: {e}")
+            logger.warning("[VectorService] Pinecone 벡터 저장 실패: %s", e)
             return None
 
     async def search_similar_vectors(self, query_embedding: List[float], 
@@ -192,9 +239,9 @@ class VectorService:
             Dict[str, Any]: 검색 결과
         """
         try:
-            print(f"[VectorService] Pinecone 검색 시작...")
-            print(f"[VectorService] 검색 제한: {top_k}")
-            print(f"[VectorService] 필터 타입: {filter_type}")
+            logger.debug("[VectorService] Pinecone 검색 시작...")
+            logger.debug("[VectorService] 검색 제한: %s", top_k)
+            logger.debug("[VectorService] 필터 타입: %s", filter_type)
             
             # 필터 구성
             filter_dict = {}
@@ -202,7 +249,8 @@ class VectorService:
                 filter_dict["chunk_type"] = {"$eq": filter_type}
             
             # Pinecone 검색
-            search_results = self.index.query(
+            search_results = await asyncio.to_thread(
+                self.index.query,
                 vector=query_embedding,
                 top_k=top_k,
                 include_metadata=True,
@@ -218,13 +266,13 @@ class VectorService:
                     "metadata": match.get("metadata", {})
                 })
             
-            print(f"[VectorService] Pinecone 검색 완료!")
-            print(f"[VectorService] 검색 결과 수: {len(matches)}")
+            logger.debug("[VectorService] Pinecone 검색 완료!")
+            logger.debug("[VectorService] 검색 결과 수: %s", len(matches))
             
             return {"matches": matches}
             
         except Exception as e:
-            print(f"[VectorService] Pinecone 검색 실패: {e}")
+            logger.warning("[VectorService] Pinecone 검색 실패: %s", e)
             return {"matches": []}
 
     async def delete_vectors_by_resume_id(self, resume_id: str) -> bool:
@@ -238,7 +286,7 @@ class VectorService:
             bool: 삭제 성공 여부
         """
         try:
-            print(f"[VectorService] 이력서 '{resume_id}' 벡터 삭제 시작...")
+            logger.debug("[VectorService] 이력서 '%s' 벡터 삭제 시작...", resume_id)
             
             # Pinecone에서 해당 이력서의 벡터들을 필터로 삭제
             # 먼저 해당 벡터들을 검색해서 ID를 찾은 후 삭제
@@ -258,14 +306,14 @@ class VectorService:
             if vector_ids_to_delete:
                 # 벡터 삭제
                 self.index.delete(ids=vector_ids_to_delete)
-                print(f"[VectorService] Pinecone에서 {len(vector_ids_to_delete)}개 벡터 삭제 완료")
+                logger.debug("[VectorService] Pinecone에서 %s개 벡터 삭제 완료", len(vector_ids_to_delete))
             else:
-                print(f"[VectorService] 삭제할 벡터가 없습니다.")
+                logger.debug("[VectorService] 삭제할 벡터가 없습니다.")
             
             return True
             
         except Exception as e:
-            print(f"[VectorService] Pinecone 벡터 삭제 실패: {e}")
+            logger.warning("[VectorService] Pinecone 벡터 삭제 실패: %s", e)
             return False
 
     def get_index_info(self) -> Dict[str, Any]:
@@ -288,7 +336,7 @@ class VectorService:
                 "spec": str(index_info.spec)
             }
         except Exception as e:
-            print(f"인덱스 정보 조회 실패: {e}")
+            logger.warning("인덱스 정보 조회 실패: %s", e)
             return {"error": str(e)}
 
     def get_stats(self) -> Dict[str, Any]:
@@ -311,7 +359,7 @@ class VectorService:
                 "environment": self.environment
             }
         except Exception as e:
-            print(f"[VectorService] Pinecone 통계 조회 실패: {e}")
+            logger.warning("[VectorService] Pinecone 통계 조회 실패: %s", e)
             return {
                 "total_vectors": 0,
                 "index_name": self.index_name,
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 
 import motor.motor_asyncio
 from fastapi import HTTPException
+from modules.core.services.near_duplicate_index import CoverLetterNearDuplicateIndex
 from modules.shared.services import BaseService
 
 from .models import CoverLetter, CoverLetterCreate, CoverLetterStatus, CoverLetterUpdate
@@ -16,6 +17,7 @@ class CoverLetterService(BaseService):
     def __init__(self, db: motor.motor_asyncio.AsyncIOMotorDatabase):
         super().__init__(db)
         self.collection = "cover_letters"
+        self.near_duplicate_index = CoverLetterNearDuplicateIndex(db)
 
     async def create_cover_letter(self, cover_letter_data: CoverLetterCreate) -> str:
         """자기소개서 생성"""
@@ -23,12 +25,22 @@ class CoverLetterService(BaseService):
             cover_letter = CoverLetter(**cover_letter_data.dict())
             result = await self.db[self.collection].insert_one(cover_letter.dict(by_alias=True))
             cover_letter_id = str(result.inserted_id)
+            await self._sync_near_duplicate_index(result.inserted_id)
             logger.info(f"자기소개서 생성 완료: {cover_letter_id}")
             return cover_letter_id
         except Exception as e:
             logger.error(f"자기소개서 생성 실패: {str(e)}")
             raise HTTPException(status_code=500, detail="자기소개서 생성에 실패했습니다.")
 
+    async def _sync_near_duplicate_index(self, cover_letter_object_id) -> None:
+        """표절 체크용 MinHash 서명 갱신 (실패해도 본 작업은 유지)"""
+        try:
+            cover_letter_data = await self.db[self.collection].find_one({"_id": cover_letter_object_id})
+            if cover_letter_data:
+                await self.near_duplicate_index.index_cover_letter(cover_letter_data)
+        except Exception as e:
+            logger.warning(f"자기소개서 서명 인덱스 갱신 실패: {str(e)}")
+
     async def get_cover_letter(self, cover_letter_id: str) -> Optional[CoverLetter]:
         """자기소개서 조회"""
         try:
@@ -83,6 +95,8 @@ class CoverLetterService(BaseService):
                 {"_id": ObjectId(cover_letter_id)},
                 {"$set": update_dict}
             )
+            if result.modified_count > 0:
+                await self._sync_near_duplicate_index(ObjectId(cover_letter_id))
             return result.modified_count > 0
         except Exception as e:
             logger.error(f"자기소개서 수정 실패: {str(e)}")
@@ -93,6 +107,8 @@ class CoverLetterService(BaseService):
         try:
             from bson import ObjectId
             result = await self.db[self.collection].delete_one({"_id": ObjectId(cover_letter_id)})
+            if result.deleted_count > 0:
+                await self.near_duplicate_index.remove_cover_letter(ObjectId(cover_letter_id))
             return result.deleted_count > 0
         except Exception as e:
             logger.error(f"자기소개서 삭제 실패: {str(e)}")
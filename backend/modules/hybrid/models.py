@@ -59,6 +59,7 @@ class HybridAnalysis(BaseModel):
     analysis_date: datetime = Field(default_factory=datetime.utcnow, description="분석 일시")
     model_used: Optional[str] = Field(None, description="사용된 AI 모델")
     confidence: float = Field(default=0.0, description="신뢰도 (0-1)")
+    source_versions: Dict[str, str] = Field(default={}, description="분석에 사용된 원본 문서별 분석 결과 버전")
     
     class Config:
         populate_by_name = True
@@ -107,6 +108,12 @@ class HybridSearchRequest(BaseModel):
 class HybridComparisonRequest(BaseModel):
     hybrid_ids: List[str] = Field(..., description="비교할 하이브리드 분석 ID 목록")
     comparison_type: str = Field(default="overall", description="비교 유형 (overall/consistency/completeness)")
+    compute_missing: bool = Field(default=False, description="분석이 없거나 원본이 바뀐 문서를 계산/저장한 뒤 비교")
+
+# 하이브리드 일괄 분석 요청 모델
+class HybridBatchAnalysisRequest(BaseModel):
+    hybrid_ids: List[str] = Field(..., description="분석할 하이브리드 분석 ID 목록")
+    force: bool = Field(default=False, description="원본이 바뀌지 않았어도 다시 분석")
 
 # 하이브리드 통계 모델
 class HybridStatistics(BaseModel):
@@ -3,7 +3,8 @@ from typing import Optional, List
 import motor.motor_asyncio
 from .models import (
     HybridCreate, HybridDocument, HybridUpdate, HybridAnalysis,
-    HybridSearchRequest, HybridComparisonRequest, HybridStatistics
+    HybridSearchRequest, HybridComparisonRequest, HybridStatistics,
+    HybridBatchAnalysisRequest
 )
 from .services import HybridService
 from ..shared.models import BaseResponse, PaginationParams
@@ -212,14 +213,66 @@ async def get_hybrid_statistics(
             error=str(e)
         )
 
+@router.post("/statistics/reconcile", response_model=BaseResponse)
+async def reconcile_hybrid_statistics(
+    hybrid_service: HybridService = Depends(get_hybrid_service)
+):
+    """하이브리드 분석 통계 롤업 재집계"""
+    try:
+        await hybrid_service.reconcile_statistics()
+        statistics = await hybrid_service.get_hybrid_statistics()
+        
+        return BaseResponse(
+            success=True,
+            message="하이브리드 분석 통계 재집계가 완료되었습니다",
+            data=statistics.dict()
+        )
+        
+    except Exception as e:
+        return BaseResponse(
+            success=False,
+            message="하이브리드 분석 통계 재집계 중 오류가 발생했습니다",
+            error=str(e)
+        )
+
+@router.post("/batch-analyze", response_model=BaseResponse)
+async def perform_batch_analysis(
+    batch_request: HybridBatchAnalysisRequest,
+    hybrid_service: HybridService = Depends(get_hybrid_service)
+):
+    """여러 하이브리드 문서 일괄 종합 분석"""
+    try:
+        result = await hybrid_service.perform_batch_analysis(
+            batch_request.hybrid_ids, force=batch_request.force
+        )
+        
+        return BaseResponse(
+            success=True,
+            message="일괄 종합 분석이 완료되었습니다",
+            data={
+                "analysis_results": {
+                    hybrid_id: analysis.dict() for hybrid_id, analysis in result["analyses"].items()
+                },
+                "missing_ids": result["missing_ids"]
+            }
+        )
+        
+    except Exception as e:
+        return BaseResponse(
+            success=False,
+            message="일괄 종합 분석 중 오류가 발생했습니다",
+            error=str(e)
+        )
+
 @router.post("/{hybrid_id}/analyze", response_model=BaseResponse)
 async def perform_comprehensive_analysis(
     hybrid_id: str,
+    force: bool = False,
     hybrid_service: HybridService = Depends(get_hybrid_service)
 ):
-    """종합 분석 수행"""
+    """종합 분석 수행 (force=true 면 원본 분석 결과가 그대로여도 다시 계산)"""
     try:
-        analysis = await hybrid_service.perform_comprehensive_analysis(hybrid_id)
+        analysis = await hybrid_service.perform_comprehensive_analysis(hybrid_id, force=force)
         
         return BaseResponse(
             success=True,
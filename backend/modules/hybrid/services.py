@@ -2,7 +2,12 @@ from typing import Optional, List, Dict, Any
 from fastapi import HTTPException
 import motor.motor_asyncio
 from datetime import datetime
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import time
 from ..shared.services import BaseService
 from .models import (
     HybridDocument, HybridCreate, HybridUpdate, HybridAnalysis,
@@ -13,8 +18,28 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# 원본 문서 타입별 컬렉션 (HybridDocument 의 <타입>_id 필드와 대응)
+SOURCE_COLLECTIONS = {
+    "resume": "resumes",
+    "cover_letter": "cover_letters",
+    "portfolio": "portfolios"
+}
+
+# 통계 롤업 문서 컬렉션 (_id 는 집계 대상 컬렉션명)
+STATISTICS_COLLECTION = "hybrid_statistics"
+
+# 점수 분포 구간 ($bucket boundaries 와 동일, 범위 밖/누락 점수는 "100+")
+SCORE_BUCKET_BOUNDARIES = [0, 20, 40, 60, 80, 100]
+SCORE_BUCKET_DEFAULT = "100+"
+
+# 롤업 재검증 주기 (초), 증분 갱신 중 생긴 오차를 전체 집계로 보정
+STATISTICS_RECONCILE_SECONDS = int(os.getenv("HYBRID_STATS_RECONCILE_SECONDS", "3600"))
+
 class HybridService(BaseService):
     """하이브리드 통합 분석 서비스"""
+
+    _indexes_ensured = False
+    _reconcile_task: Optional[asyncio.Task] = None
     
     def __init__(self, db: motor.motor_asyncio.AsyncIOMotorDatabase):
         super().__init__(db)
@@ -31,6 +56,7 @@ class HybridService(BaseService):
             hybrid_dict["document_type"] = "hybrid"
             
             hybrid_id = await self.create(self.collection, hybrid_dict)
+            await self._apply_statistics_delta(self._statistics_delta(hybrid_dict))
             logger.info(f"하이브리드 분석 생성 완료: {hybrid_id}")
             return hybrid_id
         except Exception as e:
@@ -101,135 +127,192 @@ class HybridService(BaseService):
     async def delete_hybrid_analysis(self, hybrid_id: str) -> bool:
         """하이브리드 분석 삭제"""
         try:
-            success = await self.delete(self.collection, hybrid_id)
+            document = await self.db[self.collection].find_one_and_delete({"_id": hybrid_id})
+            success = document is not None
             if success:
+                await self._apply_statistics_delta(self._statistics_delta(
+                    document,
+                    scores=[result.get("overall_score") for result in document.get("analysis_results") or []],
+                    sign=-1
+                ))
                 logger.info(f"하이브리드 분석 삭제 완료: {hybrid_id}")
             return success
         except Exception as e:
             logger.error(f"하이브리드 분석 삭제 실패: {e}")
             raise HTTPException(status_code=500, detail="하이브리드 분석 삭제 중 오류가 발생했습니다")
     
-    async def perform_comprehensive_analysis(self, hybrid_id: str) -> HybridAnalysis:
-        """종합 분석 수행"""
+    async def perform_comprehensive_analysis(self, hybrid_id: str, force: bool = False) -> HybridAnalysis:
+        """종합 분석 수행 (원본 분석 결과가 그대로면 저장된 결과 재사용)"""
         try:
             hybrid_doc = await self.get_hybrid_analysis(hybrid_id)
             if not hybrid_doc:
                 raise HTTPException(status_code=404, detail="하이브리드 분석을 찾을 수 없습니다")
-            
-            # 각 문서별 분석 결과 수집
-            resume_analysis = None
-            cover_letter_analysis = None
-            portfolio_analysis = None
-            
-            if hybrid_doc.resume_id:
-                resume_analysis = await self._get_resume_analysis(hybrid_doc.resume_id)
-            
-            if hybrid_doc.cover_letter_id:
-                cover_letter_analysis = await self._get_cover_letter_analysis(hybrid_doc.cover_letter_id)
-            
-            if hybrid_doc.portfolio_id:
-                portfolio_analysis = await self._get_portfolio_analysis(hybrid_doc.portfolio_id)
-            
-            # 교차 참조 분석
-            cross_references = await self._perform_cross_reference_analysis(
-                resume_analysis, cover_letter_analysis, portfolio_analysis
-            )
-            
-            # 종합 점수 계산
-            overall_score = self._calculate_overall_score(
-                resume_analysis, cover_letter_analysis, portfolio_analysis
-            )
-            
-            # 일관성 점수 계산
-            consistency_score = self._calculate_consistency_score(cross_references)
-            
-            # 완성도 점수 계산
-            completeness_score = self._calculate_completeness_score(
-                resume_analysis, cover_letter_analysis, portfolio_analysis
-            )
-            
-            # 논리성 점수 계산
-            coherence_score = self._calculate_coherence_score(
-                resume_analysis, cover_letter_analysis, portfolio_analysis
-            )
-            
-            # 분석 결과 생성
-            analysis = HybridAnalysis(
-                applicant_id=hybrid_doc.applicant_id,
-                analysis_type=HybridAnalysisType.COMPREHENSIVE,
-                integrated_document_type=hybrid_doc.integrated_document_type,
-                resume_id=hybrid_doc.resume_id,
-                cover_letter_id=hybrid_doc.cover_letter_id,
-                portfolio_id=hybrid_doc.portfolio_id,
-                overall_score=overall_score,
-                consistency_score=consistency_score,
-                completeness_score=completeness_score,
-                coherence_score=coherence_score,
-                summary=self._generate_comprehensive_summary(
-                    resume_analysis, cover_letter_analysis, portfolio_analysis
-                ),
-                strengths=self._extract_strengths(
-                    resume_analysis, cover_letter_analysis, portfolio_analysis
-                ),
-                weaknesses=self._extract_weaknesses(
-                    resume_analysis, cover_letter_analysis, portfolio_analysis
-                ),
-                recommendations=self._generate_recommendations(
-                    resume_analysis, cover_letter_analysis, portfolio_analysis
-                ),
-                resume_analysis=resume_analysis,
-                cover_letter_analysis=cover_letter_analysis,
-                portfolio_analysis=portfolio_analysis,
-                cross_references=cross_references,
-                contradictions=self._find_contradictions(cross_references),
-                reinforcements=self._find_reinforcements(cross_references),
-                model_used="hybrid-comprehensive-v1",
-                confidence=0.85
-            )
-            
-            # 분석 결과 저장
-            analysis_id = await self.save_analysis_result(hybrid_id, analysis)
-            logger.info(f"종합 분석 완료: {analysis_id}")
-            
-            return analysis
-            
+
+            analyses = await self._analyze_hybrid_documents([hybrid_doc], force=force)
+            return analyses[hybrid_doc.id]
+
         except Exception as e:
             logger.error(f"종합 분석 실패: {e}")
             raise HTTPException(status_code=500, detail="종합 분석 중 오류가 발생했습니다")
-    
-    async def _get_resume_analysis(self, resume_id: str) -> Optional[Dict[str, Any]]:
-        """이력서 분석 결과 조회"""
-        try:
-            resume_data = await self.db["resumes"].find_one({"_id": resume_id})
-            if resume_data and "analysis_results" in resume_data:
-                return resume_data["analysis_results"][-1] if resume_data["analysis_results"] else None
-            return None
-        except Exception as e:
-            logger.error(f"이력서 분석 결과 조회 실패: {e}")
-            return None
-    
-    async def _get_cover_letter_analysis(self, cover_letter_id: str) -> Optional[Dict[str, Any]]:
-        """자기소개서 분석 결과 조회"""
-        try:
-            cover_letter_data = await self.db["cover_letters"].find_one({"_id": cover_letter_id})
-            if cover_letter_data and "analysis_results" in cover_letter_data:
-                return cover_letter_data["analysis_results"][-1] if cover_letter_data["analysis_results"] else None
-            return None
-        except Exception as e:
-            logger.error(f"자기소개서 분석 결과 조회 실패: {e}")
-            return None
-    
-    async def _get_portfolio_analysis(self, portfolio_id: str) -> Optional[Dict[str, Any]]:
-        """포트폴리오 분석 결과 조회"""
+
+    async def perform_batch_analysis(self, hybrid_ids: List[str], force: bool = False) -> Dict[str, Any]:
+        """여러 하이브리드 문서를 한 번에 종합 분석
+
+        하이브리드 문서 조회 1회, 원본 문서 타입별 조회 1회(동시 실행)로 처리합니다.
+        """
         try:
-            portfolio_data = await self.db["portfolios"].find_one({"_id": portfolio_id})
-            if portfolio_data and "analysis_results" in portfolio_data:
-                return portfolio_data["analysis_results"][-1] if portfolio_data["analysis_results"] else None
-            return None
+            hybrid_docs = await self._get_hybrid_documents(hybrid_ids)
+            analyses = await self._analyze_hybrid_documents(hybrid_docs, force=force)
+            return {
+                "analyses": analyses,
+                "missing_ids": [hybrid_id for hybrid_id in hybrid_ids if hybrid_id not in analyses]
+            }
         except Exception as e:
-            logger.error(f"포트폴리오 분석 결과 조회 실패: {e}")
-            return None
-    
+            logger.error(f"일괄 종합 분석 실패: {e}")
+            raise HTTPException(status_code=500, detail="일괄 종합 분석 중 오류가 발생했습니다")
+
+    async def _get_hybrid_documents(self, hybrid_ids: List[str]) -> List[HybridDocument]:
+        """하이브리드 문서 일괄 조회 (요청 순서 유지)"""
+        unique_ids = list(dict.fromkeys(hybrid_ids))
+        cursor = self.db[self.collection].find({"_id": {"$in": unique_ids}})
+        documents = {document["_id"]: document for document in await cursor.to_list(length=len(unique_ids))}
+        return [HybridDocument(**documents[hybrid_id]) for hybrid_id in unique_ids if hybrid_id in documents]
+
+    async def _analyze_hybrid_documents(self, hybrid_docs: List[HybridDocument], force: bool = False,
+                                        compute_missing: bool = True) -> Dict[str, HybridAnalysis]:
+        """원본 분석 결과를 일괄 조회하고, 버전이 바뀐 문서만 다시 계산/저장
+
+        compute_missing 이 False 이면 저장된 최신 분석만 반환하고 계산/저장하지 않음 (읽기 전용)
+        """
+        latest_analyses = await self._get_latest_source_analyses(hybrid_docs)
+
+        results: Dict[str, HybridAnalysis] = {}
+        pending: List[tuple] = []
+        for hybrid_doc in hybrid_docs:
+            sources = {
+                document_type: latest_analyses.get((document_type, getattr(hybrid_doc, f"{document_type}_id")))
+                for document_type in SOURCE_COLLECTIONS
+            }
+            source_versions = {
+                document_type: self._analysis_version(getattr(hybrid_doc, f"{document_type}_id"), analysis)
+                for document_type, analysis in sources.items()
+                if getattr(hybrid_doc, f"{document_type}_id")
+            }
+
+            cached = hybrid_doc.analysis_results[-1] if hybrid_doc.analysis_results else None
+            if (not force and cached is not None
+                    and cached.analysis_type == HybridAnalysisType.COMPREHENSIVE
+                    and cached.source_versions == source_versions):
+                results[hybrid_doc.id] = cached
+                continue
+            if not compute_missing:
+                continue
+
+            analysis = await self._build_comprehensive_analysis(hybrid_doc, sources, source_versions)
+            results[hybrid_doc.id] = analysis
+            pending.append((hybrid_doc.id, analysis))
+
+        if pending:
+            analysis_ids = await asyncio.gather(*(
+                self.save_analysis_result(hybrid_id, analysis) for hybrid_id, analysis in pending
+            ))
+            logger.info(f"종합 분석 완료: {len(analysis_ids)}건 계산, {len(results) - len(pending)}건 재사용")
+
+        return results
+
+    async def _get_latest_source_analyses(self, hybrid_docs: List[HybridDocument]) -> Dict[tuple, Optional[Dict[str, Any]]]:
+        """원본 문서(이력서/자기소개서/포트폴리오)의 최신 분석 결과를 타입별 $in 조회로 동시에 가져옴
+
+        Returns:
+            {(문서 타입, 문서 ID): 최신 분석 결과 또는 None}
+        """
+        async def fetch(document_type: str, document_ids: List[str]) -> Dict[tuple, Optional[Dict[str, Any]]]:
+            try:
+                cursor = self.db[SOURCE_COLLECTIONS[document_type]].find(
+                    {"_id": {"$in": document_ids}},
+                    {"_id": 1, "analysis_results": {"$slice": -1}}
+                )
+                return {
+                    (document_type, document["_id"]): (document.get("analysis_results") or [None])[-1]
+                    for document in await cursor.to_list(length=len(document_ids))
+                }
+            except Exception as e:
+                logger.error(f"{document_type} 분석 결과 조회 실패: {e}")
+                return {}
+
+        ids_by_type = {
+            document_type: list({getattr(doc, f"{document_type}_id") for doc in hybrid_docs
+                                 if getattr(doc, f"{document_type}_id")})
+            for document_type in SOURCE_COLLECTIONS
+        }
+        fetched = await asyncio.gather(*(
+            fetch(document_type, document_ids) for document_type, document_ids in ids_by_type.items() if document_ids
+        ))
+
+        latest: Dict[tuple, Optional[Dict[str, Any]]] = {}
+        for result in fetched:
+            latest.update(result)
+        return latest
+
+    @staticmethod
+    def _analysis_version(document_id: str, analysis: Optional[Dict[str, Any]]) -> str:
+        """원본 분석 결과 내용 기반 버전 (내용이 같으면 같은 값)"""
+        payload = json.dumps([document_id, analysis], sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    async def _build_comprehensive_analysis(self, hybrid_doc: HybridDocument,
+                                            sources: Dict[str, Optional[Dict[str, Any]]],
+                                            source_versions: Dict[str, str]) -> HybridAnalysis:
+        """수집한 원본 분석 결과로 종합 분석 결과 생성"""
+        resume_analysis = sources["resume"]
+        cover_letter_analysis = sources["cover_letter"]
+        portfolio_analysis = sources["portfolio"]
+
+        # 교차 참조 분석
+        cross_references = await self._perform_cross_reference_analysis(
+            resume_analysis, cover_letter_analysis, portfolio_analysis
+        )
+
+        return HybridAnalysis(
+            applicant_id=hybrid_doc.applicant_id,
+            analysis_type=HybridAnalysisType.COMPREHENSIVE,
+            integrated_document_type=hybrid_doc.integrated_document_type,
+            resume_id=hybrid_doc.resume_id,
+            cover_letter_id=hybrid_doc.cover_letter_id,
+            portfolio_id=hybrid_doc.portfolio_id,
+            overall_score=self._calculate_overall_score(
+                resume_analysis, cover_letter_analysis, portfolio_analysis
+            ),
+            consistency_score=self._calculate_consistency_score(cross_references),
+            completeness_score=self._calculate_completeness_score(
+                resume_analysis, cover_letter_analysis, portfolio_analysis
+            ),
+            coherence_score=self._calculate_coherence_score(
+                resume_analysis, cover_letter_analysis, portfolio_analysis
+            ),
+            summary=self._generate_comprehensive_summary(
+                resume_analysis, cover_letter_analysis, portfolio_analysis
+            ),
+            strengths=self._extract_strengths(
+                resume_analysis, cover_letter_analysis, portfolio_analysis
+            ),
+            weaknesses=self._extract_weaknesses(
+                resume_analysis, cover_letter_analysis, portfolio_analysis
+            ),
+            recommendations=self._generate_recommendations(
+                resume_analysis, cover_letter_analysis, portfolio_analysis
+            ),
+            resume_analysis=resume_analysis,
+            cover_letter_analysis=cover_letter_analysis,
+            portfolio_analysis=portfolio_analysis,
+            cross_references=cross_references,
+            contradictions=self._find_contradictions(cross_references),
+            reinforcements=self._find_reinforcements(cross_references),
+            model_used="hybrid-comprehensive-v1",
+            confidence=0.85,
+            source_versions=source_versions
+        )
+
     async def _perform_cross_reference_analysis(self, resume_analysis: Optional[Dict], 
                                               cover_letter_analysis: Optional[Dict], 
                                               portfolio_analysis: Optional[Dict]) -> Dict[str, Any]:
@@ -439,10 +522,16 @@ class HybridService(BaseService):
             analysis_id = await self.create("hybrid_analyses", analysis_dict)
             
             # 하이브리드 문서에 분석 결과 추가
-            await self.db[self.collection].update_one(
+            result = await self.db[self.collection].update_one(
                 {"_id": hybrid_id},
                 {"$push": {"analysis_results": analysis_dict}}
             )
+
+            # 통계 롤업 증분 갱신 (분석 문서 1건 + 하이브리드 문서에 추가된 점수)
+            await self._apply_statistics_delta(self._statistics_delta(
+                analysis_dict,
+                scores=[analysis.overall_score] if result.matched_count else []
+            ))
             
             logger.info(f"하이브리드 분석 결과 저장 완료: {analysis_id}")
             return analysis_id
@@ -453,6 +542,7 @@ class HybridService(BaseService):
     async def search_hybrid_analyses(self, search_request: HybridSearchRequest) -> List[HybridDocument]:
         """하이브리드 분석 검색"""
         try:
+            await self.ensure_indexes()
             query = {"$text": {"$search": search_request.query}}
             
             filters = {}
@@ -475,131 +565,183 @@ class HybridService(BaseService):
             raise HTTPException(status_code=500, detail="하이브리드 분석 검색 중 오류가 발생했습니다")
     
     async def compare_hybrid_analyses(self, comparison_request: HybridComparisonRequest) -> Dict[str, Any]:
-        """하이브리드 분석 비교"""
+        """하이브리드 분석 비교 (저장된 최신 분석 비교, compute_missing 이면 없는 분석을 일괄 계산 후 비교)"""
         try:
-            hybrid_analyses = []
-            for hybrid_id in comparison_request.hybrid_ids:
-                hybrid = await self.get_hybrid_analysis(hybrid_id)
-                if hybrid:
-                    hybrid_analyses.append(hybrid)
-            
-            if len(hybrid_analyses) < 2:
+            hybrid_docs = await self._get_hybrid_documents(comparison_request.hybrid_ids)
+            if len(hybrid_docs) < 2:
                 raise HTTPException(status_code=400, detail="비교할 분석이 2개 이상 필요합니다")
-            
+
+            analyses = await self._analyze_hybrid_documents(
+                hybrid_docs, compute_missing=comparison_request.compute_missing
+            )
+
             comparison_result = {
                 "hybrid_ids": comparison_request.hybrid_ids,
                 "comparison_type": comparison_request.comparison_type,
-                "comparison_data": {}
+                "comparison_data": {},
+                # 분석이 없거나 원본이 바뀌어 비교에서 제외된 ID (compute_missing=true 로 계산 가능)
+                "missing": [hybrid_doc.id for hybrid_doc in hybrid_docs if hybrid_doc.id not in analyses]
             }
-            
+
             # 비교 유형에 따른 분석
-            if comparison_request.comparison_type == "overall":
-                comparison_result["comparison_data"] = self._compare_overall_scores(hybrid_analyses)
-            elif comparison_request.comparison_type == "consistency":
-                comparison_result["comparison_data"] = self._compare_consistency_scores(hybrid_analyses)
-            elif comparison_request.comparison_type == "completeness":
-                comparison_result["comparison_data"] = self._compare_completeness_scores(hybrid_analyses)
-            
+            score_fields = {
+                "overall": "overall_score",
+                "consistency": "consistency_score",
+                "completeness": "completeness_score"
+            }
+            if comparison_request.comparison_type in score_fields:
+                comparison_result["comparison_data"] = self._compare_scores(
+                    analyses, score_fields[comparison_request.comparison_type]
+                )
+
             return comparison_result
         except Exception as e:
             logger.error(f"하이브리드 분석 비교 실패: {e}")
             raise HTTPException(status_code=500, detail="하이브리드 분석 비교 중 오류가 발생했습니다")
-    
-    def _compare_overall_scores(self, hybrid_analyses: List[HybridDocument]) -> Dict[str, Any]:
-        """종합 점수 비교"""
-        scores = {}
-        for hybrid in hybrid_analyses:
-            if hybrid.analysis_results:
-                latest_analysis = hybrid.analysis_results[-1]
-                scores[hybrid.id] = latest_analysis.get("overall_score", 0)
-        
-        return {
-            "scores": scores,
-            "average": sum(scores.values()) / len(scores) if scores else 0,
-            "highest": max(scores.values()) if scores else 0,
-            "lowest": min(scores.values()) if scores else 0
-        }
-    
-    def _compare_consistency_scores(self, hybrid_analyses: List[HybridDocument]) -> Dict[str, Any]:
-        """일관성 점수 비교"""
-        scores = {}
-        for hybrid in hybrid_analyses:
-            if hybrid.analysis_results:
-                latest_analysis = hybrid.analysis_results[-1]
-                scores[hybrid.id] = latest_analysis.get("consistency_score", 0)
-        
-        return {
-            "scores": scores,
-            "average": sum(scores.values()) / len(scores) if scores else 0,
-            "highest": max(scores.values()) if scores else 0,
-            "lowest": min(scores.values()) if scores else 0
-        }
-    
-    def _compare_completeness_scores(self, hybrid_analyses: List[HybridDocument]) -> Dict[str, Any]:
-        """완성도 점수 비교"""
-        scores = {}
-        for hybrid in hybrid_analyses:
-            if hybrid.analysis_results:
-                latest_analysis = hybrid.analysis_results[-1]
-                scores[hybrid.id] = latest_analysis.get("completeness_score", 0)
-        
+
+    def _compare_scores(self, analyses: Dict[str, HybridAnalysis], score_field: str) -> Dict[str, Any]:
+        """분석 결과의 점수 필드 비교"""
+        scores = {hybrid_id: getattr(analysis, score_field, 0) for hybrid_id, analysis in analyses.items()}
+
         return {
             "scores": scores,
             "average": sum(scores.values()) / len(scores) if scores else 0,
             "highest": max(scores.values()) if scores else 0,
             "lowest": min(scores.values()) if scores else 0
         }
-    
+
+    async def ensure_indexes(self) -> None:
+        """검색 필터/정렬용 인덱스 생성 (프로세스당 1회)"""
+        if HybridService._indexes_ensured:
+            return
+        collection = self.db[self.collection]
+        await collection.create_index(
+            [("summary", "text"), ("strengths", "text"), ("weaknesses", "text")],
+            name="analysis_text", default_language="none"
+        )
+        await collection.create_index(
+            [("analysis_type", 1), ("integrated_document_type", 1), ("overall_score", -1), ("created_at", -1)],
+            name="analysis_type_1_integrated_document_type_1_overall_score_-1_created_at_-1"
+        )
+        await collection.create_index(
+            [("integrated_document_type", 1), ("overall_score", -1), ("created_at", -1)],
+            name="integrated_document_type_1_overall_score_-1_created_at_-1"
+        )
+        await collection.create_index(
+            [("applicant_id", 1), ("created_at", -1)], name="applicant_id_1_created_at_-1"
+        )
+        HybridService._indexes_ensured = True
+
     async def get_hybrid_statistics(self) -> HybridStatistics:
-        """하이브리드 분석 통계 조회"""
+        """하이브리드 분석 통계 조회 (롤업 문서 1건 조회, 컬렉션 크기와 무관)"""
         try:
-            total_analyses = await self.count(self.collection)
-            
-            # 평균 종합 점수 계산
-            pipeline = [
-                {"$unwind": "$analysis_results"},
-                {"$group": {"_id": None, "avg_score": {"$avg": "$analysis_results.overall_score"}}}
-            ]
-            cursor = self.db[self.collection].aggregate(pipeline)
-            result = await cursor.to_list(length=1)
-            average_overall_score = result[0]["avg_score"] if result else 0.0
-            
-            # 분석 타입 분포
-            pipeline = [
-                {"$group": {"_id": "$analysis_type", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}}
-            ]
-            cursor = self.db[self.collection].aggregate(pipeline)
-            analysis_type_distribution = await cursor.to_list(length=10)
-            
-            # 문서 타입 분포
-            pipeline = [
-                {"$group": {"_id": "$integrated_document_type", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}}
-            ]
-            cursor = self.db[self.collection].aggregate(pipeline)
-            document_type_distribution = await cursor.to_list(length=10)
-            
-            # 점수 분포
-            pipeline = [
-                {"$unwind": "$analysis_results"},
-                {"$bucket": {
-                    "groupBy": "$analysis_results.overall_score",
-                    "boundaries": [0, 20, 40, 60, 80, 100],
-                    "default": "100+",
-                    "output": {"count": {"$sum": 1}}
-                }}
-            ]
-            cursor = self.db[self.collection].aggregate(pipeline)
-            score_distribution = await cursor.to_list(length=10)
-            
+            rollup = await self.db[STATISTICS_COLLECTION].find_one({"_id": self.collection})
+            if rollup is None:
+                rollup = await self.reconcile_statistics()
+            elif time.time() - rollup.get("reconciled_at", 0) > STATISTICS_RECONCILE_SECONDS:
+                self._schedule_reconciliation()
+
+            score_count = rollup.get("score_count", 0)
             return HybridStatistics(
-                total_analyses=total_analyses,
-                average_overall_score=average_overall_score,
-                analysis_type_distribution={item["_id"]: item["count"] for item in analysis_type_distribution},
-                document_type_distribution={item["_id"]: item["count"] for item in document_type_distribution},
-                score_distribution={item["_id"]: item["count"] for item in score_distribution}
+                total_analyses=max(int(rollup.get("total_analyses", 0)), 0),
+                average_overall_score=rollup.get("score_sum", 0.0) / score_count if score_count > 0 else 0.0,
+                analysis_type_distribution=self._positive_counts(rollup.get("analysis_type_distribution")),
+                document_type_distribution=self._positive_counts(rollup.get("document_type_distribution")),
+                score_distribution=self._positive_counts(rollup.get("score_distribution"))
             )
         except Exception as e:
             logger.error(f"하이브리드 분석 통계 조회 실패: {e}")
             raise HTTPException(status_code=500, detail="하이브리드 분석 통계 조회 중 오류가 발생했습니다")
+
+    async def reconcile_statistics(self) -> Dict[str, Any]:
+        """전체 컬렉션을 $facet 한 번으로 집계해 롤업 문서를 다시 작성"""
+        scores = [{"$unwind": "$analysis_results"},
+                  {"$project": {"score": "$analysis_results.overall_score"}}]
+        pipeline = [{"$facet": {
+            "total": [{"$count": "count"}],
+            "average": scores + [
+                {"$match": {"score": {"$type": "number"}}},
+                {"$group": {"_id": None, "sum": {"$sum": "$score"}, "count": {"$sum": 1}}}
+            ],
+            "analysis_types": [{"$group": {"_id": "$analysis_type", "count": {"$sum": 1}}}],
+            "document_types": [{"$group": {"_id": "$integrated_document_type", "count": {"$sum": 1}}}],
+            "scores": scores + [{"$bucket": {
+                "groupBy": "$score",
+                "boundaries": SCORE_BUCKET_BOUNDARIES,
+                "default": SCORE_BUCKET_DEFAULT,
+                "output": {"count": {"$sum": 1}}
+            }}]
+        }}]
+        cursor = self.db[self.collection].aggregate(pipeline)
+        facets = (await cursor.to_list(length=1))[0]
+
+        average = facets["average"][0] if facets["average"] else {"sum": 0.0, "count": 0}
+        rollup = {
+            "total_analyses": facets["total"][0]["count"] if facets["total"] else 0,
+            "score_sum": average["sum"],
+            "score_count": average["count"],
+            "analysis_type_distribution": {
+                str(item["_id"]): item["count"] for item in facets["analysis_types"] if item["_id"] is not None
+            },
+            "document_type_distribution": {
+                str(item["_id"]): item["count"] for item in facets["document_types"] if item["_id"] is not None
+            },
+            "score_distribution": {str(item["_id"]): item["count"] for item in facets["scores"]},
+            "reconciled_at": time.time()
+        }
+        await self.db[STATISTICS_COLLECTION].replace_one({"_id": self.collection}, rollup, upsert=True)
+        logger.info(f"하이브리드 분석 통계 재집계 완료: {rollup['total_analyses']}건")
+        return rollup
+
+    def _schedule_reconciliation(self) -> None:
+        """재집계를 백그라운드로 실행 (이미 실행 중이면 생략, 응답은 기존 롤업으로 즉시 반환)"""
+        task = HybridService._reconcile_task
+        if task is not None and not task.done():
+            return
+
+        async def reconcile():
+            try:
+                await self.reconcile_statistics()
+            except Exception as e:
+                logger.warning(f"하이브리드 분석 통계 재집계 실패: {e}")
+
+        HybridService._reconcile_task = asyncio.create_task(reconcile())
+
+    @staticmethod
+    def _score_bucket(score: Any) -> str:
+        """$bucket 과 같은 규칙으로 점수 구간 키 계산"""
+        if isinstance(score, (int, float)) and not isinstance(score, bool):
+            for lower, upper in zip(SCORE_BUCKET_BOUNDARIES, SCORE_BUCKET_BOUNDARIES[1:]):
+                if lower <= score < upper:
+                    return str(lower)
+        return SCORE_BUCKET_DEFAULT
+
+    def _statistics_delta(self, document: Dict[str, Any], scores: Optional[List[Any]] = None,
+                          sign: int = 1) -> Dict[str, float]:
+        """문서 추가(sign=1)/삭제(sign=-1)에 따른 롤업 $inc 값"""
+        delta: Dict[str, float] = {"total_analyses": sign}
+        for field, key in (("analysis_type_distribution", document.get("analysis_type")),
+                           ("document_type_distribution", document.get("integrated_document_type"))):
+            if key is not None:
+                delta[f"{field}.{getattr(key, 'value', key)}"] = sign
+
+        for score in scores or []:
+            bucket = f"score_distribution.{self._score_bucket(score)}"
+            delta[bucket] = delta.get(bucket, 0) + sign
+            if isinstance(score, (int, float)) and not isinstance(score, bool):
+                delta["score_sum"] = delta.get("score_sum", 0.0) + sign * score
+                delta["score_count"] = delta.get("score_count", 0) + sign
+        return delta
+
+    async def _apply_statistics_delta(self, delta: Dict[str, float]) -> None:
+        """롤업 문서에 증분 반영 (롤업이 아직 없으면 다음 조회 시 전체 집계로 생성)"""
+        try:
+            await self.db[STATISTICS_COLLECTION].update_one(
+                {"_id": self.collection}, {"$inc": delta}
+            )
+        except Exception as e:
+            logger.warning(f"하이브리드 분석 통계 갱신 실패: {e}")
+
+    @staticmethod
+    def _positive_counts(distribution: Optional[Dict[str, Any]]) -> Dict[str, int]:
+        return {key: int(count) for key, count in (distribution or {}).items() if count > 0}
@@ -10,10 +10,31 @@ import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from modules.ai.services.intent_classifier import classify_locally
+
 from .duties_separator import DutiesSeparator
+from .rule_extractor import (
+    FILL_SCHEMA,
+    LLM_FIELD_CONFIDENCE,
+    LLM_FILL_MIN_CONFIDENCE,
+    build_fill_messages,
+    job_posting_rule_extractor,
+    low_confidence_fields,
+    parse_fill_response,
+)
 
 logger = logging.getLogger(__name__)
 
+# 채용공고 생성 시 규칙으로 찾지 못하면 LLM 에 요청하는 필드
+POSTING_LLM_FIELDS = ["position", "tech_stack"]
+# 정보 추출 강화 시 LLM 에 요청할 수 있는 필드
+ENHANCE_LLM_FIELDS = [
+    "company_name", "department", "position_level", "employment_type",
+    "salary_min", "salary_max", "benefits", "deadline", "interview_process"
+]
+POSTING_FILL_MAX_TOKENS = 400
+ENHANCE_FILL_MAX_TOKENS = 300
+
 class ParallelJobPostingAgent:
     """병렬 채용공고 생성 에이전트"""
 
@@ -22,6 +43,7 @@ class ParallelJobPostingAgent:
         self.openai_service = openai_service
         self.tool_executor = tool_executor
         self.duties_separator = DutiesSeparator()  # 주요업무 분리기
+        self.rule_extractor = job_posting_rule_extractor  # 규칙 기반 정보 추출기
 
         # 기술 스택 키워드
         self.tech_keywords = {
@@ -58,6 +80,7 @@ class ParallelJobPostingAgent:
         # 의도분류 결과 저장용 변수
         self.last_intent_tool = ""
         self.last_intent_action = ""
+        self._llm_service = None
 
     async def process_job_posting_request(self, user_message: str, session_id: str = None) -> Dict[str, Any]:
         """채용공고 요청 처리 - 실제 채용공고 생성 및 미리보기"""
@@ -75,7 +98,7 @@ class ParallelJobPostingAgent:
 
         # 의도 분류
         intent_start = time.time()
-        is_job_posting = self._is_job_posting_intent(user_message)
+        is_job_posting = await self._is_job_posting_intent(user_message)
         intent_time = time.time() - intent_start
         print(f"🎯 [의도 분류] 결과: {is_job_posting} (소요시간: {intent_time:.3f}초)")
 
@@ -214,7 +237,7 @@ class ParallelJobPostingAgent:
         logger.info(f"최종 응답 완성: 타입={result['type']}, 페이지액션={bool(result.get('page_action'))}")
         return result
 
-    def _is_job_posting_intent(self, message: str) -> bool:
+    async def _is_job_posting_intent(self, message: str) -> bool:
         """채용공고 생성 의도 판단 - LLM 기반으로 단순화"""
         logger.debug(f"의도 분류 분석: '{message}'")
 
@@ -228,14 +251,30 @@ class ParallelJobPostingAgent:
                 logger.debug("기본 키워드 없음 - False 반환")
                 return False
 
+            # 로컬 분류기가 확신하면 LLM 호출 생략
+            local_prediction = classify_locally("job_posting_intent", message)
+            if local_prediction is not None:
+                is_intent = local_prediction.label == "job_posting"
+                logger.debug(f"로컬 의도 분류: {is_intent} (신뢰도: {local_prediction.confidence:.2f})")
+                self.last_intent_tool = "job_posting" if is_intent else ""
+                self.last_intent_action = "create" if is_intent else ""
+                return is_intent
+
             # LLM에게 의도 분류 요청
-            return self._classify_intent_with_llm(message)
+            return await self._classify_intent_with_llm(message)
 
         except Exception as e:
             logger.warning(f"LLM 기반 분류 실패, 기본 로직으로 폴백: {e}")
             return self._fallback_intent_classification(message)
 
-    def _classify_intent_with_llm(self, message: str) -> bool:
+    def _get_llm_service(self):
+        """의도 분류용 LLM 서비스 (에이전트당 1개)"""
+        if self._llm_service is None:
+            from modules.core.services.llm_service import LLMService
+            self._llm_service = LLMService()
+        return self._llm_service
+
+    async def _classify_intent_with_llm(self, message: str) -> bool:
         """LLM을 사용한 의도 분류"""
         try:
             # LLM에게 JSON 형식으로 의도 분류 요청 (툴 정보 포함)
@@ -278,72 +317,58 @@ class ParallelJobPostingAgent:
 reason에는 판단 근거를 구체적으로 작성해주세요.
 """
 
-            # LLM 서비스 호출 (비동기 처리)
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # LLM 서비스 호출 (요청 루프에서 await, 서비스 인스턴스는 재사용)
+            response = await self._get_llm_service().chat_completion(
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=100,
+                temperature=0.1
+            )
+
+            print(f"🔍 [의도분류] LLM 응답: {response}")
 
+            # JSON 파싱 시도 (안전화 강화)
+            import json
             try:
-                from modules.core.services.llm_service import LLMService
-                llm_service = LLMService()
-
-                # 간단한 응답 생성 (실제로는 LLM 호출)
-                response = loop.run_until_complete(
-                    llm_service.chat_completion(
-                        messages=[{"role": "user", "content": prompt}],
-                        max_tokens=100,
-                        temperature=0.1
-                    )
-                )
+                if "{" in response and "}" in response:
+                    start = response.find("{")
+                    end = response.rfind("}") + 1
+                    json_str = response[start:end]
 
-                print(f"🔍 [의도분류] LLM 응답: {response}")
+                    # JSON 유효성 검사
+                    result = json.loads(json_str)
 
-                # JSON 파싱 시도 (안전화 강화)
-                import json
-                try:
-                    if "{" in response and "}" in response:
-                        start = response.find("{")
-                        end = response.rfind("}") + 1
-                        json_str = response[start:end]
-
-                        # JSON 유효성 검사
-                        result = json.loads(json_str)
-
-                        # 필수 필드 검증
-                        if "is_job_posting_intent" not in result:
-                            print(f"🔍 [의도분류] JSON에 필수 필드 없음, 폴백 사용")
-                            return self._fallback_intent_classification(message)
-
-                        is_intent = result.get("is_job_posting_intent", False)
-                        confidence = result.get("confidence", 0.0)
-                        suggested_tool = result.get("suggested_tool", "")
-                        suggested_action = result.get("suggested_action", "")
-                        reason = result.get("reason", "")
-
-                        print(f"🔍 [의도분류] LLM 결과: {is_intent} (신뢰도: {confidence})")
-                        print(f"🔍 [의도분류] 제안 툴: {suggested_tool}, 액션: {suggested_action}")
-                        print(f"🔍 [의도분류] 판단 근거: {reason}")
-
-                        # 툴 정보를 인스턴스 변수에 저장
-                        self.last_intent_tool = suggested_tool
-                        self.last_intent_action = suggested_action
-
-                        # 신뢰도가 낮으면 폴백 로직 사용
-                        if confidence < 0.5:
-                            print(f"🔍 [의도분류] 신뢰도 낮음 ({confidence}), 폴백 사용")
-                            return self._fallback_intent_classification(message)
-
-                        return is_intent
-                    else:
-                        print(f"🔍 [의도분류] JSON 형식 없음, 폴백 사용")
+                    # 필수 필드 검증
+                    if "is_job_posting_intent" not in result:
+                        print(f"🔍 [의도분류] JSON에 필수 필드 없음, 폴백 사용")
                         return self._fallback_intent_classification(message)
 
-                except (json.JSONDecodeError, KeyError, TypeError) as e:
-                    print(f"🔍 [의도분류] JSON 파싱 오류: {e}, 폴백 사용")
+                    is_intent = result.get("is_job_posting_intent", False)
+                    confidence = result.get("confidence", 0.0)
+                    suggested_tool = result.get("suggested_tool", "")
+                    suggested_action = result.get("suggested_action", "")
+                    reason = result.get("reason", "")
+
+                    print(f"🔍 [의도분류] LLM 결과: {is_intent} (신뢰도: {confidence})")
+                    print(f"🔍 [의도분류] 제안 툴: {suggested_tool}, 액션: {suggested_action}")
+                    print(f"🔍 [의도분류] 판단 근거: {reason}")
+
+                    # 툴 정보를 인스턴스 변수에 저장
+                    self.last_intent_tool = suggested_tool
+                    self.last_intent_action = suggested_action
+
+                    # 신뢰도가 낮으면 폴백 로직 사용
+                    if confidence < 0.5:
+                        print(f"🔍 [의도분류] 신뢰도 낮음 ({confidence}), 폴백 사용")
+                        return self._fallback_intent_classification(message)
+
+                    return is_intent
+                else:
+                    print(f"🔍 [의도분류] JSON 형식 없음, 폴백 사용")
                     return self._fallback_intent_classification(message)
 
-            finally:
-                loop.close()
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                print(f"🔍 [의도분류] JSON 파싱 오류: {e}, 폴백 사용")
+                return self._fallback_intent_classification(message)
 
         except Exception as e:
             print(f"🔍 [의도분류] LLM 분류 오류: {e}")
@@ -524,176 +549,63 @@ reason에는 판단 근거를 구체적으로 작성해주세요.
             }
 
     async def _generate_complete_job_posting(self, message: str, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
-        """LLM을 사용한 완전한 채용공고 생성"""
-        system_prompt = """당신은 전문 채용공고 작성 전문가입니다.
-
-주어진 정보를 바탕으로 완전한 채용공고를 JSON 형식으로 생성하세요.
-
-응답 형식:
-{
-  "title": "구체적인 채용공고 제목",
-  "company_name": "회사명 (알 수 없으면 '스타트업' 또는 '성장기업')",
-  "department": "부서명",
-  "position": "직무명",
-  "employment_type": "정규직",
-  "experience_level": "신입/경력 구분",
-  "location": "근무지",
-  "salary": {
-    "min": 최소급여(숫자, 천단위 쉼표 없이),
-    "max": 최대급여(숫자, 천단위 쉼표 없이),
-    "currency": "KRW"
-  },
-  "description": "회사 소개 및 일반적인 업무 개요 (예: 우리 회사는 성장기업이며, 백엔드 개발 업무를 담당하게 됩니다)",
-  "requirements": [
-    "필수 요구사항1",
-    "필수 요구사항2"
-  ],
-  "preferred_qualifications": [
-    "우대사항1",
-    "우대사항2"
-  ],
-  "benefits": [
-    "복리후생1",
-    "복리후생2"
-  ],
-  "work_conditions": {
-    "location": "구체적 근무지",
-    "remote": true/false,
-    "working_hours": "근무시간"
-  },
-  "tech_stack": ["기술1", "기술2"],
-  "team_size": 숫자,
-  "application_deadline": "2024-12-31",
-  "contact_info": {
-    "email": "contact@company.com",
-    "phone": "02-1234-5678"
-  }
-}
-
-**중요 규칙:**
-- description: 회사 소개와 일반적인 업무 개요만 작성. 구체적인 기술명, 경력 요구사항, 스킬은 절대 언급하지 말 것
-- requirements: 필수 요구사항만 배열로 작성 (구체적인 기술, 경력, 스킬 포함)
-- preferred_qualifications: 우대사항만 배열로 작성
-- benefits: 복리후생/혜택만 배열로 작성
-
-**절대 금지:** description에 기술명(Node.js, JavaScript 등), 경력(5년 이상 등), 구체적 업무(API 개발, 데이터베이스 설계 등) 언급 금지
-
-**올바른 예시:**
-- description: "우리 회사는 혁신적인 서비스를 제공하는 성장기업입니다. 개발팀에서 백엔드 개발 업무를 담당하게 됩니다."
-- requirements: ["Node.js 개발 경력 5년 이상", "데이터베이스 설계 경험"]
-
-**잘못된 예시:**
-- description: "Node.js를 활용한 백엔드 개발자를 찾습니다. 5년 이상의 경력과 데이터베이스 설계 경험이 필요합니다."
-
-반드시 완전한 JSON만 응답하세요."""
-
-        user_prompt = f"""
-다음 요청을 바탕으로 채용공고를 생성하세요:
-
-사용자 요청: {message}
-
-추출된 정보:
-- 기술 스택: {extracted_data.get('tech_stack', [])}
-- 직무: {extracted_data.get('job_title', '')}
-- 위치: {extracted_data.get('location', '')}
-- 경력: {extracted_data.get('experience', '')}
-- 인원: {extracted_data.get('team_size', '')}명
-- 재택근무: {extracted_data.get('remote', False)}
-
-완전한 채용공고 JSON을 생성하세요.
-"""
-
-        try:
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-
-            response = await self.openai_service.chat_completion(messages)
-            job_posting = self._parse_json_response(response)
-
-            if job_posting:
-                # 추출된 데이터로 보완
-                if not job_posting.get('tech_stack'):
-                    job_posting['tech_stack'] = extracted_data.get('tech_stack', [])
-                if not job_posting.get('team_size'):
-                    job_posting['team_size'] = extracted_data.get('team_size', 1)
-
-                # ✅ description을 고정된 깔끔한 회사 소개로 교체
-                try:
-                    job_posting['description'] = "우리 회사는 혁신적인 서비스를 제공하는 성장기업입니다. 개발팀에서 함께 성장할 동료를 찾고 있습니다."
-                    logger.info("description을 고정값으로 교체 완료")
-                except Exception as e:
-                    logger.error(f"description 교체 중 오류: {e}")
-
-                return job_posting
-            else:
-                # JSON 파싱 실패 시 기본 템플릿 사용
-                return self._create_default_job_posting(extracted_data)
+        """채용공고 생성 (규칙 추출값으로 즉시 초안을 만들고, 직무/기술 스택을 알 수 없을 때만 LLM 으로 보완)"""
+        missing = low_confidence_fields(extracted_data.get("field_confidence", {}), POSTING_LLM_FIELDS)
+        if missing:
+            # 직무를 모를 때는 자격요건/우대사항도 규칙으로 만들 수 없으므로 같은 호출에서 함께 요청
+            fields = missing + ["requirements", "preferred_qualifications"]
+            filled = await self._fill_fields_with_llm(message, extracted_data, fields, POSTING_FILL_MAX_TOKENS)
+            self._apply_llm_fields(extracted_data, filled)
 
-        except Exception as e:
-            logger.error(f"LLM 채용공고 생성 실패: {str(e)}")
-            return self._create_default_job_posting(extracted_data)
+        return self._create_default_job_posting(extracted_data)
 
     def _create_default_job_posting(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
-        """기본 채용공고 템플릿"""
+        """기본 채용공고 템플릿 (추출된 값이 없는 항목은 기본값)"""
         tech_stack = extracted_data.get('tech_stack', [])
         job_title = extracted_data.get('job_title', '개발자')
+        position = extracted_data.get('position') or job_title
         location = extracted_data.get('location', '서울')
+        experience = extracted_data.get('experience') or '경력무관'
+        working_hours = extracted_data.get('working_hours') or "09:00-18:00"
 
-        title = f"{' '.join(tech_stack[:2])} {job_title} 채용" if tech_stack else f"{job_title} 채용"
-
-        # 급여 정보 설정
-        salary_info = extracted_data.get('salary', '협의')
-        if salary_info != '협의' and salary_info:
-            # 급여가 "5000만원" 형식인 경우 숫자 추출
-            import re
-            salary_match = re.search(r'(\d+)만원', str(salary_info))
-            if salary_match:
-                salary_amount = int(salary_match.group(1))
-                salary_dict = {
-                    "min": salary_amount,
-                    "max": salary_amount,
-                    "currency": "KRW"
-                }
-            else:
-                # 기본값
-                salary_dict = {
-                    "min": 3000,
-                    "max": 6000,
-                    "currency": "KRW"
-                }
-        else:
-            # 기본값
-            salary_dict = {
-                "min": 3000,
-                "max": 6000,
-                "currency": "KRW"
-            }
+        title = f"{' '.join(tech_stack[:2])} {position} 채용" if tech_stack else f"{position} 채용"
+
+        # 급여 정보 설정 (만원 단위, 없으면 기본값)
+        salary_dict = {
+            "min": extracted_data.get('salary_min') or 3000,
+            "max": extracted_data.get('salary_max') or extracted_data.get('salary_min') or 6000,
+            "currency": "KRW"
+        }
+
+        requirements = extracted_data.get('requirements')
+        if not requirements:
+            requirements = [f"{tech} 실무 경험" for tech in tech_stack[:3]] or ["개발 경험"]
+            if experience.endswith("년"):
+                requirements.append(f"관련 경력 {experience} 이상")
 
         return {
             "title": title,
-            "company_name": "성장기업",
-            "department": "개발팀",
-            "position": job_title,
-            "employment_type": "정규직",
-            "experience_level": extracted_data.get('experience', '경력무관'),
+            "company_name": extracted_data.get('company_name') or "성장기업",
+            "department": extracted_data.get('department') or "개발팀",
+            "position": position,
+            "employment_type": extracted_data.get('employment_type') or "정규직",
+            "experience_level": experience,
             "location": location,
             "salary": salary_dict,
-            "working_hours": "09:00-18:00",  # 근무 시간 기본값
+            "working_hours": working_hours,
             "contact_email": "",  # 연락처 이메일 빈 값
             "description": "우리 회사는 혁신적인 서비스를 제공하는 성장기업입니다. 개발팀에서 함께 성장할 동료를 찾고 있습니다.",
-            "requirements": tech_stack[:3] if tech_stack else ["개발 경험"],
-            "preferred_qualifications": ["팀워크", "커뮤니케이션 능력"],
-            "benefits": ["재택근무 가능", "유연근무제", "교육비 지원"],
+            "requirements": requirements,
+            "preferred_qualifications": extracted_data.get('preferred_qualifications') or ["팀워크", "커뮤니케이션 능력"],
+            "benefits": extracted_data.get('benefits') or ["재택근무 가능", "유연근무제", "교육비 지원"],
             "work_conditions": {
                 "location": location,
                 "remote": extracted_data.get('remote', False),
-                "working_hours": "09:00-18:00"
+                "working_hours": working_hours
             },
             "tech_stack": tech_stack,
-            "team_size": extracted_data.get('team_size', 2),
-            "application_deadline": "2024-12-31",
+            "team_size": extracted_data.get('team_size') or 2,
+            "application_deadline": extracted_data.get('deadline') or "2024-12-31",
             "contact_info": {
                 "email": "recruit@company.com",
                 "phone": "02-1234-5678"
@@ -708,10 +620,10 @@ reason에는 판단 근거를 구체적으로 작성해주세요.
             # 기본 정보 추출
             extracted_data = self._extract_job_info(message)
 
-            # LLM을 사용한 추가 정보 추출 (옵션)
+            # 규칙으로 찾지 못한 정보만 LLM 으로 보완 (옵션)
             if self.openai_service:
                 enhanced_data = await self._enhance_extraction_with_llm(message, extracted_data)
-                extracted_data.update(enhanced_data)
+                self._apply_llm_fields(extracted_data, enhanced_data)
 
             logger.info("정보 추출 완료")
             return {
@@ -728,53 +640,40 @@ reason에는 판단 근거를 구체적으로 작성해주세요.
             }
 
     async def _enhance_extraction_with_llm(self, message: str, base_data: Dict[str, Any]) -> Dict[str, Any]:
-        """LLM을 사용한 정보 추출 강화"""
-        system_prompt = """당신은 채용공고 정보 추출 전문가입니다.
-
-사용자의 메시지에서 다음 정보를 추출하여 JSON으로 응답하세요:
-{
-  "company_name": "회사명",
-  "department": "부서명",
-  "position_level": "junior/middle/senior",
-  "employment_type": "정규직/계약직/인턴",
-  "salary_min": 최소급여(숫자),
-  "salary_max": 최대급여(숫자),
-  "benefits": ["복리후생1", "복리후생2"],
-  "deadline": "마감일",
-  "interview_process": ["면접절차1", "면접절차2"]
-}
-
-정보가 없으면 null을 사용하세요."""
-
-        user_prompt = f"""
-다음 메시지에서 채용공고 정보를 추출하세요:
-
-메시지: {message}
-
-기본 추출 정보:
-- 기술 스택: {base_data['tech_stack']}
-- 직무: {base_data['job_title']}
-- 위치: {base_data['location']}
-- 경력: {base_data['experience']}
-
-추가 정보를 JSON 형태로 추출하세요.
-"""
+        """LLM을 사용한 정보 추출 강화 (누락/저신뢰 필드만 요청, 모두 추출되었으면 호출하지 않음)"""
+        missing = low_confidence_fields(base_data.get("field_confidence", {}), ENHANCE_LLM_FIELDS)
+        if not missing:
+            return {}
+        return await self._fill_fields_with_llm(message, base_data, missing, ENHANCE_FILL_MAX_TOKENS)
 
+    async def _fill_fields_with_llm(self, message: str, extracted_data: Dict[str, Any], fields: List[str],
+                                    max_tokens: int) -> Dict[str, Any]:
+        """지정한 필드만 제한된 스키마로 LLM 에 요청 (스키마에 맞지 않는 값은 버림)"""
+        if not self.openai_service:
+            return {}
+        confidence = extracted_data.get("field_confidence", {})
+        known = {
+            name: value for name, value in extracted_data.items()
+            if name in FILL_SCHEMA and confidence.get(name, 0.0) >= LLM_FILL_MIN_CONFIDENCE and value not in (None, "", [])
+        }
         try:
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-
-            response = await self.openai_service.chat_completion(messages)
-            enhanced_data = self._parse_json_response(response)
-
-            return enhanced_data if enhanced_data else {}
-
+            messages = build_fill_messages(message, known, fields)
+            response = await self.openai_service.chat_completion(messages, max_tokens=max_tokens, temperature=0.2)
+            filled = parse_fill_response(response, fields)
+            logger.info(f"LLM 필드 보완: 요청 {fields}, 반영 {list(filled.keys())}")
+            return filled
         except Exception as e:
-            logger.error(f"LLM 정보 추출 강화 실패: {str(e)}")
+            logger.error(f"LLM 필드 보완 실패: {str(e)}")
             return {}
 
+    @staticmethod
+    def _apply_llm_fields(extracted_data: Dict[str, Any], filled: Dict[str, Any]) -> None:
+        """LLM 이 채운 값 반영 (필드 신뢰도도 함께 갱신)"""
+        confidence = extracted_data.setdefault("field_confidence", {})
+        for name, value in filled.items():
+            extracted_data[name] = value
+            confidence[name] = LLM_FIELD_CONFIDENCE
+
     async def _generate_job_posting(self, message: str) -> Dict[str, Any]:
         """메인 작업: 채용공고 생성"""
         logger.info("채용공고 생성 시작")
@@ -841,65 +740,21 @@ reason에는 판단 근거를 구체적으로 작성해주세요.
             return {"status": "error", "message": str(e), "candidates": []}
 
     def _extract_job_info(self, message: str) -> Dict[str, Any]:
-        """채용공고 정보 추출"""
-        # 먼저 pick_chatbot의 extract_job_posting_info 함수 사용
-        from backend.routers.pick_chatbot import extract_job_posting_info
-        detailed_info = extract_job_posting_info(message)
-
-        extracted = {
-            "tech_stack": [],
-            "job_title": "개발자",
-            "location": "서울",
-            "experience": detailed_info.get('experience'),
-            "team_size": detailed_info.get('headcount', 0),  # 기본값 0명
-            "headcount": detailed_info.get('headcount', 0),  # headcount 필드도 추가
-            "remote": False,
-            "salary": detailed_info.get('salary')
-        }
-
-        # 기술 스택 추출
-        for tech, variants in self.tech_keywords.items():
-            if any(variant in message.lower() for variant in variants):
-                extracted["tech_stack"].append(tech)
-
-        # 직무 추출
-        for job in self.job_keywords:
-            if job in message:
-                extracted["job_title"] = job
-                break
-
-        # 위치 추출
-        for location in self.location_keywords:
-            if location in message:
-                extracted["location"] = location
-                break
-
-        # 경력 추출
-        experience_patterns = [
-            r'(\d+)\s*년\s*(?:이상|이하|정도)?',
-            r'신입',
-            r'경력',
-            r'시니어',
-            r'주니어'
-        ]
-        for pattern in experience_patterns:
-            match = re.search(pattern, message)
-            if match:
-                if pattern in ['신입', '경력', '시니어', '주니어']:
-                    extracted["experience"] = pattern
-                else:
-                    extracted["experience"] = f"{match.group(1)}년"
-                break
-
-        # 팀 규모 추출
-        team_match = re.search(r'(\d+)\s*명', message)
-        if team_match:
-            extracted["team_size"] = int(team_match.group(1))
-
-        # 재택근무 체크
-        remote_keywords = ["재택", "원격", "remote", "하이브리드"]
-        extracted["remote"] = any(keyword in message for keyword in remote_keywords)
-
+        """채용공고 정보 추출 (규칙 기반, field_confidence 에 필드별 신뢰도)"""
+        result = self.rule_extractor.extract(message)
+
+        extracted = result.values()
+        extracted.update({
+            "tech_stack": result.get("tech_stack", []),
+            "job_title": result.get("job_title", "개발자"),
+            "location": result.get("location", "서울"),
+            "experience": result.get("experience"),
+            "team_size": result.get("headcount", 0),  # 기본값 0명
+            "headcount": result.get("headcount", 0),
+            "remote": result.get("remote", False),
+            "salary": result.get("salary", "협의")
+        })
+        extracted["field_confidence"] = result.confidences()
         return extracted
 
     def _format_salary_for_ui(self, salary_info):
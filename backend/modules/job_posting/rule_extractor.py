@@ -0,0 +1,472 @@
+"""
+규칙 기반 채용공고 정보 추출기
+컴파일된 패턴과 필드 사전으로 필드별 값/신뢰도를 추출하고,
+누락되었거나 신뢰도가 낮은 필드만 LLM 에 제한된 스키마로 요청하기 위한 프롬프트 구성/검증을 제공
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 이 값 미만인 필드만 LLM 보완 대상
+LLM_FILL_MIN_CONFIDENCE = 0.7
+# LLM 이 채운 값의 신뢰도
+LLM_FIELD_CONFIDENCE = 0.6
+
+# 신뢰도 기준: 명시적 패턴 일치 / 사전 키워드 일치 / 다른 필드에서 유추 / 기본값
+EXPLICIT = 0.9
+KEYWORD = 0.8
+DERIVED = 0.6
+DEFAULT = 0.3
+
+
+# 한글 키워드 중 더 긴 다른 단어의 앞부분인 경우 (예: 자바스크립트의 "자바")
+_KEYWORD_EXCLUDED_SUFFIXES = {"자바": "스크립트"}
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> re.Pattern:
+    """영문 키워드는 단어 경계로, 한글 키워드는 부분 일치로 찾는 패턴 (긴 키워드 우선)"""
+    parts = []
+    for keyword in sorted(keywords, key=len, reverse=True):
+        escaped = re.escape(keyword.lower())
+        if re.fullmatch(r"[a-z0-9.+#\- ]+", keyword.lower()):
+            parts.append(rf"(?<![a-z0-9]){escaped}(?![a-z0-9])")
+        elif keyword in _KEYWORD_EXCLUDED_SUFFIXES:
+            parts.append(rf"{escaped}(?!{re.escape(_KEYWORD_EXCLUDED_SUFFIXES[keyword])})")
+        else:
+            parts.append(escaped)
+    return re.compile("|".join(parts))
+
+
+def _dictionary(entries: Dict[str, List[str]]) -> List[Tuple[str, re.Pattern]]:
+    return [(name, _keyword_pattern(variants)) for name, variants in entries.items()]
+
+
+# 분야 단어 뒤에 붙어야 직무로 보는 명사 ("보안 엔지니어", "기획자" / "보안 솔루션", "기획팀", "인사드립니다" 는 제외)
+ROLE_NOUN_SUFFIX = r"(?:\s?(?:개발|엔지니어|담당|매니저|전문가|관리|직무|업무)|자(?!격|료|원|산|금|본|율|체|동|유))"
+
+
+def _position_dictionary(entries: Dict[str, Tuple[List[str], List[str]]]
+                         ) -> List[Tuple[str, re.Pattern, Optional[re.Pattern]]]:
+    """(직무명, 직무 패턴, 분야 단어 단독 패턴) 목록
+
+    직무 패턴은 키워드 또는 "분야 단어 + 직무 명사" 에 일치하고,
+    분야 단어 단독 패턴은 직무명이 전혀 없을 때만 낮은 신뢰도로 사용합니다.
+    """
+    titles = []
+    for title, (keywords, domain_words) in entries.items():
+        parts = [_keyword_pattern(keywords).pattern] if keywords else []
+        domain_pattern = _keyword_pattern(domain_words) if domain_words else None
+        if domain_pattern is not None:
+            parts.append(rf"(?:{domain_pattern.pattern}){ROLE_NOUN_SUFFIX}")
+        titles.append((title, re.compile("|".join(parts)), domain_pattern))
+    return titles
+
+
+# ----- 필드 사전 -----
+
+TECH_STACK = _dictionary({
+    "React Native": ["react native", "reactnative", "리액트네이티브", "리액트 네이티브"],
+    "React": ["react", "리액트"],
+    # "뷰" 단독은 리뷰/인터뷰와 겹쳐 제외
+    "Vue.js": ["vue", "vue.js", "뷰js", "뷰.js", "뷰제이에스"],
+    "Angular": ["angular", "angularjs", "앵귤러"],
+    "Next.js": ["next.js", "nextjs"],
+    "TypeScript": ["typescript", "ts", "타입스크립트"],
+    "JavaScript": ["javascript", "js", "자바스크립트"],
+    "Node.js": ["node", "nodejs", "node.js", "노드"],
+    "Python": ["python", "파이썬"],
+    "Django": ["django", "장고"],
+    "FastAPI": ["fastapi"],
+    "Java": ["java", "자바"],
+    "Spring": ["spring", "spring boot", "스프링"],
+    "Kotlin": ["kotlin", "코틀린"],
+    "Swift": ["swift", "스위프트"],
+    "Go": ["golang", "고랭"],
+    "C++": ["c++"],
+    "Unity": ["unity", "유니티"],
+    "AWS": ["aws", "아마존 웹 서비스"],
+    "Docker": ["docker", "도커"],
+    "Kubernetes": ["kubernetes", "k8s", "쿠버네티스"],
+    "MySQL": ["mysql"],
+    "PostgreSQL": ["postgresql", "postgres"],
+    "MongoDB": ["mongodb", "몽고디비"],
+})
+
+# 구체적인 직무가 앞에 오도록 정렬, 직무명: (키워드, 분야 단어)
+# 분야 단어는 단독으로 다른 뜻으로 흔히 쓰여 (인사드립니다, 기획팀과 협업, 보안 솔루션 회사) 직무 명사가 붙은 경우만 인정
+POSITION_TITLES = _position_dictionary({
+    "프론트엔드 개발자": (["프론트엔드", "frontend", "front-end", "프론트"], []),
+    "백엔드 개발자": (["백엔드", "backend", "back-end", "서버 개발"], []),
+    "풀스택 개발자": (["풀스택", "fullstack", "full-stack"], []),
+    "모바일 앱 개발자": (["ios", "android", "안드로이드", "앱 개발"], ["모바일"]),
+    "데이터 엔지니어": (["데이터 엔지니어", "data engineer"], []),
+    "데이터 분석가": (["데이터 분석", "data analyst"], []),
+    "AI 엔지니어": (["ai", "머신러닝", "딥러닝", "ml"], ["인공지능"]),
+    "DevOps 엔지니어": (["devops", "데브옵스", "sre"], []),
+    "보안 엔지니어": ([], ["보안"]),
+    "QA 엔지니어": (["qa", "테스터"], ["품질"]),
+    "게임 개발자": ([], ["게임"]),
+    "UI/UX 디자이너": (["ui", "ux", "디자이너"], []),
+    "서비스 기획자": ([], ["기획"]),
+    "프로덕트 매니저": (["pm", "프로덕트 매니저", "po"], []),
+    "마케팅 매니저": (["마케터"], ["마케팅"]),
+    "영업 매니저": ([], ["영업"]),
+    "인사 담당자": (["hr"], ["인사"]),
+    "회계 담당자": ([], ["회계", "재무"]),
+})
+
+# 기존 job_title 값 (구체적 직무가 없을 때 사용하는 일반 직무명)
+JOB_KEYWORDS = [
+    "개발자", "엔지니어", "프로그래머", "아키텍트", "리드",
+    "신입", "시니어", "주니어", "인턴", "CTO", "테크리드", "테크 리드"
+]
+
+EMPLOYMENT_TYPES = _dictionary({
+    "정규직": ["정규직", "full-time", "fulltime"],
+    "계약직": ["계약직", "contract"],
+    "인턴": ["인턴", "intern"],
+    "파트타임": ["파트타임", "아르바이트", "part-time"],
+    "프리랜서": ["프리랜서", "freelance"],
+})
+
+LOCATIONS = [
+    "서울", "부산", "대구", "인천", "대전", "광주", "울산", "세종", "제주",
+    "판교", "성남", "분당", "수원", "용인", "고양", "강남", "강남구", "서초", "종로구", "마포구", "여의도", "구로"
+]
+LOCATION_PATTERN = _keyword_pattern(LOCATIONS)
+
+BENEFITS = _dictionary({
+    "재택근무": ["재택", "원격", "remote"],
+    "유연근무제": ["유연근무", "유연 근무", "시차출퇴근"],
+    "자율출퇴근": ["자율출퇴근", "자율 출퇴근"],
+    "교육비 지원": ["교육비", "도서", "컨퍼런스"],
+    "스톡옵션": ["스톡옵션", "스톡 옵션"],
+    "성과급": ["성과급", "인센티브", "보너스"],
+    "식대 지원": ["식대", "점심", "중식"],
+    "최신 장비 지원": ["장비", "맥북"],
+    "건강검진": ["건강검진"],
+    "4대보험": ["4대보험", "4대 보험"],
+})
+
+INTERVIEW_STEPS = _dictionary({
+    "서류 전형": ["서류"],
+    "코딩 테스트": ["코딩테스트", "코딩 테스트", "코테"],
+    "과제 전형": ["과제"],
+    "인적성 검사": ["인적성"],
+    "1차 면접": ["1차 면접", "1차면접", "실무 면접", "실무면접", "기술 면접", "기술면접"],
+    "2차 면접": ["2차 면접", "2차면접"],
+    "임원 면접": ["임원 면접", "임원면접", "최종 면접", "최종면접"],
+})
+
+REMOTE_PATTERN = _keyword_pattern(["재택", "원격", "remote", "하이브리드"])
+
+# ----- 패턴 -----
+
+# 연도("2024년")나 날짜("24년 12월")는 경력으로 보지 않음, 범위("3~5년")는 하한 사용
+EXPERIENCE_RANGE_PATTERN = re.compile(r"(?<![\d.])(\d{1,2})\s*년?\s*[~\-]\s*(\d{1,2})\s*년(?!\s*\d{1,2}\s*월)")
+EXPERIENCE_YEARS_PATTERN = re.compile(r"(?<![\d.])(\d{1,2})\s*년(?!\s*\d{1,2}\s*월)\s*(?:차|이상|이하|정도)?")
+EXPERIENCE_WORDS = [("경력무관", "경력무관"), ("경력 무관", "경력무관"), ("신입", "신입"), ("시니어", "시니어"),
+                    ("주니어", "주니어"), ("경력", "경력")]
+HEADCOUNT_PATTERN = re.compile(r"(\d{1,3})\s*명")
+SALARY_RANGE_PATTERN = re.compile(r"(\d{3,5})\s*(?:만\s*원?)?\s*[~\-]\s*(\d{3,5})\s*만\s*원?")
+SALARY_PATTERN = re.compile(r"(\d{3,5})\s*만\s*원")
+SALARY_THOUSANDS_PATTERN = re.compile(r"연봉\s*(\d{1,2})\s*천")
+SALARY_NEGOTIABLE_PATTERN = re.compile(r"협의|내규")
+COMPANY_PATTERNS = [
+    re.compile(r"(?:\(주\)|㈜|주식회사)\s*([가-힣A-Za-z0-9&]+)"),
+    re.compile(r"회사\s*(?:명|이름)\s*[:은는]?\s*([가-힣A-Za-z0-9&]+)"),
+]
+# 부서명은 알려진 업무 단어로 끝나는 경우만 인정 (예: 개발팀, 서버개발팀, 마케팅 본부 / "좋은 팀" 은 제외)
+DEPARTMENT_KEYWORDS = [
+    "개발", "연구", "기획", "디자인", "마케팅", "영업", "인사", "재무", "회계", "경영지원", "총무", "법무",
+    "운영", "품질", "보안", "데이터", "플랫폼", "인프라", "서비스", "전략", "사업", "고객지원", "구매",
+    "생산", "물류", "홍보", "교육", "프론트엔드", "백엔드", "모바일", "AI", "IT", "QA", "CS",
+]
+DEPARTMENT_PATTERN = re.compile(
+    r"(?<![가-힣A-Za-z])([가-힣A-Za-z]{0,8}?(?:" + "|".join(sorted(DEPARTMENT_KEYWORDS, key=len, reverse=True))
+    + r"))\s*(팀|본부|부서|실|센터|그룹)(?:(?=[은는이가을를의와과에로도])|(?![가-힣]))"
+)
+DEADLINE_FULL_PATTERN = re.compile(r"(20\d{2})\s*[-./년]\s*(\d{1,2})\s*[-./월]\s*(\d{1,2})")
+DEADLINE_MONTH_DAY_PATTERN = re.compile(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*(?:까지|마감)")
+WORKING_HOURS_PATTERN = re.compile(r"(?<!\d)(\d{1,2})(?::(\d{2})|\s*시)\s*[~\-]\s*(\d{1,2})(?::(\d{2}))?")
+
+
+@dataclass
+class ExtractedField:
+    """추출된 필드 값과 신뢰도 (source: rule/default/llm)"""
+    value: Any
+    confidence: float
+    source: str = "rule"
+
+
+@dataclass
+class ExtractionResult:
+    """필드별 추출 결과"""
+    fields: Dict[str, ExtractedField] = field(default_factory=dict)
+
+    def set(self, name: str, value: Any, confidence: float, source: str = "rule") -> None:
+        self.fields[name] = ExtractedField(value, confidence, source)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        extracted = self.fields.get(name)
+        return extracted.value if extracted is not None and extracted.value is not None else default
+
+    def confidence(self, name: str) -> float:
+        extracted = self.fields.get(name)
+        return extracted.confidence if extracted is not None else 0.0
+
+    def confidences(self) -> Dict[str, float]:
+        return {name: extracted.confidence for name, extracted in self.fields.items()}
+
+    def values(self) -> Dict[str, Any]:
+        return {name: extracted.value for name, extracted in self.fields.items()}
+
+
+def low_confidence_fields(field_confidence: Dict[str, float], names: Iterable[str],
+                          threshold: float = LLM_FILL_MIN_CONFIDENCE) -> List[str]:
+    """누락되었거나 신뢰도가 threshold 미만인 필드"""
+    return [name for name in names if field_confidence.get(name, 0.0) < threshold]
+
+
+class JobPostingRuleExtractor:
+    """컴파일된 패턴/필드 사전 기반 채용공고 정보 추출기 (LLM 호출 없음)"""
+
+    def extract(self, message: str, today: Optional[date] = None) -> ExtractionResult:
+        result = ExtractionResult()
+        lowered = message.lower()
+
+        tech_stack = [name for name, pattern in TECH_STACK if pattern.search(lowered)]
+        # "React Native" 가 있으면 "React" 는 중복
+        if "React Native" in tech_stack and not re.search(r"react(?!\s*native)|리액트(?!\s*네이티브)", lowered):
+            tech_stack.remove("React")
+        result.set("tech_stack", tech_stack, EXPLICIT if tech_stack else 0.0)
+
+        self._extract_position(message, lowered, result)
+        self._extract_experience(message, result)
+        self._extract_first(lowered, EMPLOYMENT_TYPES, "employment_type", result)
+
+        location = LOCATION_PATTERN.search(lowered)
+        result.set("location", location.group(0) if location else "서울", EXPLICIT if location else DEFAULT,
+                   "rule" if location else "default")
+        remote = REMOTE_PATTERN.search(lowered) is not None
+        result.set("remote", remote, EXPLICIT if remote else DEFAULT)
+
+        headcount = HEADCOUNT_PATTERN.search(message)
+        result.set("headcount", int(headcount.group(1)) if headcount else 0, EXPLICIT if headcount else 0.0)
+
+        self._extract_salary(message, result)
+        self._extract_company(message, result)
+        self._extract_deadline(message, result, today or date.today())
+
+        working_hours = WORKING_HOURS_PATTERN.search(message)
+        if working_hours:
+            start_hour, start_minute, end_hour, end_minute = working_hours.groups()
+            result.set("working_hours",
+                       f"{int(start_hour):02d}:{start_minute or '00'}-{int(end_hour):02d}:{end_minute or '00'}", EXPLICIT)
+
+        benefits = [name for name, pattern in BENEFITS if pattern.search(lowered)]
+        result.set("benefits", benefits, KEYWORD if benefits else 0.0)
+
+        steps = sorted(((pattern.search(lowered), name) for name, pattern in INTERVIEW_STEPS),
+                       key=lambda item: item[0].start() if item[0] else 0)
+        interview_process = [name for match, name in steps if match]
+        result.set("interview_process", interview_process, KEYWORD if interview_process else 0.0)
+        return result
+
+    @staticmethod
+    def _extract_first(lowered: str, dictionary, name: str, result: ExtractionResult) -> None:
+        for value, pattern in dictionary:
+            if pattern.search(lowered):
+                result.set(name, value, KEYWORD)
+                return
+
+    @staticmethod
+    def _extract_position(message: str, lowered: str, result: ExtractionResult) -> None:
+        job_title = next((job for job in JOB_KEYWORDS if job in message), None)
+        result.set("job_title", job_title or "개발자", KEYWORD if job_title else DEFAULT,
+                   "rule" if job_title else "default")
+
+        for title, pattern, _ in POSITION_TITLES:
+            if pattern.search(lowered):
+                result.set("position", title, KEYWORD)
+                return
+        # 구체적 직무 없이 "개발자" 등 일반 직무명만 있는 경우 (근처의 분야 단어는 직무가 아님)
+        if job_title and job_title not in ("신입", "시니어", "주니어", "인턴"):
+            result.set("position", job_title, 0.5)
+            return
+        # 직무명 없이 분야 단어만 있는 경우 (예: "마케팅 인원 충원") - LLM 보완 대상 신뢰도
+        for title, _, domain_pattern in POSITION_TITLES:
+            if domain_pattern is not None and domain_pattern.search(lowered):
+                result.set("position", title, DERIVED)
+                return
+
+    @staticmethod
+    def _extract_experience(message: str, result: ExtractionResult) -> None:
+        years_match = EXPERIENCE_RANGE_PATTERN.search(message) or EXPERIENCE_YEARS_PATTERN.search(message)
+        years = None
+        if years_match:
+            years = int(years_match.group(1))
+            result.set("experience", f"{years}년", EXPLICIT)
+            result.set("experience_years", years, EXPLICIT)
+        else:
+            word = next((label for keyword, label in EXPERIENCE_WORDS if keyword in message), None)
+            if word:
+                result.set("experience", word, KEYWORD)
+                if word == "신입":
+                    years = 0
+                    result.set("experience_years", 0, KEYWORD)
+
+        experience = result.get("experience")
+        if experience in ("시니어", "주니어"):
+            result.set("position_level", "senior" if experience == "시니어" else "junior", KEYWORD)
+        elif years is not None:
+            level = "junior" if years < 3 else "middle" if years < 7 else "senior"
+            result.set("position_level", level, DERIVED)
+
+    @staticmethod
+    def _extract_salary(message: str, result: ExtractionResult) -> None:
+        """급여 (만원 단위), salary 는 기존 형식 문자열 ("5000만원"/"4000~6000만원"/"협의")"""
+        salary_range = SALARY_RANGE_PATTERN.search(message)
+        single = SALARY_PATTERN.search(message)
+        thousands = SALARY_THOUSANDS_PATTERN.search(message)
+        if salary_range:
+            low, high = sorted((int(salary_range.group(1)), int(salary_range.group(2))))
+            result.set("salary", f"{low}~{high}만원", EXPLICIT)
+        elif single or thousands:
+            low = high = int(single.group(1)) if single else int(thousands.group(1)) * 1000
+            result.set("salary", f"{low}만원", EXPLICIT)
+        else:
+            negotiable = SALARY_NEGOTIABLE_PATTERN.search(message) is not None
+            result.set("salary", "협의", KEYWORD if negotiable else DEFAULT, "rule" if negotiable else "default")
+            return
+        result.set("salary_min", low, EXPLICIT)
+        result.set("salary_max", high, EXPLICIT)
+
+    @staticmethod
+    def _extract_company(message: str, result: ExtractionResult) -> None:
+        for pattern in COMPANY_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                result.set("company_name", match.group(1), EXPLICIT)
+                break
+
+        department = DEPARTMENT_PATTERN.search(message)
+        if department:
+            result.set("department", department.group(1) + department.group(2), KEYWORD)
+
+    @staticmethod
+    def _extract_deadline(message: str, result: ExtractionResult, today: date) -> None:
+        try:
+            full = DEADLINE_FULL_PATTERN.search(message)
+            if full:
+                deadline = date(int(full.group(1)), int(full.group(2)), int(full.group(3)))
+            else:
+                month_day = DEADLINE_MONTH_DAY_PATTERN.search(message)
+                if not month_day:
+                    return
+                deadline = date(today.year, int(month_day.group(1)), int(month_day.group(2)))
+                # 이미 지난 날짜면 내년
+                if deadline < today:
+                    deadline = deadline.replace(year=today.year + 1)
+        except ValueError:
+            return
+        result.set("deadline", deadline.isoformat(), EXPLICIT)
+
+
+# ----- LLM 보완 (제한된 스키마) -----
+
+FILL_SCHEMA: Dict[str, Dict[str, Any]] = {
+    "position": {"type": "string", "description": "직무명 (예: 백엔드 개발자)"},
+    "company_name": {"type": "string", "description": "메시지에 나온 회사명"},
+    "department": {"type": "string", "description": "부서명 (예: 개발팀)"},
+    "position_level": {"type": "string", "enum": ["junior", "middle", "senior"], "description": "직급 수준"},
+    "employment_type": {"type": "string", "enum": ["정규직", "계약직", "인턴", "파트타임", "프리랜서"],
+                        "description": "고용 형태"},
+    "experience": {"type": "string", "description": "경력 조건 (예: 3년, 신입, 경력무관)"},
+    "tech_stack": {"type": "array", "description": "기술 스택 이름 목록"},
+    "salary_min": {"type": "integer", "description": "최소 연봉 (만원 단위 숫자)"},
+    "salary_max": {"type": "integer", "description": "최대 연봉 (만원 단위 숫자)"},
+    "benefits": {"type": "array", "description": "복리후생 목록"},
+    "deadline": {"type": "string", "description": "마감일 (YYYY-MM-DD)"},
+    "interview_process": {"type": "array", "description": "전형 절차 목록"},
+    "requirements": {"type": "array", "description": "필수 자격요건 목록 (기술/경력 포함)"},
+    "preferred_qualifications": {"type": "array", "description": "우대사항 목록"},
+}
+
+MAX_ARRAY_ITEMS = 8
+
+
+def build_fill_messages(message: str, known: Dict[str, Any], fields: List[str]) -> List[Dict[str, str]]:
+    """누락/저신뢰 필드만 요청하는 프롬프트 (응답은 지정한 키만 가진 JSON, known 은 이미 확인된 필드)"""
+    schema_lines = []
+    for name in fields:
+        spec = FILL_SCHEMA[name]
+        type_hint = f"{spec['type']}, 허용값: {' | '.join(spec['enum'])}" if "enum" in spec else spec["type"]
+        schema_lines.append(f'- "{name}" ({type_hint}): {spec["description"]}')
+
+    system_prompt = (
+        "채용 요청 메시지에서 아래 필드만 채워 JSON 객체로 답하세요.\n"
+        + "\n".join(schema_lines)
+        + "\n메시지로 알 수 없는 필드는 null 로 두고, 다른 키나 설명은 넣지 마세요."
+    )
+    user_prompt = f"메시지: {message}\n이미 확인된 정보: {json.dumps(known, ensure_ascii=False)}"
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def _validate_fill_value(spec: Dict[str, Any], value: Any) -> Any:
+    """스키마에 맞는 값만 반환 (맞지 않으면 None)"""
+    if value is None:
+        return None
+    if spec["type"] == "string":
+        if not isinstance(value, str) or not value.strip():
+            return None
+        value = value.strip()
+        return value if "enum" not in spec or value in spec["enum"] else None
+    if spec["type"] == "integer":
+        if isinstance(value, str):
+            digits = re.sub(r"[^\d]", "", value)
+            value = int(digits) if digits else None
+        return value if isinstance(value, int) and not isinstance(value, bool) and value > 0 else None
+    if spec["type"] == "array":
+        if isinstance(value, str):
+            value = [item for item in re.split(r"[,\n]", value)]
+        if not isinstance(value, list):
+            return None
+        items = [str(item).strip() for item in value if isinstance(item, (str, int, float)) and str(item).strip()]
+        return items[:MAX_ARRAY_ITEMS] or None
+    return None
+
+
+def parse_fill_response(response: str, fields: List[str]) -> Dict[str, Any]:
+    """LLM 응답에서 요청한 필드만 스키마 검증 후 반환"""
+    if not response:
+        return {}
+    text = response.strip()
+    try:
+        data = json.loads(text)
+    except ValueError:
+        start, end = text.find("{"), text.rfind("}")
+        if start < 0 or end <= start:
+            return {}
+        try:
+            data = json.loads(text[start:end + 1])
+        except ValueError:
+            return {}
+    if not isinstance(data, dict):
+        return {}
+
+    filled = {}
+    for name in fields:
+        value = _validate_fill_value(FILL_SCHEMA[name], data.get(name))
+        if value is not None:
+            filled[name] = value
+    return filled
+
+
+job_posting_rule_extractor = JobPostingRuleExtractor()
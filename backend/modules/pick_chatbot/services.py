@@ -67,7 +67,7 @@ class PickChatbotService(BaseService):
                 quick_actions=response.quick_actions
             )
         except Exception as e:
-            logger.error(f"채팅 메시지 처리 실패: {str(e)}")
+            logger.error("채팅 메시지 처리 실패: %s", e)
             return ChatResponse(
                 success=False,
                 message="죄송합니다. 처리 중 오류가 발생했습니다.",
@@ -83,7 +83,7 @@ class PickChatbotService(BaseService):
                 return ChatSession(**session_data)
             return None
         except Exception as e:
-            logger.error(f"세션 조회 실패: {str(e)}")
+            logger.error("세션 조회 실패: %s", e)
             return None
 
     async def delete_session(self, session_id: str) -> bool:
@@ -94,7 +94,7 @@ class PickChatbotService(BaseService):
                 del self.sessions[session_id]
             return result.deleted_count > 0
         except Exception as e:
-            logger.error(f"세션 삭제 실패: {str(e)}")
+            logger.error("세션 삭제 실패: %s", e)
             return False
 
     async def create_job_posting(self, message: str) -> Dict[str, Any]:
@@ -125,7 +125,7 @@ class PickChatbotService(BaseService):
             }
 
         except Exception as e:
-            logger.error(f"채용공고 생성 실패: {str(e)}")
+            logger.error("채용공고 생성 실패: %s", e)
             return {
                 "success": False,
                 "message": f"채용공고 생성 중 오류가 발생했습니다: {str(e)}"
@@ -159,7 +159,7 @@ class PickChatbotService(BaseService):
             }
 
         except Exception as e:
-            logger.error(f"지원자 관리 실패: {str(e)}")
+            logger.error("지원자 관리 실패: %s", e)
             return {
                 "success": False,
                 "message": f"지원자 관리 중 오류가 발생했습니다: {str(e)}"
@@ -189,7 +189,7 @@ class PickChatbotService(BaseService):
             }
 
         except Exception as e:
-            logger.error(f"이력서 업로드 실패: {str(e)}")
+            logger.error("이력서 업로드 실패: %s", e)
             return {
                 "success": False,
                 "message": f"이력서 업로드 중 오류가 발생했습니다: {str(e)}"
@@ -216,7 +216,7 @@ class PickChatbotService(BaseService):
             }
 
         except Exception as e:
-            logger.error(f"이력서 검색 실패: {str(e)}")
+            logger.error("이력서 검색 실패: %s", e)
             return {
                 "success": False,
                 "message": f"이력서 검색 중 오류가 발생했습니다: {str(e)}"
@@ -241,7 +241,7 @@ class PickChatbotService(BaseService):
             }
 
         except Exception as e:
-            logger.error(f"AI 분석 실패: {str(e)}")
+            logger.error("AI 분석 실패: %s", e)
             return {
                 "success": False,
                 "message": f"AI 분석 중 오류가 발생했습니다: {str(e)}"
@@ -252,7 +252,7 @@ class PickChatbotService(BaseService):
         import time
         start_time = time.time()
 
-        logger.info(f"🔍 [GitHub 분석 서비스] 시작 - 사용자: {request.username}")
+        logger.info("🔍 [GitHub 분석 서비스] 시작 - 사용자: %s", request.username)
 
         try:
             # GitHub 사용자명 추출
@@ -261,43 +261,43 @@ class PickChatbotService(BaseService):
             if not username:
                 raise ValueError("GitHub 사용자명을 찾을 수 없습니다.")
             extract_time = time.time() - extract_start
-            logger.info(f"📝 [사용자명 추출] 완료: {username} (소요시간: {extract_time:.3f}초)")
+            logger.info("📝 [사용자명 추출] 완료: %s (소요시간: %.3f초)", username, extract_time)
 
             # GitHub API 호출 (실제 구현에서는 GitHub API 사용)
             profile_start = time.time()
             profile_info = await self._get_github_profile(username)
             profile_time = time.time() - profile_start
-            logger.info(f"👤 [프로필 조회] 완료 (소요시간: {profile_time:.3f}초)")
+            logger.info("👤 [프로필 조회] 완료 (소요시간: %.3f초)", profile_time)
 
             repos_start = time.time()
             repositories = await self._get_github_repositories(username)
             repos_time = time.time() - repos_start
-            logger.info(f"📚 [레포지토리 조회] 완료: {len(repositories)}개 (소요시간: {repos_time:.3f}초)")
+            logger.info("📚 [레포지토리 조회] 완료: %s개 (소요시간: %.3f초)", len(repositories), repos_time)
 
             activity_start = time.time()
             activity_analysis = await self._analyze_github_activity(username)
             activity_time = time.time() - activity_start
-            logger.info(f"📈 [활동 분석] 완료 (소요시간: {activity_time:.3f}초)")
+            logger.info("📈 [활동 분석] 완료 (소요시간: %.3f초)", activity_time)
 
             skills_start = time.time()
             skill_analysis = await self._analyze_github_skills(repositories)
             skills_time = time.time() - skills_start
-            logger.info(f"🔧 [기술 분석] 완료 (소요시간: {skills_time:.3f}초)")
+            logger.info("🔧 [기술 분석] 완료 (소요시간: %.3f초)", skills_time)
 
             # 종합 점수 계산
             score_start = time.time()
             overall_score = self._calculate_overall_score(profile_info, repositories, activity_analysis, skill_analysis)
             score_time = time.time() - score_start
-            logger.info(f"📊 [점수 계산] 완료: {overall_score:.2f}/10 (소요시간: {score_time:.3f}초)")
+            logger.info("📊 [점수 계산] 완료: %.2f/10 (소요시간: %.3f초)", overall_score, score_time)
 
             # 권장사항 생성
             rec_start = time.time()
             recommendations = self._generate_recommendations(profile_info, repositories, activity_analysis, skill_analysis)
             rec_time = time.time() - rec_start
-            logger.info(f"💡 [권장사항 생성] 완료: {len(recommendations)}개 (소요시간: {rec_time:.3f}초)")
+            logger.info("💡 [권장사항 생성] 완료: %s개 (소요시간: %.3f초)", len(recommendations), rec_time)
 
             total_time = time.time() - start_time
-            logger.info(f"🎉 [GitHub 분석 전체 완료] 총 소요시간: {total_time:.3f}초")
+            logger.info("🎉 [GitHub 분석 전체 완료] 총 소요시간: %.3f초", total_time)
 
             return GitHubAnalysisResult(
                 username=username,
@@ -310,13 +310,13 @@ class PickChatbotService(BaseService):
             )
         except Exception as e:
             error_time = time.time() - start_time
-            logger.error(f"❌ [GitHub 분석 실패] 소요시간: {error_time:.3f}초, 오류: {str(e)}")
+            logger.error("❌ [GitHub 분석 실패] 소요시간: %.3f초, 오류: %s", error_time, e)
 
             # 상세 오류 정보 로깅
-            logger.error(f"🔍 [오류 상세]:")
-            logger.error(f"    📝 사용자명: {request.username}")
-            logger.error(f"    🔍 오류 타입: {type(e).__name__}")
-            logger.error(f"    📄 오류 메시지: {str(e)}")
+            logger.error("🔍 [오류 상세]:")
+            logger.error("    📝 사용자명: %s", request.username)
+            logger.error("    🔍 오류 타입: %s", type(e).__name__)
+            logger.error("    📄 오류 메시지: %s", e)
 
             raise HTTPException(status_code=500, detail=f"GitHub 분석에 실패했습니다: {str(e)}")
 
@@ -347,7 +347,7 @@ class PickChatbotService(BaseService):
                 page_title=request.target_page
             )
         except Exception as e:
-            logger.error(f"페이지 네비게이션 실패: {str(e)}")
+            logger.error("페이지 네비게이션 실패: %s", e)
             return PageNavigationResult(
                 target_page=request.target_page,
                 navigation_success=False,
@@ -377,7 +377,7 @@ class PickChatbotService(BaseService):
                 execution_time=execution_time
             )
         except Exception as e:
-            logger.error(f"도구 실행 실패: {str(e)}")
+            logger.error("도구 실행 실패: %s", e)
             return ToolExecutionResult(
                 tool_type=request.tool_type,
                 success=False,
@@ -415,7 +415,7 @@ class PickChatbotService(BaseService):
                 total_messages=0
             )
         except Exception as e:
-            logger.error(f"세션 통계 조회 실패: {str(e)}")
+            logger.error("세션 통계 조회 실패: %s", e)
             raise HTTPException(status_code=500, detail="세션 통계 조회에 실패했습니다.")
 
     async def _manage_session(self, session_id: str, role: str, content: str):
@@ -3,8 +3,18 @@
 다른 프로젝트에서도 재사용 가능한 독립적인 토큰 사용량 모니터링 시스템
 """
 
+from .core.admission import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    AdmissionController,
+    AdmissionRejected,
+    estimate_message_tokens,
+    estimate_tokens,
+    llm_call_context,
+)
 from .core.auto_monitor import AutoTokenMonitor
 from .core.config import TokenMonitorConfig
+from .core.instrumentation import LLMInstrumentation, LLMRouteMiddleware
 from .core.monitor import TokenLimits, TokenMonitor, TokenUsage
 from .utils.aggregator import GlobalTokenMonitor, TokenUsageAggregator
 from .utils.export import TokenDataExporter
@@ -18,6 +28,8 @@ __author__ = "HireMe Team"
 default_config = TokenMonitorConfig()
 token_monitor = TokenMonitor(config=default_config)
 auto_monitor = AutoTokenMonitor(token_monitor=token_monitor)
+admission_controller = AdmissionController(token_monitor=token_monitor)
+llm_instrumentation = LLMInstrumentation(token_monitor=token_monitor)
 
 __all__ = [
     "TokenMonitor",
@@ -31,7 +43,18 @@ __all__ = [
     "GlobalTokenMonitor",
     "TokenSyncService",
     "ProjectTokenSync",
+    "AdmissionController",
+    "AdmissionRejected",
+    "PRIORITY_BATCH",
+    "PRIORITY_INTERACTIVE",
+    "estimate_tokens",
+    "estimate_message_tokens",
+    "llm_call_context",
+    "LLMInstrumentation",
+    "LLMRouteMiddleware",
     "token_monitor",
     "auto_monitor",
+    "admission_controller",
+    "llm_instrumentation",
     "default_config"
 ]
@@ -0,0 +1,286 @@
+"""
+LLM 호출 전 허용 제어 (admission control)
+
+호출 전에 토큰 수를 추정해 모델별/프로젝트별 토큰 버킷(분당 토큰, 분당 요청)에서 차감하고,
+버킷이 비어 있으면 채워질 때까지 기다립니다. 사용량은 호출 후 실제 토큰 수로 정산합니다.
+
+- 우선순위: 대화(interactive)가 기본, 일괄 분석/백필은 llm_call_context(priority="batch") 로 표시
+  batch 는 분당 한도의 batch_reserve_ratio 만큼을 대화용으로 남겨두고, 대화 요청이 대기 중이면 양보
+- 월 한도: budget_degrade_threshold 이상이면 batch 는 거절, 대화는 응답 길이를 줄여 허용, 한도 초과 시 모두 거절
+"""
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .config import TokenMonitorConfig
+from .monitor import TokenMonitor
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BATCH = "batch"
+
+# 메시지마다 붙는 역할/구분자 토큰 (OpenAI 채팅 형식 기준 근사값)
+MESSAGE_OVERHEAD_TOKENS = 4
+# 대기 중 버킷 재확인 최대 간격 (초)
+MAX_WAIT_STEP = 0.5
+# 월 사용량 조회 캐시 (초)
+BUDGET_CACHE_SECONDS = 5.0
+
+_call_context: ContextVar[Dict[str, Optional[str]]] = ContextVar("llm_call_context", default={})
+_encodings: Dict[str, Any] = {}
+
+
+class AdmissionRejected(Exception):
+    """한도/예산 때문에 호출을 허용하지 않음"""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+@contextmanager
+def llm_call_context(priority: Optional[str] = None, project_id: Optional[str] = None):
+    """블록 안의 LLM/임베딩 호출에 우선순위/프로젝트 지정 (asyncio 태스크로 전파됨)"""
+    current = dict(_call_context.get())
+    if priority is not None:
+        current["priority"] = priority
+    if project_id is not None:
+        current["project_id"] = project_id
+    token = _call_context.set(current)
+    try:
+        yield
+    finally:
+        _call_context.reset(token)
+
+
+def current_call_context() -> Dict[str, Optional[str]]:
+    context = _call_context.get()
+    return {
+        "priority": context.get("priority") or PRIORITY_INTERACTIVE,
+        "project_id": context.get("project_id")
+    }
+
+
+def _get_encoding(model: str):
+    """모델 토크나이저 (tiktoken 이 없거나 인코딩을 받을 수 없으면 None, 결과는 캐시)"""
+    if tiktoken is None:
+        return None
+    if model not in _encodings:
+        try:
+            _encodings[model] = tiktoken.encoding_for_model(model)
+        except KeyError:
+            try:
+                _encodings[model] = tiktoken.get_encoding("o200k_base")
+            except Exception:
+                _encodings[model] = None
+        except Exception:
+            _encodings[model] = None
+    return _encodings[model]
+
+
+def estimate_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """텍스트 토큰 수 추정 (토크나이저가 없으면 UTF-8 3바이트당 1토큰, 한글/영문 모두 넉넉하게 잡힘)"""
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return len(text.encode("utf-8")) // 3 + 1
+
+
+def estimate_message_tokens(messages: List[Dict[str, str]], model: str = "gpt-4o-mini") -> int:
+    return sum(
+        estimate_tokens(message.get("content") or "", model) + MESSAGE_OVERHEAD_TOKENS
+        for message in messages
+    ) + 2
+
+
+class TokenBucket:
+    """분당 한도 토큰 버킷 (잠금은 호출하는 쪽에서 보유)"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float, reserve: float = 0.0) -> float:
+        """amount 를 꺼내고도 reserve(용량 비율) 이상 남을 때까지 걸리는 시간"""
+        missing = amount + self.capacity * reserve - self.level
+        return max(0.0, missing / self.rate) if self.rate > 0 else float("inf")
+
+
+@dataclass
+class Admission:
+    """허용된 호출 (호출 후 settle 로 실제 토큰 수 정산)"""
+    model: str
+    project_id: Optional[str]
+    priority: str
+    reserved_tokens: int
+    max_tokens: int
+    degraded: bool = False
+    waited_seconds: float = 0.0
+
+
+class AdmissionController:
+    """모델별/프로젝트별 토큰 버킷과 월 예산으로 LLM 호출을 허용/대기/거절
+
+    스레드 잠금과 짧은 asyncio.sleep 으로 기다리므로 여러 이벤트 루프/스레드에서 같이 써도 됩니다.
+    """
+
+    def __init__(self, token_monitor: TokenMonitor, config: Optional[TokenMonitorConfig] = None):
+        self.token_monitor = token_monitor
+        self.config = config or token_monitor.config
+        self._lock = threading.Lock()
+        self._model_tokens: Dict[str, TokenBucket] = {}
+        self._model_requests: Dict[str, TokenBucket] = {}
+        self._project_tokens: Dict[str, TokenBucket] = {}
+        self._interactive_waiting: Dict[str, int] = {}
+        self._budget_ratio = 0.0
+        self._budget_checked_at = 0.0
+        self.stats = {"admitted": 0, "waited": 0, "degraded": 0, "rejected": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.admission_enabled
+
+    def _buckets(self, model: str, project_id: Optional[str]) -> List[TokenBucket]:
+        """모델 토큰 버킷 (+ 프로젝트 토큰 버킷), self._lock 보유 상태에서 호출"""
+        if model not in self._model_tokens:
+            self._model_tokens[model] = TokenBucket(self.token_monitor.limits.per_minute_limit)
+            self._model_requests[model] = TokenBucket(self.token_monitor.limits.requests_per_minute)
+        buckets = [self._model_tokens[model]]
+        if project_id and self.config.project_per_minute_limit > 0:
+            if project_id not in self._project_tokens:
+                self._project_tokens[project_id] = TokenBucket(self.config.project_per_minute_limit)
+            buckets.append(self._project_tokens[project_id])
+        return buckets
+
+    def budget_ratio(self) -> float:
+        """월 한도 대비 사용 비율 (짧게 캐시)"""
+        now = time.monotonic()
+        if now - self._budget_checked_at >= BUDGET_CACHE_SECONDS:
+            monthly_limit = self.token_monitor.limits.monthly_limit
+            if monthly_limit > 0:
+                self._budget_ratio = self.token_monitor.get_monthly_usage()["total_tokens"] / monthly_limit
+            self._budget_checked_at = now
+        return self._budget_ratio
+
+    def _reject(self, reason: str, message: str) -> AdmissionRejected:
+        self.stats["rejected"] += 1
+        return AdmissionRejected(reason, message)
+
+    async def admit(self, model: str, prompt_tokens: int, max_tokens: int = 0,
+                    priority: Optional[str] = None, project_id: Optional[str] = None) -> Admission:
+        """토큰 버킷에서 (프롬프트 + 최대 응답) 토큰을 확보할 때까지 대기 후 허용
+
+        Raises:
+            AdmissionRejected: 월 한도 초과/근접(batch) 또는 admission_timeout 동안 확보 실패
+        """
+        context = current_call_context()
+        priority = priority or context["priority"]
+        project_id = project_id or context["project_id"]
+        is_batch = priority == PRIORITY_BATCH
+
+        if not self.enabled:
+            return Admission(model, project_id, priority, prompt_tokens + max_tokens, max_tokens)
+
+        degraded = False
+        ratio = self.budget_ratio()
+        if ratio >= 1.0:
+            raise self._reject("monthly_budget_exhausted", "이번 달 토큰 한도를 모두 사용했습니다.")
+        if ratio >= self.config.budget_degrade_threshold:
+            if is_batch:
+                raise self._reject("monthly_budget_near", "월 토큰 한도에 가까워 일괄 작업을 보류합니다.")
+            if max_tokens > self.config.degraded_max_tokens:
+                max_tokens = self.config.degraded_max_tokens
+                degraded = True
+
+        reserve = self.config.batch_reserve_ratio if is_batch else 0.0
+        started = time.monotonic()
+        deadline = started + self.config.admission_timeout
+        waiting = False
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    token_buckets = self._buckets(model, project_id)
+                    request_bucket = self._model_requests[model]
+                    # 버킷 용량보다 큰 요청은 용량만큼만 확보 (영원히 기다리지 않도록)
+                    # batch 는 예비분을 남겨야 하므로 (1 - reserve) 용량까지만
+                    usable = 1.0 - reserve
+                    amount = min(prompt_tokens + max_tokens, token_buckets[0].capacity * usable)
+                    wait = 0.0
+                    for bucket in token_buckets:
+                        bucket.refill(now)
+                        wait = max(wait, bucket.wait_time(min(amount, bucket.capacity * usable), reserve))
+                    request_bucket.refill(now)
+                    wait = max(wait, request_bucket.wait_time(1.0, reserve))
+                    yield_to_interactive = is_batch and self._interactive_waiting.get(model, 0) > 0
+
+                    if wait == 0.0 and not yield_to_interactive:
+                        for bucket in token_buckets:
+                            bucket.level -= min(amount, bucket.capacity * usable)
+                        request_bucket.level -= 1.0
+                        self.stats["admitted"] += 1
+                        if degraded:
+                            self.stats["degraded"] += 1
+                        return Admission(model, project_id, priority, int(amount), max_tokens, degraded,
+                                         round(now - started, 3))
+
+                    if not waiting:
+                        waiting = True
+                        self.stats["waited"] += 1
+                        if not is_batch:
+                            self._interactive_waiting[model] = self._interactive_waiting.get(model, 0) + 1
+
+                if now >= deadline:
+                    raise self._reject("rate_limited", "요청이 많아 잠시 후 다시 시도해주세요.")
+                await asyncio.sleep(min(wait or MAX_WAIT_STEP, MAX_WAIT_STEP, max(deadline - now, 0.01)))
+        finally:
+            if waiting and not is_batch:
+                with self._lock:
+                    self._interactive_waiting[model] -= 1
+
+    def settle(self, admission: Admission, actual_tokens: Optional[int]) -> None:
+        """실제 사용 토큰으로 정산 (추정보다 적게 쓰면 돌려주고, 많이 쓰면 더 차감)"""
+        if actual_tokens is None or not self.enabled:
+            return
+        difference = admission.reserved_tokens - actual_tokens
+        with self._lock:
+            for bucket in self._buckets(admission.model, admission.project_id):
+                bucket.level = min(bucket.capacity, bucket.level + difference)
+
+    def get_status(self) -> Dict[str, Any]:
+        """모델/프로젝트별 남은 분당 한도와 누적 통계"""
+        with self._lock:
+            now = time.monotonic()
+            for bucket in (*self._model_tokens.values(), *self._model_requests.values(),
+                           *self._project_tokens.values()):
+                bucket.refill(now)
+            return {
+                "enabled": self.enabled,
+                "budget_ratio": round(self._budget_ratio, 4),
+                "models": {
+                    model: {
+                        "tokens_available": int(bucket.level),
+                        "requests_available": int(self._model_requests[model].level),
+                        "interactive_waiting": self._interactive_waiting.get(model, 0)
+                    }
+                    for model, bucket in self._model_tokens.items()
+                },
+                "projects": {project_id: int(bucket.level) for project_id, bucket in self._project_tokens.items()},
+                "stats": dict(self.stats)
+            }
@@ -46,6 +46,18 @@ class TokenMonitorConfig:
     enable_file_logging: bool = field(default_factory=lambda: os.getenv("TOKEN_ENABLE_FILE_LOGGING", "true").lower() == "true")
     log_level: str = field(default_factory=lambda: os.getenv("TOKEN_LOG_LEVEL", "INFO"))
 
+    # 저장소 버퍼 설정 (사용 기록은 메모리에 모았다가 주기/건수 기준으로 파일에 추가)
+    storage_flush_interval: float = field(default_factory=lambda: float(os.getenv("TOKEN_STORAGE_FLUSH_SECONDS", "2.0")))
+    storage_flush_size: int = field(default_factory=lambda: int(os.getenv("TOKEN_STORAGE_FLUSH_RECORDS", "100")))
+
+    # 호출 전 허용 제어 (분당 한도는 모델별 토큰 버킷, 프로젝트별 한도는 0이면 사용 안 함)
+    admission_enabled: bool = field(default_factory=lambda: os.getenv("TOKEN_ADMISSION_ENABLED", "true").lower() == "true")
+    project_per_minute_limit: int = field(default_factory=lambda: int(os.getenv("TOKEN_PROJECT_PER_MINUTE_LIMIT", "0")))
+    batch_reserve_ratio: float = field(default_factory=lambda: float(os.getenv("TOKEN_BATCH_RESERVE_RATIO", "0.3")))  # 대화용으로 남겨둘 분당 한도 비율
+    admission_timeout: float = field(default_factory=lambda: float(os.getenv("TOKEN_ADMISSION_TIMEOUT_SECONDS", "30")))
+    budget_degrade_threshold: float = field(default_factory=lambda: float(os.getenv("TOKEN_BUDGET_DEGRADE_THRESHOLD", "0.95")))  # 월 한도 대비
+    degraded_max_tokens: int = field(default_factory=lambda: int(os.getenv("TOKEN_DEGRADED_MAX_TOKENS", "500")))
+
     # 데이터 보관 설정
     retention_days: int = field(default_factory=lambda: int(os.getenv("TOKEN_RETENTION_DAYS", "90")))  # 90일
     enable_compression: bool = field(default_factory=lambda: os.getenv("TOKEN_ENABLE_COMPRESSION", "false").lower() == "true")
@@ -81,6 +93,14 @@ class TokenMonitorConfig:
             "model_costs": self.model_costs,
             "enable_file_logging": self.enable_file_logging,
             "log_level": self.log_level,
+            "storage_flush_interval": self.storage_flush_interval,
+            "storage_flush_size": self.storage_flush_size,
+            "admission_enabled": self.admission_enabled,
+            "project_per_minute_limit": self.project_per_minute_limit,
+            "batch_reserve_ratio": self.batch_reserve_ratio,
+            "admission_timeout": self.admission_timeout,
+            "budget_degrade_threshold": self.budget_degrade_threshold,
+            "degraded_max_tokens": self.degraded_max_tokens,
             "retention_days": self.retention_days,
             "enable_compression": self.enable_compression
         }
@@ -121,5 +141,13 @@ class TokenMonitorConfig:
         self.webhook_url = os.getenv("TOKEN_WEBHOOK_URL", self.webhook_url)
         self.enable_file_logging = os.getenv("TOKEN_ENABLE_FILE_LOGGING", str(self.enable_file_logging)).lower() == "true"
         self.log_level = os.getenv("TOKEN_LOG_LEVEL", self.log_level)
+        self.storage_flush_interval = float(os.getenv("TOKEN_STORAGE_FLUSH_SECONDS", str(self.storage_flush_interval)))
+        self.storage_flush_size = int(os.getenv("TOKEN_STORAGE_FLUSH_RECORDS", str(self.storage_flush_size)))
+        self.admission_enabled = os.getenv("TOKEN_ADMISSION_ENABLED", str(self.admission_enabled)).lower() == "true"
+        self.project_per_minute_limit = int(os.getenv("TOKEN_PROJECT_PER_MINUTE_LIMIT", str(self.project_per_minute_limit)))
+        self.batch_reserve_ratio = float(os.getenv("TOKEN_BATCH_RESERVE_RATIO", str(self.batch_reserve_ratio)))
+        self.admission_timeout = float(os.getenv("TOKEN_ADMISSION_TIMEOUT_SECONDS", str(self.admission_timeout)))
+        self.budget_degrade_threshold = float(os.getenv("TOKEN_BUDGET_DEGRADE_THRESHOLD", str(self.budget_degrade_threshold)))
+        self.degraded_max_tokens = int(os.getenv("TOKEN_DEGRADED_MAX_TOKENS", str(self.degraded_max_tokens)))
         self.retention_days = int(os.getenv("TOKEN_RETENTION_DAYS", str(self.retention_days)))
         self.enable_compression = os.getenv("TOKEN_ENABLE_COMPRESSION", str(self.enable_compression)).lower() == "true"
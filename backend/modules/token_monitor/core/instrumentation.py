@@ -0,0 +1,234 @@
+"""
+LLM 클라이언트 호출 계측
+
+공용 OpenAI 클라이언트(동기/비동기)의 chat.completions.create / embeddings.create 를 감싸
+호출마다 토큰 수, 지연 시간, 모델, 호출 위치, HTTP 경로, 프롬프트 캐시 적중을 TokenMonitor 에 기록합니다.
+
+- 토큰 수는 응답의 usage 필드를 우선 사용하고, 없으면(스트리밍 등) 토크나이저 추정값 사용
+- 호출 위치(endpoint)는 클라이언트를 가진 모듈 바깥의 첫 호출 함수 (예: routers.pick_chatbot.extract_username_with_ai)
+- HTTP 경로(route)는 LLMRouteMiddleware 가 요청마다 기록한 라우트 경로
+- 클라이언트를 거치지 않는 호출(httpx 직접 호출, LangChain 등)은 record() 로 직접 기록
+"""
+import functools
+import inspect
+import sys
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Optional
+
+from .admission import current_call_context, estimate_message_tokens, estimate_tokens
+from .monitor import TokenMonitor
+
+_request_scope: ContextVar[Optional[Dict[str, Any]]] = ContextVar("llm_request_scope", default=None)
+
+# 호출 위치를 찾을 때 건너뛰는 라이브러리 모듈 접두사
+_LIBRARY_PREFIXES = ("asyncio", "concurrent", "threading", "contextlib", "functools", "openai", "httpx", "anyio")
+
+
+class LLMRouteMiddleware:
+    """요청 scope 를 컨텍스트에 두어 LLM 호출 기록에 라우트 경로를 남기는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_scope.reset(token)
+
+
+def current_route() -> Optional[str]:
+    """현재 요청의 라우트 경로 (라우팅 전이거나 요청 밖이면 실제 경로/None)"""
+    scope = _request_scope.get()
+    if scope is None:
+        return None
+    path = getattr(scope.get("route"), "path", None) or scope.get("path")
+    return f"{scope.get('method', '')} {path}".strip()
+
+
+def _usage_value(usage: Any, key: str) -> Optional[int]:
+    if usage is None:
+        return None
+    value = usage.get(key) if isinstance(usage, dict) else getattr(usage, key, None)
+    return value if isinstance(value, int) else None
+
+
+def _cached_tokens(usage: Any) -> int:
+    details = usage.get("prompt_tokens_details") if isinstance(usage, dict) else getattr(usage, "prompt_tokens_details", None)
+    return _usage_value(details, "cached_tokens") or 0
+
+
+def _response_text(response: Any) -> str:
+    """채팅 응답 본문 (추정용)"""
+    try:
+        return response.choices[0].message.content or ""
+    except (AttributeError, IndexError, TypeError):
+        return ""
+
+
+class InstrumentedStream:
+    """스트리밍 응답을 그대로 넘기면서 본문/usage 를 모아 끝날 때 기록"""
+
+    def __init__(self, stream, on_complete):
+        self._stream = stream
+        self._on_complete = on_complete
+        self._parts = []
+        self._usage = None
+        self._recorded = False
+
+    def _observe(self, chunk) -> None:
+        if getattr(chunk, "usage", None):
+            self._usage = chunk.usage
+        choices = getattr(chunk, "choices", None)
+        if choices and getattr(choices[0].delta, "content", None):
+            self._parts.append(choices[0].delta.content)
+
+    def _finish(self) -> None:
+        if not self._recorded:
+            self._recorded = True
+            self._on_complete(self._usage, "".join(self._parts))
+
+    def __iter__(self):
+        try:
+            for chunk in self._stream:
+                self._observe(chunk)
+                yield chunk
+        finally:
+            self._finish()
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                self._observe(chunk)
+                yield chunk
+        finally:
+            self._finish()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class LLMInstrumentation:
+    """LLM 호출 계측기 (TokenMonitor 당 1개)"""
+
+    def __init__(self, token_monitor: TokenMonitor):
+        self.token_monitor = token_monitor
+
+    def record(self, call_site: str, model: str, usage: Any = None, messages: Optional[Iterable[Dict]] = None,
+               prompt: Optional[str] = None, output_text: str = "", latency_ms: Optional[float] = None,
+               route: Optional[str] = None) -> None:
+        """호출 1건 기록 (usage 는 OpenAI usage 객체/딕셔너리, 없으면 messages/prompt/output_text 로 추정)"""
+        try:
+            input_tokens = _usage_value(usage, "prompt_tokens")
+            output_tokens = _usage_value(usage, "completion_tokens")
+            usage_source = "provider"
+            if input_tokens is None:
+                usage_source = "estimate"
+                if messages is not None:
+                    input_tokens = estimate_message_tokens(list(messages), model)
+                else:
+                    input_tokens = estimate_tokens(prompt or "", model)
+            if output_tokens is None:
+                # 임베딩 응답은 completion_tokens 가 없음 (total = prompt)
+                output_tokens = 0 if usage_source == "provider" else estimate_tokens(output_text, model)
+            cached_tokens = _cached_tokens(usage) if usage is not None else 0
+
+            context = current_call_context()
+            record = self.token_monitor.create_usage_record(
+                model=model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                endpoint=call_site,
+                project_id=context["project_id"],
+                route=route or current_route(),
+                latency_ms=round(latency_ms, 1) if latency_ms is not None else None,
+                cached_tokens=cached_tokens,
+                cache_hit=cached_tokens > 0,
+                usage_source=usage_source
+            )
+            self.token_monitor.log_usage(record)
+        except Exception as e:
+            # 계측 실패가 LLM 호출 결과에 영향을 주지 않도록 함
+            print(f"⚠️ LLM 사용량 기록 실패 ({call_site}): {e}")
+
+    @staticmethod
+    def _call_site(owner: str) -> str:
+        """클라이언트를 가진 모듈/라이브러리 바깥의 첫 호출 함수 (없으면 owner 안의 가장 바깥 함수)"""
+        frame = sys._getframe(2)
+        fallback = owner
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module == owner:
+                fallback = f"{module}.{frame.f_code.co_name}"
+            elif module != __name__ and not module.startswith(_LIBRARY_PREFIXES):
+                return f"{module}.{frame.f_code.co_name}"
+            frame = frame.f_back
+        return fallback
+
+    def _wrap(self, create, owner: str, kind: str):
+        def complete(call_site, route, kwargs, started, response=None, usage=None, output_text=None):
+            latency_ms = (time.perf_counter() - started) * 1000
+            if response is not None:
+                usage = getattr(response, "usage", None)
+                output_text = _response_text(response) if kind == "chat" else ""
+            self.record(
+                call_site,
+                kwargs.get("model", "unknown"),
+                usage=usage,
+                messages=kwargs.get("messages") if kind == "chat" else None,
+                prompt=None if kind == "chat" else _embedding_input_text(kwargs.get("input")),
+                output_text=output_text or "",
+                latency_ms=latency_ms,
+                route=route
+            )
+
+        def handle(result, call_site, route, kwargs, started):
+            if kwargs.get("stream"):
+                return InstrumentedStream(result, lambda usage, text: complete(
+                    call_site, route, kwargs, started, usage=usage, output_text=text))
+            complete(call_site, route, kwargs, started, response=result)
+            return result
+
+        async def finish(awaitable, call_site, route, kwargs, started):
+            # 성공한 응답만 기록 (usage/지연 시간은 await 이후 값, 스트림은 await 로 받은 뒤 감쌈)
+            return handle(await awaitable, call_site, route, kwargs, started)
+
+        # AsyncOpenAI 의 create 는 동기 데코레이터(required_args)로 감싸져 있어 iscoroutinefunction 이
+        # False 이므로, 함수 종류가 아니라 반환값이 awaitable 인지로 비동기 호출을 구분
+        @functools.wraps(create)
+        def instrumented(*args, **kwargs):
+            call_site, route, started = self._call_site(owner), current_route(), time.perf_counter()
+            result = create(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return finish(result, call_site, route, kwargs, started)
+            return handle(result, call_site, route, kwargs, started)
+
+        instrumented.__llm_instrumented__ = True
+        return instrumented
+
+    def instrument(self, client, owner: str):
+        """OpenAI/AsyncOpenAI 클라이언트의 채팅/임베딩 호출 계측 (같은 클라이언트에 여러 번 호출해도 1회만 적용)
+
+        Args:
+            client: openai.OpenAI 또는 openai.AsyncOpenAI 인스턴스
+            owner: 클라이언트를 가진 모듈 이름 (__name__), 호출 위치 판단 시 건너뜀
+        """
+        if client is None:
+            return client
+        for resource, kind in ((client.chat.completions, "chat"), (client.embeddings, "embedding")):
+            if not getattr(resource.create, "__llm_instrumented__", False):
+                resource.create = self._wrap(resource.create, owner, kind)
+        return client
+
+
+def _embedding_input_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return "\n".join(item for item in value if isinstance(item, str))
+    return ""
@@ -1,16 +1,13 @@
 """
 토큰 사용량 모니터링 핵심 클래스
 """
-import json
-import os
-import threading
-import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from .config import TokenMonitorConfig
+from .storage import UsageStore
 
 
 @dataclass
@@ -26,6 +23,12 @@ class TokenUsage:
     user_id: Optional[str] = None
     project_id: Optional[str] = None
     session_id: Optional[str] = None
+    # 호출 단위 계측 정보 (endpoint 는 호출 위치, route 는 HTTP 경로)
+    route: Optional[str] = None
+    latency_ms: Optional[float] = None
+    cached_tokens: int = 0
+    cache_hit: bool = False
+    usage_source: str = "provider"  # provider: API usage 필드, estimate: 토크나이저 추정
 
 @dataclass
 class TokenLimits:
@@ -55,128 +58,36 @@ class TokenMonitor:
             alert_threshold=self.config.alert_threshold
         )
 
-        self._lock = threading.Lock()
+        # append-only 저장소 (누적값은 메모리에서 갱신, flush 때 체크포인트)
+        self.store = UsageStore(
+            self.data_dir,
+            flush_interval=self.config.storage_flush_interval,
+            flush_size=self.config.storage_flush_size
+        )
 
     def log_usage(self, usage: TokenUsage):
-        """토큰 사용량 로깅"""
-        with self._lock:
-            # 일일 사용량 파일에 저장
-            today = datetime.now().strftime("%Y-%m-%d")
-            daily_file = self.data_dir / f"usage_{today}.json"
-
-            # 기존 데이터 로드
-            daily_usage = []
-            if daily_file.exists():
-                try:
-                    with open(daily_file, 'r', encoding='utf-8') as f:
-                        daily_usage = json.load(f)
-                except:
-                    daily_usage = []
-
-            # 새 사용량 추가
-            daily_usage.append(asdict(usage))
-
-            # 파일에 저장
-            with open(daily_file, 'w', encoding='utf-8') as f:
-                json.dump(daily_usage, f, ensure_ascii=False, indent=2)
-
-            # 월간 사용량도 업데이트
-            self._update_monthly_usage(usage)
-
-            # 프로젝트별 사용량 업데이트
-            if usage.project_id:
-                self._update_project_usage(usage)
-
-    def _update_monthly_usage(self, usage: TokenUsage):
-        """월간 사용량 업데이트"""
-        month = datetime.now().strftime("%Y-%m")
-        monthly_file = self.data_dir / f"monthly_{month}.json"
-
-        monthly_data = {"total_tokens": 0, "total_cost": 0.0, "usage_count": 0}
-        if monthly_file.exists():
-            try:
-                with open(monthly_file, 'r', encoding='utf-8') as f:
-                    monthly_data = json.load(f)
-            except:
-                pass
-
-        monthly_data["total_tokens"] += usage.total_tokens
-        monthly_data["total_cost"] += usage.cost_estimate
-        monthly_data["usage_count"] += 1
-
-        with open(monthly_file, 'w', encoding='utf-8') as f:
-            json.dump(monthly_data, f, ensure_ascii=False, indent=2)
-
-    def _update_project_usage(self, usage: TokenUsage):
-        """프로젝트별 사용량 업데이트"""
-        project_file = self.data_dir / f"project_{usage.project_id}.json"
-
-        project_data = {"total_tokens": 0, "total_cost": 0.0, "usage_count": 0, "last_updated": ""}
-        if project_file.exists():
-            try:
-                with open(project_file, 'r', encoding='utf-8') as f:
-                    project_data = json.load(f)
-            except:
-                pass
-
-        project_data["total_tokens"] += usage.total_tokens
-        project_data["total_cost"] += usage.cost_estimate
-        project_data["usage_count"] += 1
-        project_data["last_updated"] = datetime.now().isoformat()
+        """토큰 사용량 로깅 (메모리 버퍼에 추가, 일일/월간/프로젝트 누적값 즉시 반영)"""
+        self.store.append(asdict(usage))
 
-        with open(project_file, 'w', encoding='utf-8') as f:
-            json.dump(project_data, f, ensure_ascii=False, indent=2)
+    def flush(self):
+        """버퍼에 쌓인 사용 기록을 파일에 기록"""
+        self.store.flush()
 
     def get_daily_usage(self, date: Optional[str] = None) -> Dict:
-        """일일 사용량 조회"""
+        """일일 사용량 조회 (집계 인덱스 기반)"""
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
 
-        daily_file = self.data_dir / f"usage_{date}.json"
-
-        if not daily_file.exists():
-            return {
-                "date": date,
-                "total_tokens": 0,
-                "total_cost": 0.0,
-                "usage_count": 0,
-                "models": {},
-                "projects": {},
-                "limit_usage_percent": 0.0
-            }
-
-        with open(daily_file, 'r', encoding='utf-8') as f:
-            daily_usage = json.load(f)
-
-        total_tokens = sum(usage["total_tokens"] for usage in daily_usage)
-        total_cost = sum(usage["cost_estimate"] for usage in daily_usage)
-
-        # 모델별 사용량 집계
-        models = {}
-        projects = {}
-        for usage in daily_usage:
-            model = usage["model"]
-            if model not in models:
-                models[model] = {"tokens": 0, "cost": 0.0, "count": 0}
-            models[model]["tokens"] += usage["total_tokens"]
-            models[model]["cost"] += usage["cost_estimate"]
-            models[model]["count"] += 1
-
-            # 프로젝트별 집계
-            project_id = usage.get("project_id", "default")
-            if project_id not in projects:
-                projects[project_id] = {"tokens": 0, "cost": 0.0, "count": 0}
-            projects[project_id]["tokens"] += usage["total_tokens"]
-            projects[project_id]["cost"] += usage["cost_estimate"]
-            projects[project_id]["count"] += 1
+        rollup = self.store.get_daily(date)
+        total_tokens = rollup["total_tokens"]
 
         return {
             "date": date,
             "total_tokens": total_tokens,
-            "total_cost": total_cost,
-            "usage_count": len(daily_usage),
-            "models": models,
-            "projects": projects,
+            "total_cost": rollup["total_cost"],
+            "usage_count": rollup["usage_count"],
+            "models": rollup["models"],
+            "projects": rollup["projects"],
             "limit_usage_percent": (total_tokens / self.limits.daily_limit) * 100 if self.limits.daily_limit > 0 else 0
         }
 
@@ -185,9 +96,9 @@ class TokenMonitor:
         if month is None:
             month = datetime.now().strftime("%Y-%m")
 
-        monthly_file = self.data_dir / f"monthly_{month}.json"
+        monthly_data = self.store.get_monthly(month)
 
-        if not monthly_file.exists():
+        if monthly_data is None:
             return {
                 "month": month,
                 "total_tokens": 0,
@@ -196,9 +107,6 @@ class TokenMonitor:
                 "limit_usage_percent": 0.0
             }
 
-        with open(monthly_file, 'r', encoding='utf-8') as f:
-            monthly_data = json.load(f)
-
         monthly_data["limit_usage_percent"] = (monthly_data["total_tokens"] / self.limits.monthly_limit) * 100 if self.limits.monthly_limit > 0 else 0
         monthly_data["month"] = month
 
@@ -206,9 +114,9 @@ class TokenMonitor:
 
     def get_project_usage(self, project_id: str) -> Dict:
         """프로젝트별 사용량 조회"""
-        project_file = self.data_dir / f"project_{project_id}.json"
+        project_data = self.store.get_project(project_id)
 
-        if not project_file.exists():
+        if project_data is None:
             return {
                 "project_id": project_id,
                 "total_tokens": 0,
@@ -217,9 +125,6 @@ class TokenMonitor:
                 "last_updated": None
             }
 
-        with open(project_file, 'r', encoding='utf-8') as f:
-            project_data = json.load(f)
-
         return project_data
 
     def get_usage_summary(self) -> Dict:
@@ -267,8 +172,9 @@ class TokenMonitor:
 
     def create_usage_record(self, model: str, input_tokens: int, output_tokens: int,
                           endpoint: str, user_id: Optional[str] = None,
-                          project_id: Optional[str] = None, session_id: Optional[str] = None) -> TokenUsage:
-        """사용량 레코드 생성"""
+                          project_id: Optional[str] = None, session_id: Optional[str] = None,
+                          **call_info) -> TokenUsage:
+        """사용량 레코드 생성 (call_info: route, latency_ms, cached_tokens, cache_hit, usage_source)"""
         return TokenUsage(
             timestamp=datetime.now().isoformat(),
             model=model,
@@ -279,7 +185,8 @@ class TokenMonitor:
             endpoint=endpoint,
             user_id=user_id,
             project_id=project_id,
-            session_id=session_id
+            session_id=session_id,
+            **call_info
         )
 
     def cleanup_old_data(self):
@@ -289,20 +196,19 @@ class TokenMonitor:
 
         cutoff_date = datetime.now() - timedelta(days=self.config.retention_days)
 
-        # 일일 사용량 파일 정리
-        for file_path in self.data_dir.glob("usage_*.json"):
+        # 일일 사용 기록/집계 인덱스 정리
+        for date in self.store.dates():
             try:
-                file_date = datetime.strptime(file_path.stem.split("_")[1], "%Y-%m-%d")
-                if file_date < cutoff_date:
-                    file_path.unlink()
-            except:
+                if datetime.strptime(date, "%Y-%m-%d") < cutoff_date:
+                    self.store.remove_date(date)
+            except ValueError:
                 pass
 
-        # 월간 사용량 파일 정리
+        # 월간 사용량 정리
         for file_path in self.data_dir.glob("monthly_*.json"):
             try:
-                file_month = datetime.strptime(file_path.stem.split("_")[1], "%Y-%m")
-                if file_month < cutoff_date.replace(day=1):
-                    file_path.unlink()
-            except:
+                month = file_path.stem.split("_")[1]
+                if datetime.strptime(month, "%Y-%m") < cutoff_date.replace(day=1):
+                    self.store.remove_month(month)
+            except ValueError:
                 pass
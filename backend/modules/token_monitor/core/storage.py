@@ -0,0 +1,482 @@
+"""
+토큰 사용량 저장소
+- 사용 기록은 날짜별 JSON Lines 파일에 추가만 함 (메모리 버퍼를 주기/건수 기준으로 flush)
+- 일일/월간/프로젝트 누적값은 메모리에서 갱신하고 flush 때 체크포인트
+- 일일 조회는 집계 인덱스(daily_*.json)를 읽고, 인덱스 이후에 추가된 로그만 이어서 반영
+
+파일 구성 (data_dir):
+    usage_{YYYY-MM-DD}.jsonl   사용 기록 (1줄 1건)
+    usage_{YYYY-MM-DD}.json    이전 형식(JSON 배열) 사용 기록 - 읽기만 함
+    daily_{YYYY-MM-DD}.json    일일 집계 인덱스 (모델/프로젝트/엔드포인트별, 반영된 로그 오프셋 포함)
+    monthly_{YYYY-MM}.json     월간 누적 (기존 형식 유지)
+    project_{id}.json          프로젝트 누적 (기존 형식 유지)
+    usage_state.json           월간/프로젝트 누적값과 로그별 반영 오프셋 (재시작 시 복구 기준)
+"""
+import atexit
+import copy
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# 메모리에 유지하는 일일 집계 수 (flush 대기 중인 날짜는 제외하고 오래된 것부터 정리)
+MAX_CACHED_DAYS = 64
+
+
+def empty_rollup() -> Dict[str, Any]:
+    """빈 집계 (모델/프로젝트/엔드포인트별 tokens, cost, count)"""
+    return {"total_tokens": 0, "total_cost": 0.0, "usage_count": 0, "models": {}, "projects": {}, "endpoints": {}}
+
+
+def add_to_rollup(rollup: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """사용 기록 1건을 집계에 반영"""
+    tokens = record.get("total_tokens", 0)
+    cost = record.get("cost_estimate", 0.0)
+    rollup["total_tokens"] += tokens
+    rollup["total_cost"] += cost
+    rollup["usage_count"] += 1
+    for key, name in (("models", record.get("model") or "unknown"),
+                      ("projects", record.get("project_id") or "default"),
+                      ("endpoints", record.get("endpoint") or "unknown")):
+        bucket = rollup[key].setdefault(name, {"tokens": 0, "cost": 0.0, "count": 0})
+        bucket["tokens"] += tokens
+        bucket["cost"] += cost
+        bucket["count"] += 1
+
+
+def merge_rollups(target: Dict[str, Any], source: Dict[str, Any]) -> Dict[str, Any]:
+    """집계 병합 (target 에 누적)"""
+    target["total_tokens"] += source.get("total_tokens", 0)
+    target["total_cost"] += source.get("total_cost", 0.0)
+    target["usage_count"] += source.get("usage_count", 0)
+    for key in ("models", "projects", "endpoints"):
+        for name, values in source.get(key, {}).items():
+            bucket = target[key].setdefault(name, {"tokens": 0, "cost": 0.0, "count": 0})
+            bucket["tokens"] += values.get("tokens", 0)
+            bucket["cost"] += values.get("cost", 0.0)
+            bucket["count"] += values.get("count", 0)
+    return target
+
+
+def date_range(start_date: str, end_date: str) -> Iterator[str]:
+    """start_date ~ end_date (YYYY-MM-DD, 양끝 포함) 날짜 문자열"""
+    current = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    while current <= end:
+        yield current.strftime("%Y-%m-%d")
+        current += timedelta(days=1)
+
+
+def record_date(record: Dict[str, Any]) -> str:
+    timestamp = record.get("timestamp") or ""
+    return timestamp[:10] if len(timestamp) >= 10 else datetime.now().strftime("%Y-%m-%d")
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def _read_json(path: Path, default: Any = None) -> Any:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+class UsageStore:
+    """append-only 토큰 사용량 저장소 (프로세스 내 스레드 안전)
+
+    read_only=True 면 다른 프로세스가 쓰는 디렉토리를 집계용으로 읽기만 함 (파일을 고치거나 쓰지 않음)
+    """
+
+    state_file_name = "usage_state.json"
+
+    def __init__(self, data_dir, flush_interval: float = 2.0, flush_size: int = 100, read_only: bool = False):
+        self.data_dir = Path(data_dir)
+        self.read_only = read_only
+        if not read_only:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffer: List[Dict[str, Any]] = []
+        self._daily: Dict[str, Dict[str, Any]] = {}
+        self._monthly: Dict[str, Dict[str, Any]] = {}
+        self._projects: Dict[str, Dict[str, Any]] = {}
+        # 월간/프로젝트 누적값에 반영된 로그 바이트 수 (날짜별)
+        self._offsets: Dict[str, int] = {}
+        self._dirty_dates: set = set()
+        self._dirty_months: set = set()
+        self._dirty_projects: set = set()
+        self._loaded = False
+
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if not read_only:
+            atexit.register(self.close)
+
+    # ----- 경로 -----
+
+    def log_path(self, date: str) -> Path:
+        return self.data_dir / f"usage_{date}.jsonl"
+
+    def legacy_path(self, date: str) -> Path:
+        return self.data_dir / f"usage_{date}.json"
+
+    def daily_index_path(self, date: str) -> Path:
+        return self.data_dir / f"daily_{date}.json"
+
+    def dates(self) -> List[str]:
+        """기록이 있는 날짜 목록 (오름차순)"""
+        dates = {path.stem.split("_", 1)[1] for pattern in ("usage_*.jsonl", "usage_*.json")
+                 for path in self.data_dir.glob(pattern) if path.name != self.state_file_name}
+        with self._lock:
+            dates.update(record_date(record) for record in self._buffer)
+        return sorted(dates)
+
+    # ----- 로딩/복구 -----
+
+    def _ensure_loaded(self) -> None:
+        """누적값 로드 + 체크포인트 이후에 추가된 로그 반영 (self._lock 보유 상태에서 호출)"""
+        if self._loaded:
+            return
+        state = _read_json(self.data_dir / self.state_file_name)
+        if state is not None:
+            self._monthly = state.get("monthly", {})
+            self._projects = state.get("projects", {})
+            self._offsets = state.get("offsets", {})
+        else:
+            # 이전 형식 누적 파일에서 시작 (이전 형식 사용 기록은 이미 반영되어 있음)
+            for path in self.data_dir.glob("monthly_*.json"):
+                data = _read_json(path)
+                if isinstance(data, dict):
+                    self._monthly[path.stem.split("_", 1)[1]] = data
+            for path in self.data_dir.glob("project_*.json"):
+                data = _read_json(path)
+                if isinstance(data, dict):
+                    self._projects[path.stem.split("_", 1)[1]] = data
+
+        for path in self.data_dir.glob("usage_*.jsonl"):
+            date = path.stem.split("_", 1)[1]
+            offset = self._offsets.get(date, 0)
+            size = path.stat().st_size if self.read_only else self._repair_tail(path)
+            if size <= offset:
+                continue
+            for record in self._read_log(path, offset):
+                self._add_to_totals(record)
+            self._offsets[date] = size
+        self._loaded = True
+
+    @staticmethod
+    def _repair_tail(path: Path) -> int:
+        """중단된 쓰기로 남은 마지막 불완전한 줄 제거 후 파일 크기 반환"""
+        size = path.stat().st_size
+        if size == 0:
+            return 0
+        with open(path, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) == b"\n":
+                return size
+            # 마지막 줄바꿈 위치까지 자름
+            position = size
+            chunk = 4096
+            while position > 0:
+                start = max(0, position - chunk)
+                f.seek(start)
+                data = f.read(position - start)
+                index = data.rfind(b"\n")
+                if index >= 0:
+                    f.truncate(start + index + 1)
+                    return start + index + 1
+                position = start
+            f.truncate(0)
+            return 0
+
+    @staticmethod
+    def _read_log(path: Path, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def _add_to_totals(self, record: Dict[str, Any]) -> None:
+        tokens = record.get("total_tokens", 0)
+        cost = record.get("cost_estimate", 0.0)
+
+        month = record_date(record)[:7]
+        monthly = self._monthly.setdefault(month, {"total_tokens": 0, "total_cost": 0.0, "usage_count": 0})
+        monthly["total_tokens"] += tokens
+        monthly["total_cost"] += cost
+        monthly["usage_count"] += 1
+        self._dirty_months.add(month)
+
+        project_id = record.get("project_id")
+        if project_id:
+            project = self._projects.setdefault(
+                project_id, {"total_tokens": 0, "total_cost": 0.0, "usage_count": 0, "last_updated": ""}
+            )
+            project["total_tokens"] += tokens
+            project["total_cost"] += cost
+            project["usage_count"] += 1
+            project["last_updated"] = datetime.now().isoformat()
+            self._dirty_projects.add(project_id)
+
+    def _daily_rollup(self, date: str) -> Dict[str, Any]:
+        """일일 집계 (메모리 → 인덱스 + 이후 로그 → 전체 재계산 순, self._lock 보유 상태에서 호출)"""
+        rollup = self._daily.get(date)
+        if rollup is not None:
+            return rollup
+
+        log_path = self.log_path(date)
+        legacy_path = self.legacy_path(date)
+        log_size = log_path.stat().st_size if log_path.exists() else 0
+        legacy_size = legacy_path.stat().st_size if legacy_path.exists() else 0
+
+        index = _read_json(self.daily_index_path(date))
+        if (isinstance(index, dict) and index.get("legacy_size", 0) == legacy_size
+                and index.get("log_offset", 0) <= log_size):
+            rollup = index["rollup"]
+            offset = index.get("log_offset", 0)
+        else:
+            rollup = empty_rollup()
+            offset = 0
+            if legacy_path.exists():
+                for record in _read_json(legacy_path, []):
+                    add_to_rollup(rollup, record)
+            # 다음 flush 때 인덱스 기록
+            if (legacy_size or log_size) and not self.read_only:
+                self._dirty_dates.add(date)
+
+        if log_path.exists() and offset < log_size:
+            for record in self._read_log(log_path, offset):
+                add_to_rollup(rollup, record)
+            if not self.read_only:
+                self._dirty_dates.add(date)
+
+        self._daily[date] = rollup
+        self._evict_days()
+        return rollup
+
+    def _evict_days(self) -> None:
+        # flush 중에는 로그에 쓰는 중인 날짜가 있으므로 정리하지 않음
+        if len(self._daily) <= MAX_CACHED_DAYS or self._flush_lock.locked():
+            return
+        buffered = {record_date(record) for record in self._buffer}
+        for date in sorted(self._daily):
+            if len(self._daily) <= MAX_CACHED_DAYS:
+                break
+            if date not in self._dirty_dates and date not in buffered:
+                del self._daily[date]
+
+    # ----- 쓰기 -----
+
+    def append(self, record: Dict[str, Any], update_totals: bool = True) -> None:
+        """사용 기록 추가 (파일 쓰기는 flush 에서 일괄 처리)"""
+        if self.read_only:
+            raise PermissionError("읽기 전용 저장소에는 기록할 수 없습니다")
+        should_flush = False
+        with self._lock:
+            self._ensure_loaded()
+            date = record_date(record)
+            add_to_rollup(self._daily_rollup(date), record)
+            self._dirty_dates.add(date)
+            if update_totals:
+                self._add_to_totals(record)
+            self._buffer.append(record)
+            should_flush = len(self._buffer) >= self.flush_size
+            self._start_flusher()
+        if should_flush:
+            self.flush()
+
+    def _start_flusher(self) -> None:
+        if self._flusher is not None or self.flush_interval <= 0:
+            return
+        self._flusher = threading.Thread(target=self._flush_loop, name="token-usage-flusher", daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"❌ 토큰 사용량 flush 오류: {e}")
+
+    def flush(self) -> None:
+        """버퍼를 로그에 추가하고 누적값/인덱스 체크포인트 기록"""
+        if self.read_only:
+            return
+        with self._flush_lock:
+            with self._lock:
+                if not self._buffer and not (self._dirty_dates or self._dirty_months or self._dirty_projects):
+                    return
+                records, self._buffer = self._buffer, []
+                # 버퍼를 비운 시점의 누적값 = 이번 flush 후 파일 내용과 일치
+                daily = {date: copy.deepcopy(self._daily[date]) for date in self._dirty_dates if date in self._daily}
+                monthly = copy.deepcopy(self._monthly)
+                projects = copy.deepcopy(self._projects)
+                dirty_months, dirty_projects = set(self._dirty_months), set(self._dirty_projects)
+                self._dirty_dates.clear()
+                self._dirty_months.clear()
+                self._dirty_projects.clear()
+
+            try:
+                by_date: Dict[str, List[str]] = {}
+                for record in records:
+                    by_date.setdefault(record_date(record), []).append(json.dumps(record, ensure_ascii=False))
+                offsets = {}
+                for date, lines in by_date.items():
+                    with open(self.log_path(date), 'a', encoding='utf-8') as f:
+                        f.write("\n".join(lines) + "\n")
+                        offsets[date] = f.tell()
+            except OSError:
+                with self._lock:
+                    # 쓰지 못한 기록은 다음 flush 때 다시 시도
+                    self._buffer[:0] = records
+                    self._dirty_dates.update(daily)
+                    self._dirty_months.update(dirty_months)
+                    self._dirty_projects.update(dirty_projects)
+                raise
+
+            with self._lock:
+                self._offsets.update(offsets)
+                state_offsets = dict(self._offsets)
+
+            for date, rollup in daily.items():
+                log_path = self.log_path(date)
+                legacy_path = self.legacy_path(date)
+                _write_json_atomic(self.daily_index_path(date), {
+                    "date": date,
+                    "rollup": rollup,
+                    "log_offset": log_path.stat().st_size if log_path.exists() else 0,
+                    "legacy_size": legacy_path.stat().st_size if legacy_path.exists() else 0,
+                    "updated_at": datetime.now().isoformat()
+                })
+
+            _write_json_atomic(self.data_dir / self.state_file_name, {
+                "monthly": monthly,
+                "projects": projects,
+                "offsets": state_offsets,
+                "checkpointed_at": datetime.now().isoformat()
+            })
+            # 기존 형식 누적 파일도 갱신 (외부 도구 호환)
+            for month in dirty_months:
+                _write_json_atomic(self.data_dir / f"monthly_{month}.json", monthly[month])
+            for project_id in dirty_projects:
+                _write_json_atomic(self.data_dir / f"project_{project_id}.json", projects[project_id])
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=self.flush_interval + 1)
+        self._flusher = None
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"❌ 토큰 사용량 flush 오류: {e}")
+        self._stop.clear()
+
+    # ----- 읽기 -----
+
+    def get_daily(self, date: str) -> Dict[str, Any]:
+        with self._lock:
+            return copy.deepcopy(self._daily_rollup(date))
+
+    def get_monthly(self, month: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._ensure_loaded()
+            data = self._monthly.get(month)
+            return dict(data) if data is not None else None
+
+    def get_project(self, project_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._ensure_loaded()
+            data = self._projects.get(project_id)
+            return dict(data) if data is not None else None
+
+    def iter_records(self, date: str, include_buffered: bool = True) -> Iterator[Dict[str, Any]]:
+        """날짜의 사용 기록을 순서대로 (이전 형식 → 로그 → 아직 flush 되지 않은 버퍼)"""
+        buffered = []
+        if include_buffered:
+            with self._lock:
+                buffered = [record for record in self._buffer if record_date(record) == date]
+        legacy_path = self.legacy_path(date)
+        if legacy_path.exists():
+            yield from _read_json(legacy_path, [])
+        log_path = self.log_path(date)
+        if log_path.exists():
+            yield from self._read_log(log_path)
+        yield from buffered
+
+    # ----- 가져오기/정리 -----
+
+    def import_records(self, records: List[Dict[str, Any]], merge: bool = True) -> int:
+        """외부 기록 추가 (timestamp 중복 제외, 월간/프로젝트 누적값은 건드리지 않음)
+
+        merge=False 면 가져오는 기록이 있는 날짜의 기존 기록을 지우고 교체합니다.
+        """
+        by_date: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            by_date.setdefault(record_date(record), []).append(record)
+
+        imported = 0
+        for date, date_records in by_date.items():
+            if not merge:
+                self.remove_date(date)
+            existing = {record.get("timestamp") for record in self.iter_records(date)}
+            for record in date_records:
+                if record.get("timestamp") in existing:
+                    continue
+                existing.add(record.get("timestamp"))
+                self.append(record, update_totals=False)
+                imported += 1
+        self.flush()
+        return imported
+
+    def merge_monthly(self, month: str, data: Dict[str, Any], merge: bool = True) -> None:
+        """월간 누적값 가져오기 (merge=False 면 교체)"""
+        with self._lock:
+            self._ensure_loaded()
+            current = self._monthly.get(month) if merge else None
+            if current is None:
+                self._monthly[month] = {
+                    "total_tokens": data.get("total_tokens", 0),
+                    "total_cost": data.get("total_cost", 0.0),
+                    "usage_count": data.get("usage_count", 0)
+                }
+            else:
+                current["total_tokens"] += data.get("total_tokens", 0)
+                current["total_cost"] += data.get("total_cost", 0.0)
+                current["usage_count"] += data.get("usage_count", 0)
+            self._dirty_months.add(month)
+        self.flush()
+
+    def remove_date(self, date: str) -> None:
+        """날짜의 기록/인덱스 삭제 (보관 기간 정리, 교체 가져오기)"""
+        with self._lock:
+            self._buffer = [record for record in self._buffer if record_date(record) != date]
+            self._daily.pop(date, None)
+            self._dirty_dates.discard(date)
+            self._offsets.pop(date, None)
+            for path in (self.log_path(date), self.legacy_path(date), self.daily_index_path(date)):
+                if path.exists():
+                    path.unlink()
+
+    def remove_month(self, month: str) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            self._monthly.pop(month, None)
+            self._dirty_months.discard(month)
+            path = self.data_dir / f"monthly_{month}.json"
+            if path.exists():
+                path.unlink()
@@ -9,6 +9,7 @@ from typing import Dict, List, Optional
 
 from ..core.config import TokenMonitorConfig
 from ..core.monitor import TokenMonitor
+from ..core.storage import UsageStore, date_range, empty_rollup, merge_rollups
 
 
 class TokenUsageAggregator:
@@ -19,72 +20,59 @@ class TokenUsageAggregator:
         self.aggregated_data_dir = Path(aggregated_data_dir)
         self.aggregated_data_dir.mkdir(parents=True, exist_ok=True)
 
+    def _project_stores(self):
+        """(프로젝트 이름, 읽기 전용 저장소) - 다른 프로세스가 쓰는 중이어도 파일을 건드리지 않음
+
+        호출마다 새로 열어 최신 인덱스/로그를 읽음 (날짜별 집계 인덱스 + 그 이후 로그만 읽으므로 가벼움)
+        """
+        for project_dir in self.projects_data_dirs:
+            project_path = Path(project_dir)
+            if project_path.exists():
+                yield project_path.name, UsageStore(project_path, flush_interval=0, read_only=True)
+
     def aggregate_daily_usage(self, date: Optional[str] = None) -> Dict:
         """여러 프로젝트의 일일 사용량을 통합"""
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
+        return {"date": date, **self._aggregate_dates(date, date)}
 
-        aggregated_data = {
-            "date": date,
-            "total_tokens": 0,
-            "total_cost": 0.0,
-            "usage_count": 0,
-            "models": {},
-            "projects": {},
-            "endpoints": {}
-        }
+    def aggregate_range(self, start_date: str, end_date: str) -> Dict:
+        """기간(양끝 포함) 사용량 통합"""
+        return {"start_date": start_date, "end_date": end_date, **self._aggregate_dates(start_date, end_date)}
 
-        for project_dir in self.projects_data_dirs:
-            project_path = Path(project_dir)
-            if not project_path.exists():
-                continue
+    def _aggregate_dates(self, start_date: str, end_date: str) -> Dict:
+        """기간 집계
 
-            daily_file = project_path / f"usage_{date}.json"
-            if not daily_file.exists():
-                continue
+        사용 기록을 모두 읽지 않고 flush 시점에 기록된 날짜별 집계(모델/엔드포인트별 포함)를 병합하므로
+        메모리 사용량이 기록 수와 무관함. projects 는 데이터 디렉토리(프로젝트) 단위
+        """
+        aggregated = empty_rollup()
+        projects = {}
 
+        for project_name, store in self._project_stores():
             try:
-                with open(daily_file, 'r', encoding='utf-8') as f:
-                    daily_usage = json.load(f)
-
-                project_name = project_path.name
-
-                for usage in daily_usage:
-                    # 총합 계산
-                    aggregated_data["total_tokens"] += usage.get("total_tokens", 0)
-                    aggregated_data["total_cost"] += usage.get("cost_estimate", 0.0)
-                    aggregated_data["usage_count"] += 1
-
-                    # 모델별 집계
-                    model = usage.get("model", "unknown")
-                    if model not in aggregated_data["models"]:
-                        aggregated_data["models"][model] = {"tokens": 0, "cost": 0.0, "count": 0}
-                    aggregated_data["models"][model]["tokens"] += usage.get("total_tokens", 0)
-                    aggregated_data["models"][model]["cost"] += usage.get("cost_estimate", 0.0)
-                    aggregated_data["models"][model]["count"] += 1
-
-                    # 프로젝트별 집계
-                    if project_name not in aggregated_data["projects"]:
-                        aggregated_data["projects"][project_name] = {"tokens": 0, "cost": 0.0, "count": 0}
-                    aggregated_data["projects"][project_name]["tokens"] += usage.get("total_tokens", 0)
-                    aggregated_data["projects"][project_name]["cost"] += usage.get("cost_estimate", 0.0)
-                    aggregated_data["projects"][project_name]["count"] += 1
-
-                    # 엔드포인트별 집계
-                    endpoint = usage.get("endpoint", "unknown")
-                    if endpoint not in aggregated_data["endpoints"]:
-                        aggregated_data["endpoints"][endpoint] = {"tokens": 0, "cost": 0.0, "count": 0}
-                    aggregated_data["endpoints"][endpoint]["tokens"] += usage.get("total_tokens", 0)
-                    aggregated_data["endpoints"][endpoint]["cost"] += usage.get("cost_estimate", 0.0)
-                    aggregated_data["endpoints"][endpoint]["count"] += 1
+                project_rollup = empty_rollup()
+                for date in date_range(start_date, end_date):
+                    merge_rollups(project_rollup, store.get_daily(date))
+                if not project_rollup["usage_count"]:
+                    continue
+
+                project_rollup["projects"] = {}
+                merge_rollups(aggregated, project_rollup)
+                projects[project_name] = {
+                    "tokens": project_rollup["total_tokens"],
+                    "cost": project_rollup["total_cost"],
+                    "count": project_rollup["usage_count"]
+                }
 
             except Exception as e:
-                print(f"❌ 프로젝트 {project_dir} 처리 오류: {e}")
+                print(f"❌ 프로젝트 {project_name} 처리 오류: {e}")
 
-        return aggregated_data
+        aggregated["projects"] = projects
+        return aggregated
 
     def aggregate_monthly_usage(self, month: Optional[str] = None) -> Dict:
-        """여러 프로젝트의 월간 사용량을 통합"""
+        """여러 프로젝트의 월간 사용량을 통합 (총합은 월간 누적값, 모델/엔드포인트별은 일일 집계 병합)"""
         if month is None:
             month = datetime.now().strftime("%Y-%m")
 
@@ -93,23 +81,20 @@ class TokenUsageAggregator:
             "total_tokens": 0,
             "total_cost": 0.0,
             "usage_count": 0,
-            "projects": {}
+            "projects": {},
+            "models": {},
+            "endpoints": {}
         }
 
-        for project_dir in self.projects_data_dirs:
-            project_path = Path(project_dir)
-            if not project_path.exists():
-                continue
-
-            monthly_file = project_path / f"monthly_{month}.json"
-            if not monthly_file.exists():
-                continue
+        first_day = datetime.strptime(month, "%Y-%m")
+        last_day = (first_day + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        breakdown = empty_rollup()
 
+        for project_name, store in self._project_stores():
             try:
-                with open(monthly_file, 'r', encoding='utf-8') as f:
-                    monthly_usage = json.load(f)
-
-                project_name = project_path.name
+                monthly_usage = store.get_monthly(month)
+                if monthly_usage is None:
+                    continue
 
                 # 총합 계산
                 aggregated_data["total_tokens"] += monthly_usage.get("total_tokens", 0)
@@ -123,9 +108,15 @@ class TokenUsageAggregator:
                     "count": monthly_usage.get("usage_count", 0)
                 }
 
+                # 모델/엔드포인트별 집계
+                for date in date_range(first_day.strftime("%Y-%m-%d"), last_day.strftime("%Y-%m-%d")):
+                    merge_rollups(breakdown, store.get_daily(date))
+
             except Exception as e:
-                print(f"❌ 프로젝트 {project_dir} 처리 오류: {e}")
+                print(f"❌ 프로젝트 {project_name} 처리 오류: {e}")
 
+        aggregated_data["models"] = breakdown["models"]
+        aggregated_data["endpoints"] = breakdown["endpoints"]
         return aggregated_data
 
     def save_aggregated_data(self, data: Dict, data_type: str, period: str):
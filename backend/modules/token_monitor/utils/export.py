@@ -2,13 +2,14 @@
 토큰 사용량 데이터 내보내기 유틸리티
 """
 import csv
+import io
 import json
 import zipfile
-from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Dict, TextIO
 
 from ..core.monitor import TokenMonitor
+from ..core.storage import date_range, empty_rollup, merge_rollups
 
 
 class TokenDataExporter:
@@ -17,54 +18,81 @@ class TokenDataExporter:
     def __init__(self, token_monitor: TokenMonitor):
         self.token_monitor = token_monitor
 
+    CSV_HEADER = [
+        'Date', 'Model', 'Input Tokens', 'Output Tokens',
+        'Total Tokens', 'Cost', 'Endpoint', 'User ID', 'Project ID'
+    ]
+
+    def _build_export_data(self, start_date: str, end_date: str) -> Dict:
+        """JSON 내보내기 데이터 (일/월/프로젝트 집계만 포함하므로 기록 수와 무관한 크기)"""
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        end = datetime.strptime(end_date, "%Y-%m-%d")
+
+        export_data = {
+            "export_info": {
+                "start_date": start_date,
+                "end_date": end_date,
+                "exported_at": datetime.now().isoformat(),
+                "version": "1.0.0"
+            },
+            "daily_usage": [],
+            "monthly_usage": [],
+            "projects": []
+        }
+
+        # 일일 사용량 데이터 수집
+        for date_str in date_range(start_date, end_date):
+            daily_data = self.token_monitor.get_daily_usage(date_str)
+            if daily_data["total_tokens"] > 0:
+                export_data["daily_usage"].append(daily_data)
+
+        # 월간 사용량 데이터 수집
+        current_month = start.replace(day=1)
+        end_month = end.replace(day=1)
+        while current_month <= end_month:
+            month_str = current_month.strftime("%Y-%m")
+            monthly_data = self.token_monitor.get_monthly_usage(month_str)
+            if monthly_data["total_tokens"] > 0:
+                export_data["monthly_usage"].append(monthly_data)
+            if current_month.month == 12:
+                current_month = current_month.replace(year=current_month.year + 1, month=1)
+            else:
+                current_month = current_month.replace(month=current_month.month + 1)
+
+        # 프로젝트별 데이터 수집
+        for project_file in self.token_monitor.data_dir.glob("project_*.json"):
+            project_data = self.token_monitor.get_project_usage(project_file.stem.split("_", 1)[1])
+            if project_data:
+                export_data["projects"].append(project_data)
+
+        return export_data
+
+    def _write_csv_rows(self, csvfile: TextIO, start_date: str, end_date: str) -> int:
+        """사용 기록을 날짜별 로그에서 한 줄씩 읽어 CSV 로 기록 (전체를 메모리에 올리지 않음)"""
+        writer = csv.writer(csvfile)
+        writer.writerow(self.CSV_HEADER)
+
+        rows = 0
+        for date_str in date_range(start_date, end_date):
+            for usage in self.token_monitor.store.iter_records(date_str):
+                writer.writerow([
+                    usage.get('timestamp', ''),
+                    usage.get('model', ''),
+                    usage.get('input_tokens', 0),
+                    usage.get('output_tokens', 0),
+                    usage.get('total_tokens', 0),
+                    usage.get('cost_estimate', 0.0),
+                    usage.get('endpoint', ''),
+                    usage.get('user_id', ''),
+                    usage.get('project_id', '')
+                ])
+                rows += 1
+        return rows
+
     def export_to_json(self, start_date: str, end_date: str, output_file: str) -> bool:
         """JSON 형식으로 데이터 내보내기"""
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
-
-            export_data = {
-                "export_info": {
-                    "start_date": start_date,
-                    "end_date": end_date,
-                    "exported_at": datetime.now().isoformat(),
-                    "version": "1.0.0"
-                },
-                "daily_usage": [],
-                "monthly_usage": [],
-                "projects": []
-            }
-
-            # 일일 사용량 데이터 수집
-            current_date = start
-            while current_date <= end:
-                date_str = current_date.strftime("%Y-%m-%d")
-                daily_data = self.token_monitor.get_daily_usage(date_str)
-                if daily_data["total_tokens"] > 0:
-                    export_data["daily_usage"].append(daily_data)
-                current_date += timedelta(days=1)
-
-            # 월간 사용량 데이터 수집
-            current_month = start.replace(day=1)
-            end_month = end.replace(day=1)
-            while current_month <= end_month:
-                month_str = current_month.strftime("%Y-%m")
-                monthly_data = self.token_monitor.get_monthly_usage(month_str)
-                if monthly_data["total_tokens"] > 0:
-                    export_data["monthly_usage"].append(monthly_data)
-                if current_month.month == 12:
-                    current_month = current_month.replace(year=current_month.year + 1, month=1)
-                else:
-                    current_month = current_month.replace(month=current_month.month + 1)
-
-            # 프로젝트별 데이터 수집
-            for project_file in self.token_monitor.data_dir.glob("project_*.json"):
-                try:
-                    with open(project_file, 'r', encoding='utf-8') as f:
-                        project_data = json.load(f)
-                    export_data["projects"].append(project_data)
-                except:
-                    pass
+            export_data = self._build_export_data(start_date, end_date)
 
             # 파일로 저장
             with open(output_file, 'w', encoding='utf-8') as f:
@@ -79,42 +107,8 @@ class TokenDataExporter:
     def export_to_csv(self, start_date: str, end_date: str, output_file: str) -> bool:
         """CSV 형식으로 데이터 내보내기"""
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
-
             with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-
-                # 헤더 작성
-                writer.writerow([
-                    'Date', 'Model', 'Input Tokens', 'Output Tokens',
-                    'Total Tokens', 'Cost', 'Endpoint', 'User ID', 'Project ID'
-                ])
-
-                # 일일 사용량 데이터 수집
-                current_date = start
-                while current_date <= end:
-                    date_str = current_date.strftime("%Y-%m-%d")
-                    daily_file = self.token_monitor.data_dir / f"usage_{date_str}.json"
-
-                    if daily_file.exists():
-                        with open(daily_file, 'r', encoding='utf-8') as f:
-                            daily_usage = json.load(f)
-
-                        for usage in daily_usage:
-                            writer.writerow([
-                                usage.get('timestamp', ''),
-                                usage.get('model', ''),
-                                usage.get('input_tokens', 0),
-                                usage.get('output_tokens', 0),
-                                usage.get('total_tokens', 0),
-                                usage.get('cost_estimate', 0.0),
-                                usage.get('endpoint', ''),
-                                usage.get('user_id', ''),
-                                usage.get('project_id', '')
-                            ])
-
-                    current_date += timedelta(days=1)
+                self._write_csv_rows(csvfile, start_date, end_date)
 
             return True
 
@@ -123,20 +117,18 @@ class TokenDataExporter:
             return False
 
     def export_to_zip(self, start_date: str, end_date: str, output_file: str) -> bool:
-        """ZIP 형식으로 전체 데이터 내보내기"""
+        """ZIP 형식으로 전체 데이터 내보내기 (임시 파일 없이 압축 항목에 바로 기록)"""
         try:
             with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
                 # JSON 데이터 추가
-                json_file = output_file.replace('.zip', '.json')
-                if self.export_to_json(start_date, end_date, json_file):
-                    zipf.write(json_file, 'token_usage.json')
-                    Path(json_file).unlink()  # 임시 파일 삭제
+                with zipf.open('token_usage.json', 'w') as entry:
+                    with io.TextIOWrapper(entry, encoding='utf-8') as f:
+                        json.dump(self._build_export_data(start_date, end_date), f, ensure_ascii=False, indent=2)
 
                 # CSV 데이터 추가
-                csv_file = output_file.replace('.zip', '.csv')
-                if self.export_to_csv(start_date, end_date, csv_file):
-                    zipf.write(csv_file, 'token_usage.csv')
-                    Path(csv_file).unlink()  # 임시 파일 삭제
+                with zipf.open('token_usage.csv', 'w', force_zip64=True) as entry:
+                    with io.TextIOWrapper(entry, encoding='utf-8', newline='') as f:
+                        self._write_csv_rows(f, start_date, end_date)
 
                 # 설정 파일 추가
                 config_data = self.token_monitor.config.to_dict()
@@ -155,58 +147,27 @@ class TokenDataExporter:
             return False
 
     def get_export_summary(self, start_date: str, end_date: str) -> Dict:
-        """내보내기 요약 정보"""
+        """내보내기 요약 정보 (flush 시점에 기록된 날짜별 집계 병합)"""
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.strptime(end_date, "%Y-%m-%d")
-
-            total_tokens = 0
-            total_cost = 0.0
-            total_requests = 0
-            models = {}
-            projects = {}
-
-            current_date = start
-            while current_date <= end:
-                date_str = current_date.strftime("%Y-%m-%d")
-                daily_file = self.token_monitor.data_dir / f"usage_{date_str}.json"
-
-                if daily_file.exists():
-                    with open(daily_file, 'r', encoding='utf-8') as f:
-                        daily_usage = json.load(f)
-
-                    for usage in daily_usage:
-                        total_tokens += usage.get('total_tokens', 0)
-                        total_cost += usage.get('cost_estimate', 0.0)
-                        total_requests += 1
-
-                        # 모델별 집계
-                        model = usage.get('model', 'unknown')
-                        if model not in models:
-                            models[model] = {"tokens": 0, "cost": 0.0, "requests": 0}
-                        models[model]["tokens"] += usage.get('total_tokens', 0)
-                        models[model]["cost"] += usage.get('cost_estimate', 0.0)
-                        models[model]["requests"] += 1
-
-                        # 프로젝트별 집계
-                        project = usage.get('project_id', 'default')
-                        if project not in projects:
-                            projects[project] = {"tokens": 0, "cost": 0.0, "requests": 0}
-                        projects[project]["tokens"] += usage.get('total_tokens', 0)
-                        projects[project]["cost"] += usage.get('cost_estimate', 0.0)
-                        projects[project]["requests"] += 1
-
-                current_date += timedelta(days=1)
+            rollup = empty_rollup()
+            for date_str in date_range(start_date, end_date):
+                merge_rollups(rollup, self.token_monitor.store.get_daily(date_str))
+
+            def with_requests(buckets: Dict) -> Dict:
+                return {
+                    name: {"tokens": values["tokens"], "cost": values["cost"], "requests": values["count"]}
+                    for name, values in buckets.items()
+                }
 
             return {
                 "period": {"start_date": start_date, "end_date": end_date},
                 "summary": {
-                    "total_tokens": total_tokens,
-                    "total_cost": total_cost,
-                    "total_requests": total_requests
+                    "total_tokens": rollup["total_tokens"],
+                    "total_cost": rollup["total_cost"],
+                    "total_requests": rollup["usage_count"]
                 },
-                "models": models,
-                "projects": projects
+                "models": with_requests(rollup["models"]),
+                "projects": with_requests(rollup["projects"])
             }
 
         except Exception as e:
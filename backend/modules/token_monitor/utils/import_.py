@@ -29,60 +29,22 @@ class TokenDataImporter:
                 return False
 
             imported_count = 0
+            store = self.token_monitor.store
 
-            # 일일 사용량 데이터 가져오기
+            # 일일 사용량 데이터 가져오기 (merge=True 면 timestamp 중복 제외 후 추가, False 면 날짜별 교체)
+            records = []
             for daily_data in data.get("daily_usage", []):
-                date = daily_data.get("date")
-                if not date:
+                if not daily_data.get("date"):
                     continue
-
-                daily_file = self.token_monitor.data_dir / f"usage_{date}.json"
-
-                if merge and daily_file.exists():
-                    # 기존 데이터와 병합
-                    with open(daily_file, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
-
-                    # 중복 제거 (timestamp 기준)
-                    existing_timestamps = {item.get('timestamp') for item in existing_data}
-                    new_items = [item for item in daily_data.get("usage_details", [])
-                               if item.get('timestamp') not in existing_timestamps]
-
-                    existing_data.extend(new_items)
-
-                    with open(daily_file, 'w', encoding='utf-8') as f:
-                        json.dump(existing_data, f, ensure_ascii=False, indent=2)
-                else:
-                    # 새로 생성
-                    usage_details = daily_data.get("usage_details", [])
-                    with open(daily_file, 'w', encoding='utf-8') as f:
-                        json.dump(usage_details, f, ensure_ascii=False, indent=2)
-
-                imported_count += len(daily_data.get("usage_details", []))
+                records.extend(daily_data.get("usage_details", []))
+            imported_count += store.import_records(records, merge)
 
             # 월간 사용량 데이터 가져오기
             for monthly_data in data.get("monthly_usage", []):
                 month = monthly_data.get("month")
                 if not month:
                     continue
-
-                monthly_file = self.token_monitor.data_dir / f"monthly_{month}.json"
-
-                if merge and monthly_file.exists():
-                    # 기존 데이터와 병합
-                    with open(monthly_file, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
-
-                    existing_data["total_tokens"] += monthly_data.get("total_tokens", 0)
-                    existing_data["total_cost"] += monthly_data.get("total_cost", 0.0)
-                    existing_data["usage_count"] += monthly_data.get("usage_count", 0)
-
-                    with open(monthly_file, 'w', encoding='utf-8') as f:
-                        json.dump(existing_data, f, ensure_ascii=False, indent=2)
-                else:
-                    # 새로 생성
-                    with open(monthly_file, 'w', encoding='utf-8') as f:
-                        json.dump(monthly_data, f, ensure_ascii=False, indent=2)
+                store.merge_monthly(month, monthly_data, merge)
 
             print(f"✅ JSON 데이터 가져오기 완료: {imported_count}개 레코드")
             return True
@@ -94,7 +56,7 @@ class TokenDataImporter:
     def import_from_csv(self, file_path: str, merge: bool = True) -> bool:
         """CSV 파일에서 데이터 가져오기"""
         try:
-            imported_count = 0
+            records = []
 
             with open(file_path, 'r', encoding='utf-8') as csvfile:
                 reader = csv.DictReader(csvfile)
@@ -105,16 +67,8 @@ class TokenDataImporter:
                     if not date:
                         continue
 
-                    daily_file = self.token_monitor.data_dir / f"usage_{date}.json"
-
-                    # 기존 데이터 로드
-                    daily_usage = []
-                    if daily_file.exists() and merge:
-                        with open(daily_file, 'r', encoding='utf-8') as f:
-                            daily_usage = json.load(f)
-
                     # 새 레코드 생성
-                    usage_record = {
+                    records.append({
                         "timestamp": row.get('Date', ''),
                         "model": row.get('Model', ''),
                         "input_tokens": int(row.get('Input Tokens', 0)),
@@ -124,16 +78,10 @@ class TokenDataImporter:
                         "endpoint": row.get('Endpoint', ''),
                         "user_id": row.get('User ID', ''),
                         "project_id": row.get('Project ID', '')
-                    }
-
-                    # 중복 체크 (timestamp 기준)
-                    if not any(item.get('timestamp') == usage_record['timestamp'] for item in daily_usage):
-                        daily_usage.append(usage_record)
-                        imported_count += 1
+                    })
 
-                    # 파일 저장
-                    with open(daily_file, 'w', encoding='utf-8') as f:
-                        json.dump(daily_usage, f, ensure_ascii=False, indent=2)
+            # 로그에 추가 (merge=True 면 timestamp 중복 제외, False 면 날짜별 교체)
+            imported_count = self.token_monitor.store.import_records(records, merge)
 
             print(f"✅ CSV 데이터 가져오기 완료: {imported_count}개 레코드")
             return True
@@ -34,8 +34,9 @@ class AIAnalyzer:
 
         if self.settings.llm_provider == "openai" and self.settings.openai_api_key:
             try:
+                from modules.token_monitor import llm_instrumentation
                 from openai import OpenAI
-                self.llm = OpenAI(api_key=self.settings.openai_api_key)
+                self.llm = llm_instrumentation.instrument(OpenAI(api_key=self.settings.openai_api_key), __name__)
                 logger.info("OpenAI LLM 설정 완료")
             except ImportError:
                 logger.warning("OpenAI 라이브러리가 설치되지 않았습니다.")
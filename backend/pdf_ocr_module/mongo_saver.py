@@ -3,8 +3,9 @@ import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from bson import ObjectId
 from models.applicant import ApplicantCreate
 from models.document import (
     Artifact,
@@ -16,14 +17,21 @@ from models.document import (
     ResumeCreate,
 )
 from modules.core.services.chunking_service import ChunkingService
+from modules.core.services.document_unit_of_work import DocumentUnitOfWork
 from modules.core.services.embedding_service import EmbeddingService
 from modules.core.services.mongo_service import MongoService
 from modules.core.services.vector_service import VectorService
 
+from .pdf_extractor import iter_page_texts
+
 
 class MongoSaver:
-    def __init__(self, mongo_uri: str = None):
+    def __init__(self, mongo_uri: str = None, use_transaction: Optional[bool] = None):
         self.mongo_service = MongoService(mongo_uri)
+        # 지원자 upsert + 문서 insert 를 트랜잭션으로 묶을지 여부 (레플리카셋 필요)
+        if use_transaction is None:
+            use_transaction = os.getenv("MONGO_SAVER_USE_TRANSACTION", "false").lower() == "true"
+        self.use_transaction = use_transaction
         self.chunking_service = ChunkingService()
         self.embedding_service = EmbeddingService()
         self.vector_service = VectorService()
@@ -146,8 +154,9 @@ class MongoSaver:
 
         # 동기식 OpenAI 클라이언트 사용
         try:
+            from modules.token_monitor import llm_instrumentation
             from openai import OpenAI
-            sync_client = OpenAI()
+            sync_client = llm_instrumentation.instrument(OpenAI(), __name__)
 
             ai_prompt = f"""다음은 자기소개서 텍스트입니다. 이 텍스트에서 다음 정보들을 추출해주세요:
 
@@ -209,85 +218,71 @@ class MongoSaver:
                            file_path: Optional[Path] = None) -> Dict[str, Any]:
         """이력서 OCR 결과를 저장합니다."""
         try:
-            # 1. 지원자 생성/조회
-            applicant = self.mongo_service.create_or_get_applicant_sync(applicant_data)
-
-            # 2. 파일 메타데이터 생성
+            # 1. 파일 메타데이터 생성
             file_metadata = {}
             if file_path:
                 file_metadata = self._create_file_metadata(file_path)
 
-            # 3. 기본 정보 추출
+            # 2. 기본 정보 추출
             basic_info = self._extract_basic_info_from_ocr(ocr_result)
 
-            # 4. 지원자 데이터에 기술 스택 정보 업데이트
-            if basic_info.get("skills"):
-                try:
-                    self.mongo_service.update_applicant_sync(
-                        applicant["id"],
-                        {"skills": ", ".join(basic_info["skills"])}
-                    )
-                    print(f"✅ 지원자 데이터에 기술 스택 업데이트: {basic_info['skills']}")
-                except Exception as e:
-                    print(f"⚠️ 기술 스택 업데이트 실패: {e}")
-
-            # 5. 이력서 데이터 생성 (application_id 제거)
-            resume_data = ResumeCreate(
-                applicant_id=applicant["id"],
-                extracted_text=ocr_result.get("extracted_text", ""),
-                summary=ocr_result.get("summary", ""),
-                keywords=ocr_result.get("keywords", []),
-                document_type="resume",
-                basic_info=basic_info,
-                file_metadata=file_metadata
-            )
+            # 재업로드면 기존 이력서 ID 를 그대로 사용 (청크 ID 가 유지되어 바뀐 청크만 다시 임베딩)
+            previous_resume = await self._find_previous_resume(applicant_data)
+            previous_chunks = (previous_resume or {}).get("chunks") or []
 
-            # 5. 이력서 저장
-            resume = self.mongo_service.create_resume(resume_data)
+            async with DocumentUnitOfWork(self.mongo_service, self.use_transaction) as uow:
+                # 3. 지원자 생성/조회 + 기술 스택 + resume_id 연결 (upsert 1회)
+                resume_id = previous_resume["_id"] if previous_resume else uow.new_document_id()
+                applicant = await uow.upsert_applicant(
+                    applicant_data, "resume", resume_id,
+                    skills=basic_info.get("skills"), merge_skills=False
+                )
 
-            # 6. 의미론적 청킹 적용
-            try:
-                # 지원자 데이터를 이력서 형태로 변환하여 청킹
-                if hasattr(applicant_data, 'dict'):
-                    applicant_dict = applicant_data.dict()
-                else:
-                    applicant_dict = applicant_data
-
-                resume_for_chunking = {
-                    "_id": resume["id"],
-                    "name": applicant_dict.get("name", "") or applicant.get("name", ""),
-                    "position": applicant_dict.get("position", "") or applicant.get("position", ""),
-                    "department": applicant_dict.get("department", "") or applicant.get("department", ""),
-                    "experience": applicant_dict.get("experience", "") or applicant.get("experience", ""),
-                    "skills": applicant_dict.get("skills", "") or applicant.get("skills", ""),
-                    "growthBackground": applicant_dict.get("growthBackground", "") or applicant.get("growthBackground", ""),
-                    "motivation": applicant_dict.get("motivation", "") or applicant.get("motivation", ""),
-                    "careerHistory": applicant_dict.get("careerHistory", "") or applicant.get("careerHistory", ""),
-                    "resume_text": ocr_result.get("extracted_text", "")
-                }
-
-                chunks = self.chunking_service.chunk_resume_text(resume_for_chunking)
-                print(f"✅ 의미론적 청킹 완료: {len(chunks)}개 청크 생성")
-
-                # 청킹 결과를 resume 데이터에 추가
-                if chunks:
-                    self.mongo_service.update_resume_chunks(resume["id"], chunks)
-
-                    # 벡터 DB에 저장 (이력서로 타입 통일)
-                    await self._save_chunks_to_vector_db(chunks, document_type="resume")
+                # 4. 이력서 데이터 생성 (application_id 제거)
+                resume_data = ResumeCreate(
+                    applicant_id=applicant["id"],
+                    extracted_text=ocr_result.get("extracted_text", ""),
+                    summary=ocr_result.get("summary", ""),
+                    keywords=ocr_result.get("keywords", []),
+                    document_type="resume",
+                    basic_info=basic_info,
+                    file_metadata=file_metadata
+                )
 
-            except Exception as e:
-                print(f"⚠️ 청킹 처리 실패: {e}")
+                # 5. 의미론적 청킹 적용
+                chunks = []
+                try:
+                    # 지원자 데이터를 이력서 형태로 변환하여 청킹
+                    if hasattr(applicant_data, 'dict'):
+                        applicant_dict = applicant_data.dict()
+                    else:
+                        applicant_dict = applicant_data
+                    resume_for_chunking = ChunkingService.build_resume_source(
+                        str(resume_id), applicant["applicant"], ocr_result.get("extracted_text", ""),
+                        overrides=applicant_dict
+                    )
 
-            # 7. 지원자 데이터에 resume_id 업데이트
-            try:
-                self.mongo_service.update_applicant_sync(
-                    applicant["id"],
-                    {"resume_id": str(resume["id"])}
+                    chunks = self.chunking_service.chunk_resume_text(resume_for_chunking)
+                    print(f"✅ 의미론적 청킹 완료: {len(chunks)}개 청크 생성")
+                except Exception as e:
+                    print(f"⚠️ 청킹 처리 실패: {e}")
+
+                # 6. 이력서 저장 (청크 포함 insert 1회, 재업로드면 같은 ID 로 교체)
+                resume = await uow.insert_document(
+                    "resume", resume_id, resume_data, chunks, replace=previous_resume is not None
                 )
-                print(f"✅ 지원자 데이터에 resume_id 업데이트: {str(resume['id'])}")
-            except Exception as e:
-                print(f"⚠️ resume_id 업데이트 실패: {e}")
+                print(f"✅ 이력서 저장 및 지원자 resume_id 연결: {resume['id']}")
+
+            # 7. 추가/변경된 청크만 벡터 DB에 저장, 사라진 청크는 삭제 (이력서로 타입 통일, MongoDB 커밋 이후)
+            if chunks or previous_chunks:
+                try:
+                    await self.mongo_service.sync_document_chunks(
+                        "resumes", str(resume_id), chunks, self.vector_service, self.embedding_service,
+                        document_type="resume", previous_chunks=previous_chunks, chunks_stored=True,
+                        chunking_service=self.chunking_service
+                    )
+                except Exception as e:
+                    print(f"[MongoSaver] 이력서 벡터 증분 저장 실패: {e}")
 
             return {
                 "applicant": self._dict_with_serialized_datetime(applicant),
@@ -298,6 +293,25 @@ class MongoSaver:
         except Exception as e:
             raise Exception(f"이력서 저장 실패: {str(e)}")
 
+    @staticmethod
+    def _pdf_text_source(file_path: Optional[Path]):
+        """PDF 파일이면 페이지별 텍스트 스트림, 아니면 None"""
+        if file_path is None or Path(file_path).suffix.lower() != ".pdf":
+            return None
+        return iter_page_texts(Path(file_path))
+
+    async def _find_previous_resume(self, applicant_data: Any) -> Optional[Dict[str, Any]]:
+        """같은 이메일 지원자의 기존 이력서 (_id, chunks), 없으면 None"""
+        applicant_dict = applicant_data.dict() if hasattr(applicant_data, 'dict') else applicant_data
+        email = applicant_dict.get("email")
+        if not email:
+            return None
+        applicant = await self.mongo_service.db.applicants.find_one({"email": email}, {"resume_id": 1})
+        resume_id = str((applicant or {}).get("resume_id") or "")
+        if not ObjectId.is_valid(resume_id):
+            return None
+        return await self.mongo_service.db.resumes.find_one({"_id": ObjectId(resume_id)}, {"chunks": 1})
+
     async def save_cover_letter_with_ocr(self,
                                  ocr_result: Dict[str, Any],
                                  applicant_data: ApplicantCreate,
@@ -305,100 +319,69 @@ class MongoSaver:
                                  file_path: Optional[Path] = None) -> Dict[str, Any]:
         """자기소개서 OCR 결과를 저장합니다."""
         try:
-            # 1. 지원자 생성/조회
-            applicant = self.mongo_service.create_or_get_applicant_sync(applicant_data)
-
-            # 2. 파일 메타데이터 생성
+            # 1. 파일 메타데이터 생성
             file_metadata = {}
             if file_path:
                 file_metadata = self._create_file_metadata(file_path)
 
-            # 3. 기본 정보 추출
+            # 2. 기본 정보 추출
             basic_info = self._extract_basic_info_from_ocr(ocr_result)
 
-            # 4. 자기소개서 특화 필드 추출 (AI 분석)
+            # 3. 자기소개서 특화 필드 추출 (AI 분석)
             cover_letter_fields = self._extract_cover_letter_fields(ocr_result.get("extracted_text", ""))
 
-            # 5. 지원자 데이터에 기술 스택 정보 업데이트 (기존 기술 스택에 추가)
-            if basic_info.get("skills"):
-                try:
-                    # 기존 기술 스택 가져오기
-                    existing_applicant = self.mongo_service.get_applicant_by_id_sync(applicant["id"])
-                    existing_skills = existing_applicant.get("skills", "") if existing_applicant else ""
-
-                    # 새로운 기술 스택과 기존 기술 스택 합치기
-                    new_skills = basic_info["skills"]
-                    if existing_skills:
-                        existing_skills_list = [s.strip() for s in existing_skills.split(",")]
-                        combined_skills = list(set(existing_skills_list + new_skills))
-                    else:
-                        combined_skills = new_skills
-
-                    # 지원자 정보 업데이트
-                    self.mongo_service.update_applicant_sync(
-                        applicant["id"],
-                        {"skills": ", ".join(combined_skills)}
-                    )
-                    print(f"✅ 지원자 데이터에 기술 스택 추가: {new_skills}")
-                except Exception as e:
-                    print(f"⚠️ 기술 스택 업데이트 실패: {e}")
-
-            # 6. 자기소개서 데이터 생성 (application_id 제거)
-            cover_letter_data = CoverLetterCreate(
-                applicant_id=applicant["id"],
-                extracted_text=ocr_result.get("extracted_text", ""),
-                summary=ocr_result.get("summary", ""),
-                keywords=ocr_result.get("keywords", []),
-                document_type="cover_letter",
-                basic_info=basic_info,
-                file_metadata=file_metadata,
-                careerHistory=cover_letter_fields["careerHistory"],
-                growthBackground=cover_letter_fields["growthBackground"],
-                motivation=cover_letter_fields["motivation"]
-            )
+            async with DocumentUnitOfWork(self.mongo_service, self.use_transaction) as uow:
+                # 4. 지원자 생성/조회 + 기술 스택 병합 + cover_letter_id 연결 (upsert 1회)
+                cover_letter_id = uow.new_document_id()
+                applicant = await uow.upsert_applicant(
+                    applicant_data, "cover_letter", cover_letter_id,
+                    skills=basic_info.get("skills"), merge_skills=True
+                )
 
-            # 5. 자기소개서 저장
-            cover_letter = self.mongo_service.create_cover_letter(cover_letter_data)
+                # 5. 자기소개서 데이터 생성 (application_id 제거)
+                cover_letter_data = CoverLetterCreate(
+                    applicant_id=applicant["id"],
+                    extracted_text=ocr_result.get("extracted_text", ""),
+                    summary=ocr_result.get("summary", ""),
+                    keywords=ocr_result.get("keywords", []),
+                    document_type="cover_letter",
+                    basic_info=basic_info,
+                    file_metadata=file_metadata,
+                    careerHistory=cover_letter_fields["careerHistory"],
+                    growthBackground=cover_letter_fields["growthBackground"],
+                    motivation=cover_letter_fields["motivation"]
+                )
 
-            # 6. 의미론적 청킹 적용
-            try:
-                # 자기소개서 데이터를 청킹용 형태로 변환
-                cover_letter_for_chunking = {
-                    "_id": cover_letter["id"],
-                    "applicant_id": applicant["id"],
-                    "document_type": "cover_letter",
-                    "extracted_text": ocr_result.get("extracted_text", ""),
-                    "summary": ocr_result.get("summary", ""),
-                    "keywords": ocr_result.get("keywords", []),
-                    "basic_info": basic_info,
-                    "file_metadata": file_metadata,
-                    "careerHistory": cover_letter_fields["careerHistory"],
-                    "growthBackground": cover_letter_fields["growthBackground"],
-                    "motivation": cover_letter_fields["motivation"]
-                }
-
-                chunks = self.chunking_service.chunk_cover_letter(cover_letter_for_chunking)
-                print(f"✅ 자기소개서 의미론적 청킹 완료: {len(chunks)}개 청크 생성")
-
-                # 청킹 결과를 cover_letter 데이터에 추가
-                if chunks:
-                    self.mongo_service.update_cover_letter_chunks(cover_letter["id"], chunks)
-
-                    # 벡터 DB에 저장 (자소서로 타입 통일)
-                    await self._save_chunks_to_vector_db(chunks, document_type="cover_letter")
+                # 6. 의미론적 청킹 적용
+                chunks = []
+                try:
+                    # 자기소개서 데이터를 청킹용 형태로 변환
+                    cover_letter_for_chunking = {
+                        "_id": str(cover_letter_id),
+                        "applicant_id": applicant["id"],
+                        "document_type": "cover_letter",
+                        "extracted_text": ocr_result.get("extracted_text", ""),
+                        "summary": ocr_result.get("summary", ""),
+                        "keywords": ocr_result.get("keywords", []),
+                        "basic_info": basic_info,
+                        "file_metadata": file_metadata,
+                        "careerHistory": cover_letter_fields["careerHistory"],
+                        "growthBackground": cover_letter_fields["growthBackground"],
+                        "motivation": cover_letter_fields["motivation"]
+                    }
+
+                    chunks = self.chunking_service.chunk_cover_letter(cover_letter_for_chunking)
+                    print(f"✅ 자기소개서 의미론적 청킹 완료: {len(chunks)}개 청크 생성")
+                except Exception as e:
+                    print(f"⚠️ 자기소개서 청킹 처리 실패: {e}")
 
-            except Exception as e:
-                print(f"⚠️ 자기소개서 청킹 처리 실패: {e}")
+                # 7. 자기소개서 저장 (청크 포함 insert 1회)
+                cover_letter = await uow.insert_document("cover_letter", cover_letter_id, cover_letter_data, chunks)
+                print(f"✅ 자기소개서 저장 및 지원자 cover_letter_id 연결: {cover_letter['id']}")
 
-            # 7. 지원자 데이터에 cover_letter_id 업데이트
-            try:
-                self.mongo_service.update_applicant_sync(
-                    applicant["id"],
-                    {"cover_letter_id": str(cover_letter["id"])}
-                )
-                print(f"✅ 지원자 데이터에 cover_letter_id 업데이트: {str(cover_letter['id'])}")
-            except Exception as e:
-                print(f"⚠️ cover_letter_id 업데이트 실패: {e}")
+            # 8. 벡터 DB에 저장 (자소서로 타입 통일, MongoDB 커밋 이후)
+            if chunks:
+                await self._save_chunks_to_vector_db(chunks, document_type="cover_letter")
 
             return {
                 "applicant": self._dict_with_serialized_datetime(applicant),
@@ -416,105 +399,80 @@ class MongoSaver:
                               file_path: Optional[Path] = None) -> Dict[str, Any]:
         """포트폴리오 OCR 결과를 저장합니다."""
         try:
-            # 1. 지원자 생성/조회
-            applicant = self.mongo_service.create_or_get_applicant_sync(applicant_data)
-
-            # 2. 파일 메타데이터 생성
+            # 1. 파일 메타데이터 생성
             file_metadata = {}
             if file_path:
                 file_metadata = self._create_file_metadata(file_path)
 
-            # 3. 기본 정보 추출
+            # 2. 기본 정보 추출
             basic_info = self._extract_basic_info_from_ocr(ocr_result)
 
-            # 4. 지원자 데이터에 기술 스택 정보 업데이트 (기존 기술 스택에 추가)
-            if basic_info.get("skills"):
-                try:
-                    # 기존 기술 스택 가져오기
-                    existing_applicant = self.mongo_service.get_applicant_by_id_sync(applicant["id"])
-                    existing_skills = existing_applicant.get("skills", "") if existing_applicant else ""
-
-                    # 새로운 기술 스택과 기존 기술 스택 합치기
-                    new_skills = basic_info["skills"]
-                    if existing_skills:
-                        existing_skills_list = [s.strip() for s in existing_skills.split(",")]
-                        combined_skills = list(set(existing_skills_list + new_skills))
-                    else:
-                        combined_skills = new_skills
-
-                    # 지원자 정보 업데이트
-                    self.mongo_service.update_applicant_sync(
-                        applicant["id"],
-                        {"skills": ", ".join(combined_skills)}
-                    )
-                    print(f"✅ 지원자 데이터에 기술 스택 추가: {new_skills}")
-                except Exception as e:
-                    print(f"⚠️ 기술 스택 업데이트 실패: {e}")
-
-            # 5. 포트폴리오 아이템 생성
-            portfolio_item = PortfolioItem(
-                item_id=f"item_{int(datetime.utcnow().timestamp())}",
-                title="포트폴리오 문서",
-                type=PortfolioItemType.DOC,
-                artifacts=[]
-            )
+            async with DocumentUnitOfWork(self.mongo_service, self.use_transaction) as uow:
+                # 3. 지원자 생성/조회 + 기술 스택 병합 + portfolio_id 연결 (upsert 1회)
+                portfolio_id = uow.new_document_id()
+                applicant = await uow.upsert_applicant(
+                    applicant_data, "portfolio", portfolio_id,
+                    skills=basic_info.get("skills"), merge_skills=True
+                )
 
-            # 5. 포트폴리오 데이터 생성 (application_id 제거)
-            portfolio_data = PortfolioCreate(
-                applicant_id=applicant["id"],
-                extracted_text=ocr_result.get("extracted_text", ""),
-                summary=ocr_result.get("summary", ""),
-                keywords=ocr_result.get("keywords", []),
-                document_type="portfolio",
-                basic_info=basic_info,
-                file_metadata=file_metadata,
-                items=[portfolio_item],
-                analysis_score=0.0,  # 기본값 설정
-                status="active"
-            )
+                # 4. 포트폴리오 아이템 생성
+                portfolio_item = PortfolioItem(
+                    item_id=f"item_{int(datetime.utcnow().timestamp())}",
+                    title="포트폴리오 문서",
+                    type=PortfolioItemType.DOC,
+                    artifacts=[]
+                )
 
-            # 6. 포트폴리오 저장
-            portfolio = self.mongo_service.create_portfolio(portfolio_data)
+                # 5. 포트폴리오 데이터 생성 (application_id 제거)
+                portfolio_data = PortfolioCreate(
+                    applicant_id=applicant["id"],
+                    extracted_text=ocr_result.get("extracted_text", ""),
+                    summary=ocr_result.get("summary", ""),
+                    keywords=ocr_result.get("keywords", []),
+                    document_type="portfolio",
+                    basic_info=basic_info,
+                    file_metadata=file_metadata,
+                    items=[portfolio_item],
+                    analysis_score=0.0,  # 기본값 설정
+                    status="active"
+                )
 
-            # 7. 의미론적 청킹 적용
-            try:
-                # 포트폴리오 데이터를 청킹용 형태로 변환
-                portfolio_for_chunking = {
-                    "_id": portfolio["id"],
-                    "applicant_id": applicant["id"],
-                    "document_type": "portfolio",
-                    "extracted_text": ocr_result.get("extracted_text", ""),
-                    "summary": ocr_result.get("summary", ""),
-                    "keywords": ocr_result.get("keywords", []),
-                    "basic_info": basic_info,
-                    "file_metadata": file_metadata,
-                    "items": [portfolio_item],
-                    "analysis_score": 0.0,
-                    "status": "active"
-                }
-
-                chunks = self.chunking_service.chunk_portfolio(portfolio_for_chunking)
-                print(f"✅ 포트폴리오 의미론적 청킹 완료: {len(chunks)}개 청크 생성")
-
-                # 청킹 결과를 portfolio 데이터에 추가
-                if chunks:
-                    self.mongo_service.update_portfolio_chunks(portfolio["id"], chunks)
-
-                    # 벡터 DB에 저장 (포트폴리오로 타입 통일)
-                    await self._save_chunks_to_vector_db(chunks, document_type="portfolio")
+                # 6. 의미론적 청킹 적용
+                chunks = []
+                try:
+                    # 포트폴리오 데이터를 청킹용 형태로 변환
+                    portfolio_for_chunking = {
+                        "_id": str(portfolio_id),
+                        "applicant_id": applicant["id"],
+                        "document_type": "portfolio",
+                        "extracted_text": ocr_result.get("extracted_text", ""),
+                        "summary": ocr_result.get("summary", ""),
+                        "keywords": ocr_result.get("keywords", []),
+                        "basic_info": basic_info,
+                        "file_metadata": file_metadata,
+                        "items": [portfolio_item],
+                        "analysis_score": 0.0,
+                        "status": "active"
+                    }
+
+                    # PDF 는 텍스트 레이어를 페이지 단위로 읽어 청킹 (전체 텍스트를 다시 만들지 않음)
+                    chunks = self.chunking_service.chunk_portfolio(
+                        portfolio_for_chunking, text_source=self._pdf_text_source(file_path)
+                    )
+                    if file_path and not any(chunk.get("chunk_type") == "extracted_text" for chunk in chunks):
+                        # 스캔 PDF 처럼 텍스트 레이어가 없으면 OCR 결과 텍스트로 청킹
+                        chunks = self.chunking_service.chunk_portfolio(portfolio_for_chunking)
+                    print(f"✅ 포트폴리오 의미론적 청킹 완료: {len(chunks)}개 청크 생성")
+                except Exception as e:
+                    print(f"⚠️ 포트폴리오 청킹 처리 실패: {e}")
 
-            except Exception as e:
-                print(f"⚠️ 포트폴리오 청킹 처리 실패: {e}")
+                # 7. 포트폴리오 저장 (청크 포함 insert 1회)
+                portfolio = await uow.insert_document("portfolio", portfolio_id, portfolio_data, chunks)
+                print(f"✅ 포트폴리오 저장 및 지원자 portfolio_id 연결: {portfolio['id']}")
 
-            # 8. 지원자 데이터에 portfolio_id 업데이트
-            try:
-                self.mongo_service.update_applicant_sync(
-                    applicant["id"],
-                    {"portfolio_id": str(portfolio["id"])}
-                )
-                print(f"✅ 지원자 데이터에 portfolio_id 업데이트: {str(portfolio['id'])}")
-            except Exception as e:
-                print(f"⚠️ portfolio_id 업데이트 실패: {e}")
+            # 8. 벡터 DB에 저장 (포트폴리오로 타입 통일, MongoDB 커밋 이후)
+            if chunks:
+                await self._save_chunks_to_vector_db(chunks, document_type="portfolio")
 
             return {
                 "applicant": self._dict_with_serialized_datetime(applicant),
@@ -525,6 +483,25 @@ class MongoSaver:
         except Exception as e:
             raise Exception(f"포트폴리오 저장 실패: {str(e)}")
 
+    async def bulk_save_applicants(self, records: List[Dict[str, Any]], batch_size: int = 500) -> List[Dict[str, Any]]:
+        """여러 지원자(및 문서)를 일괄 저장합니다. (캠퍼스 리크루팅 일괄 등록용)
+
+        records 형식은 DocumentUnitOfWork.bulk_ingest 와 같으며,
+        batch_size 단위로 나누어 배치마다 bulk_write/insert_many 로 저장합니다.
+        """
+        results = []
+        for start in range(0, len(records), batch_size):
+            batch = records[start:start + batch_size]
+            async with DocumentUnitOfWork(self.mongo_service, self.use_transaction) as uow:
+                results.extend(await uow.bulk_ingest(batch, chunker=self._chunk_for_bulk))
+        print(f"✅ 지원자 일괄 저장 완료: {len(results)}건")
+        return results
+
+    def _chunk_for_bulk(self, document_type: str, document: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """일괄 저장 시 문서 타입별 청킹"""
+        chunk_document = dict(document, _id=str(document["_id"]))
+        return self.chunking_service.chunk_document(chunk_document, document_type)
+
     async def _save_chunks_to_vector_db(self, chunks, document_type="resume"):
         """청크를 벡터 DB에 저장합니다."""
         try:
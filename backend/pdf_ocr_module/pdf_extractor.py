@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import fitz  # PyMuPDF
 import pdfplumber
@@ -17,6 +17,20 @@ class TextSpan:
     line: Optional[int] = None
 
 
+def iter_page_texts(pdf_path: Path) -> Iterator[str]:
+    """PDF 텍스트를 페이지 단위로 하나씩 생성.
+
+    ChunkingService.chunk_document(text_source=...) 에 넘겨 전체 텍스트를
+    메모리에 올리지 않고 청킹할 때 사용합니다.
+    """
+    doc = fitz.open(str(pdf_path))
+    try:
+        for page_index in range(len(doc)):
+            yield doc.load_page(page_index).get_text("text")
+    finally:
+        doc.close()
+
+
 def extract_text_with_layout(pdf_path: Path) -> Dict[str, Any]:
     """PyMuPDF로 텍스트+박스, pdfplumber로 표를 보조 추출.
 
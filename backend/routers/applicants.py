@@ -8,6 +8,7 @@ from modules.core.services.embedding_service import EmbeddingService
 from modules.core.services.mongo_service import MongoService
 from modules.core.services.similarity_service import SimilarityService
 from modules.core.services.vector_service import VectorService
+from modules.token_monitor import AdmissionRejected
 
 router = APIRouter(prefix="/api/applicants", tags=["applicants"])
 
@@ -59,6 +60,7 @@ async def get_all_applicants(
     limit: int = Query(50, ge=1, le=1000, description="가져올 개수"),
     status: Optional[str] = Query(None, description="상태 필터"),
     position: Optional[str] = Query(None, description="직무 필터"),
+    cursor: Optional[str] = Query(None, description="키셋 페이지네이션 커서 (이전 응답의 next_cursor, 지정 시 skip 무시)"),
     mongo_service: MongoService = Depends(get_mongo_service)
 ):
     """모든 지원자 목록을 조회합니다."""
@@ -66,7 +68,9 @@ async def get_all_applicants(
         print(f"🔍 API 라우터 호출 - MongoDB URI: {mongo_service.mongo_uri}")
         print(f"🔍 API 라우터 호출 - skip: {skip}, limit: {limit}, status: {status}, position: {position}")
 
-        result = await mongo_service.get_applicants(skip=skip, limit=limit, status=status, position=position)
+        result = await mongo_service.get_applicants(
+            skip=skip, limit=limit, status=status, position=position, cursor=cursor
+        )
 
         # 디버깅: 응답 데이터 확인
         if result.get('applicants') and len(result['applicants']) > 0:
@@ -91,6 +95,8 @@ async def get_all_applicants(
             print(f"🔍 API 응답 - phone 존재: {'phone' in first_applicant}, 값: {first_applicant.get('phone', 'None')}")
 
         return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"❌ API 라우터 오류: {e}")
         raise HTTPException(status_code=500, detail=f"지원자 목록 조회 실패: {str(e)}")
@@ -160,6 +166,8 @@ async def search_similar_applicants(
             "message": f"{len(similar_applicants)}명의 유사한 지원자를 발견했습니다."
         }
 
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         print(f"[ERROR] 유사 지원자 검색 실패: {str(e)}")
         raise HTTPException(
@@ -345,6 +353,8 @@ async def get_talent_recommendations(
     except HTTPException:
         print(f"❌ [유사인재 추천 API] HTTP 예외 발생 - 재발생")
         raise
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         print(f"❌ [유사인재 추천 API] 예상치 못한 오류 발생")
         print(f"  - 오류 타입: {type(e).__name__}")
@@ -415,6 +425,8 @@ async def check_cover_letter_plagiarism(
 
     except HTTPException:
         raise
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         print(f"[ERROR] 자소서 표절체크 실패: {str(e)}")
         raise HTTPException(
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import tempfile
@@ -727,7 +728,7 @@ async def upload_multiple_documents(
                 # 기존 지원자 데이터 사용 또는 새로 생성
                 if applicant_id:
                     # 기존 지원자 정보 가져오기
-                    existing_applicant = mongo_saver.mongo_service.get_applicant_by_id_sync(applicant_id)
+                    existing_applicant = await asyncio.to_thread(mongo_saver.mongo_service.get_applicant_by_id_sync, applicant_id)
                     if existing_applicant:
                         applicant_data = ApplicantCreate(
                             name=existing_applicant.get("name", name),
@@ -810,7 +811,7 @@ async def upload_multiple_documents(
                 # 기존 지원자 데이터 사용 또는 새로 생성
                 if applicant_id:
                     # 기존 지원자 정보 가져오기
-                    existing_applicant = mongo_saver.mongo_service.get_applicant_by_id_sync(applicant_id)
+                    existing_applicant = await asyncio.to_thread(mongo_saver.mongo_service.get_applicant_by_id_sync, applicant_id)
                     if existing_applicant:
                         applicant_data = ApplicantCreate(
                             name=existing_applicant.get("name", name),
@@ -869,7 +870,7 @@ async def upload_multiple_documents(
         # 최종 지원자 정보 가져오기
         final_applicant_info = None
         if applicant_id:
-            final_applicant_info = mongo_saver.mongo_service.get_applicant_by_id_sync(applicant_id)
+            final_applicant_info = await asyncio.to_thread(mongo_saver.mongo_service.get_applicant_by_id_sync, applicant_id)
             # ObjectId를 문자열로 직렬화
             final_applicant_info = serialize_mongo_data(final_applicant_info)
 
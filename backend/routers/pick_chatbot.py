@@ -18,6 +18,9 @@ try:
 except ImportError:
     from modules.core.services.llm_service import LLMService
     from modules.core.services.mongo_service import MongoService
+from modules.ai.services.intent_classifier import classify_locally
+from modules.core.services.cohort_similarity_index import (COHORT_INDEX_FIELDS,
+                                                           schedule_cohort_sync)
 
 # 웹 자동화를 위한 추가 import
 import asyncio
@@ -714,6 +717,7 @@ class ToolExecutor:
                 applicant_data["status"] = "pending"
 
                 result = await self.mongo_service.db.applicants.insert_one(applicant_data)
+                schedule_cohort_sync(self.mongo_service.db, [result.inserted_id])
                 logger.info(f"✅ [지원자툴] 생성 완료: {result.inserted_id}")
                 return {
                     "applicant_id": str(result.inserted_id),
@@ -765,6 +769,8 @@ class ToolExecutor:
                 )
 
                 if result.modified_count > 0:
+                    if COHORT_INDEX_FIELDS.intersection(update_data):
+                        schedule_cohort_sync(self.mongo_service.db, [applicant_id])
                     logger.info(f"✅ [지원자툴] 수정 완료: {applicant_id}")
                     return {"message": "지원자 정보가 성공적으로 수정되었습니다."}
                 else:
@@ -777,6 +783,7 @@ class ToolExecutor:
                 result = await self.mongo_service.db.applicants.delete_one({"_id": ObjectId(applicant_id)})
 
                 if result.deleted_count > 0:
+                    schedule_cohort_sync(self.mongo_service.db, [applicant_id], removed=True)
                     logger.info(f"✅ [지원자툴] 삭제 완료: {applicant_id}")
                     return {"message": "지원자가 성공적으로 삭제되었습니다."}
                 else:
@@ -1367,17 +1374,9 @@ monitoring_system = MonitoringSystem()
 
 router = APIRouter(tags=["pick-chatbot"])
 
-# 로깅 설정 (안전한 로깅)
+# 로깅 설정 (출력은 루트 로거의 비동기 큐 핸들러가 담당)
 logger = logging.getLogger(__name__)
 
-# 로거 핸들러가 없으면 추가
-if not logger.handlers:
-    import sys
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s'))
-    logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
-
 class SessionManager:
     def __init__(self, expiry_seconds=1800, max_history=10):
         self.sessions = defaultdict(dict)
@@ -1402,17 +1401,17 @@ class SessionManager:
             }
         }
         try:
-            print(f"🔑 [SESSION DEBUG] 새 세션 생성")
-            print(f"    📝 세션 ID: {session_id}")
-            print(f"    ⏰ 생성 시간: {current_time}")
-            print(f"    📊 총 활성 세션 수: {len(self.sessions)}")
-            logger.info(f"새 세션 생성: {session_id}")
+            logger.debug("🔑 [SESSION DEBUG] 새 세션 생성")
+            logger.debug("    📝 세션 ID: %s", session_id)
+            logger.debug("    ⏰ 생성 시간: %s", current_time)
+            logger.debug("    📊 총 활성 세션 수: %s", len(self.sessions))
+            logger.info("새 세션 생성: %s", session_id)
         except (ValueError, OSError):
             pass  # detached buffer 오류 무시
 
     def add_message(self, session_id, role, content):
         if session_id not in self.sessions:
-            print(f"🔑 [SESSION DEBUG] 세션이 없어서 새로 생성: {session_id}")
+            logger.debug("🔑 [SESSION DEBUG] 세션이 없어서 새로 생성: %s", session_id)
             self.create_session(session_id)
 
         session = self.sessions[session_id]
@@ -1423,17 +1422,17 @@ class SessionManager:
         if len(session["history"]) > self.max_history:
             trimmed_count = len(session["history"]) - self.max_history
             session["history"] = session["history"][-self.max_history:]
-            print(f"📚 [SESSION DEBUG] 히스토리 정리: {trimmed_count}개 메시지 제거")
+            logger.debug("📚 [SESSION DEBUG] 히스토리 정리: %s개 메시지 제거", trimmed_count)
 
         session["last_activity"] = self._current_time()
 
         try:
-            print(f"💬 [SESSION DEBUG] 메시지 추가")
-            print(f"    📝 세션 ID: {session_id}")
-            print(f"    👤 역할: {role}")
-            print(f"    📄 내용 길이: {len(content)}자")
-            print(f"    📊 히스토리: {old_history_count} → {len(session['history'])}개")
-            logger.info(f"세션 {session_id}에 메시지 추가: {role}")
+            logger.debug("💬 [SESSION DEBUG] 메시지 추가")
+            logger.debug("    📝 세션 ID: %s", session_id)
+            logger.debug("    👤 역할: %s", role)
+            logger.debug("    📄 내용 길이: %s자", len(content))
+            logger.debug("    📊 히스토리: %s → %s개", old_history_count, len(session['history']))
+            logger.info("세션 %s에 메시지 추가: %s", session_id, role)
         except (ValueError, OSError):
             pass  # detached buffer 오류 무시
 
@@ -1452,7 +1451,7 @@ class SessionManager:
             del self.sessions[sid]
         if expired:
             try:
-                logger.info(f"만료된 세션 {len(expired)}개 정리: {expired}")
+                logger.info("만료된 세션 %s개 정리: %s", len(expired), expired)
             except (ValueError, OSError):
                 pass  # detached buffer 오류 무시
 
@@ -1464,7 +1463,7 @@ class SessionManager:
                 if value is not None:
                     session_context[key] = value
             try:
-                logger.info(f"세션 {session_id} 컨텍스트 업데이트: {context_update}")
+                logger.info("세션 %s 컨텍스트 업데이트: %s", session_id, context_update)
             except (ValueError, OSError):
                 pass
 
@@ -1804,6 +1803,12 @@ async def detect_tool_usage_with_ai(
 ) -> Optional[Dict[str, Any]]:
     """AI를 사용하여 사용자 메시지에서 툴 사용 의도 감지 (순수 AI 기반)"""
 
+    # 로컬 분류기가 툴 불필요를 확신하면 AI 호출 생략 (툴/파라미터 선택은 AI가 담당)
+    local_prediction = classify_locally("tool_usage", user_message)
+    if local_prediction is not None and local_prediction.label == "none":
+        print(f"🔍 [DEBUG] 로컬 분류: 툴 불필요 (신뢰도 {local_prediction.confidence:.2f})")
+        return None
+
     # 컨텍스트 정보 구성
     context_info = ""
 
@@ -13,30 +13,21 @@ from fastapi import APIRouter, HTTPException
 # 기존 서비스들 import
 from modules.core.services.openai_service import OpenAIService
 
-from modules.ai.services.langgraph_agent_system import LangGraphAgentSystem
+from modules.ai.services.langgraph_agent_system import (
+    get_langgraph_agent_system, langgraph_workflow_registry)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/react-agent", tags=["react-agent"])
 
-# Ollama LLM 서비스 초기화
-try:
-    from modules.core.services.llm_service import LLMService
-    llm_service = LLMService()
-    print(f"🔍 [ReactAgent] Ollama LLM 서비스 초기화 성공")
-except Exception as e:
-    logger.error(f"Ollama LLM 서비스 초기화 실패: {e}")
-    llm_service = None
+# LLM 서비스 / LangGraph 에이전트는 워커 공용 레지스트리의 인스턴스를 재사용
+llm_service = langgraph_workflow_registry.llm_service
 
 # OpenAI 서비스 (비활성화)
 openai_service = None
 
-# LangGraph 에이전트 시스템 초기화
-try:
-    langgraph_system = LangGraphAgentSystem()
-except Exception as e:
-    logger.error(f"LangGraph 시스템 초기화 실패: {e}")
-    langgraph_system = None
+# LangGraph 에이전트 시스템 (컴파일된 그래프 공유)
+langgraph_system = get_langgraph_agent_system()
 
 # 에이전트 세션 저장소 (실제로는 Redis나 DB 사용 권장)
 agent_sessions = {}
@@ -1020,9 +1011,7 @@ async def _execute_job_posting_tool(action: str, params: Dict) -> Dict:
         elif action == "list":
             # 실제 데이터베이스에서 채용공고 목록 조회
             try:
-                from motor.motor_asyncio import AsyncIOMotorClient
-                client = AsyncIOMotorClient('mongodb://localhost:27017')
-                db = client.hireme
+                db = langgraph_workflow_registry.get_database()
 
                 # 전체 채용공고 수 조회
                 total_count = await db.job_postings.count_documents({})
@@ -1036,8 +1025,6 @@ async def _execute_job_posting_tool(action: str, params: Dict) -> Dict:
                     job["id"] = str(job["_id"])
                     del job["_id"]
 
-                client.close()
-
                 result = {
                     "message": f"📋 현재 등록된 채용공고 목록입니다 (총 {total_count}개):",
                     "data": recent_jobs,
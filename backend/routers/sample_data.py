@@ -8,7 +8,10 @@ import pandas as pd
 from bson import ObjectId
 from faker import Faker
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from modules.core.services.cohort_similarity_index import (CohortSimilarityIndex,
+                                                           schedule_cohort_sync)
 from modules.core.services.embedding_service import EmbeddingService
+from modules.core.services.near_duplicate_index import CoverLetterNearDuplicateIndex
 from modules.core.services.vector_service import VectorService
 from motor.motor_asyncio import AsyncIOMotorClient
 
@@ -221,6 +224,7 @@ async def generate_sample_applicants(
         if applicants:
             result = await db.applicants.insert_many(applicants)
             generated_count = len(result.inserted_ids)
+            schedule_cohort_sync(db, result.inserted_ids)
 
             # 채용공고별 지원자 수 업데이트
             job_posting_counts = {}
@@ -371,6 +375,7 @@ async def upload_excel_file(
         # 지원자 데이터 처리
         if 'name' in df.columns and 'email' in df.columns:
             # 지원자 데이터로 인식
+            inserted_applicant_ids = []
             for index, row in df.iterrows():
                 try:
                     applicant_data = {
@@ -397,11 +402,13 @@ async def upload_excel_file(
                         continue
 
                     # DB에 삽입
-                    await db.applicants.insert_one(applicant_data)
+                    result = await db.applicants.insert_one(applicant_data)
+                    inserted_applicant_ids.append(result.inserted_id)
                     uploaded_count += 1
 
                 except Exception as e:
                     errors.append(f"행 {index + 1}: {str(e)}")
+            schedule_cohort_sync(db, inserted_applicant_ids)
 
         # 채용공고 데이터 처리
         elif 'title' in df.columns and 'company' in df.columns:
@@ -473,6 +480,7 @@ async def upload_json_data(
             existing_job_postings = await db.job_postings.find({}, {"_id": 1}).to_list(None)
             job_posting_ids = [str(job["_id"]) for job in existing_job_postings]
 
+            inserted_applicant_ids = []
             for index, applicant in enumerate(data['applicants']):
                 try:
                     # 랜덤하게 채용공고 ID 할당
@@ -514,6 +522,7 @@ async def upload_json_data(
 
                     # DB에 삽입
                     result = await db.applicants.insert_one(applicant_data)
+                    inserted_applicant_ids.append(result.inserted_id)
                     uploaded_count += 1
 
                     # 자소서 데이터가 있으면 별도로 저장
@@ -535,6 +544,7 @@ async def upload_json_data(
 
                         try:
                             await db.cover_letters.insert_one(cover_letter_data)
+                            await CoverLetterNearDuplicateIndex(db).index_cover_letter(cover_letter_data)
                         except Exception as e:
                             print(f"자소서 저장 실패: {e}")
 
@@ -547,6 +557,7 @@ async def upload_json_data(
 
                 except Exception as e:
                     errors.append(f"지원자 {index + 1}: {str(e)}")
+            schedule_cohort_sync(db, inserted_applicant_ids)
 
         # 채용공고 데이터 처리
         if 'job_postings' in data and isinstance(data['job_postings'], list):
@@ -689,6 +700,9 @@ async def reset_all_data(db: AsyncIOMotorClient = Depends(get_database)):
             result = await db[collection_name].delete_many({})
             deleted_counts[collection_name] = result.deleted_count
 
+        # 지원자 유사도 인덱스도 함께 비움
+        await CohortSimilarityIndex(db, None).clear()
+
         return {
             "success": True,
             "message": "모든 데이터가 성공적으로 초기화되었습니다.",
@@ -877,6 +891,8 @@ async def generate_sample_cover_letters(
         # 데이터베이스에 저장
         if cover_letters:
             result = await db.cover_letters.insert_many(cover_letters)
+            # 표절 후보 검색용 서명 인덱싱 (insert_many 가 각 문서에 _id 를 채움)
+            await CoverLetterNearDuplicateIndex(db).index_cover_letters(cover_letters)
 
             # 지원자 데이터에 cover_letter_id 업데이트
             for i, cover_letter in enumerate(cover_letters):
@@ -1060,6 +1076,7 @@ async def create_single_applicant(
 
         # MongoDB에 저장
         result = await db.applicants.insert_one(applicant_data)
+        schedule_cohort_sync(db, [result.inserted_id])
 
         return {
             "success": True,
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
-from modules.token_monitor import token_monitor
+from modules.token_monitor import admission_controller, token_monitor
 
 router = APIRouter(prefix="/api/token-monitor", tags=["Token Monitor"])
 
@@ -123,3 +123,14 @@ async def get_usage_limits():
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"한도 정보 조회 실패: {str(e)}")
+
+@router.get("/admission")
+async def get_admission_status():
+    """호출 전 허용 제어 상태 (모델/프로젝트별 남은 분당 한도, 대기/거절 통계)"""
+    try:
+        return {
+            "success": True,
+            "data": admission_controller.get_status()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"허용 제어 상태 조회 실패: {str(e)}")
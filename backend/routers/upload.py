@@ -13,6 +13,8 @@ from fastapi.responses import JSONResponse
 sys.path.append('..')  # 상위 디렉토리의 openai_service.py 사용
 import re
 
+from modules.core.services.model_warmup import \
+    get_readiness as get_model_readiness
 from modules.core.services.openai_service import OpenAIService
 from pydantic import BaseModel
 
@@ -441,9 +443,10 @@ async def summarize_text(request: SummaryRequest):
 
 @router.get("/health")
 async def upload_health_check():
-    """업로드 서비스 헬스 체크"""
+    """업로드 서비스 헬스 체크 (main.py 의 /health 보다 먼저 매칭되므로 모델 준비 상태도 함께 보고)"""
     return {
         "status": "healthy",
+        "readiness": get_model_readiness(),
         "openai_api_configured": bool(openai_service),
         "supported_formats": list(ALLOWED_EXTENSIONS.keys()),
         "max_file_size_mb": MAX_FILE_SIZE // (1024 * 1024)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+로컬 의도 분류기 정확도/지연 시간 측정 스크립트
+
+사용법:
+    python benchmark_intent_classifier.py [LLM 평균 지연(ms)] [폴드 수]
+
+작업(task)마다 예시를 K-fold 로 나눠 학습하지 않은 폴드를 예측하고,
+신뢰도 임계값별로 로컬 처리 비율, 로컬 처리분의 정확도,
+LLM 폴백을 포함한 메시지당 기대 지연 시간을 출력합니다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+current_dir = Path(__file__).parent
+backend_dir = current_dir.parent
+sys.path.append(str(backend_dir))
+
+from modules.ai.services.intent_classifier import load_examples, train_classifier
+
+THRESHOLDS = [0.5, 0.6, 0.7, 0.8, 0.9, 0.95]
+
+
+def out_of_fold_predictions(task, examples, folds):
+    predictions = []
+    for fold in range(folds):
+        train = [example for index, example in enumerate(examples) if index % folds != fold]
+        test = [example for index, example in enumerate(examples) if index % folds == fold]
+        classifier = train_classifier(task, train)
+        for text, label in test:
+            predictions.append((classifier.predict(text), label))
+    return predictions
+
+
+def main():
+    llm_latency_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 1000.0
+    folds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    for task, examples in load_examples().items():
+        started = time.perf_counter()
+        classifier = train_classifier(task, examples)
+        train_seconds = time.perf_counter() - started
+
+        predictions = out_of_fold_predictions(task, examples, folds)
+        local_latency_ms = sum(prediction.latency_ms for prediction, _ in predictions) / len(predictions)
+
+        print(f"\n🔍 {task}: 예시 {len(examples)}개, 라벨 {classifier.labels}")
+        print(f"   학습 {train_seconds:.2f}s, 온도 {classifier.temperature}, 예측 평균 {local_latency_ms:.3f}ms")
+        print(f"   {'임계값':>6} {'로컬 처리':>9} {'로컬 정확도':>10} {'기대 지연(ms)':>13}")
+        for threshold in THRESHOLDS:
+            covered = [(prediction, label) for prediction, label in predictions
+                       if prediction.confidence >= threshold]
+            coverage = len(covered) / len(predictions)
+            accuracy = (sum(1 for prediction, label in covered if prediction.label == label) / len(covered)
+                        if covered else 0.0)
+            expected_ms = local_latency_ms + (1 - coverage) * llm_latency_ms
+            print(f"   {threshold:>6.2f} {coverage:>9.1%} {accuracy:>10.1%} {expected_ms:>13.1f}")
+
+    print(f"\n📊 LLM 단독 분류 기준 지연: {llm_latency_ms:.0f}ms/메시지")
+
+
+if __name__ == "__main__":
+    main()
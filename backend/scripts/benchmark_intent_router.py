@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+채팅 의도 라우팅 비용 측정 스크립트
+
+사용법:
+    python benchmark_intent_router.py [반복 횟수]
+
+샘플 메시지마다 키워드 오토마톤 탐색, 혼합 의도 분리/판단에 걸리는 시간을 측정해
+메시지당 평균/최대 비용(마이크로초)을 출력합니다.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+current_dir = Path(__file__).parent
+backend_dir = current_dir.parent
+sys.path.append(str(backend_dir))
+
+from modules.ai.services.intent_router import INTENT_AUTOMATON, IntentFeatures
+
+SAMPLE_MESSAGES = [
+    "네",
+    "ㅋㅋㅋ",
+    "지원자 목록 보여줘",
+    "채용 공고 작성 방법 알려줘",
+    "면접 준비 방법 알려주고 면접 관리 페이지로 이동해줘",
+    "대시보드 화면 열어서 이번 달 지원 현황 확인하고 분석해줘",
+    "개발자 채용 트렌드 설명하고 채용공고 등록 화면 보여줘",
+    "그거 다시 저장해줘",
+    "포트폴리오 평가 기준이 뭐야? 그리고 평가 결과 페이지 열어줘",
+    "프론트엔드 개발자 3년차 연봉 5000만원으로 채용공고 만들어줘",
+]
+
+
+def measure(label, func, iterations):
+    timings = []
+    for message in SAMPLE_MESSAGES:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func(message)
+        timings.append((time.perf_counter() - started) / iterations * 1_000_000)
+
+    print(f"{label:<24} 평균 {sum(timings) / len(timings):8.2f}µs  최대 {max(timings):8.2f}µs")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(f"🔍 샘플 {len(SAMPLE_MESSAGES)}개, 메시지당 {iterations}회 반복")
+    measure("키워드 탐색(scan)", INTENT_AUTOMATON.scan, iterations)
+    measure("전체 라우팅(mixed)", lambda message: IntentFeatures(message.lower()).mixed, iterations)
+
+    print("\n📊 라우팅 결과")
+    for message in SAMPLE_MESSAGES:
+        is_mixed, sub_intents, parts, confidence = IntentFeatures(message.lower()).mixed
+        print(f"  {message[:30]:<32} mixed={is_mixed} {sub_intents} {confidence}")
+
+
+if __name__ == "__main__":
+    main()
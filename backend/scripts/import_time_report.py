@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+모듈별 import 비용 리포트 (python -X importtime 집계)
+
+사용법:
+    python import_time_report.py [대상 모듈(기본: main)] [상위 N개(기본: 30)] [예산(초)]
+
+대상 모듈을 별도 프로세스에서 -X importtime 으로 import 하고,
+최상위 패키지별 누적 시간과 단일 모듈 기준 상위 N개를 출력합니다.
+예산을 주면 전체 import 시간이 예산을 넘을 때 종료 코드 1 (배포 전 확인용).
+LAZY_ROUTERS 환경변수를 바꿔 지연 등록 전후를 비교할 수 있습니다.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# 프로젝트 루트 (main.py 위치)
+current_dir = Path(__file__).parent
+backend_dir = current_dir.parent
+
+LINE_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def collect_import_times(target):
+    """[(모듈명, self_us, cumulative_us, 깊이)]"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=str(backend_dir), capture_output=True, text=True, env=os.environ.copy()
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    if result.returncode != 0:
+        print(f"⚠️ {target} import 실패 (종료 코드 {result.returncode}):")
+        print("\n".join(line for line in result.stderr.splitlines() if not line.startswith("import time:"))[-2000:])
+    return rows
+
+
+def main():
+    target = sys.argv[1] if len(sys.argv) > 1 else "main"
+    top_n = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    budget = float(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    rows = collect_import_times(target)
+    if not rows:
+        print("❌ import 시간 정보를 얻지 못했습니다")
+        return 1
+
+    # 최상위 import(깊이 0)의 누적 시간 합 = 전체 import 시간
+    total_seconds = sum(cumulative for _, _, cumulative, depth in rows if depth == 0) / 1e6
+
+    by_package = defaultdict(int)
+    for module, self_us, _, _ in rows:
+        by_package[module.split(".")[0]] += self_us
+
+    print(f"\n🔍 {target} import 전체: {total_seconds:.2f}s (모듈 {len(rows)}개)")
+    print(f"\n📦 패키지별 (self 합계) 상위 {top_n}")
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top_n]:
+        print(f"   {self_us / 1e6:>8.3f}s  {package}")
+
+    print(f"\n📋 모듈별 (누적) 상위 {top_n}")
+    for module, _, cumulative_us, depth in sorted(rows, key=lambda row: row[2], reverse=True)[:top_n]:
+        print(f"   {cumulative_us / 1e6:>8.3f}s  {'  ' * min(depth, 6)}{module}")
+
+    if budget is not None and total_seconds > budget:
+        print(f"\n❌ import 시간 {total_seconds:.2f}s 가 예산 {budget:.2f}s 초과")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""LLMInstrumentation 이 AsyncOpenAI 처럼 동기 함수가 코루틴을 반환하는 create 를 계측하는지 확인"""
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "backend"))
+
+from modules.token_monitor.core.instrumentation import LLMInstrumentation  # noqa: E402
+
+
+class FakeTokenMonitor:
+    def __init__(self):
+        self.records = []
+
+    def create_usage_record(self, **fields):
+        return fields
+
+    def log_usage(self, record):
+        self.records.append(record)
+
+
+def _usage(prompt_tokens, completion_tokens):
+    return SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                           prompt_tokens_details=None)
+
+
+def _chunk(content=None, usage=None):
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content is not None else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class FakeAsyncStream:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class FakeAsyncCompletions:
+    """openai 1.x AsyncCompletions: create 는 required_args 로 감싼 동기 함수라 코루틴을 반환"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def create(self, **kwargs):
+        return self._create(**kwargs)
+
+    async def _create(self, **kwargs):
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("upstream error")
+        if kwargs.get("stream"):
+            return FakeAsyncStream([_chunk("안녕"), _chunk("하세요"), _chunk(usage=_usage(11, 3))])
+        return SimpleNamespace(
+            usage=_usage(12, 5),
+            choices=[SimpleNamespace(message=SimpleNamespace(content="응답"))]
+        )
+
+
+class FakeSyncCompletions:
+    def create(self, **kwargs):
+        return SimpleNamespace(
+            usage=_usage(7, 2),
+            choices=[SimpleNamespace(message=SimpleNamespace(content="응답"))]
+        )
+
+
+class FakeEmbeddings:
+    def create(self, **kwargs):
+        return SimpleNamespace(usage=_usage(4, None), data=[])
+
+
+def _client(completions):
+    return SimpleNamespace(chat=SimpleNamespace(completions=completions), embeddings=FakeEmbeddings())
+
+
+def _instrumented(completions):
+    monitor = FakeTokenMonitor()
+    client = LLMInstrumentation(monitor).instrument(_client(completions), "tests.fake_owner")
+    return client, monitor
+
+
+def test_async_client_records_provider_usage_after_await():
+    client, monitor = _instrumented(FakeAsyncCompletions())
+    messages = [{"role": "user", "content": "질문"}]
+
+    pending = client.chat.completions.create(model="gpt-4o-mini", messages=messages)
+    assert monitor.records == []
+
+    response = asyncio.run(pending)
+    assert response.choices[0].message.content == "응답"
+    assert len(monitor.records) == 1
+    record = monitor.records[0]
+    assert record["input_tokens"] == 12
+    assert record["output_tokens"] == 5
+    assert record["usage_source"] == "provider"
+    assert record["latency_ms"] >= 10
+
+
+def test_async_client_failure_is_not_recorded():
+    client, monitor = _instrumented(FakeAsyncCompletions(fail=True))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(client.chat.completions.create(model="gpt-4o-mini", messages=[]))
+    assert monitor.records == []
+
+
+def test_async_client_stream_is_awaitable_and_recorded_when_consumed():
+    client, monitor = _instrumented(FakeAsyncCompletions())
+
+    async def consume():
+        stream = await client.chat.completions.create(model="gpt-4o-mini", messages=[], stream=True)
+        return [chunk.choices[0].delta.content async for chunk in stream if chunk.choices]
+
+    assert asyncio.run(consume()) == ["안녕", "하세요"]
+    assert len(monitor.records) == 1
+    assert monitor.records[0]["input_tokens"] == 11
+    assert monitor.records[0]["output_tokens"] == 3
+
+
+def test_sync_client_records_immediately():
+    client, monitor = _instrumented(FakeSyncCompletions())
+
+    client.chat.completions.create(model="gpt-4o-mini", messages=[])
+    assert len(monitor.records) == 1
+    assert monitor.records[0]["input_tokens"] == 7
+    assert monitor.records[0]["endpoint"].endswith("test_sync_client_records_immediately")
@@ -0,0 +1,101 @@
+"""JobPostingRuleExtractor 의 사전/패턴 오탐 회귀 테스트"""
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "backend"))
+
+from modules.job_posting.rule_extractor import (  # noqa: E402
+    LLM_FILL_MIN_CONFIDENCE, JobPostingRuleExtractor)
+
+TODAY = date(2024, 6, 1)
+
+
+@pytest.fixture
+def extractor():
+    return JobPostingRuleExtractor()
+
+
+@pytest.mark.parametrize("message", ["코드 리뷰 문화가 있습니다", "인터뷰는 1회 진행합니다"])
+def test_review_and_interview_are_not_vue(extractor, message):
+    assert "Vue.js" not in extractor.extract(message, TODAY).get("tech_stack")
+
+
+def test_vue_is_still_detected(extractor):
+    assert "Vue.js" in extractor.extract("Vue 와 TypeScript 사용", TODAY).get("tech_stack")
+
+
+def test_javascript_is_not_java(extractor):
+    tech_stack = extractor.extract("자바스크립트 개발자를 찾습니다", TODAY).get("tech_stack")
+    assert "JavaScript" in tech_stack
+    assert "Java" not in tech_stack
+
+
+def test_java_is_still_detected(extractor):
+    assert "Java" in extractor.extract("자바 스프링 백엔드 개발자", TODAY).get("tech_stack")
+
+
+@pytest.mark.parametrize("message", ["지원 마감은 2024년 12월 31일까지입니다", "24년 12월 마감"])
+def test_dates_are_not_experience(extractor, message):
+    result = extractor.extract(message, TODAY)
+    assert result.get("experience") is None
+    assert result.get("experience_years") is None
+    assert result.get("position_level") is None
+
+
+def test_experience_years_next_to_a_date(extractor):
+    result = extractor.extract("경력 5년 이상, 2024년 12월 31일 마감", TODAY)
+    assert result.get("experience_years") == 5
+    assert result.get("position_level") == "middle"
+    assert result.get("deadline") == "2024-12-31"
+
+
+@pytest.mark.parametrize("message", ["좋은 팀에서 함께 성장해요", "우리 팀과 함께", "개발팀장 채용"])
+def test_generic_team_words_are_not_departments(extractor, message):
+    assert extractor.extract(message, TODAY).get("department") is None
+
+
+@pytest.mark.parametrize("message, department", [
+    ("서버개발팀에서 백엔드 개발자 채용", "서버개발팀"),
+    ("마케팅 본부 인원 충원", "마케팅본부"),
+    ("데이터팀은 5명입니다", "데이터팀"),
+])
+def test_known_departments(extractor, message, department):
+    assert extractor.extract(message, TODAY).get("department") == department
+
+
+@pytest.mark.parametrize("message", [
+    "안녕하세요 처음 인사드립니다. 파이썬 개발자 한 명 구합니다",
+    "기획팀과 협업할 Django 개발자 채용",
+    "보안 솔루션 회사에서 Java 개발자 채용",
+])
+def test_domain_words_without_role_noun_are_not_positions(extractor, message):
+    result = extractor.extract(message, TODAY)
+    assert result.get("position") == "개발자"
+    assert result.confidence("position") < LLM_FILL_MIN_CONFIDENCE
+
+
+@pytest.mark.parametrize("message, position", [
+    ("보안 엔지니어 채용", "보안 엔지니어"),
+    ("서비스 기획자를 찾습니다", "서비스 기획자"),
+    ("인사 담당자 모집", "인사 담당자"),
+])
+def test_domain_words_with_role_noun(extractor, message, position):
+    result = extractor.extract(message, TODAY)
+    assert result.get("position") == position
+    assert result.confidence("position") >= LLM_FILL_MIN_CONFIDENCE
+
+
+def test_bare_domain_word_is_below_llm_threshold(extractor):
+    result = extractor.extract("마케팅 인원 충원", TODAY)
+    assert result.get("position") == "마케팅 매니저"
+    assert result.confidence("position") < LLM_FILL_MIN_CONFIDENCE
+
+
+@pytest.mark.parametrize("message", ["경력 3~5년 백엔드 개발자", "3년-5년 경력"])
+def test_experience_range_uses_lower_bound(extractor, message):
+    result = extractor.extract(message, TODAY)
+    assert result.get("experience_years") == 3
+    assert result.get("position_level") == "middle"